@@ -2,13 +2,31 @@
 Camera Interface for AMS
 
 Provides abstract camera interface and OpenCV implementation for CV detection.
+
+ThreadedCamera wraps any camera with a capture thread that writes frames,
+tagged with monotonic capture timestamps, into a small ring buffer. Detection
+backends then take the latest frame (or every frame since the last poll)
+without blocking the game loop on cv2.VideoCapture.read().
+
+ReplayCamera plays back a recorded video file or image sequence with its
+original frame timing, so detection backends can be benchmarked and tested
+without camera hardware.
 """
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+import time
+from typing import Deque, Dict, List, Sequence, Tuple, Optional
 import numpy as np
 import cv2
 
+from ams.logging import get_logger
+
+log = get_logger('camera')
+
 
 class CameraInterface(ABC):
     """Abstract camera interface for CV detection."""
@@ -97,6 +115,411 @@ class OpenCVCamera(CameraInterface):
         self.release()
 
 
+@dataclass
+class CapturedFrame:
+    """A camera frame tagged with when it was captured."""
+    image: np.ndarray
+    timestamp: float  # time.monotonic() when the read completed
+    index: int        # Sequence number (0 = first frame captured)
+
+
+class FrameRingBuffer:
+    """Fixed-size, thread-safe buffer of the most recent frames.
+
+    The writer never blocks: when the buffer is full the oldest unread
+    frame is overwritten and counted as dropped. Unread frames discarded
+    by latest() are counted as skipped.
+
+    Args:
+        capacity: Number of frames kept
+    """
+
+    def __init__(self, capacity: int = 4):
+        self.capacity = max(1, int(capacity))
+        self._frames: Deque[CapturedFrame] = deque(maxlen=self.capacity)
+        self._condition = threading.Condition()
+        self._written = 0
+        self._dropped = 0
+        self._skipped = 0
+
+    def put(self, frame: CapturedFrame) -> None:
+        """Append a frame, dropping the oldest unread one if full."""
+        with self._condition:
+            if len(self._frames) == self.capacity:
+                self._dropped += 1
+            self._frames.append(frame)
+            self._written += 1
+            self._condition.notify_all()
+
+    def latest(self) -> Optional[CapturedFrame]:
+        """Newest unread frame (older unread frames are discarded), or None."""
+        with self._condition:
+            if not self._frames:
+                return None
+            frame = self._frames.pop()
+            self._skipped += len(self._frames)
+            self._frames.clear()
+            return frame
+
+    def drain(self) -> List[CapturedFrame]:
+        """All unread frames, oldest first."""
+        with self._condition:
+            frames = list(self._frames)
+            self._frames.clear()
+            return frames
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until an unread frame is available (False on timeout)."""
+        with self._condition:
+            return self._condition.wait_for(lambda: bool(self._frames), timeout)
+
+    @property
+    def depth(self) -> int:
+        """Number of unread frames."""
+        return len(self._frames)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get buffer counters.
+
+        Returns:
+            Dict with written, dropped, skipped and depth
+        """
+        with self._condition:
+            return {
+                'written': self._written,
+                'dropped': self._dropped,
+                'skipped': self._skipped,
+                'depth': len(self._frames),
+            }
+
+
+class ThreadedCamera(CameraInterface):
+    """Camera wrapper that captures frames on a background thread.
+
+    Frames go into a FrameRingBuffer with monotonic capture timestamps.
+    Use read_latest() or read_all() from the game loop; they never block.
+    capture_frame() keeps the CameraInterface contract (waits for a frame
+    newer than the last one it returned) for calibration and other
+    synchronous callers.
+
+    Args:
+        source: Camera to read from (e.g. OpenCVCamera)
+        buffer_size: Ring buffer capacity in frames
+        frame_timeout: Max seconds capture_frame() waits for a new frame
+    """
+
+    def __init__(self, source: CameraInterface, buffer_size: int = 4,
+                 frame_timeout: float = 1.0):
+        self.source = source
+        self.frame_timeout = frame_timeout
+        self.buffer = FrameRingBuffer(buffer_size)
+        self._newest: Optional[CapturedFrame] = None
+        self._newest_cond = threading.Condition()
+        self._last_returned = -1
+        self._capture_errors = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop,
+                                        name='camera-capture', daemon=True)
+        self._thread.start()
+
+    def _capture_loop(self) -> None:
+        index = 0
+        while self._running:
+            try:
+                image = self.source.capture_frame()
+            except Exception as e:
+                if not self._running:
+                    break
+                self._capture_errors += 1
+                log.warning("Camera capture failed: %s", e)
+                time.sleep(0.01)
+                continue
+            if image is None:
+                continue
+            frame = CapturedFrame(image=image, timestamp=time.monotonic(), index=index)
+            index += 1
+            self.buffer.put(frame)
+            with self._newest_cond:
+                self._newest = frame
+                self._newest_cond.notify_all()
+
+    def read_latest(self) -> Optional[CapturedFrame]:
+        """Newest frame captured since the last read, or None (non-blocking)."""
+        return self.buffer.latest()
+
+    def read_all(self) -> List[CapturedFrame]:
+        """Every frame captured since the last read, oldest first (non-blocking)."""
+        return self.buffer.drain()
+
+    def capture_frame(self) -> np.ndarray:
+        """Wait for a frame newer than the last one returned here."""
+        with self._newest_cond:
+            ready = self._newest_cond.wait_for(
+                lambda: self._newest is not None and self._newest.index > self._last_returned,
+                self.frame_timeout,
+            )
+            if not ready:
+                raise RuntimeError("Failed to capture frame")
+            self._last_returned = self._newest.index
+            return self._newest.image
+
+    def get_resolution(self) -> Tuple[int, int]:
+        """Get resolution of the wrapped camera."""
+        return self.source.get_resolution()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get capture counters.
+
+        Returns:
+            Dict with captured, dropped (overwritten before being read),
+            skipped (passed over by read_latest()), queue_depth and
+            capture_errors
+        """
+        stats = self.buffer.get_stats()
+        return {
+            'captured': stats['written'],
+            'dropped': stats['dropped'],
+            'skipped': stats['skipped'],
+            'queue_depth': stats['depth'],
+            'capture_errors': self._capture_errors,
+        }
+
+    def release(self):
+        """Stop the capture thread and release the wrapped camera."""
+        if self._running:
+            self._running = False
+            self._thread.join(timeout=self.frame_timeout)
+        self.source.release()
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+
+
+def load_timestamps(path: str) -> List[float]:
+    """Read frame timestamps (seconds, one per line; '#' starts a comment)."""
+    timestamps = []
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                timestamps.append(float(line))
+    return timestamps
+
+
+class ReplayCamera(CameraInterface):
+    """Camera that plays back a recording.
+
+    The source is a video file or a directory of images (sorted by name).
+    Frame times come from a timestamps file when one exists (one value in
+    seconds per line: `timestamps.txt` inside an image directory, or
+    `<video stem>.timestamps.txt` next to a video), otherwise from the
+    frame rate.
+
+    In real-time mode frames become available at their recorded pace,
+    starting when the first frame is read, and are tagged with
+    time.monotonic() equivalents like live frames. Otherwise every read
+    returns the next frame immediately, tagged with its recording time
+    (seconds from the first frame), so backends see the original timing
+    while running as fast as they can.
+
+    Args:
+        source: Video file or image directory
+        realtime: Pace frames at the recorded rate
+        fps: Frame rate when there is no timestamps file (defaults to the
+            video's frame rate, or 30 for image sequences)
+        timestamps: Explicit frame times in seconds (overrides the file)
+        loop: Restart from the first frame at the end of the recording
+    """
+
+    def __init__(self, source: str, realtime: bool = False, fps: Optional[float] = None,
+                 timestamps: Optional[Sequence[float]] = None, loop: bool = False):
+        self.source = Path(source)
+        self.realtime = realtime
+        self.loop = loop
+        self._capture: Optional[cv2.VideoCapture] = None
+        self._images: List[Path] = []
+
+        if self.source.is_dir():
+            self._images = sorted(p for p in self.source.iterdir()
+                                  if p.suffix.lower() in IMAGE_EXTENSIONS)
+            if not self._images:
+                raise RuntimeError(f"No images found in {self.source}")
+            frame_count = len(self._images)
+            sidecar = self.source / 'timestamps.txt'
+            first = cv2.imread(str(self._images[0]))
+            if first is None:
+                raise RuntimeError(f"Could not read {self._images[0]}")
+            self._resolution = (first.shape[1], first.shape[0])
+        else:
+            self._capture = cv2.VideoCapture(str(self.source))
+            if not self._capture.isOpened():
+                raise RuntimeError(f"Could not open recording {self.source}")
+            frame_count = int(self._capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            sidecar = self.source.with_suffix('.timestamps.txt')
+            fps = fps or self._capture.get(cv2.CAP_PROP_FPS) or None
+            self._resolution = (int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                                int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+        if timestamps is None and sidecar.exists():
+            timestamps = load_timestamps(str(sidecar))
+        if timestamps is not None:
+            first_time = timestamps[0] if len(timestamps) else 0.0
+            self._timestamps: Optional[List[float]] = [t - first_time for t in timestamps]
+            if frame_count <= 0 or frame_count > len(self._timestamps):
+                frame_count = len(self._timestamps)
+        else:
+            self._timestamps = None
+        self.fps = fps or 30.0
+        self.frame_count = frame_count
+
+        self._index = 0            # Next frame to read within the current pass
+        self._pass_offset = 0.0    # Recording time added per completed loop
+        self._frames_read = 0
+        self._start: Optional[float] = None  # monotonic time of the first frame
+        self.finished = False
+
+    def _recording_time(self, index: int) -> float:
+        if self._timestamps is not None:
+            return self._timestamps[index]
+        return index / self.fps
+
+    def _rewind(self) -> None:
+        self._pass_offset += self._recording_time(self._index - 1) + 1.0 / self.fps
+        self._index = 0
+        if self._capture is not None:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def _decode(self) -> Optional[np.ndarray]:
+        if self._capture is not None:
+            ok, image = self._capture.read()
+            return image if ok else None
+        return cv2.imread(str(self._images[self._index]))
+
+    def read_frame(self, wait: bool = False) -> Optional[CapturedFrame]:
+        """Next frame of the recording.
+
+        Args:
+            wait: In real-time mode, sleep until the next frame is due
+                instead of returning None
+
+        Returns:
+            The frame, or None at the end of the recording (see finished)
+            or, in real-time mode, when the next frame is not due yet
+        """
+        if self.finished:
+            return None
+        if self.frame_count > 0 and self._index >= self.frame_count:
+            if not self.loop:
+                self.finished = True
+                return None
+            self._rewind()
+
+        recorded = self._pass_offset + self._recording_time(self._index)
+        if self.realtime:
+            now = time.monotonic()
+            if self._start is None:
+                self._start = now - recorded
+            due = self._start + recorded
+            if due > now:
+                if not wait:
+                    return None
+                time.sleep(due - now)
+            timestamp = due
+        else:
+            timestamp = recorded
+
+        image = self._decode()
+        if image is None:
+            if self.loop and self._index > 0:
+                self._rewind()
+                return self.read_frame(wait)
+            self.finished = True
+            return None
+
+        frame = CapturedFrame(image=image, timestamp=timestamp, index=self._frames_read)
+        self._index += 1
+        self._frames_read += 1
+        return frame
+
+    def read_available(self) -> List[CapturedFrame]:
+        """All frames due by now in real-time mode (the next frame otherwise)."""
+        if not self.realtime:
+            frame = self.read_frame()
+            return [frame] if frame is not None else []
+        frames = []
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                return frames
+            frames.append(frame)
+
+    def capture_frame(self) -> np.ndarray:
+        """Next frame (waits for it in real-time mode)."""
+        frame = self.read_frame(wait=True)
+        if frame is None:
+            raise RuntimeError("Failed to capture frame")
+        return frame.image
+
+    @property
+    def time_origin(self) -> float:
+        """Frame timestamp corresponding to the start of the recording."""
+        return self._start if self.realtime and self._start is not None else 0.0
+
+    def get_resolution(self) -> Tuple[int, int]:
+        """Resolution of the recording."""
+        return self._resolution
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get playback counters.
+
+        Returns:
+            Dict with frames_read, frame_count (frames per pass, 0 if the
+            video doesn't report it) and finished
+        """
+        return {
+            'frames_read': self._frames_read,
+            'frame_count': self.frame_count,
+            'finished': self.finished,
+        }
+
+    def release(self):
+        """Close the recording."""
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+        self.finished = True
+
+
+def grab_frame(camera: CameraInterface) -> Optional[CapturedFrame]:
+    """Latest frame from any camera, without blocking on a ThreadedCamera.
+
+    Returns None when a ThreadedCamera has no new frame yet (or a
+    ReplayCamera has none due, or reached the end). Other cameras are read
+    synchronously and tagged with the time the read completed.
+    """
+    if isinstance(camera, ThreadedCamera):
+        return camera.read_latest()
+    if isinstance(camera, ReplayCamera):
+        if camera.realtime:
+            frames = camera.read_available()
+            return frames[-1] if frames else None
+        return camera.read_frame()
+    image = camera.capture_frame()
+    if image is None:
+        return None
+    return CapturedFrame(image=image, timestamp=time.monotonic(), index=-1)
+
+
+def grab_frames(camera: CameraInterface) -> List[CapturedFrame]:
+    """All frames since the last call (one synchronous read for plain cameras)."""
+    if isinstance(camera, ThreadedCamera):
+        return camera.read_all()
+    if isinstance(camera, ReplayCamera):
+        return camera.read_available()
+    frame = grab_frame(camera)
+    return [frame] if frame is not None else []
+
+
 if __name__ == "__main__":
     # Test camera capture
     print("Testing OpenCV camera...")
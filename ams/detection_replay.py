@@ -0,0 +1,156 @@
+"""
+Replay recorded footage through a detection backend and score the events.
+
+Drives any DetectionBackend reading from a ReplayCamera until the recording
+ends, timing every frame, and compares the hit events it produced with an
+annotated ground-truth file. Used by benchmarks/bench_detection_replay.py
+to catch detection speed and accuracy regressions without hardware.
+
+Ground-truth files are JSON, with hit times in seconds from the first
+frame and positions in normalized game coordinates:
+
+    {"hits": [{"t": 1.25, "x": 0.41, "y": 0.63}, ...]}
+
+Usage:
+    camera = ReplayCamera('session01/')
+    backend = LaserDetectionBackend(camera, calibration, 1920, 1080)
+    result = run_replay(backend, camera)
+    scores = match_events(result.events, load_ground_truth('session01.json'))
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ams.camera import ReplayCamera
+from ams.detection_backend import DetectionBackend
+from ams.events import PlaneHitEvent
+from ams.object_detection.tracker import solve_assignment
+
+
+@dataclass
+class GroundTruthHit:
+    """An annotated hit: recording time (s) and normalized game position."""
+    timestamp: float
+    x: float
+    y: float
+
+
+@dataclass
+class ReplayResult:
+    """Output of run_replay().
+
+    Event timestamps are converted to recording time (seconds from the
+    first frame), the same clock as ground-truth files.
+    """
+    events: List[PlaneHitEvent]
+    frames: int
+    elapsed: float                                          # Wall seconds
+    frame_ms: List[float] = field(default_factory=list)     # Per update+poll
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def load_ground_truth(path: str) -> List[GroundTruthHit]:
+    """Read a ground-truth JSON file (a {"hits": [...]} object or a bare list)."""
+    with open(path) as f:
+        data = json.load(f)
+    hits = data['hits'] if isinstance(data, dict) else data
+    return sorted((GroundTruthHit(timestamp=float(h['t']), x=float(h['x']), y=float(h['y']))
+                   for h in hits), key=lambda h: h.timestamp)
+
+
+def save_ground_truth(path: str, hits: Sequence[GroundTruthHit]) -> None:
+    """Write hits in the format read by load_ground_truth()."""
+    with open(path, 'w') as f:
+        json.dump({'hits': [{'t': h.timestamp, 'x': h.x, 'y': h.y} for h in hits]}, f, indent=2)
+
+
+def run_replay(backend: DetectionBackend, camera: ReplayCamera,
+               max_frames: Optional[int] = None) -> ReplayResult:
+    """Run a backend over a recording until it ends.
+
+    Each iteration calls backend.update() and backend.poll_events(), which
+    consume one frame in as-fast-as-possible mode. In real-time mode
+    iterations without a due frame just poll again.
+
+    Args:
+        backend: Detection backend reading from camera
+        camera: The backend's ReplayCamera
+        max_frames: Stop after this many frames
+
+    Returns:
+        ReplayResult with events, frame count and timings
+    """
+    events: List[PlaneHitEvent] = []
+    frame_ms: List[float] = []
+    start = time.perf_counter()
+    while not camera.finished:
+        read = camera.get_stats()['frames_read']
+        if max_frames is not None and read >= max_frames:
+            break
+        iteration = time.perf_counter()
+        backend.update(0.0)
+        polled = backend.poll_events()
+        if camera.get_stats()['frames_read'] > read:
+            frame_ms.append((time.perf_counter() - iteration) * 1000)
+        origin = camera.time_origin
+        events.extend(event.model_copy(update={'timestamp': event.timestamp - origin})
+                      for event in polled)
+    elapsed = time.perf_counter() - start
+    return ReplayResult(events=events, frames=len(frame_ms), elapsed=elapsed, frame_ms=frame_ms)
+
+
+def match_events(events: Sequence[PlaneHitEvent], truth: Sequence[GroundTruthHit],
+                 time_tolerance: float = 0.15,
+                 distance_tolerance: float = 0.05) -> Dict[str, Any]:
+    """Score events against ground truth.
+
+    Events and hits are paired one-to-one (global assignment) when they
+    are within time_tolerance seconds and distance_tolerance (normalized
+    units) of each other; cost favours close positions, then close times.
+
+    Returns:
+        Dict with true_positives, false_positives, false_negatives,
+        precision, recall, f1, mean_error (normalized distance of matched
+        pairs) and mean_delay (event time - hit time, seconds)
+    """
+    matched_pairs = []
+    if events and truth:
+        event_xyt = np.array([(e.x, e.y, e.timestamp) for e in events])
+        truth_xyt = np.array([(h.x, h.y, h.timestamp) for h in truth])
+        distance = np.hypot(event_xyt[:, None, 0] - truth_xyt[None, :, 0],
+                            event_xyt[:, None, 1] - truth_xyt[None, :, 1])
+        delay = event_xyt[:, None, 2] - truth_xyt[None, :, 2]
+        valid = (distance <= distance_tolerance) & (np.abs(delay) <= time_tolerance)
+        cost = distance / distance_tolerance + np.abs(delay) / time_tolerance
+        # Penalty above any sum of valid costs: maximize matches first
+        penalty = 2.0 * (min(cost.shape) + 1)
+        rows, cols = solve_assignment(np.where(valid, cost, penalty))
+        keep = valid[rows, cols]
+        matched_pairs = list(zip(rows[keep].tolist(), cols[keep].tolist()))
+
+    tp = len(matched_pairs)
+    fp = len(events) - tp
+    fn = len(truth) - tp
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    errors = [float(np.hypot(events[e].x - truth[h].x, events[e].y - truth[h].y))
+              for e, h in matched_pairs]
+    delays = [events[e].timestamp - truth[h].timestamp for e, h in matched_pairs]
+    return {
+        'true_positives': tp,
+        'false_positives': fp,
+        'false_negatives': fn,
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+        'mean_error': float(np.mean(errors)) if errors else 0.0,
+        'mean_delay': float(np.mean(delays)) if delays else 0.0,
+    }
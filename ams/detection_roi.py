@@ -0,0 +1,110 @@
+"""
+Region of interest for camera detection.
+
+The camera usually sees much more than the projected screen. Detection
+used to process the whole frame and only then throw away detections
+outside the calibrated screen polygon (CalibrationManager.is_within_screen_bounds).
+
+ScreenROI turns that polygon (CalibrationManager.get_screen_bounds()) into
+a bounding rectangle and a polygon mask. Detectors crop the frame to the
+rectangle before color conversion / blur / threshold, and AND the binary
+mask with the polygon before morphology and contours, so pixels outside the
+screen are never processed and every contour found is already inside it:
+no per-detection point-in-polygon test is needed.
+
+Contours are found with offset=roi.offset, so positions stay in full-frame
+camera coordinates.
+
+Usage:
+    roi = ScreenROI.from_calibration(calibration_manager)
+    crop = roi.crop(frame)                       # view, no copy
+    mask = roi.apply_mask(cv2.inRange(hsv, lo, hi))
+    contours, _ = cv2.findContours(mask, ..., offset=roi.offset)
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class ScreenROI:
+    """Crop rectangle and mask for the calibrated screen polygon.
+
+    The rectangle and mask depend on the frame size; they are computed on
+    the first frame and again whenever the size changes.
+
+    Args:
+        polygon: Screen corners in camera pixels, shape (N, 2)
+        margin: Pixels to grow the rectangle and mask by on every side
+    """
+
+    def __init__(self, polygon: np.ndarray, margin: int = 0):
+        self.polygon = np.asarray(polygon, dtype=np.float32).reshape(-1, 2)
+        self.margin = margin
+        self._frame_size: Optional[Tuple[int, int]] = None
+        self.rect: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        self.mask: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_calibration(cls, calibration_manager, margin: int = 0) -> Optional['ScreenROI']:
+        """ROI for a calibration, or None if it has no screen bounds."""
+        if calibration_manager is None:
+            return None
+        bounds = calibration_manager.get_screen_bounds()
+        if bounds is None:
+            return None
+        return cls(bounds.to_numpy_polygon(), margin)
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Top-left corner of the crop in frame coordinates."""
+        return self.rect[0], self.rect[1]
+
+    def prepare(self, frame_shape: Tuple[int, ...]) -> None:
+        """Compute the rectangle and mask for frames of this shape."""
+        height, width = frame_shape[:2]
+        if self._frame_size == (width, height):
+            return
+        self._frame_size = (width, height)
+
+        x0, y0 = np.floor(self.polygon.min(axis=0)).astype(int) - self.margin
+        x1, y1 = np.ceil(self.polygon.max(axis=0)).astype(int) + self.margin + 1
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(width, x1), min(height, y1)
+        self.rect = (int(x0), int(y0), int(max(0, x1 - x0)), int(max(0, y1 - y0)))
+
+        x, y, w, h = self.rect
+        mask = np.zeros((h, w), dtype=np.uint8)
+        points = np.round(self.polygon - (x, y)).astype(np.int32)
+        cv2.fillPoly(mask, [points], 255)
+        if self.margin:
+            size = 2 * self.margin + 1
+            mask = cv2.dilate(mask, np.ones((size, size), np.uint8))
+        self.mask = mask
+
+    def crop(self, frame: np.ndarray) -> np.ndarray:
+        """View of the frame restricted to the ROI rectangle."""
+        self.prepare(frame.shape)
+        x, y, w, h = self.rect
+        return frame[y:y + h, x:x + w]
+
+    def apply_mask(self, binary: np.ndarray) -> np.ndarray:
+        """Clear pixels of a cropped binary image outside the polygon (in place)."""
+        return cv2.bitwise_and(binary, self.mask, dst=binary)
+
+    def expand(self, cropped: np.ndarray) -> np.ndarray:
+        """Place a cropped image back into a zeroed full-frame image (debug views)."""
+        width, height = self._frame_size
+        full = np.zeros((height, width) + cropped.shape[2:], dtype=cropped.dtype)
+        x, y, w, h = self.rect
+        full[y:y + h, x:x + w] = cropped
+        return full
+
+    @property
+    def area_fraction(self) -> float:
+        """Fraction of the frame's pixels inside the crop rectangle."""
+        if self._frame_size is None:
+            return 1.0
+        width, height = self._frame_size
+        return (self.rect[2] * self.rect[3]) / (width * height) if width and height else 1.0
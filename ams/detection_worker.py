@@ -0,0 +1,417 @@
+"""
+Detection worker process for camera-based backends.
+
+Laser thresholding and blob detection (HSV conversion, morphology,
+contours) are CPU heavy and used to run inside the pygame process, between
+game updates. DetectionWorkerBackend moves them to a separate process: the
+worker builds the real backend (camera + detector) from a factory, runs its
+update()/poll_events() loop as fast as the camera delivers frames, and
+sends PlaneHitEvents back over a queue. The game process only drains the
+queue, so detection runs on another core.
+
+Debug frames (when debug mode is on) are published through a
+SharedFrameBuffer, a shared-memory slot the worker overwrites and the game
+process copies out of, instead of pickling images through a pipe.
+
+Hit timestamps are time.monotonic() values from the worker; on Linux,
+macOS and Windows the monotonic clock is system-wide, so they are directly
+comparable with the game process clock (rollback, temporal state).
+
+Usage:
+    factory = functools.partial(build_laser_backend, camera_id=0, ...)
+    backend = DetectionWorkerBackend(factory, 1920, 1080)
+    ams = AMSSession(backend=backend)
+    ...
+    backend.close()
+
+The factory runs in the worker process, so it must be picklable (a
+module-level function or functools.partial of one).
+"""
+
+import math
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ams.detection_backend import DetectionBackend
+from ams.events import PlaneHitEvent, CalibrationResult
+from ams.logging import get_logger
+
+log = get_logger('detection_worker')
+
+# Largest frame the shared buffer holds by default (height, width, channels)
+DEFAULT_FRAME_SHAPE = (1080, 1920, 3)
+
+# Shared buffer header: sequence, height, width, channels (int64) + timestamp (float64)
+_HEADER_BYTES = 64
+
+# Worker counters: polls, events, dropped events, last poll ms, frames published
+_COUNTERS = 5
+
+# Optional backend methods DetectionWorkerBackend proxies to the worker
+_FORWARDED_METHODS = ('toggle_bw_mode', 'set_brightness_threshold')
+
+# Max seconds the worker blocks waiting for a threaded camera frame, so it
+# still notices stop requests and commands while the camera is idle
+FRAME_WAIT = 0.05
+
+
+class SharedFrameBuffer:
+    """Single-slot uint8 frame buffer in shared memory.
+
+    One process writes, any number read. A sequence counter (odd while a
+    write is in progress) lets readers detect torn reads and retry, so no
+    lock is shared between processes. Frames of any shape up to the
+    capacity fit; larger ones are rejected.
+
+    Args:
+        max_shape: Largest (height, width, channels) frame to hold
+        name: Name of an existing buffer to attach to (None creates one)
+    """
+
+    def __init__(self, max_shape: Tuple[int, ...] = DEFAULT_FRAME_SHAPE,
+                 name: Optional[str] = None):
+        self.max_shape = tuple(max_shape)
+        self.capacity = math.prod(self.max_shape)
+        self._owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner,
+                                               size=_HEADER_BYTES + self.capacity)
+        self._header = np.ndarray((4,), dtype=np.int64, buffer=self._shm.buf)
+        self._timestamp = np.ndarray((1,), dtype=np.float64, buffer=self._shm.buf, offset=32)
+        self._data = np.ndarray((self.capacity,), dtype=np.uint8, buffer=self._shm.buf,
+                                offset=_HEADER_BYTES)
+        if self._owner:
+            self._header[:] = 0
+            self._timestamp[0] = 0.0
+
+    @property
+    def name(self) -> str:
+        """Shared memory name, for attaching from another process."""
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """Write counter (even when no write is in progress)."""
+        return int(self._header[0])
+
+    def write(self, frame: np.ndarray, timestamp: float) -> bool:
+        """Publish a frame (False if it is not uint8 or exceeds capacity)."""
+        if frame.dtype != np.uint8 or frame.size > self.capacity or frame.ndim not in (2, 3):
+            return False
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 0
+        self._header[0] += 1  # odd: write in progress
+        self._header[1:4] = (height, width, channels)
+        self._timestamp[0] = timestamp
+        self._data[:frame.size] = frame.reshape(-1)
+        self._header[0] += 1
+        return True
+
+    def read(self, after: int = 0) -> Optional[Tuple[np.ndarray, float, int]]:
+        """Copy of the latest frame if it is newer than sequence `after`.
+
+        Returns:
+            (frame, timestamp, sequence), or None if nothing newer was written
+        """
+        while True:
+            sequence = int(self._header[0])
+            if sequence % 2:
+                time.sleep(0)
+                continue
+            if sequence <= after:
+                return None
+            height, width, channels = (int(v) for v in self._header[1:4])
+            shape = (height, width, channels) if channels else (height, width)
+            frame = self._data[:math.prod(shape)].reshape(shape).copy()
+            timestamp = float(self._timestamp[0])
+            if int(self._header[0]) == sequence:
+                return frame, timestamp, sequence
+
+    def close(self) -> None:
+        """Detach from the buffer (and free it if this process created it)."""
+        # Views must go before the mapping can be closed
+        self._header = self._timestamp = self._data = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class DetectionWorkerBackend(DetectionBackend):
+    """DetectionBackend that runs another backend in a worker process.
+
+    The worker owns the camera and detector; this object is what the game
+    and AMSSession see. poll_events() never blocks: it returns the hits the
+    worker produced since the last poll.
+
+    Calibration draws on the game display, which the worker does not own,
+    so calibrate() is not available in worker mode: calibrate with the
+    in-process backend first (the factory loads the saved calibration).
+
+    The constructor waits for the worker to build its backend and raises
+    RuntimeError if the factory fails (e.g. no camera), so callers can fall
+    back to another backend as they would for an in-process one.
+
+    toggle_bw_mode() and set_brightness_threshold() forward to the worker's
+    backend when it has them (laser backends). brightness_threshold is a
+    local mirror of the last value sent, so callers can step it without a
+    round trip to the worker.
+
+    Args:
+        factory: Picklable callable building the real DetectionBackend
+            (run in the worker process)
+        display_width: Display width in pixels
+        display_height: Display height in pixels
+        frame_shape: Largest debug frame shared back (height, width, channels)
+        queue_size: Max hits buffered between polls (extra hits are dropped)
+        poll_interval: Seconds the worker sleeps between polls (0 relies on
+            the camera to pace the loop: capture_frame() blocks, and with a
+            ThreadedCamera the worker waits on its frame buffer)
+        startup_timeout: Max seconds to wait for the worker's backend
+
+    Raises:
+        RuntimeError: If the worker could not build its backend in time
+    """
+
+    def __init__(self, factory: Callable[[], DetectionBackend],
+                 display_width: int, display_height: int,
+                 frame_shape: Tuple[int, ...] = DEFAULT_FRAME_SHAPE,
+                 queue_size: int = 256, poll_interval: float = 0.0,
+                 startup_timeout: float = 10.0):
+        super().__init__(display_width, display_height)
+        context = multiprocessing.get_context()
+        self.debug_mode = False
+        self.frames = SharedFrameBuffer(frame_shape)
+        self._events = context.Queue(maxsize=queue_size)
+        self._commands = context.Queue()
+        self._status = context.Queue()
+        self._stop = context.Event()
+        self._counters = context.Array('d', _COUNTERS)
+        self._frame_sequence = 0
+        self._debug_frame: Optional[np.ndarray] = None
+        self._received = 0
+        self._exit_reported = False
+        self._remote_methods: frozenset = frozenset()
+        self.brightness_threshold = 0
+        self._process = context.Process(
+            target=_worker_main,
+            args=(factory, self._events, self._commands, self._status, self._stop,
+                  self.frames.name, self.frames.max_shape, self._counters, poll_interval),
+            name='detection-worker',
+            daemon=True,
+        )
+        self._process.start()
+        error = self._wait_until_ready(startup_timeout)
+        if error is not None:
+            self.close()
+            raise RuntimeError(f"Detection worker failed to start: {error}")
+
+    def _wait_until_ready(self, timeout: float) -> Optional[str]:
+        """Wait for the worker's startup report (None once its backend is built)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                kind, detail = self._status.get(timeout=0.1)
+            except queue.Empty:
+                if not self.alive:
+                    return f"worker exited (exit code {self._process.exitcode})"
+                if time.monotonic() >= deadline:
+                    return f"no response within {timeout:g}s"
+                continue
+            if kind == 'error':
+                return detail
+            self._remote_methods = frozenset(detail['methods'])
+            if detail['brightness_threshold'] is not None:
+                self.brightness_threshold = detail['brightness_threshold']
+            return None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self._process.is_alive()
+
+    def poll_events(self) -> List[PlaneHitEvent]:
+        """Hits produced by the worker since the last poll (non-blocking)."""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+        self._received += len(events)
+        return events
+
+    def update(self, dt: float):
+        """Report the worker exiting (detection itself runs in the worker)."""
+        if not self._exit_reported and not self.alive:
+            self._exit_reported = True
+            log.error("Detection worker exited (exit code %s)", self._process.exitcode)
+
+    def calibrate(self, display_surface=None, display_resolution=None, **kwargs) -> CalibrationResult:
+        """Calibration is not available while detection runs in a worker."""
+        return CalibrationResult(
+            success=False,
+            method="detection_worker",
+            notes="Calibration needs the in-process backend; run without the "
+                  "detection worker to calibrate",
+        )
+
+    def call(self, method: str, *args, **kwargs) -> None:
+        """Call a method on the worker's backend (fire and forget)."""
+        self._commands.put((method, args, kwargs))
+
+    def set_debug_mode(self, enabled: bool) -> None:
+        """Enable/disable debug visualization in the worker."""
+        self.debug_mode = enabled
+        if not enabled:
+            self._debug_frame = None
+        self.call('set_debug_mode', enabled)
+
+    def toggle_bw_mode(self) -> None:
+        """Toggle the worker backend's B/W threshold view (if it has one)."""
+        if 'toggle_bw_mode' in self._remote_methods:
+            self.call('toggle_bw_mode')
+
+    def set_brightness_threshold(self, threshold: int) -> None:
+        """Set the worker backend's brightness threshold (if it has one).
+
+        Args:
+            threshold: Brightness threshold (clamped to 0-255 here; the
+                backend may clamp it further)
+        """
+        if 'set_brightness_threshold' not in self._remote_methods:
+            return
+        self.brightness_threshold = max(0, min(255, int(threshold)))
+        self.call('set_brightness_threshold', self.brightness_threshold)
+
+    def set_game_targets(self, targets: List[Tuple[float, float, float, Tuple[int, int, int]]]) -> None:
+        """Forward game targets for the debug overlay."""
+        self.call('set_game_targets', targets)
+
+    def get_debug_frame(self) -> Optional[np.ndarray]:
+        """Latest debug frame published by the worker, or None."""
+        if not self.debug_mode:
+            return None
+        latest = self.frames.read(self._frame_sequence)
+        if latest is not None:
+            self._debug_frame, _, self._frame_sequence = latest
+        return self._debug_frame
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get worker statistics.
+
+        Returns:
+            Dict with alive, polls (worker loop iterations), events_sent,
+            events_received, events_dropped (queue full), poll_ms (last
+            worker poll) and frames_published
+        """
+        with self._counters.get_lock():
+            polls, sent, dropped, poll_ms, frames = self._counters[:]
+        return {
+            'alive': self.alive,
+            'polls': int(polls),
+            'events_sent': int(sent),
+            'events_received': self._received,
+            'events_dropped': int(dropped),
+            'poll_ms': poll_ms,
+            'frames_published': int(frames),
+        }
+
+    def get_backend_info(self) -> dict:
+        info = super().get_backend_info()
+        info['supports_calibration'] = False
+        info['worker_pid'] = self._process.pid
+        return info
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Stop the worker (which releases the camera) and free shared memory."""
+        if self.frames is None:
+            return
+        self._stop.set()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            log.warning("Detection worker did not stop; terminating")
+            self._process.terminate()
+            self._process.join(timeout)
+        if self._process.is_alive():
+            # A forked worker inherits SDL's SIGTERM handler once pygame is
+            # initialised, which turns terminate() into a queued quit event
+            self._process.kill()
+            self._process.join(timeout)
+        self._events.cancel_join_thread()
+        self._commands.cancel_join_thread()
+        self._status.cancel_join_thread()
+        self._debug_frame = None
+        self.frames.close()
+        self.frames = None
+
+
+def _worker_main(factory, events, commands, status, stop, frame_name, frame_shape,
+                 counters, poll_interval):
+    """Worker process loop: poll the real backend and forward its hits."""
+    frames = SharedFrameBuffer(frame_shape, name=frame_name)
+    backend = None
+    try:
+        try:
+            backend = factory()
+        except Exception as e:
+            log.error("Detection worker could not build its backend: %s", e)
+            status.put(('error', f"{type(e).__name__}: {e}"))
+            return
+        status.put(('ready', {
+            'methods': [name for name in _FORWARDED_METHODS
+                        if callable(getattr(backend, name, None))],
+            'brightness_threshold': getattr(backend, 'brightness_threshold', None),
+        }))
+        # ThreadedCamera reads never block; wait on its buffer instead of spinning
+        frame_buffer = getattr(getattr(backend, 'camera', None), 'buffer', None)
+        last_frame = None
+        previous = time.monotonic()
+        while not stop.is_set():
+            _run_commands(backend, commands)
+            started = time.monotonic()
+            backend.update(started - previous)
+            previous = started
+            hits = backend.poll_events()
+            dropped = 0
+            for hit in hits:
+                try:
+                    events.put_nowait(hit)
+                except queue.Full:
+                    dropped += 1
+            published = 0
+            if getattr(backend, 'debug_mode', False):
+                frame = backend.get_debug_frame()
+                if frame is not None and frame is not last_frame:
+                    published = int(frames.write(frame, started))
+                    last_frame = frame
+            with counters.get_lock():
+                counters[0] += 1
+                counters[1] += len(hits) - dropped
+                counters[2] += dropped
+                counters[3] = (time.monotonic() - started) * 1000
+                counters[4] += published
+            if poll_interval:
+                stop.wait(poll_interval)
+            elif frame_buffer is not None:
+                frame_buffer.wait(FRAME_WAIT)
+    finally:
+        camera = getattr(backend, 'camera', None)
+        if camera is not None:
+            camera.release()
+        frames.close()
+
+
+def _run_commands(backend: DetectionBackend, commands) -> None:
+    while True:
+        try:
+            method, args, kwargs = commands.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            getattr(backend, method)(*args, **kwargs)
+        except Exception as e:
+            log.warning("Detection worker command %s failed: %s", method, e)
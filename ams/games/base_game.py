@@ -322,6 +322,22 @@ class BaseGame(ABC):
         """
         pass
 
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Screen regions changed by the last render().
+
+        Game loops present these with pygame.display.update(rects). None
+        (the default) means the whole screen may have changed, so present
+        with pygame.display.flip().
+        """
+        return None
+
+    def invalidate_display(self) -> None:
+        """Note that the screen was drawn over or resized outside render().
+
+        Games that track dirty regions repaint everything on the next frame.
+        """
+        pass
+
     # =========================================================================
     # Quiver/Retrieval Support
     # =========================================================================
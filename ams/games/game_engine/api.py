@@ -19,6 +19,8 @@ from ams.logging import get_logger
 
 if TYPE_CHECKING:
     from ams.lua.engine import LuaEngine
+    from ams.games.game_engine.entity_index import EntityIndex
+    from ams.games.game_engine.lua_mirror import LuaEntityMirror
 
 log = get_logger('game_lua_api')
 
@@ -31,6 +33,8 @@ class GameLuaAPI(LuaAPIBase):
     on entities by ID to maintain the sandbox boundary.
 
     The spawn_handler and transform_handler are set by GameEngine during setup.
+    GameEngine also shares its EntityIndex so type/tag queries avoid full scans;
+    without one (e.g. a bare LuaEngine) queries scan engine.entities.
     """
 
     def __init__(self, engine: 'LuaEngine'):
@@ -38,6 +42,7 @@ class GameLuaAPI(LuaAPIBase):
         self._spawn_handler: Optional[Callable] = None
         self._transform_handler: Optional[Callable] = None
         self._lose_life_handler: Optional[Callable] = None
+        self._entity_index: Optional['EntityIndex'] = None
 
     def set_spawn_handler(self, handler: Callable) -> None:
         """Set the spawn handler (called by GameEngine during setup)."""
@@ -51,6 +56,19 @@ class GameLuaAPI(LuaAPIBase):
         """Set the lose_life handler (called by GameEngine during setup)."""
         self._lose_life_handler = handler
 
+    def set_entity_index(self, index: 'EntityIndex') -> None:
+        """Set the entity index used by type/tag queries (called by GameEngine)."""
+        self._entity_index = index
+
+    def create_entity_mirror(self) -> 'LuaEntityMirror':
+        """Install Lua-side entity mirroring on the ams.* namespace.
+
+        Wraps the field accessors registered by register_api(), so call it
+        after the LuaEngine is set up (see LuaEntityMirror).
+        """
+        from ams.games.game_engine.lua_mirror import LuaEntityMirror
+        return LuaEntityMirror(self._lua, self._lua.globals().ams)
+
     def register_api(self, ams_namespace) -> None:
         """Register game API methods on the ams.* namespace."""
         # Register base methods first
@@ -107,6 +125,9 @@ class GameLuaAPI(LuaAPIBase):
         ams_namespace.get_children = self.get_children
         ams_namespace.has_parent = self.has_parent
 
+        # Entity tables, filled during on_update when LuaEntityMirror is on
+        ams_namespace.entities = self._lua.table()
+
     # =========================================================================
     # Entity Access - Transform
     # =========================================================================
@@ -220,6 +241,7 @@ class GameLuaAPI(LuaAPIBase):
         entity = self._engine.get_entity(entity_id)
         if entity:
             entity.destroy()
+            self._engine.notify_destroyed(entity_id)
 
     @profiling.profile("lua_api", "ams.transform")
     def transform(self, entity_id: str, into_type: str) -> bool:
@@ -299,6 +321,8 @@ class GameLuaAPI(LuaAPIBase):
 
         Returns a 1-indexed Lua table, suitable for ipairs iteration.
         """
+        if self._entity_index is not None:
+            return [e.id for e in self._entity_index.of_type(entity_type)]
         return [e.id for e in self._engine.entities.values()
                 if e.entity_type == entity_type and e.alive]
 
@@ -308,6 +332,8 @@ class GameLuaAPI(LuaAPIBase):
 
         Returns a 1-indexed Lua table, suitable for ipairs iteration.
         """
+        if self._entity_index is not None:
+            return [e.id for e in self._entity_index.with_tag(tag)]
         return [e.id for e in self._engine.entities.values()
                 if tag in e.tags and e.alive]
 
@@ -321,6 +347,8 @@ class GameLuaAPI(LuaAPIBase):
 
     def count_entities_by_tag(self, tag: str) -> int:
         """Count alive entities with a given tag."""
+        if self._entity_index is not None:
+            return self._entity_index.count_tag(tag)
         return sum(1 for e in self._engine.entities.values()
                    if tag in e.tags and e.alive)
 
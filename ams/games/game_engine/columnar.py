@@ -0,0 +1,238 @@
+"""
+Columnar entity store - struct-of-arrays backing for GameEntity transforms.
+
+With the store enabled (GameEngine(columnar_store=True)), entities are
+ColumnarEntity instances whose x/y/vx/vy/width/height/alive live in shared
+NumPy arrays instead of per-object attributes. Reading or writing
+entity.x still works (Lua API, rollback, rendering), while whole-frame
+operations run as array maths:
+
+- integrate():     position += velocity * dt for every live row
+- exited_screen(): screen-bounds test for a set of rows
+- overlaps():      AABB test of one row against many rows
+
+Rows are recycled through a free list. When an entity is released its
+current values are copied back onto the object, so stale references
+(e.g. held by tests or callbacks) keep reading sensible values.
+
+NumPy is only imported when the store is enabled, so browser builds
+without NumPy are unaffected.
+
+Usage:
+    store = ColumnarStore()
+    entity = ColumnarEntity(id='ball_1', entity_type='ball', store=store)
+    store.integrate(dt)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ams.games.game_engine.entity import GameEntity
+
+# Float columns shadowed by ColumnarEntity properties
+FLOAT_COLUMNS = ('x', 'y', 'vx', 'vy', 'width', 'height')
+
+
+class ColumnarStore:
+    """Struct-of-arrays storage for entity transforms and liveness.
+
+    Args:
+        capacity: Initial number of rows (grows by doubling)
+    """
+
+    def __init__(self, capacity: int = 256):
+        capacity = max(1, int(capacity))
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.width = np.zeros(capacity)
+        self.height = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Row is owned by an entity
+        self.active = np.zeros(capacity, dtype=bool)
+
+        self._owners: List[Optional['ColumnarEntity']] = [None] * capacity
+        self._free: List[int] = []
+        # Rows [0, _high) have been handed out at least once
+        self._high = 0
+
+    def __len__(self) -> int:
+        return self._high - len(self._free)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.x)
+
+    # =========================================================================
+    # Row management
+    # =========================================================================
+
+    def allocate(self, owner: 'ColumnarEntity') -> int:
+        """Reserve a row for an entity and return its index."""
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._high == self.capacity:
+                self._grow()
+            row = self._high
+            self._high += 1
+        self.active[row] = True
+        self._owners[row] = owner
+        return row
+
+    def release(self, entity: 'ColumnarEntity') -> None:
+        """Detach an entity from the store and recycle its row."""
+        row = entity._row
+        if row is None or self._owners[row] is not entity:
+            return
+        entity._detach()
+        self.active[row] = False
+        self.alive[row] = False
+        self._owners[row] = None
+        self._free.append(row)
+
+    def retain(self, entities: Sequence[Any]) -> None:
+        """Release every row whose owner is not in entities."""
+        keep = {id(e) for e in entities}
+        for owner in list(self._owners[:self._high]):
+            if owner is not None and id(owner) not in keep:
+                self.release(owner)
+
+    def clear(self) -> None:
+        """Release all rows."""
+        for owner in list(self._owners[:self._high]):
+            if owner is not None:
+                self.release(owner)
+        self._free.clear()
+        self._high = 0
+
+    def _grow(self) -> None:
+        capacity = self.capacity * 2
+        for name in FLOAT_COLUMNS + ('alive', 'active'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self._owners.extend([None] * (capacity - len(self._owners)))
+
+    def rows_of(self, entities: Sequence[Any]) -> Optional[np.ndarray]:
+        """Row indices for entities, or None if any is not store-backed.
+
+        Assumes a single store per engine: any ColumnarEntity with a row
+        is taken to belong to this store.
+        """
+        try:
+            return np.fromiter((e._row for e in entities), dtype=np.intp,
+                               count=len(entities))
+        except (AttributeError, TypeError):
+            # System entity without _row, or a released entity (_row is None)
+            return None
+
+    # =========================================================================
+    # Batched operations
+    # =========================================================================
+
+    def integrate(self, dt: float) -> None:
+        """Advance positions of all live rows by velocity * dt."""
+        n = self._high
+        if not n:
+            return
+        live = self.active[:n] & self.alive[:n]
+        np.add(self.x[:n], self.vx[:n] * dt, out=self.x[:n], where=live)
+        np.add(self.y[:n], self.vy[:n] * dt, out=self.y[:n], where=live)
+
+    def exited_screen(self, rows: np.ndarray, edge: str,
+                      screen_width: float, screen_height: float) -> np.ndarray:
+        """Mask of rows whose AABB is fully past the given screen edge.
+
+        Matches GameEngine._check_exited_screen_condition: 'any' tests all
+        four edges.
+        """
+        x = self.x[rows]
+        y = self.y[rows]
+        exited = np.zeros(len(rows), dtype=bool)
+        if edge in ('bottom', 'any'):
+            exited |= y > screen_height
+        if edge in ('top', 'any'):
+            exited |= (y + self.height[rows]) < 0
+        if edge in ('left', 'any'):
+            exited |= (x + self.width[rows]) < 0
+        if edge in ('right', 'any'):
+            exited |= x > screen_width
+        return exited
+
+    def overlaps(self, row: int, rows: np.ndarray) -> np.ndarray:
+        """Mask of rows whose AABB overlaps the AABB of row."""
+        ax = self.x[row]
+        ay = self.y[row]
+        bx = self.x[rows]
+        by = self.y[rows]
+        return ((ax < bx + self.width[rows]) &
+                (ax + self.width[row] > bx) &
+                (ay < by + self.height[rows]) &
+                (ay + self.height[row] > by))
+
+
+def _column(name: str) -> property:
+    """Property reading/writing a store column (or detached value)."""
+
+    def get(self):
+        row = self._row
+        if row is None:
+            return self._detached[name]
+        return getattr(self._store, name)[row].item()
+
+    def set(self, value):
+        row = self._row
+        if row is None:
+            self._detached[name] = value
+        else:
+            getattr(self._store, name)[row] = value
+
+    return property(get, set, doc=f"{name} (stored in ColumnarStore.{name})")
+
+
+class ColumnarEntity(GameEntity):
+    """GameEntity whose transform and liveness live in a ColumnarStore row.
+
+    Constructed like GameEntity plus a store keyword argument.
+    """
+
+    def __init__(self, *args, store: ColumnarStore, **kwargs):
+        # Row must exist before the dataclass __init__ assigns x/y/alive
+        self._store = store
+        self._detached: Dict[str, Any] = {}
+        self._alive = True
+        self._row: Optional[int] = store.allocate(self)
+        super().__init__(*args, **kwargs)
+
+    def _detach(self) -> None:
+        """Copy column values onto the object and drop the row."""
+        row = self._row
+        if row is None:
+            return
+        store = self._store
+        self._detached = {name: getattr(store, name)[row].item()
+                          for name in FLOAT_COLUMNS}
+        self._row = None
+
+    # alive is read far more often than written (every index query), so the
+    # object keeps its own copy and mirrors writes into the column
+    @property
+    def alive(self) -> bool:
+        return self._alive
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        self._alive = value
+        if self._row is not None:
+            self._store.alive[self._row] = value
+
+    x = _column('x')
+    y = _column('y')
+    vx = _column('vx')
+    vy = _column('vy')
+    width = _column('width')
+    height = _column('height')
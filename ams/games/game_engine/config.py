@@ -1,7 +1,7 @@
 """Configuration dataclasses for game engine YAML definitions."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 
 @dataclass
@@ -59,6 +59,9 @@ class RenderCommand:
     # Conditional rendering:
     when: Optional[RenderWhen] = None  # Only render if condition is true
     stop: bool = False  # If true, stop processing further render commands after this one
+    # Compiled at load time (entity.compile_when / compile_sprite_template):
+    when_check: Optional[Callable[[Any, float], bool]] = field(default=None, repr=False, compare=False)
+    sprite_template: Optional[Callable[[Any], str]] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
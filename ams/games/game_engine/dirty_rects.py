@@ -0,0 +1,121 @@
+"""
+DirtyRectTracker - changed screen regions between rendered frames.
+
+With dirty-rect rendering enabled (GameEngine(dirty_rects=True)), each
+frame the renderer reports, for every drawable item (entity or HUD), the
+screen rectangle it covers and a signature of everything that affects its
+pixels (position, resolved colors, text, sprite frame, ...). The tracker
+compares these with the previous frame and returns the regions that need
+repainting: the old and new rectangles of every item that changed,
+appeared or disappeared, merged where they overlap.
+
+When the dirty regions cover more than `threshold` of the screen (or on
+the first frame / after invalidate()), compute() returns None and the
+caller does a full redraw instead.
+
+Usage:
+    tracker = DirtyRectTracker(threshold=0.5)
+    rects = tracker.compute(states, screen.get_rect())
+    if rects is None:
+        ...  # full redraw, pygame.display.flip()
+    else:
+        ...  # repaint rects, pygame.display.update(rects)
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+# Per-item render state: (screen rect, signature)
+ItemState = Tuple[pygame.Rect, Hashable]
+
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Merge overlapping rectangles until none overlap."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectTracker:
+    """Tracks item render states across frames and derives dirty regions.
+
+    Args:
+        threshold: Fraction of the screen area above which a full redraw
+            is cheaper than repainting the dirty regions
+    """
+
+    def __init__(self, threshold: float = 0.5):
+        self.threshold = threshold
+        self._previous: Optional[Dict[Any, ItemState]] = None
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._frames = 0
+        self._full_redraws = 0
+        self._dirty_fraction = 1.0
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next compute()."""
+        self._previous = None
+
+    def compute(self, states: Dict[Any, ItemState],
+                screen_rect: pygame.Rect) -> Optional[List[pygame.Rect]]:
+        """Dirty regions for this frame, or None for a full redraw.
+
+        Args:
+            states: Item key -> (rect, signature) for everything drawn this frame
+            screen_rect: Rectangle of the target surface
+
+        Returns:
+            Non-overlapping rectangles clipped to the screen (possibly empty),
+            or None when the whole screen should be redrawn
+        """
+        self._frames += 1
+        previous = self._previous
+        self._previous = states
+        screen_size = screen_rect.size
+        if previous is None or screen_size != self._screen_size:
+            self._screen_size = screen_size
+            return self._full_redraw()
+
+        changed: List[pygame.Rect] = []
+        for key, (rect, signature) in states.items():
+            old = previous.get(key)
+            if old is None:
+                changed.append(rect)
+            elif old[1] != signature or old[0] != rect:
+                changed.append(old[0])
+                changed.append(rect)
+        for key, (rect, _) in previous.items():
+            if key not in states:
+                changed.append(rect)
+
+        rects = [r for r in (rect.clip(screen_rect) for rect in merge_rects(changed)) if r.w and r.h]
+        area = sum(r.w * r.h for r in rects)
+        screen_area = screen_rect.w * screen_rect.h
+        self._dirty_fraction = area / screen_area if screen_area else 1.0
+        if self._dirty_fraction > self.threshold:
+            return self._full_redraw()
+        return rects
+
+    def _full_redraw(self) -> None:
+        self._full_redraws += 1
+        self._dirty_fraction = 1.0
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracker statistics.
+
+        Returns:
+            Dict with frames, full_redraws and dirty_fraction (last frame)
+        """
+        return {
+            'frames': self._frames,
+            'full_redraws': self._full_redraws,
+            'dirty_fraction': self._dirty_fraction,
+        }
@@ -36,7 +36,8 @@ from ams.games.game_state import GameState
 from ams.games.input.input_event import InputEvent
 from ams.lua import LuaEngine, Entity
 from ams.games.game_engine.api import GameLuaAPI
-from ams.games.game_engine.entity import GameEntity
+from ams.games.game_engine.entity import GameEntity, compile_sprite_template, compile_when
+from ams.games.game_engine.entity_index import EntityIndex
 from ams.games.game_engine.schema import SchemaValidationError, validate_game_yaml
 from ams.games.game_engine.lua.behavior_loader import BehaviorLoader
 from ams.games.game_engine.config import (
@@ -61,6 +62,8 @@ from ams.games.game_engine.config import (
     WhenCondition,
 )
 from ams.games.game_engine.renderer import GameEngineRenderer
+from ams.games.game_engine.dirty_rects import DirtyRectTracker
+from ams.games.game_engine.spatial_hash import SpatialHash
 from ams.games.game_engine.rollback import RollbackStateManager, create_logger
 from ams import profiling
 from ams.interactions import InteractionEngine, Entity as InteractionEntity, LuaActionHandler
@@ -68,6 +71,8 @@ from ams.games.game_engine.lua.script_loader import VALID_SUBROUTINE_TYPES
 
 if TYPE_CHECKING:
     from ams.content_fs import ContentFS
+    from ams.games.game_engine.columnar import ColumnarStore
+    from ams.games.game_engine.lua_mirror import LuaEntityMirror
 
 
 class GameEngine(BaseGame):
@@ -88,10 +93,82 @@ class GameEngine(BaseGame):
         Hits within ROLLBACK_THRESHOLD (default 100ms) are processed immediately.
         Older hits trigger rollback → apply hit → re-simulate to present.
 
+        When several hits can arrive per frame (e.g. a volley detected in one
+        camera frame), queue them with queue_delayed_hit(). The next update()
+        processes the queue with a single rollback to the earliest hit, and
+        applies each hit at its own frame during that re-simulation.
+
         Configure via __init__ kwargs:
         - rollback_enabled: Enable/disable rollback (default: True)
         - rollback_history: Seconds of history to keep (default: 2.0)
         - rollback_threshold: Skip rollback for hits newer than this (default: 0.1)
+        - rollback_snapshot_mode: 'full' or 'delta' (keyframes + deltas) (default: 'full')
+        - rollback_keyframe_interval: Captures per keyframe in delta mode (default: 30)
+        - rollback_headless: Re-simulate with headless frames (no skin update,
+          sound playback or profiling) except the last one (default: True).
+          Sounds from the window play in order on the last frame, within the
+          same update() call as before; only skins that animate in update()
+          see one skin update per rollback instead of one per frame
+
+    Collision Broadphase:
+        Legacy collision rules (collisions / collision_behaviors) use a uniform
+        grid rebuilt once per frame, so only nearby pairs reach the AABB test.
+
+        Configure via __init__ kwargs:
+        - broadphase_enabled: Use the grid instead of all-pairs (default: True)
+        - broadphase_cell_size: Grid cell size in pixels (default: 64)
+        - interaction_spatial_index: Let distance-bounded interactions query
+          only targets in range (default: True)
+
+    Columnar Entity Store:
+        Optionally keeps entity transforms in NumPy arrays (ColumnarStore) so
+        physics, exited_screen lose checks and AABB tests run as batched
+        array operations. Entities remain usable as GameEntity.
+
+        Legacy collision narrowphase with the store:
+        - broadphase off: each entity is tested against all of the other
+          side's rows in one array operation
+        - broadphase on (default): grid candidates are tested as rows when
+          there are at least COLUMNAR_CANDIDATE_MIN of them; shorter
+          candidate lists use the per-pair test, which is cheaper than
+          building a row array for a handful of entities
+
+        Configure via __init__ kwargs:
+        - columnar_store: Store transforms in arrays (default: False)
+
+    Dirty-Rect Rendering:
+        Opt-in alternative to redrawing the whole screen every frame. The
+        skin reports each entity's bounds and visual signature, and render()
+        repaints only the regions that changed; present them with
+        pygame.display.update(get_dirty_rects()). Falls back to a full
+        redraw on the first frame, on overlays, or when the dirty area is
+        larger than the threshold.
+
+        Configure via __init__ kwargs:
+        - dirty_rects: Enable dirty-rect rendering (default: False)
+        - dirty_rect_threshold: Screen fraction above which a full redraw is
+          used instead (default: 0.5)
+
+    Lua Expressions:
+        {lua: ...} property values, win conditions and other YAML expressions
+        are compiled once and cached by LuaEngine.evaluate_expression().
+
+        Configure via __init__ kwargs:
+        - lua_expression_cache_size: Compiled expressions kept (LRU, 0 disables)
+          (default: 512)
+
+    Behavior Update Phase:
+        Behavior on_update hooks run once per frame (on_entities_update).
+        Optionally all hooks run from a single Lua call, and entity fields
+        are synced to Lua tables in bulk (LuaEntityMirror) so ams.get_x,
+        ams.set_vx, ams.get_prop, ... don't cross into Python per call.
+
+        Configure via __init__ kwargs:
+        - batched_dispatch: Group hooks by behavior, one Lua call per frame
+          (default: False)
+        - lua_mirror: Mirror x/y/vx/vy/width/height/health/properties of
+          entities with behaviors as ams.entities[id] during on_update
+          (default: False)
 
     Subclasses must implement:
     - _get_skin(): Return rendering skin instance
@@ -208,6 +285,29 @@ class GameEngine(BaseGame):
         # Frame counter for profiling
         self._frame_count = 0
 
+        # Collision broadphase (uniform grid rebuilt once per frame)
+        # Disable with broadphase_enabled=False to fall back to all-pairs checks
+        self._broadphase_enabled = kwargs.get('broadphase_enabled', True)
+        self._collision_grid = SpatialHash(
+            cell_size=kwargs.get('broadphase_cell_size', self.BROADPHASE_CELL_SIZE)
+        )
+        self._collision_pairs_tested = 0
+        self._collisions_detected = 0
+
+        # Live entities by type/base type/tag, kept in step with LuaEngine.entities
+        self._entity_index = EntityIndex()
+
+        # Batched behavior updates: one Lua call per frame for all
+        # on_update hooks, grouped by behavior (see on_entities_update)
+        self._batched_dispatch = kwargs.get('batched_dispatch', False)
+
+        # Optional struct-of-arrays storage for entity transforms
+        # (NumPy is only imported when enabled)
+        self._entity_store: Optional['ColumnarStore'] = None
+        if kwargs.get('columnar_store', False):
+            from ams.games.game_engine.columnar import ColumnarStore
+            self._entity_store = ColumnarStore()
+
         # Add game directory as ContentFS layer (higher priority than engine)
         # This allows games to override engine lua scripts at lua/{type}/
         if self.GAME_SLUG:
@@ -215,11 +315,16 @@ class GameEngine(BaseGame):
             self._content_fs.add_game_layer(game_path)
 
         # Create behavior engine with ContentFS and game-specific API
+        # (LuaEngine applies its own cache default when none is given)
+        lua_options = {}
+        if 'lua_expression_cache_size' in kwargs:
+            lua_options['expression_cache_size'] = kwargs['lua_expression_cache_size']
         self._behavior_engine = LuaEngine(
             content_fs=self._content_fs,
             screen_width=width,
             screen_height=height,
             api_class=GameLuaAPI,
+            **lua_options,
         )
 
         # Create interaction engine for unified interactions
@@ -227,6 +332,7 @@ class GameEngine(BaseGame):
             screen_width=width,
             screen_height=height,
             lives=lives,
+            spatial_index=kwargs.get('interaction_spatial_index', True),
         )
 
         # Wire action handler to Lua engine
@@ -240,6 +346,7 @@ class GameEngine(BaseGame):
         from ams.games.game_engine.entity import SystemEntity
         self._pointer_entity = SystemEntity(id="pointer", entity_type="pointer")
         self._behavior_engine.register_entity(self._pointer_entity)
+        self._entity_index.add(self._pointer_entity)
 
         # Load subroutines from lua/{type}/ - ContentFS resolves game overrides automatically
         # Priority: game > engine > core (via ContentFS layering)
@@ -267,12 +374,21 @@ class GameEngine(BaseGame):
         if hasattr(api, 'set_lose_life_handler'):
             api.set_lose_life_handler(self.lose_life)
 
+        # Share entity index so Lua type/tag queries skip full scans
+        if hasattr(api, 'set_entity_index'):
+            api.set_entity_index(self._entity_index)
+
         # Register destroy callback for orphan handling
         self._behavior_engine.set_destroy_callback(self._on_entity_destroyed)
 
         # Register self as lifecycle provider for behavior dispatch
         self._behavior_engine.set_lifecycle_provider(self)
 
+        # Lua-side entity tables synced in bulk around on_update
+        self._lua_mirror: Optional['LuaEntityMirror'] = None
+        if kwargs.get('lua_mirror', False) and hasattr(api, 'create_entity_mirror'):
+            self._lua_mirror = api.create_entity_mirror()
+
         # Create skin and give it access to game definition
         self._skin = self._get_skin(skin)
         if self._game_def:
@@ -283,6 +399,17 @@ class GameEngine(BaseGame):
         # Player entity reference
         self._player_id: Optional[str] = None
 
+        # Opt-in dirty-rect rendering (repaint changed regions only)
+        self._dirty_tracker: Optional[DirtyRectTracker] = None
+        if kwargs.get('dirty_rects', False):
+            self._dirty_tracker = DirtyRectTracker(
+                threshold=kwargs.get('dirty_rect_threshold', self.DIRTY_RECT_THRESHOLD)
+            )
+        self._dirty_rects: Optional[List[pygame.Rect]] = None
+
+        # Delayed hits queued for the next update: (timestamp, x, y, applicator)
+        self._pending_hits: List[Tuple[float, float, float, Optional[Callable[[], None]]]] = []
+
         # Call super init (may load levels)
         super().__init__(**kwargs)
 
@@ -294,6 +421,9 @@ class GameEngine(BaseGame):
                 history_duration=kwargs.get('rollback_history', 2.0),
                 fps=kwargs.get('fps', 60),
                 snapshot_interval=kwargs.get('snapshot_interval', 1),
+                snapshot_mode=kwargs.get('rollback_snapshot_mode', 'full'),
+                keyframe_interval=kwargs.get('rollback_keyframe_interval', 30),
+                headless_resimulation=kwargs.get('rollback_headless', True),
             )
             self._rollback_logger = create_logger(
                 session_name=kwargs.get('session_name', 'game'),
@@ -381,6 +511,7 @@ class GameEngine(BaseGame):
                         min=when_data.get('min'),
                     )
 
+                sprite_name = render_data.get('sprite_name', render_data.get('sprite', ''))
                 render_commands.append(RenderCommand(
                     shape=render_data.get('shape', 'rectangle'),
                     color=render_data.get('color', '$color'),
@@ -390,13 +521,15 @@ class GameEngine(BaseGame):
                     points=[tuple(p) for p in render_data.get('points', [])],
                     offset=tuple(render_data.get('offset', [0, 0])),
                     size=tuple(render_data['size']) if render_data.get('size') else None,
-                    sprite_name=render_data.get('sprite_name', render_data.get('sprite', '')),
+                    sprite_name=sprite_name,
                     radius=render_data.get('radius'),
                     text=render_data.get('text', ''),
                     font_size=render_data.get('font_size', 20),
                     align=render_data.get('align', 'center'),
                     when=when_cond,
                     stop=render_data.get('stop', False),
+                    when_check=compile_when(when_cond) if when_cond else None,
+                    sprite_template=compile_sprite_template(sprite_name) if sprite_name else None,
                 ))
 
             # Parse lifecycle transforms
@@ -1176,7 +1309,7 @@ class GameEngine(BaseGame):
             level_data: Parsed level data (protocol, dict, or dataclass)
         """
         # Clear existing entities
-        self._behavior_engine.clear()
+        self._clear_entities()
 
         # Handle both dict and protocol-style access
         def get_attr(obj: Any, key: str, default: Any = None) -> Any:
@@ -1406,7 +1539,7 @@ class GameEngine(BaseGame):
             behaviors = overrides.get('behaviors', type_config.behaviors)
             behavior_config = overrides.get('behavior_config', type_config.behavior_config)
 
-            entity = GameEntity(
+            entity = self._create_entity_object(
                 id=entity_id,
                 entity_type=entity_type,
                 x=x,
@@ -1426,7 +1559,7 @@ class GameEngine(BaseGame):
             )
         else:
             # Create with overrides only
-            entity = GameEntity(
+            entity = self._create_entity_object(
                 id=entity_id,
                 entity_type=entity_type,
                 x=x,
@@ -1436,6 +1569,9 @@ class GameEngine(BaseGame):
                 **overrides,
             )
 
+        # Index before registering so on_spawn behaviors can query it
+        self._entity_index.add(entity, self._get_configured_base_type(entity_type))
+
         # Register with LuaEngine (triggers on_entity_spawned via provider)
         self._behavior_engine.register_entity(entity)
 
@@ -1453,20 +1589,53 @@ class GameEngine(BaseGame):
 
         return entity
 
+    def _create_entity_object(self, **fields) -> GameEntity:
+        """Construct a GameEntity, store-backed when the columnar store is on."""
+        if self._entity_store is not None:
+            from ams.games.game_engine.columnar import ColumnarEntity
+            return ColumnarEntity(store=self._entity_store, **fields)
+        return GameEntity(**fields)
+
+    def _clear_entities(self) -> None:
+        """Remove all entities from LuaEngine and engine-side indexes."""
+        self._behavior_engine.clear()
+        self._entity_index.clear()
+        if self._entity_store is not None:
+            self._entity_store.clear()
+
     def get_entities_by_type(self, entity_type: str) -> List[Entity]:
         """Get all alive entities of a type."""
-        return [e for e in self._behavior_engine.get_alive_entities()
-                if e.entity_type == entity_type]
+        return self._entity_index.of_type(entity_type)
 
     def get_entities_by_tag(self, tag: str) -> List[Entity]:
-        """Get all alive entities with a tag."""
-        result = []
-        for entity in self._behavior_engine.get_alive_entities():
-            if self._game_def:
-                type_config = self._game_def.entity_types.get(entity.entity_type)
-                if type_config and tag in type_config.tags:
-                    result.append(entity)
-        return result
+        """Get all alive entities whose type config has a tag."""
+        if not self._game_def:
+            return []
+        tagged_types = [name for name, config in self._game_def.entity_types.items()
+                        if tag in config.tags]
+        if not tagged_types:
+            return []
+        return self._entity_index.of_types(tagged_types)
+
+    def _get_configured_base_type(self, entity_type: str) -> Optional[str]:
+        """Get the base type declared for an entity type, or None."""
+        if self._game_def:
+            type_config = self._game_def.entity_types.get(entity_type)
+            if type_config:
+                return type_config.base_type
+        return None
+
+    def _rebuild_entity_index(self) -> None:
+        """Rebuild the entity index from LuaEngine.entities.
+
+        Needed after bulk changes that bypass spawn/destroy/transform,
+        such as rollback restore. Also frees columnar rows of entities
+        that are no longer registered.
+        """
+        entities = self._behavior_engine.entities.values()
+        self._entity_index.rebuild(entities, self._get_configured_base_type)
+        if self._entity_store is not None:
+            self._entity_store.retain(list(entities))
 
     # =========================================================================
     # BaseGame Implementation
@@ -1521,10 +1690,7 @@ class GameEngine(BaseGame):
 
         for entity_type, mapping in self._game_def.input_mapping.items():
             # Find all entities matching this type
-            entities = self._get_entities_matching_type(
-                entity_type,
-                self._behavior_engine.get_alive_entities()
-            )
+            entities = self._entity_index.matching(entity_type)
 
 
             for entity in entities:
@@ -1614,6 +1780,10 @@ class GameEngine(BaseGame):
         # Begin profiling frame
         profiling.begin_frame(self._frame_count)
 
+        # Apply queued delayed hits before this frame's snapshot
+        if self._pending_hits:
+            self.process_delayed_hits()
+
         # Capture snapshot before update for rollback capability
         if self._rollback_manager:
             snapshot = self._rollback_manager.capture(self)
@@ -1636,20 +1806,41 @@ class GameEngine(BaseGame):
 
         This method contains the core game loop logic and is called:
         - By update() during normal gameplay
-        - By RollbackStateManager during re-simulation
+        - By RollbackStateManager for the last re-simulated frame
+
+        Args:
+            dt: Delta time since last frame
+        """
+        self._run_frame(dt, headless=False)
+
+    def _do_headless_frame_update(self, dt: float) -> None:
+        """Frame update for rollback re-simulation (game logic only).
+
+        Same as _do_frame_update but without the profiling wrapper, skin
+        update or sound playback. Sounds stay queued in the behavior engine
+        and are played by the next full frame, so side effects of a
+        re-simulated window surface once, at its final frame. Profiling is
+        suspended, so @profiling.profile sub-steps (physics, collisions,
+        spawns, Lua calls) neither record nor pay for calls here.
 
         Args:
             dt: Delta time since last frame
         """
+        with profiling.suspended():
+            self._run_frame(dt, headless=True)
+
+    def _run_frame(self, dt: float, headless: bool) -> None:
+        """Core frame logic shared by full and headless frame updates."""
         # Apply velocity to position for all entities (core physics)
         self._apply_physics(dt)
 
         # Update behavior engine (moves entities, fires callbacks)
         self._behavior_engine.update(dt)
 
-        # Process queued sounds
-        for sound in self._behavior_engine.pop_sounds():
-            self._skin.play_sound(sound)
+        # Process queued sounds (headless frames leave them queued)
+        if not headless:
+            for sound in self._behavior_engine.pop_sounds():
+                self._skin.play_sound(sound)
 
         # Check on_update transforms (age-based, property-based, interval)
         self._check_on_update_transforms()
@@ -1669,7 +1860,8 @@ class GameEngine(BaseGame):
         # (see _on_entity_destroyed, registered via set_destroy_callback)
 
         # Update skin
-        self._skin.update(dt)
+        if not headless:
+            self._skin.update(dt)
 
         # Check win/lose conditions
         self._check_win_conditions()
@@ -1707,40 +1899,23 @@ class GameEngine(BaseGame):
 
         # Recent hit - process immediately, no rollback needed
         if latency <= self.ROLLBACK_THRESHOLD:
-            self._apply_input_mapping(InputEvent(
-                position=(x, y),
-                event_type='hit',
-                timestamp=hit_timestamp,
-            ))
+            self._apply_hit(x, y, hit_timestamp)
             return True
 
         # No rollback manager - process immediately
         if not self._rollback_manager:
-            self._apply_input_mapping(InputEvent(
-                position=(x, y),
-                event_type='hit',
-                timestamp=hit_timestamp,
-            ))
+            self._apply_hit(x, y, hit_timestamp)
             return True
 
         # Check if we can rollback to the hit time
         if not self._rollback_manager.can_rollback_to(hit_timestamp):
             # Hit is too old - process at current time as fallback
-            self._apply_input_mapping(InputEvent(
-                position=(x, y),
-                event_type='hit',
-                timestamp=current_time,
-            ))
+            self._apply_hit(x, y, current_time)
             return True
 
         # Create hit applicator if not provided
         if hit_applicator is None:
-            def hit_applicator():
-                self._apply_input_mapping(InputEvent(
-                    position=(x, y),
-                    event_type='hit',
-                    timestamp=hit_timestamp,
-                ))
+            hit_applicator = self._hit_applicator(x, y, hit_timestamp)
 
         # Rollback and resimulate
         result = self._rollback_manager.rollback_and_resimulate(
@@ -1757,10 +1932,109 @@ class GameEngine(BaseGame):
                 restored_frame=result.restored_frame,
                 frames_resimulated=result.frames_resimulated,
                 hit_position=(x, y),
+                duration_ms=result.total_ms,
             )
 
         return result.success
 
+    def queue_delayed_hit(
+        self,
+        x: float,
+        y: float,
+        hit_timestamp: float,
+        hit_applicator: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Queue a delayed hit for batched processing on the next update().
+
+        Same arguments as process_delayed_hit(). Use this when several hits
+        can arrive between frames, so they share one rollback instead of
+        each restoring and re-simulating the same window.
+        """
+        self._pending_hits.append((hit_timestamp, x, y, hit_applicator))
+
+    def process_delayed_hits(self) -> bool:
+        """Process all queued delayed hits with at most one rollback.
+
+        Hits old enough to need rollback are applied in a single
+        rollback_and_resimulate_batch() pass: state is restored once, to the
+        earliest hit, and every hit is applied at its own frame while
+        re-simulating. Recent hits join that pass when a rollback happens
+        anyway, otherwise they are applied immediately. Hits older than the
+        rollback history are applied at the current time.
+
+        Called automatically by update() when hits are queued.
+
+        Returns:
+            True if all hits were processed, False if the rollback failed.
+        """
+        if not self._pending_hits:
+            return True
+        hits = sorted(self._pending_hits, key=lambda hit: hit[0])
+        self._pending_hits = []
+
+        current_time = time.monotonic()
+        manager = self._rollback_manager
+        batch = []
+        stale = []
+        needs_rollback = False
+        for hit in hits:
+            hit_timestamp = hit[0]
+            if current_time - hit_timestamp <= self.ROLLBACK_THRESHOLD or not manager:
+                batch.append(hit)
+            elif manager.can_rollback_to(hit_timestamp):
+                batch.append(hit)
+                needs_rollback = True
+            else:
+                stale.append(hit)
+
+        success = True
+        if needs_rollback:
+            result = manager.rollback_and_resimulate_batch(
+                game_engine=self,
+                hits=[(hit_timestamp, applicator or self._hit_applicator(x, y, hit_timestamp))
+                      for hit_timestamp, x, y, applicator in batch],
+                current_timestamp=current_time,
+            )
+            success = result.success
+
+            if result.success and self._rollback_logger:
+                first = batch[0]
+                self._rollback_logger.log_rollback(
+                    target_timestamp=first[0],
+                    restored_frame=result.restored_frame,
+                    frames_resimulated=result.frames_resimulated,
+                    hit_position=(first[1], first[2]),
+                    duration_ms=result.total_ms,
+                )
+        else:
+            # Nothing to roll back - apply in timestamp order
+            for hit_timestamp, x, y, applicator in batch:
+                if applicator:
+                    applicator()
+                else:
+                    self._apply_hit(x, y, hit_timestamp)
+
+        # Too old to roll back to - process at current time as fallback
+        for _, x, y, applicator in stale:
+            if applicator:
+                applicator()
+            else:
+                self._apply_hit(x, y, current_time)
+
+        return success
+
+    def _apply_hit(self, x: float, y: float, timestamp: float) -> None:
+        """Apply a hit through the standard input mapping."""
+        self._apply_input_mapping(InputEvent(
+            position=(x, y),
+            event_type='hit',
+            timestamp=timestamp,
+        ))
+
+    def _hit_applicator(self, x: float, y: float, timestamp: float) -> Callable[[], None]:
+        """Deferred _apply_hit() for use as a rollback hit applicator."""
+        return lambda: self._apply_hit(x, y, timestamp)
+
     def _check_on_update_transforms(self) -> None:
         """Check and apply on_update transforms based on conditions.
 
@@ -1813,6 +2087,12 @@ class GameEngine(BaseGame):
                 if not entity.alive:
                     break
 
+    # Default broadphase grid cell size in pixels (override via broadphase_cell_size)
+    BROADPHASE_CELL_SIZE: float = 64.0
+
+    # Grid candidates per entity from which the columnar store tests them as rows
+    COLUMNAR_CANDIDATE_MIN: int = 6
+
     @profiling.profile("game_engine", "Check Collisions")
     def _check_collisions(self) -> None:
         """Check collisions based on rules defined in game.yaml.
@@ -1822,8 +2102,15 @@ class GameEngine(BaseGame):
         - collision_behaviors: {type_a: {type_b: action}} - nested dict (new)
 
         For each collision rule, finds all entity pairs that match and
-        dispatches to collision actions or on_hit behaviors.
+        dispatches to collision actions or on_hit behaviors. When the
+        broadphase is enabled, only entities sharing a grid cell reach
+        the AABB test; dispatch order is the same as the all-pairs scan.
+        With the columnar store, AABB tests run on store rows (see the
+        class docstring for which path runs when).
         """
+        self._collision_pairs_tested = 0
+        self._collisions_detected = 0
+
         if not self._game_def:
             return
 
@@ -1833,10 +2120,8 @@ class GameEngine(BaseGame):
         if not has_collisions and not has_collision_behaviors:
             return
 
-        alive_entities = self._behavior_engine.get_alive_entities()
-
         # Track collisions already processed this frame to avoid duplicates
-        processed: set[str] = set()
+        processed: set[tuple[str, str]] = set()
 
         # Collect all type pairs to check from both systems
         type_pairs: set[tuple[str, str]] = set()
@@ -1850,28 +2135,121 @@ class GameEngine(BaseGame):
             for type_b in targets.keys():
                 type_pairs.add((type_a, type_b))
 
+        # Find entities matching each side of the rules (once per type)
+        matching: Dict[str, List[Entity]] = {}
+        for type_pair in type_pairs:
+            for type_pattern in type_pair:
+                if type_pattern not in matching:
+                    matching[type_pattern] = self._entity_index.matching(type_pattern)
+
+        grid: Optional[SpatialHash] = None
+        if self._broadphase_enabled:
+            grid = self._collision_grid
+            grid.rebuild(self._entity_index.union(matching.values()))
+
         # Check all type pairs
         for type_a, type_b in type_pairs:
-            # Find entities matching each side of the rule
-            entities_a = self._get_entities_matching_type(type_a, alive_entities)
-            entities_b = self._get_entities_matching_type(type_b, alive_entities)
+            entities_a = matching[type_a]
+            entities_b = matching[type_b]
+            if not entities_a or not entities_b:
+                continue
 
-            # Check all pairs for collision
-            for entity_a in entities_a:
-                for entity_b in entities_b:
-                    # Skip self-collision
-                    if entity_a.id == entity_b.id:
+            if grid is None:
+                rows_b = None
+                if self._entity_store is not None:
+                    rows_b = self._entity_store.rows_of(entities_b)
+                for entity_a in entities_a:
+                    if rows_b is not None and getattr(entity_a, '_row', None) is not None:
+                        self._check_collision_rows(entity_a, entities_b, rows_b, processed)
                         continue
+                    for entity_b in entities_b:
+                        self._check_collision_pair(entity_a, entity_b, processed)
+                continue
 
-                    # Skip if already processed (order-independent)
-                    pair_key = "|".join(sorted([entity_a.id, entity_b.id]))
-                    if pair_key in processed:
+            ids_b = {e.id for e in entities_b}
+            store = self._entity_store
+            for entity_a in entities_a:
+                candidates = [entity_b for entity_b in grid.query(entity_a.x, entity_a.y,
+                                                                  entity_a.width, entity_a.height)
+                              if entity_b.id in ids_b]
+                if (store is not None and len(candidates) >= self.COLUMNAR_CANDIDATE_MIN
+                        and getattr(entity_a, '_row', None) is not None):
+                    rows = store.rows_of(candidates)
+                    if rows is not None:
+                        self._check_collision_rows(entity_a, candidates, rows, processed)
                         continue
+                for entity_b in candidates:
+                    self._check_collision_pair(entity_a, entity_b, processed)
+
+    def _check_collision_pair(self, entity_a: Entity, entity_b: Entity,
+                              processed: set[tuple[str, str]],
+                              count: bool = True) -> None:
+        """Test one candidate pair and dispatch if it collides.
+
+        count=False skips the pairs_tested counter (caller already counted).
+        """
+        # Skip self-collision
+        if entity_a.id == entity_b.id:
+            return
+
+        # Skip if already processed (order-independent)
+        if entity_a.id < entity_b.id:
+            pair_key = (entity_a.id, entity_b.id)
+        else:
+            pair_key = (entity_b.id, entity_a.id)
+        if pair_key in processed:
+            return
+
+        # Check AABB overlap
+        if count:
+            self._collision_pairs_tested += 1
+        if self._check_aabb_collision(entity_a, entity_b):
+            processed.add(pair_key)
+            self._collisions_detected += 1
+            self._handle_collision(entity_a, entity_b)
+
+    def _check_collision_rows(self, entity_a: Entity, entities_b: List[Entity],
+                              rows_b: Any, processed: set[tuple[str, str]]) -> None:
+        """Narrowphase for one entity against many, using the columnar store.
+
+        Overlaps are computed for all of entities_b at once; candidates are
+        then dispatched in order through _check_collision_pair. A dispatched
+        collision may move entities, so the remaining slice is re-tested
+        after each one to match the per-pair scan.
+        """
+        store = self._entity_store
+        total = len(entities_b)
+        start = 0
+        while start < total:
+            hits = store.overlaps(entity_a._row, rows_b[start:]).nonzero()[0]
+            before = self._collisions_detected
+            for offset in hits:
+                index = start + int(offset)
+                self._check_collision_pair(entity_a, entities_b[index], processed,
+                                           count=False)
+                if self._collisions_detected != before:
+                    # Pairs up to the dispatch count as tested; re-test the rest
+                    self._collision_pairs_tested += index + 1 - start
+                    start = index + 1
+                    break
+            else:
+                self._collision_pairs_tested += total - start
+                return
+
+    def get_collision_stats(self) -> Dict[str, Any]:
+        """Get legacy collision check statistics for the last frame.
 
-                    # Check AABB overlap
-                    if self._check_aabb_collision(entity_a, entity_b):
-                        processed.add(pair_key)
-                        self._handle_collision(entity_a, entity_b)
+        Returns:
+            Dict with broadphase state, pairs tested and collisions found
+        """
+        return {
+            'broadphase_enabled': self._broadphase_enabled,
+            'cell_size': self._collision_grid.cell_size,
+            'grid_entities': len(self._collision_grid),
+            'grid_cells': self._collision_grid.cell_count,
+            'pairs_tested': self._collision_pairs_tested,
+            'collisions': self._collisions_detected,
+        }
 
     def _get_entities_matching_type(self, type_pattern: str,
                                      entities: List[Entity]) -> List[Entity]:
@@ -1989,8 +2367,11 @@ class GameEngine(BaseGame):
 
         Applies on_destroy transforms, scoring, and orphan handling.
         """
-        # Remove from InteractionEngine
+        # Remove from InteractionEngine and the type index
         self._interaction_engine.remove_entity(entity.id)
+        self._entity_index.remove(entity.id)
+        if self._entity_store is not None:
+            self._entity_store.release(entity)
 
         if not self._game_def:
             return
@@ -2069,7 +2450,13 @@ class GameEngine(BaseGame):
 
         Core physics step that runs before behaviors/interactions.
         Entities with non-zero velocity will move automatically.
+        With the columnar store this is one array update (system entities
+        such as the pointer are not store-backed and never have velocity).
         """
+        if self._entity_store is not None:
+            self._entity_store.integrate(dt)
+            return
+
         for entity in self._behavior_engine.get_alive_entities():
             if entity.vx != 0 or entity.vy != 0:
                 entity.x += entity.vx * dt
@@ -2104,13 +2491,7 @@ class GameEngine(BaseGame):
 
     def get_entities_by_base_type(self, base_type: str) -> List[Entity]:
         """Get all alive entities that extend from a base type."""
-        result = []
-        for entity in self._behavior_engine.get_alive_entities():
-            if self._game_def:
-                type_config = self._game_def.entity_types.get(entity.entity_type)
-                if type_config and type_config.base_type == base_type:
-                    result.append(entity)
-        return result
+        return self._entity_index.of_base_type(base_type)
 
     def _check_lose_conditions(self) -> None:
         """Check lose conditions from game.yaml and check if player has lost."""
@@ -2130,10 +2511,18 @@ class GameEngine(BaseGame):
 
     def _check_exited_screen_condition(self, condition: LoseConditionConfig) -> None:
         """Check if any entity of type has exited the screen."""
-        entities = self._get_entities_matching_type(
-            condition.entity_type,
-            self._behavior_engine.get_alive_entities()
-        )
+        entities = self._entity_index.matching(condition.entity_type)
+
+        rows = None
+        if self._entity_store is not None and entities:
+            rows = self._entity_store.rows_of(entities)
+        if rows is not None:
+            exited_mask = self._entity_store.exited_screen(
+                rows, condition.edge or 'any', self._screen_width, self._screen_height
+            )
+            for i in exited_mask.nonzero()[0]:
+                self._handle_lose_condition_triggered(entities[i], condition)
+            return
 
         for entity in entities:
             exited = False
@@ -2161,10 +2550,7 @@ class GameEngine(BaseGame):
         if not condition.property_name:
             return
 
-        entities = self._get_entities_matching_type(
-            condition.entity_type,
-            self._behavior_engine.get_alive_entities()
-        )
+        entities = self._entity_index.matching(condition.entity_type)
 
         for entity in entities:
             prop_value = entity.properties.get(condition.property_name)
@@ -2181,10 +2567,7 @@ class GameEngine(BaseGame):
         # Execute 'then' block
         if condition.then_destroy:
             # Destroy entities matching the type
-            to_destroy = self._get_entities_matching_type(
-                condition.then_destroy,
-                self._behavior_engine.get_alive_entities()
-            )
+            to_destroy = self._entity_index.matching(condition.then_destroy)
             # For ball exiting, destroy just this entity
             if condition.then_destroy == condition.entity_type:
                 entity.alive = False
@@ -2194,10 +2577,7 @@ class GameEngine(BaseGame):
 
         if condition.then_transform:
             # Transform another entity type
-            targets = self._get_entities_matching_type(
-                condition.then_transform.entity_type,
-                self._behavior_engine.get_alive_entities()
-            )
+            targets = self._entity_index.matching(condition.then_transform.entity_type)
             if targets:
                 # Transform first matching entity
                 self.apply_transform(targets[0], condition.then_transform.transform)
@@ -2240,6 +2620,7 @@ class GameEngine(BaseGame):
 
         # Transform - keep position and ID, change type
         entity.entity_type = into_type
+        self._entity_index.retype(entity, new_config.base_type)
         entity.width = new_config.width
         entity.height = new_config.height
         entity.color = new_config.color
@@ -2397,21 +2778,33 @@ class GameEngine(BaseGame):
         if self._lives <= 0:
             self._internal_state = GameState.GAME_OVER
 
+    # Dirty screen fraction above which render() redraws everything
+    # (override via dirty_rect_threshold)
+    DIRTY_RECT_THRESHOLD: float = 0.5
+
     def render(self, screen: pygame.Surface) -> None:
-        """Render the game."""
+        """Render the game.
+
+        With dirty_rects enabled, only regions whose content changed since
+        the previous render() are repainted (see get_dirty_rects()).
+        """
         # Clear with background color
         bg = (20, 20, 30)
         if self._game_def:
             bg = self._game_def.background_color
-        screen.fill(bg)
 
         # Update skin's elapsed time for $age property
         self._skin._elapsed_time = self._behavior_engine.elapsed_time
 
+        entities = [e for e in self._behavior_engine.get_alive_entities() if e.renderable]
+        if self._dirty_tracker is not None and self._render_dirty(screen, bg, entities):
+            return
+
+        screen.fill(bg)
+
         # Render all renderable entities
-        for entity in self._behavior_engine.get_alive_entities():
-            if entity.renderable:
-                self._skin.render_entity(entity, screen)
+        for entity in entities:
+            self._skin.render_entity(entity, screen)
 
         # Render HUD
         self._skin.render_hud(screen, self.get_score(), self._lives, self._level_name)
@@ -2422,6 +2815,57 @@ class GameEngine(BaseGame):
         elif self._internal_state == GameState.WON:
             self._render_overlay(screen, "YOU WIN!", (100, 255, 100))
 
+    def _render_dirty(self, screen: pygame.Surface, bg: Tuple[int, int, int],
+                      entities: List[Entity]) -> bool:
+        """Repaint only changed regions; False if a full redraw is needed."""
+        skin = self._skin
+        tracker = self._dirty_tracker
+        self._dirty_rects = None
+        # Overlays and skins without render state always redraw everything
+        if (self._internal_state != GameState.PLAYING
+                or not hasattr(skin, 'entity_state')):
+            tracker.invalidate()
+            return False
+
+        hud = (self.get_score(), self._lives, self._level_name)
+        states = {entity.id: skin.entity_state(entity) for entity in entities}
+        states[None] = skin.hud_state(screen, *hud)
+        rects = tracker.compute(states, screen.get_rect())
+        if rects is None:
+            return False
+
+        # Repaint each region in draw order, clipped so overlaps layer correctly
+        previous_clip = screen.get_clip()
+        for rect in rects:
+            screen.set_clip(rect)
+            screen.fill(bg, rect)
+            for entity in entities:
+                if states[entity.id][0].colliderect(rect):
+                    skin.render_entity(entity, screen)
+            skin.render_hud(screen, *hud)
+        screen.set_clip(previous_clip)
+        self._dirty_rects = rects
+        return True
+
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Regions repainted by the last render(), for pygame.display.update().
+
+        None when dirty-rect rendering is disabled or the last render() was a
+        full redraw (present with pygame.display.flip()).
+        """
+        return self._dirty_rects
+
+    def invalidate_display(self) -> None:
+        """Force a full redraw on the next render() (see BaseGame)."""
+        if self._dirty_tracker is not None:
+            self._dirty_tracker.invalidate()
+
+    def get_dirty_rect_stats(self) -> Dict[str, Any]:
+        """Get dirty-rect rendering statistics (empty when disabled)."""
+        if self._dirty_tracker is None:
+            return {}
+        return self._dirty_tracker.get_stats()
+
     def _render_overlay(self, screen: pygame.Surface, text: str,
                         color: Tuple[int, int, int]) -> None:
         """Render a centered text overlay."""
@@ -2440,7 +2884,8 @@ class GameEngine(BaseGame):
     def reset(self) -> None:
         """Reset game state."""
         super().reset()
-        self._behavior_engine.clear()
+        self._clear_entities()
+        self._pending_hits.clear()
         self._score = 0
         self._lives = self._starting_lives
         self._internal_state = GameState.PLAYING
@@ -2458,6 +2903,60 @@ class GameEngine(BaseGame):
         """Called each frame for alive entities."""
         self._dispatch_to_behaviors('on_update', entity, lua_engine, dt)
 
+    def on_entities_update(self, entities: list['Entity'], lua_engine: 'LuaEngine',
+                           dt: float) -> None:
+        """Called once per frame with every registered entity.
+
+        By default each alive entity runs its behaviors' on_update in turn.
+        With batched_dispatch, alive entities are grouped by behavior and
+        all hooks run from one Lua call: behavior by behavior (in order of
+        first use), entities in registration order within each behavior.
+        Groups are fixed at the start of the frame; entities destroyed
+        during it are skipped.
+
+        With lua_mirror, entity fields are loaded into Lua before the hooks
+        run and changed fields are written back after them.
+        """
+        if self._lua_mirror is None:
+            self._update_behaviors(entities, lua_engine, dt)
+            return
+        self._lua_mirror.push(entities)
+        try:
+            self._update_behaviors(entities, lua_engine, dt)
+        finally:
+            self._lua_mirror.pull()
+
+    def _update_behaviors(self, entities: list['Entity'], lua_engine: 'LuaEngine',
+                          dt: float) -> None:
+        """Run on_update hooks, per entity or batched (see on_entities_update)."""
+        if not self._batched_dispatch:
+            for entity in entities:
+                if entity.alive:
+                    self.on_entity_update(entity, lua_engine, dt)
+            return
+
+        groups: dict[str, list[str]] = {}
+        for entity in entities:
+            if not entity.alive:
+                continue
+            for behavior_name in getattr(entity, 'behaviors', ()):
+                ids = groups.get(behavior_name)
+                if ids is None:
+                    groups[behavior_name] = [entity.id]
+                else:
+                    ids.append(entity.id)
+
+        names = []
+        batches = []
+        for behavior_name, ids in groups.items():
+            method = lua_engine.get_subroutine_method('behavior', behavior_name, 'on_update')
+            if method is not None:
+                names.append(behavior_name)
+                batches.append((method, ids))
+
+        for index, entity_id, message in lua_engine.call_batched(batches, dt):
+            log.error(f"Error in {names[index]}.on_update: {message}")
+
     def on_entity_destroyed(self, entity: 'Entity', lua_engine: 'LuaEngine') -> None:
         """Called when an entity is destroyed and about to be removed."""
         self._dispatch_to_behaviors('on_destroy', entity, lua_engine)
@@ -2493,11 +2992,7 @@ class GameEngine(BaseGame):
             return
 
         for behavior_name in entity.behaviors:
-            behavior = lua_engine.get_subroutine('behavior', behavior_name)
-            if behavior is None:
-                continue
-
-            method = getattr(behavior, method_name, None)
+            method = lua_engine.get_subroutine_method('behavior', behavior_name, method_name)
             if method is None:
                 continue
 
@@ -2523,11 +3018,7 @@ class GameEngine(BaseGame):
             return
 
         for behavior_name in entity.behaviors:
-            behavior = lua_engine.get_subroutine('behavior', behavior_name)
-            if behavior is None:
-                continue
-
-            callback = getattr(behavior, callback_name, None)
+            callback = lua_engine.get_subroutine_method('behavior', behavior_name, callback_name)
             if callback:
                 try:
                     callback(entity.id)
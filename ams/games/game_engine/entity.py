@@ -8,11 +8,16 @@ Extends the Entity ABC with game-specific attributes:
 - Game state (health, spawn time, tags)
 - Hierarchy (parent-child relationships)
 - Subroutine attachments (behaviors with config)
+
+Render conditions and sprite templates can be compiled once into closures
+(compile_when(), compile_sprite_template()) so the per-frame render path
+avoids string dispatch and regex substitution.
 """
 
 import math
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable, Optional, TYPE_CHECKING
 
 from ams.lua.entity import Entity
@@ -156,34 +161,9 @@ class GameEntity(Entity):
             - heading: direction in degrees (0=north, clockwise)
         """
         # Built-in computed properties
-        if name == 'damage_ratio':
-            max_hits = self.properties.get('brick_max_hits', 1)
-            hits_remaining = self.properties.get('brick_hits_remaining', max_hits)
-            return 0 if max_hits <= 0 else 1 - (hits_remaining / max_hits)
-        elif name == 'health_ratio':
-            max_health = self.properties.get('max_health', self.health)
-            return 0 if max_health <= 0 else self.health / max_health
-        elif name == 'alive':
-            return self.alive
-        elif name == 'age':
-            return current_time - self.spawn_time
-        elif name == 'vx':
-            return self.vx
-        elif name == 'vy':
-            return self.vy
-        elif name == 'facing':
-            return 'left' if self.vx < 0 else 'right'
-        elif name == 'moving_up':
-            return self.vy < 0
-        elif name == 'moving_down':
-            return self.vy > 0
-        elif name == 'heading':
-            # Heading in degrees: 0° = north (up), clockwise
-            if self.vx == 0 and self.vy == 0:
-                return 0  # Stationary defaults to north
-            angle_rad = math.atan2(self.vx, -self.vy)
-            heading = math.degrees(angle_rad)
-            return heading + 360 if heading < 0 else heading
+        computed = _COMPUTED_PROPERTIES.get(name)
+        if computed is not None:
+            return computed(self, current_time)
 
         # Regular properties from dict
         return self.properties.get(name)
@@ -241,17 +221,142 @@ class GameEntity(Entity):
         Returns:
             Resolved sprite name
         """
-        def replace_placeholder(match: re.Match) -> str:
-            prop_name = match.group(1)
-            value = self.properties.get(prop_name)
+        return compile_sprite_template(sprite_name)(self)
+
+
+# =============================================================================
+# Computed properties and compiled render conditions
+# =============================================================================
+
+# Getter signature: (entity, current_time) -> value
+PropertyGetter = Callable[[GameEntity, float], Any]
+
+
+def _damage_ratio(entity: GameEntity, current_time: float) -> float:
+    max_hits = entity.properties.get('brick_max_hits', 1)
+    hits_remaining = entity.properties.get('brick_hits_remaining', max_hits)
+    return 0 if max_hits <= 0 else 1 - (hits_remaining / max_hits)
+
+
+def _health_ratio(entity: GameEntity, current_time: float) -> float:
+    max_health = entity.properties.get('max_health', entity.health)
+    return 0 if max_health <= 0 else entity.health / max_health
+
+
+def _heading(entity: GameEntity, current_time: float) -> float:
+    # Heading in degrees: 0° = north (up), clockwise
+    if entity.vx == 0 and entity.vy == 0:
+        return 0  # Stationary defaults to north
+    angle_rad = math.atan2(entity.vx, -entity.vy)
+    heading = math.degrees(angle_rad)
+    return heading + 360 if heading < 0 else heading
+
+
+# Computed properties understood by GameEntity.get_property()
+_COMPUTED_PROPERTIES: dict[str, PropertyGetter] = {
+    'damage_ratio': _damage_ratio,
+    'health_ratio': _health_ratio,
+    'alive': lambda entity, current_time: entity.alive,
+    'age': lambda entity, current_time: current_time - entity.spawn_time,
+    'vx': lambda entity, current_time: entity.vx,
+    'vy': lambda entity, current_time: entity.vy,
+    'facing': lambda entity, current_time: 'left' if entity.vx < 0 else 'right',
+    'moving_up': lambda entity, current_time: entity.vy < 0,
+    'moving_down': lambda entity, current_time: entity.vy > 0,
+    'heading': _heading,
+}
+
+
+def property_getter(name: str) -> PropertyGetter:
+    """Getter equivalent to entity.get_property(name, current_time)."""
+    computed = _COMPUTED_PROPERTIES.get(name)
+    if computed is not None:
+        return computed
+    return lambda entity, current_time: entity.properties.get(name)
+
+
+def compile_when(when: 'RenderWhen') -> Callable[[GameEntity, float], bool]:
+    """Compile a render condition into a closure.
+
+    The result is equivalent to entity.evaluate_when(when, current_time),
+    with the property getter and comparator chosen once.
+
+    Args:
+        when: RenderWhen condition
+
+    Returns:
+        Function (entity, current_time) -> bool
+    """
+    get = property_getter(when.property)
+    value = when.value
+
+    if when.compare == 'equals':
+        return lambda entity, current_time: get(entity, current_time) == value
+    elif when.compare == 'not_equals':
+        return lambda entity, current_time: get(entity, current_time) != value
+    elif when.compare == 'greater_than':
+        def greater_than(entity: GameEntity, current_time: float) -> bool:
+            prop_value = get(entity, current_time)
+            return prop_value is not None and prop_value > value
+        return greater_than
+    elif when.compare == 'less_than':
+        def less_than(entity: GameEntity, current_time: float) -> bool:
+            prop_value = get(entity, current_time)
+            return prop_value is not None and prop_value < value
+        return less_than
+    elif when.compare == 'between' and when.min is not None:
+        # min <= value < max (value field is max, min field is min)
+        low = when.min
+
+        def between(entity: GameEntity, current_time: float) -> bool:
+            prop_value = get(entity, current_time)
+            return prop_value is not None and low <= prop_value < value
+        return between
+    return lambda entity, current_time: False
+
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+@lru_cache(maxsize=1024)
+def compile_sprite_template(sprite_name: str) -> Callable[[GameEntity], str]:
+    """Compile a sprite name with {property} placeholders into a closure.
+
+    The template is split once into literal text and property slots; the
+    result is equivalent to entity.resolve_sprite_template(sprite_name).
+
+    Args:
+        sprite_name: Sprite name, e.g. "duck_{color}_{frame}"
+
+    Returns:
+        Function (entity) -> resolved sprite name
+    """
+    # Alternating [literal, name, literal, name, ..., literal]
+    parts = _PLACEHOLDER.split(sprite_name)
+    if len(parts) == 1:
+        return lambda entity: sprite_name
+
+    literals = parts[0::2]
+    names = parts[1::2]
+    slots = list(zip(names, ('{' + name + '}' for name in names), literals[1:]))
+    head = literals[0]
+
+    def resolve(entity: GameEntity) -> str:
+        properties = entity.properties
+        out = [head]
+        for name, placeholder, literal in slots:
+            value = properties.get(name)
             if value is None:
-                return match.group(0)  # Keep original if not found
+                out.append(placeholder)  # Keep original if not found
             # Convert whole floats to int for cleaner names
-            if isinstance(value, float) and value == int(value):
-                return str(int(value))
-            return str(value)
-
-        return re.sub(r'\{(\w+)\}', replace_placeholder, sprite_name)
+            elif isinstance(value, float) and value == int(value):
+                out.append(str(int(value)))
+            else:
+                out.append(str(value))
+            out.append(literal)
+        return ''.join(out)
+
+    return resolve
 
 
 @dataclass
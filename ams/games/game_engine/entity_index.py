@@ -0,0 +1,195 @@
+"""
+EntityIndex - incremental lookup of live entities by type, base type and tag.
+
+GameEngine keeps one index alongside LuaEngine.entities and updates it on
+spawn, destroy and transform, so per-frame type queries (collision rules,
+lose conditions, Lua ams.get_entities_of_type etc.) no longer rescan every
+entity.
+
+Each entity is filed under:
+- its exact type            (of_type)
+- its configured base type  (of_base_type)
+- both of the above         (matching - same rule as collision patterns)
+- each of its tags          (with_tag)
+
+Query results keep entity registration order, which is also the iteration
+order of LuaEngine.entities, so switching from a linear scan to the index
+does not change dispatch order. Entities that were destroyed (alive=False)
+but not yet removed are filtered out of results.
+
+Usage:
+    index = EntityIndex()
+    index.add(entity, base_type='brick')
+    bricks = index.matching('brick')
+
+    # After bulk changes to LuaEngine.entities (e.g. rollback restore):
+    index.rebuild(lua_engine.entities.values(), base_type_of)
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ams.lua.entity import Entity
+
+# Bucket kinds
+_TYPE = 'type'
+_BASE = 'base'
+_MATCH = 'match'
+_TAG = 'tag'
+
+BucketKey = Tuple[str, str]
+
+
+class EntityIndex:
+    """Type/base-type/tag index over registered entities."""
+
+    def __init__(self):
+        # (kind, name) -> {entity_id: entity}, in registration order
+        self._buckets: Dict[BucketKey, Dict[str, Entity]] = {}
+        # Buckets that may be out of registration order (after a retype)
+        self._unsorted: Set[BucketKey] = set()
+        # entity_id -> registration sequence number
+        self._seq: Dict[str, int] = {}
+        # entity_id -> bucket keys the entity is filed under
+        self._keys: Dict[str, Tuple[BucketKey, ...]] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._keys
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def add(self, entity: Entity, base_type: Optional[str] = None) -> None:
+        """Index an entity.
+
+        Args:
+            entity: Entity to index (re-adding an indexed id re-files it)
+            base_type: Configured base type of the entity's type, if any
+        """
+        entity_id = entity.id
+        if entity_id in self._keys:
+            self._unfile(entity_id)
+            seq = self._seq[entity_id]
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._seq[entity_id] = seq
+
+        keys: List[BucketKey] = [(_TYPE, entity.entity_type), (_MATCH, entity.entity_type)]
+        if base_type and base_type != entity.entity_type:
+            keys.append((_BASE, base_type))
+            keys.append((_MATCH, base_type))
+        elif base_type:
+            keys.append((_BASE, base_type))
+        # System entities (e.g. pointer) have no tags
+        for tag in getattr(entity, 'tags', ()):
+            keys.append((_TAG, tag))
+
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = {entity_id: entity}
+                continue
+            if bucket and seq < self._seq[next(reversed(bucket))]:
+                self._unsorted.add(key)
+            bucket[entity_id] = entity
+
+        self._keys[entity_id] = tuple(keys)
+
+    def retype(self, entity: Entity, base_type: Optional[str] = None) -> None:
+        """Re-file an entity after its entity_type changed (keeps its order)."""
+        self.add(entity, base_type)
+
+    def remove(self, entity_id: str) -> None:
+        """Drop an entity from the index (no-op if not indexed)."""
+        if entity_id not in self._keys:
+            return
+        self._unfile(entity_id)
+        del self._keys[entity_id]
+        del self._seq[entity_id]
+
+    def clear(self) -> None:
+        """Remove all entities."""
+        self._buckets.clear()
+        self._unsorted.clear()
+        self._seq.clear()
+        self._keys.clear()
+        self._next_seq = 0
+
+    def rebuild(self, entities: Iterable[Entity],
+                base_type_of: Callable[[str], Optional[str]]) -> None:
+        """Replace index contents, using the iteration order of entities.
+
+        Args:
+            entities: All registered entities (e.g. LuaEngine.entities.values())
+            base_type_of: Maps an entity type to its configured base type
+        """
+        self.clear()
+        for entity in entities:
+            self.add(entity, base_type_of(entity.entity_type))
+
+    def _unfile(self, entity_id: str) -> None:
+        for key in self._keys[entity_id]:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.pop(entity_id, None)
+                if not bucket:
+                    del self._buckets[key]
+                    self._unsorted.discard(key)
+
+    # =========================================================================
+    # Queries (alive entities only)
+    # =========================================================================
+
+    def of_type(self, entity_type: str) -> List[Entity]:
+        """Entities whose type is exactly entity_type."""
+        return self._alive((_TYPE, entity_type))
+
+    def of_base_type(self, base_type: str) -> List[Entity]:
+        """Entities whose type is configured to extend base_type."""
+        return self._alive((_BASE, base_type))
+
+    def matching(self, type_pattern: str) -> List[Entity]:
+        """Entities whose exact type or base type equals type_pattern."""
+        return self._alive((_MATCH, type_pattern))
+
+    def of_types(self, entity_types: Sequence[str]) -> List[Entity]:
+        """Entities of any of the given exact types, in registration order."""
+        if len(entity_types) == 1:
+            return self.of_type(entity_types[0])
+        return self.union(self.of_type(t) for t in entity_types)
+
+    def union(self, groups: Iterable[Sequence[Entity]]) -> List[Entity]:
+        """Unique entities from several query results, in registration order."""
+        unique: Dict[str, Entity] = {}
+        for group in groups:
+            for entity in group:
+                unique[entity.id] = entity
+        seq = self._seq
+        return sorted(unique.values(), key=lambda e: seq[e.id])
+
+    def with_tag(self, tag: str) -> List[Entity]:
+        """Entities carrying tag."""
+        return self._alive((_TAG, tag))
+
+    def count_tag(self, tag: str) -> int:
+        """Number of alive entities carrying tag."""
+        bucket = self._buckets.get((_TAG, tag))
+        if not bucket:
+            return 0
+        return sum(1 for e in bucket.values() if e.alive)
+
+    def _alive(self, key: BucketKey) -> List[Entity]:
+        bucket = self._buckets.get(key)
+        if not bucket:
+            return []
+        if key in self._unsorted:
+            seq = self._seq
+            bucket = dict(sorted(bucket.items(), key=lambda item: seq[item[0]]))
+            self._buckets[key] = bucket
+            self._unsorted.discard(key)
+        return [e for e in bucket.values() if e.alive]
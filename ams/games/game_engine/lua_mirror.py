@@ -0,0 +1,292 @@
+"""
+Lua-side mirror of hot entity fields for the behavior update phase.
+
+Behaviors read and write entity state through ams.get_x/ams.set_x/...,
+and every such call crosses from Lua into Python. A typical on_update
+makes several of them per entity per frame. With the mirror enabled
+(GameEngine(lua_mirror=True)), the hot fields of every entity that has
+behaviors are copied into Lua tables once before the on_update phase and
+copied back once after it:
+
+- push():  one bulk load of x, y, vx, vy, width, height, health and
+           properties into ams.entities[id]
+- pull():  one bulk write-back of the fields that changed (compared with
+           the values loaded), then the mirror is emptied
+
+While the mirror is active, the ams.* getters/setters for these fields
+read and write the mirror for mirrored entities and fall back to Python
+for everything else, so existing behaviors keep working unchanged.
+Behaviors may also use the tables directly:
+
+    local e = ams.entities[id]
+    if e then
+        e.x = e.x + e.vx * dt
+    end
+
+Outside the phase (or with the mirror off) ams.entities is an empty
+table, so such behaviors should fall back to the ams.* calls.
+
+Notes:
+- Table-valued properties are compared by identity: assign a new table
+  (or call ams.set_prop) to write a change back, as with ams.get_prop,
+  which already returns a copy.
+- ams.transform() writes pending changes back first and drops the entity
+  from the mirror, since transforming changes its size and behaviors.
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, Iterable
+
+# Entity attributes mirrored as record fields (properties is mirrored too)
+MIRRORED_FIELDS = ('x', 'y', 'vx', 'vy', 'width', 'height', 'health')
+
+_MIRROR_LUA = """
+return function(ams, apply)
+    local FIELDS = {"x", "y", "vx", "vy", "width", "height", "health"}
+    local NFIELDS = #FIELDS
+
+    local ids, cols, origin_props, count = {}, {}, {}, 0
+    local records = nil     -- id -> record while the mirror is active
+    local mirror = {}
+
+    function mirror.load(new_ids, new_cols, new_props)
+        ids, cols, origin_props, count = new_ids, new_cols, new_props, #new_ids
+        records = {}
+        local xs, ys, vxs, vys = cols[1], cols[2], cols[3], cols[4]
+        local ws, hs, hps = cols[5], cols[6], cols[7]
+        for i = 1, count do
+            local props = {}
+            for k, v in pairs(new_props[i]) do
+                props[k] = v
+            end
+            records[ids[i]] = {
+                x = xs[i], y = ys[i], vx = vxs[i], vy = vys[i],
+                width = ws[i], height = hs[i], health = hps[i],
+                properties = props,
+            }
+        end
+        ams.entities = records
+    end
+
+    -- Changed fields as flat (id, field, value) triples, plus changed
+    -- properties as (id, key, value) triples (nil value = cleared). The
+    -- loaded values are updated, so each change is reported once.
+    function mirror.collect()
+        local hot, nh, props, np = {}, 0, {}, 0
+        if not records then
+            return hot, nh, props, np
+        end
+        for i = 1, count do
+            local id = ids[i]
+            local rec = records[id]
+            if rec then
+                for f = 1, NFIELDS do
+                    local name = FIELDS[f]
+                    local value = rec[name]
+                    local col = cols[f]
+                    if value ~= nil and value ~= col[i] then
+                        hot[nh + 1], hot[nh + 2], hot[nh + 3] = id, name, value
+                        nh = nh + 3
+                        col[i] = value
+                    end
+                end
+                local current = rec.properties or {}
+                local origin = origin_props[i]
+                local before = np
+                for k, v in pairs(current) do
+                    if origin[k] ~= v then
+                        props[np + 1], props[np + 2], props[np + 3] = id, k, v
+                        np = np + 3
+                    end
+                end
+                for k in pairs(origin) do
+                    if current[k] == nil then
+                        props[np + 1], props[np + 2] = id, k
+                        np = np + 3
+                    end
+                end
+                if np > before then
+                    local copy = {}
+                    for k, v in pairs(current) do
+                        copy[k] = v
+                    end
+                    origin_props[i] = copy
+                end
+            end
+        end
+        return hot, nh, props, np
+    end
+
+    -- collect() flattened for one Python call: the hot triple count
+    -- followed by the hot and property triples
+    function mirror.changes()
+        local hot, nh, props, np = mirror.collect()
+        for i = 1, np do
+            hot[nh + i] = props[i]
+        end
+        return nh, unpack(hot, 1, nh + np)
+    end
+
+    function mirror.unload()
+        records = nil
+        ids, cols, origin_props, count = {}, {}, {}, 0
+        ams.entities = {}
+    end
+
+    local function flush()
+        apply(mirror.changes())
+    end
+
+    local function getter(field, fallback)
+        return function(id)
+            local rec = records and records[id]
+            if rec then
+                return rec[field]
+            end
+            return fallback(id)
+        end
+    end
+
+    local function setter(field, fallback)
+        return function(id, value)
+            local rec = records and records[id]
+            if rec then
+                rec[field] = value
+            else
+                fallback(id, value)
+            end
+        end
+    end
+
+    ams.get_x, ams.set_x = getter("x", ams.get_x), setter("x", ams.set_x)
+    ams.get_y, ams.set_y = getter("y", ams.get_y), setter("y", ams.set_y)
+    ams.get_vx, ams.set_vx = getter("vx", ams.get_vx), setter("vx", ams.set_vx)
+    ams.get_vy, ams.set_vy = getter("vy", ams.get_vy), setter("vy", ams.set_vy)
+    ams.get_width = getter("width", ams.get_width)
+    ams.get_height = getter("height", ams.get_height)
+    ams.get_health = getter("health", ams.get_health)
+    ams.set_health = setter("health", ams.set_health)
+
+    local py_get_prop, py_set_prop = ams.get_prop, ams.set_prop
+    ams.get_prop = function(id, key)
+        local rec = records and records[id]
+        if rec then
+            local props = rec.properties
+            return props and props[key]
+        end
+        return py_get_prop(id, key)
+    end
+    ams.set_prop = function(id, key, value)
+        local rec = records and records[id]
+        if rec then
+            rec.properties = rec.properties or {}
+            rec.properties[key] = value
+        else
+            py_set_prop(id, key, value)
+        end
+    end
+
+    local py_transform = ams.transform
+    ams.transform = function(id, into_type)
+        if records and records[id] then
+            flush()
+            records[id] = nil
+        end
+        return py_transform(id, into_type)
+    end
+
+    ams.entities = {}
+    return mirror
+end
+"""
+
+
+class LuaEntityMirror:
+    """Bulk-synchronized Lua copies of hot entity fields.
+
+    Installs the mirror-aware ams.* accessors on creation; they behave
+    exactly like the Python ones until push() is called.
+
+    Args:
+        lua: The LuaRuntime running behaviors
+        ams_namespace: The ams.* table the API was registered on
+    """
+
+    def __init__(self, lua, ams_namespace):
+        self._lua = lua
+        self._entities: Dict[str, Any] = {}
+        self._mirror = lua.execute(_MIRROR_LUA)(ams_namespace, self._apply)
+        self.frames = 0
+        self.entities_mirrored = 0
+        self.fields_written = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether entities are currently mirrored (between push and pull)."""
+        return bool(self._entities)
+
+    def push(self, entities: Iterable[Any]) -> int:
+        """Load the alive entities that have behaviors into the mirror.
+
+        Returns:
+            Number of entities mirrored
+        """
+        mirrored = [e for e in entities if e.alive and getattr(e, 'behaviors', None)]
+        self._entities = {e.id: e for e in mirrored}
+        table_from = self._lua.table_from
+        columns = [list(map(attrgetter(name), mirrored)) for name in MIRRORED_FIELDS]
+        self._mirror.load(
+            table_from([e.id for e in mirrored]),
+            table_from(columns, recursive=True),
+            table_from([e.properties for e in mirrored], recursive=True),
+        )
+        self.frames += 1
+        self.entities_mirrored = len(mirrored)
+        return len(mirrored)
+
+    def pull(self) -> int:
+        """Write changed fields back to the entities and empty the mirror.
+
+        Returns:
+            Number of fields and properties written
+        """
+        try:
+            changes = self._mirror.changes()
+            # A lone count (no changes) comes back unwrapped
+            if not isinstance(changes, tuple):
+                changes = (changes,)
+            return self._apply(*changes)
+        finally:
+            self._mirror.unload()
+            self._entities = {}
+
+    def _apply(self, hot_count: int, *changes) -> int:
+        """Apply the (id, field, value) triples from mirror.changes()."""
+        entities = self._entities
+        for entity_id, name, value in zip(changes[0:hot_count:3], changes[1:hot_count:3],
+                                          changes[2:hot_count:3]):
+            entity = entities.get(entity_id)
+            if entity is not None:
+                setattr(entity, name, value)
+        for entity_id, key, value in zip(changes[hot_count::3], changes[hot_count + 1::3],
+                                         changes[hot_count + 2::3]):
+            entity = entities.get(entity_id)
+            if entity is not None:
+                # Cleared keys become None, as with ams.set_prop(id, key, nil)
+                entity.properties[key] = value
+        written = len(changes) // 3
+        self.fields_written += written
+        return written
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get mirror statistics.
+
+        Returns:
+            Dict with frames, entities_mirrored (last frame) and
+            fields_written (total)
+        """
+        return {
+            'frames': self.frames,
+            'entities_mirrored': self.entities_mirrored,
+            'fields_written': self.fields_written,
+        }
@@ -0,0 +1,157 @@
+"""
+RenderCache - reusable surfaces for GameEngineRenderer.
+
+Rendering a frame used to allocate the same surfaces over and over:
+a scaled copy of every sprite whose size differs from its entity, a
+Font object and a rendered surface for every text command, and a fresh
+SRCALPHA surface for every translucent shape. RenderCache keeps these
+between frames:
+
+- scaled_sprite(): pre-scaled sprites keyed by (sprite, w, h)
+- font():          pygame fonts keyed by size
+- text():          rendered text surfaces keyed by (text, size, color)
+- scratch():       cleared SRCALPHA surfaces keyed by (w, h), for alpha blits
+
+Surfaces share one LRU with a memory budget (pixel bytes); the least
+recently used ones are dropped when the budget is exceeded. Fonts are few
+and small, so they are kept outside the budget.
+
+Usage:
+    cache = RenderCache(max_bytes=64 * 1024 * 1024)
+    screen.blit(cache.scaled_sprite(sprite, 32, 32), (x, y))
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+import pygame
+
+# Default memory budget for cached surfaces
+RENDER_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Approximate pixel memory held by a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class RenderCache:
+    """LRU cache of render surfaces with a memory budget.
+
+    Args:
+        max_bytes: Budget for cached surfaces in bytes. Surfaces larger than
+            the budget are returned but not kept. 0 disables caching.
+    """
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_BYTES):
+        self.max_bytes = max(0, int(max_bytes))
+        self._surfaces: OrderedDict[Hashable, Tuple[pygame.Surface, int]] = OrderedDict()
+        self._fonts: Dict[int, pygame.font.Font] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @property
+    def bytes_used(self) -> int:
+        """Pixel bytes held by cached surfaces."""
+        return self._bytes
+
+    def clear(self) -> None:
+        """Drop all cached surfaces and fonts."""
+        self._surfaces.clear()
+        self._fonts.clear()
+        self._bytes = 0
+
+    # =========================================================================
+    # Cached resources
+    # =========================================================================
+
+    def scaled_sprite(self, sprite: pygame.Surface, w: int, h: int) -> pygame.Surface:
+        """Sprite scaled to (w, h), keeping its colorkey."""
+        key = ('sprite', sprite, w, h)
+        scaled = self._get(key)
+        if scaled is None:
+            scaled = pygame.transform.scale(sprite, (w, h))
+            # Preserve transparency after scaling
+            colorkey = sprite.get_colorkey()
+            if colorkey:
+                scaled.set_colorkey(colorkey)
+            self._put(key, scaled)
+        return scaled
+
+    def font(self, size: int) -> pygame.font.Font:
+        """Default pygame font at the given size."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            if self.max_bytes:
+                self._fonts[size] = font
+        return font
+
+    def text(self, text: str, size: int, color: Tuple[int, ...]) -> pygame.Surface:
+        """Antialiased text rendered with font(size)."""
+        key = ('text', text, size, tuple(color))
+        surface = self._get(key)
+        if surface is None:
+            surface = self.font(size).render(text, True, color)
+            self._put(key, surface)
+        return surface
+
+    def scratch(self, w: int, h: int) -> pygame.Surface:
+        """Transparent SRCALPHA surface of size (w, h).
+
+        The surface is shared: it is cleared on every call and must not be
+        kept past the blit it was requested for.
+        """
+        key = ('scratch', w, h)
+        surface = self._get(key)
+        if surface is None:
+            surface = pygame.Surface((w, h), pygame.SRCALPHA)
+            self._put(key, surface)
+        else:
+            surface.fill((0, 0, 0, 0))
+        return surface
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with entries, fonts, bytes, max_bytes, hits, misses and evictions
+        """
+        return {
+            'entries': len(self._surfaces),
+            'fonts': len(self._fonts),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+        }
+
+    # =========================================================================
+    # LRU bookkeeping
+    # =========================================================================
+
+    def _get(self, key: Hashable):
+        entry = self._surfaces.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._surfaces.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key: Hashable, surface: pygame.Surface) -> None:
+        size = surface_bytes(surface)
+        if size > self.max_bytes:
+            return
+        self._surfaces[key] = (surface, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._surfaces.popitem(last=False)
+            self._bytes -= evicted
+            self._evictions += 1
@@ -1,13 +1,14 @@
 """Renderer for the YAML-driven game engine."""
 
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Hashable, List, Optional, Tuple
 
 import pygame
 
 from ams.games.game_engine.entity import GameEntity
 from ams.games.game_engine.config import GameDefinition, RenderCommand
 from ams.games.game_engine.assets import AssetProvider
+from ams.games.game_engine.render_cache import RENDER_CACHE_BYTES, RenderCache
 
 
 class GameEngineRenderer:
@@ -15,16 +16,22 @@ class GameEngineRenderer:
 
     Uses render commands from game.yaml when available, with
     fallback to simple colored rectangles.
+
+    Scaled sprites, fonts, text surfaces and alpha scratch surfaces are
+    reused across frames through a RenderCache (see get_cache_stats()).
     """
 
-    def __init__(self, assets: Optional[AssetProvider] = None):
+    def __init__(self, assets: Optional[AssetProvider] = None,
+                 cache_bytes: int = RENDER_CACHE_BYTES):
         """Initialize renderer.
 
         Args:
             assets: Asset provider for sprites/sounds. Created internally if not provided.
+            cache_bytes: Memory budget for cached surfaces (0 disables caching)
         """
         self._game_def: Optional[GameDefinition] = None
         self._assets = assets or AssetProvider()
+        self._cache = RenderCache(max_bytes=cache_bytes)
         self._elapsed_time: float = 0.0  # Set by engine each frame
 
     def set_game_definition(self, game_def: GameDefinition,
@@ -32,6 +39,11 @@ class GameEngineRenderer:
         """Set game definition for render command lookup and load assets."""
         self._game_def = game_def
         self._assets.load_from_definition(game_def, assets_dir)
+        self._cache.clear()
+
+    def get_cache_stats(self) -> dict:
+        """Get render cache statistics (see RenderCache.get_stats())."""
+        return self._cache.get_stats()
 
     def render_entity(self, entity: GameEntity, screen: pygame.Surface) -> None:
         """Render an entity using YAML render commands or fallback."""
@@ -52,8 +64,8 @@ class GameEngineRenderer:
                          screen: pygame.Surface) -> None:
         """Render entity using a list of render commands."""
         for cmd in commands:
-            # Check when condition (delegate to entity)
-            if cmd.when and not entity.evaluate_when(cmd.when, self._elapsed_time):
+            # Check when condition (compiled at load, else delegate to entity)
+            if cmd.when and not self._when_passes(entity, cmd):
                 continue
             self._render_command(entity, cmd, screen)
             # Stop processing further commands if stop flag is set
@@ -75,9 +87,9 @@ class GameEngineRenderer:
         w = int(cmd.size[0] if cmd.size else entity.width)
         h = int(cmd.size[1] if cmd.size else entity.height)
 
-        # If alpha specified, render to temp surface then blit
+        # If alpha specified, render to scratch surface then blit
         if alpha is not None and alpha < 255:
-            temp_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+            temp_surface = self._cache.scratch(w, h)
             self._render_shape_to_surface(temp_surface, cmd, color, 0, 0, w, h, entity)
             temp_surface.set_alpha(alpha)
             screen.blit(temp_surface, (x, y))
@@ -96,11 +108,7 @@ class GameEngineRenderer:
                 pygame.draw.rect(surface, color, rect, cmd.line_width)
 
         elif cmd.shape == 'circle':
-            # Radius: use explicit, or derive from entity size
-            if cmd.radius is not None:
-                radius = int(cmd.radius * min(w, h) / 2)
-            else:
-                radius = min(w, h) // 2
+            radius = self._circle_radius(cmd, w, h)
             center = (x + w // 2, y + h // 2)
             if cmd.fill:
                 pygame.draw.circle(surface, color, center, radius)
@@ -137,23 +145,125 @@ class GameEngineRenderer:
 
         elif cmd.shape == 'sprite':
             # Sprite rendering - subclasses can override for asset loading
-            self._render_sprite(entity, cmd.sprite_name or entity.sprite, surface, x, y, w, h)
+            self._render_sprite(entity, self._sprite_name(entity, cmd), surface, x, y, w, h)
 
         elif cmd.shape == 'text':
             # Text rendering
             text_content = self._resolve_text(entity, cmd.text)
             if text_content:
-                font = pygame.font.Font(None, cmd.font_size)
-                text_surface = font.render(str(text_content), True, color)
-                rect = pygame.Rect(x, y, w, h)
-                if cmd.align == 'center':
-                    text_rect = text_surface.get_rect(center=rect.center)
-                elif cmd.align == 'left':
-                    text_rect = text_surface.get_rect(midleft=rect.midleft)
-                else:  # right
-                    text_rect = text_surface.get_rect(midright=rect.midright)
+                text_surface = self._cache.text(str(text_content), cmd.font_size, color)
+                text_rect = self._align_text(text_surface, pygame.Rect(x, y, w, h), cmd.align)
                 surface.blit(text_surface, text_rect)
 
+    def _when_passes(self, entity: GameEntity, cmd: RenderCommand) -> bool:
+        """Evaluate a command's when condition."""
+        if cmd.when_check is not None:
+            return cmd.when_check(entity, self._elapsed_time)
+        return entity.evaluate_when(cmd.when, self._elapsed_time)
+
+    def _sprite_name(self, entity: GameEntity, cmd: RenderCommand) -> str:
+        """Resolved sprite name for a sprite command ('' if none)."""
+        if cmd.sprite_template is not None:
+            return cmd.sprite_template(entity)
+        return entity.resolve_sprite_template(cmd.sprite_name or entity.sprite)
+
+    def _circle_radius(self, cmd: RenderCommand, w: int, h: int) -> int:
+        """Radius: use explicit, or derive from entity size."""
+        if cmd.radius is not None:
+            return int(cmd.radius * min(w, h) / 2)
+        return min(w, h) // 2
+
+    def _align_text(self, text_surface: pygame.Surface, rect: pygame.Rect,
+                    align: str) -> pygame.Rect:
+        """Position a rendered text surface within rect."""
+        if align == 'center':
+            return text_surface.get_rect(center=rect.center)
+        elif align == 'left':
+            return text_surface.get_rect(midleft=rect.midleft)
+        return text_surface.get_rect(midright=rect.midright)
+
+    # =========================================================================
+    # Render state (dirty-rect rendering)
+    # =========================================================================
+
+    def entity_state(self, entity: GameEntity) -> Tuple[pygame.Rect, Hashable]:
+        """Screen bounds and visual signature of an entity, without drawing.
+
+        Two frames with equal bounds and signatures draw the same pixels,
+        so dirty-rect rendering only repaints entities whose state changed.
+        The bounds are conservative (line widths and antialiasing included).
+        """
+        commands = None
+        if self._game_def:
+            type_config = self._game_def.entity_types.get(entity.entity_type)
+            if type_config and type_config.render:
+                commands = type_config.render
+
+        if not commands:
+            rect = pygame.Rect(int(entity.x), int(entity.y), int(entity.width), int(entity.height))
+            return rect, (self._parse_color(entity.color),)
+
+        bounds = None
+        signature = []
+        for cmd in commands:
+            if cmd.when and not self._when_passes(entity, cmd):
+                signature.append(None)
+                continue
+            rect, visual = self._command_state(entity, cmd)
+            bounds = rect if bounds is None else bounds.union(rect)
+            signature.append(visual)
+            if cmd.stop:
+                break
+        if bounds is None:
+            bounds = pygame.Rect(int(entity.x), int(entity.y), 0, 0)
+        return bounds, tuple(signature)
+
+    def _command_state(self, entity: GameEntity,
+                       cmd: RenderCommand) -> Tuple[pygame.Rect, Hashable]:
+        """Bounds and signature of a single render command (see entity_state)."""
+        color = self._resolve_color(entity, cmd.color)
+        alpha = self._resolve_alpha(entity, cmd.alpha)
+        x = int(entity.x + cmd.offset[0])
+        y = int(entity.y + cmd.offset[1])
+        w = int(cmd.size[0] if cmd.size else entity.width)
+        h = int(cmd.size[1] if cmd.size else entity.height)
+        rect = pygame.Rect(x, y, w, h)
+        visual: Hashable = (x, y, w, h, color, alpha)
+
+        # Content is part of the signature however the command is drawn
+        text_content = None
+        if cmd.shape == 'sprite':
+            sprite_name = self._sprite_name(entity, cmd)
+            visual += (sprite_name if sprite_name else entity.color,)
+        elif cmd.shape == 'text':
+            text_content = self._resolve_text(entity, cmd.text)
+            visual += (text_content,)
+
+        if alpha is not None and alpha < 255:
+            # Drawn through a (w, h) scratch surface, which clips the shape
+            pass
+        elif cmd.shape == 'circle':
+            radius = self._circle_radius(cmd, w, h)
+            rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+            rect.center = (x + w // 2, y + h // 2)
+        elif cmd.shape in ('triangle', 'polygon', 'line') and cmd.points:
+            xs = [x + int(p[0] * w) for p in cmd.points]
+            ys = [y + int(p[1] * h) for p in cmd.points]
+            rect = rect.union(pygame.Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)))
+        elif cmd.shape == 'text' and text_content:
+            text_surface = self._cache.text(str(text_content), cmd.font_size, color)
+            rect = rect.union(self._align_text(text_surface, rect, cmd.align))
+
+        # Outline width and antialiasing can reach past the nominal shape
+        margin = (cmd.line_width if not cmd.fill else 0) + 2
+        return rect.inflate(margin * 2, margin * 2), visual
+
+    def hud_state(self, screen: pygame.Surface, score: int, lives: int,
+                  level_name: str = "") -> Tuple[pygame.Rect, Hashable]:
+        """Screen bounds and signature of render_hud() output."""
+        height = 10 + self._cache.font(36).get_linesize()
+        return pygame.Rect(0, 0, screen.get_width(), height), (score, lives, level_name)
+
     def _resolve_alpha(self, entity: GameEntity, alpha_value: Any) -> Optional[int]:
         """Resolve alpha value (int, $property, or {lua: expr}) to 0-255 range."""
         if alpha_value is None:
@@ -187,18 +297,19 @@ class GameEngineRenderer:
 
     def _render_sprite(self, entity: GameEntity, sprite_name: str,
                        screen: pygame.Surface, x: int, y: int, w: int, h: int) -> None:
-        """Render a sprite from loaded assets."""
+        """Render a sprite from loaded assets.
+
+        Args:
+            sprite_name: Sprite name with {property} placeholders already resolved
+        """
         if not sprite_name:
             # No sprite specified, fallback to colored rectangle
             color = self._parse_color(entity.color)
             pygame.draw.rect(screen, color, pygame.Rect(x, y, w, h))
             return
 
-        # Resolve template placeholders like {frame} (delegate to entity)
-        resolved_name = entity.resolve_sprite_template(sprite_name)
-
         # Get sprite from asset provider
-        sprite = self._assets.get_sprite(resolved_name)
+        sprite = self._assets.get_sprite(sprite_name)
         if sprite is None:
             # Fallback to colored rectangle
             color = self._parse_color(entity.color)
@@ -208,12 +319,7 @@ class GameEngineRenderer:
         # Scale sprite to entity size
         sprite_w, sprite_h = sprite.get_size()
         if sprite_w != w or sprite_h != h:
-            scaled = pygame.transform.scale(sprite, (int(w), int(h)))
-            # Preserve transparency after scaling
-            colorkey = sprite.get_colorkey()
-            if colorkey:
-                scaled.set_colorkey(colorkey)
-            screen.blit(scaled, (x, y))
+            screen.blit(self._cache.scaled_sprite(sprite, int(w), int(h)), (x, y))
         else:
             screen.blit(sprite, (x, y))
 
@@ -243,19 +349,17 @@ class GameEngineRenderer:
     def render_hud(self, screen: pygame.Surface, score: int, lives: int,
                    level_name: str = "") -> None:
         """Render HUD elements."""
-        font = pygame.font.Font(None, 36)
-
         # Score
-        score_text = font.render(f"Score: {score}", True, (255, 255, 255))
+        score_text = self._cache.text(f"Score: {score}", 36, (255, 255, 255))
         screen.blit(score_text, (10, 10))
 
         # Lives
-        lives_text = font.render(f"Lives: {lives}", True, (255, 255, 255))
+        lives_text = self._cache.text(f"Lives: {lives}", 36, (255, 255, 255))
         screen.blit(lives_text, (screen.get_width() - 120, 10))
 
         # Level name
         if level_name:
-            level_text = font.render(level_name, True, (200, 200, 200))
+            level_text = self._cache.text(level_name, 36, (200, 200, 200))
             level_rect = level_text.get_rect(centerx=screen.get_width() // 2, y=10)
             screen.blit(level_text, level_rect)
 
@@ -12,6 +12,9 @@ Usage:
 
     manager = RollbackStateManager(history_duration=2.0, fps=60)
 
+    # Keyframes plus per-frame deltas instead of full copies:
+    manager = RollbackStateManager(snapshot_mode='delta', keyframe_interval=30)
+
     # In game loop:
     manager.capture_snapshot(game_engine)
 
@@ -28,7 +31,7 @@ Debugging:
         logger.log_snapshot(snapshot)
 """
 
-from .snapshot import EntitySnapshot, GameSnapshot, ScheduledCallbackSnapshot
+from .snapshot import DeltaSnapshot, EntitySnapshot, GameSnapshot, ScheduledCallbackSnapshot
 from .manager import RollbackStateManager
 from .logger import (
     GameStateLogger,
@@ -39,6 +42,7 @@ from .logger import (
 )
 
 __all__ = [
+    'DeltaSnapshot',
     'EntitySnapshot',
     'GameSnapshot',
     'ScheduledCallbackSnapshot',
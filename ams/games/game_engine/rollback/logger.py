@@ -127,6 +127,7 @@ class GameStateLogger:
         restored_frame: int,
         frames_resimulated: int,
         hit_position: Optional[tuple] = None,
+        duration_ms: Optional[float] = None,
     ) -> None:
         """Log a rollback event.
 
@@ -135,6 +136,7 @@ class GameStateLogger:
             restored_frame: Frame number we restored to
             frames_resimulated: Number of frames re-simulated
             hit_position: Optional (x, y) of the hit that triggered rollback
+            duration_ms: Optional wall time of restore + re-simulation
         """
         self._emit({
             "type": "rollback",
@@ -143,6 +145,7 @@ class GameStateLogger:
             "restored_frame": restored_frame,
             "frames_resimulated": frames_resimulated,
             "hit_position": hit_position,
+            "duration_ms": duration_ms,
             "log_index": self._logged_count,
         })
         self._logged_count += 1
@@ -421,5 +424,8 @@ def summarize_log(log_path: str) -> Dict[str, Any]:
         summary["total_frames_resimulated"] = sum(
             r.get("frames_resimulated", 0) for r in rollbacks
         )
+        durations = [r["duration_ms"] for r in rollbacks if r.get("duration_ms") is not None]
+        if durations:
+            summary["max_rollback_ms"] = max(durations)
 
     return summary
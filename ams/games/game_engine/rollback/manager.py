@@ -5,12 +5,21 @@ Manages state snapshots and provides rollback/re-simulation capabilities
 for handling delayed hit detection from CV backends.
 """
 
+import copy
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 
-from .snapshot import EntitySnapshot, GameSnapshot, ScheduledCallbackSnapshot
+from ams import profiling
+
+from .snapshot import (
+    DeltaSnapshot,
+    EntitySnapshot,
+    GameSnapshot,
+    ScheduledCallbackSnapshot,
+    estimate_size,
+)
 
 if TYPE_CHECKING:
     from ams.games.game_engine.engine import GameEngine
@@ -18,13 +27,28 @@ if TYPE_CHECKING:
     from ams.events import PlaneHitEvent
 
 
+# Stored capture: full snapshot or delta on top of earlier captures
+Snapshot = Union[GameSnapshot, DeltaSnapshot]
+
+# Snapshot storage modes
+SNAPSHOT_MODES = ('full', 'delta')
+
+
 @dataclass
 class RollbackResult:
-    """Result of a rollback operation."""
+    """Result of a rollback operation.
+
+    Timings are wall-clock milliseconds spent inside the rollback call.
+    """
     success: bool
     frames_resimulated: int = 0
     snapshot_age_ms: float = 0.0
     error: Optional[str] = None
+    restored_frame: int = 0
+    hits_applied: int = 0
+    restore_ms: float = 0.0
+    resimulate_ms: float = 0.0
+    total_ms: float = 0.0
 
 
 class RollbackStateManager:
@@ -38,6 +62,15 @@ class RollbackStateManager:
         history_duration: How far back in time we can rollback (seconds)
         fps: Expected frame rate (for calculating snapshot buffer size)
         snapshot_interval: Capture every N frames (1 = every frame)
+        snapshot_mode: 'full' stores a GameSnapshot per capture. 'delta'
+            stores a keyframe every keyframe_interval captures and
+            DeltaSnapshots (changed entities/fields only) in between.
+        keyframe_interval: Captures per keyframe in delta mode
+        headless_resimulation: Re-simulate with the engine's
+            _do_headless_frame_update (game logic only) and run just the
+            final frame through _do_frame_update, so sounds and skin
+            updates happen once per rollback (game state is the same either
+            way)
 
     Example:
         manager = RollbackStateManager(history_duration=2.0, fps=60)
@@ -58,14 +91,29 @@ class RollbackStateManager:
         history_duration: float = 2.0,
         fps: int = 60,
         snapshot_interval: int = 1,
+        snapshot_mode: str = 'full',
+        keyframe_interval: int = 30,
+        headless_resimulation: bool = True,
     ):
+        if snapshot_mode not in SNAPSHOT_MODES:
+            raise ValueError(
+                f"snapshot_mode must be one of {SNAPSHOT_MODES}, got {snapshot_mode!r}"
+            )
         self.history_duration = history_duration
         self.fps = fps
         self.snapshot_interval = snapshot_interval
+        self.snapshot_mode = snapshot_mode
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.headless_resimulation = headless_resimulation
 
         # Calculate buffer size
         max_snapshots = int(history_duration * fps / snapshot_interval)
-        self._snapshots: Deque[GameSnapshot] = deque(maxlen=max_snapshots)
+        self._snapshots: Deque[Snapshot] = deque(maxlen=max_snapshots)
+
+        # Delta mode: entity snapshots and record of the last capture
+        self._last_entities: Dict[str, EntitySnapshot] = {}
+        self._last_record: Optional[Snapshot] = None
+        self._deltas_since_keyframe = 0
 
         # Frame counter for interval-based capture
         self._frame_counter = 0
@@ -73,6 +121,11 @@ class RollbackStateManager:
         # Statistics
         self._total_captures = 0
         self._total_rollbacks = 0
+        self._last_capture_us = 0.0
+        self._total_capture_us = 0.0
+        self._last_rollback: Optional[RollbackResult] = None
+        self._max_rollback_ms = 0.0
+        self._total_rollback_ms = 0.0
 
     @property
     def snapshot_count(self) -> int:
@@ -111,7 +164,7 @@ class RollbackStateManager:
             return False
         return self._snapshots[0].timestamp <= timestamp
 
-    def capture(self, game_engine: 'GameEngine', force: bool = False) -> Optional[GameSnapshot]:
+    def capture(self, game_engine: 'GameEngine', force: bool = False) -> Optional[Snapshot]:
         """Capture current game state as a snapshot.
 
         Args:
@@ -119,7 +172,8 @@ class RollbackStateManager:
             force: If True, capture even if not at snapshot interval
 
         Returns:
-            The captured snapshot, or None if skipped due to interval
+            The captured snapshot (a DeltaSnapshot between keyframes in
+            delta mode), or None if skipped due to interval
         """
         self._frame_counter += 1
 
@@ -127,8 +181,14 @@ class RollbackStateManager:
         if not force and (self._frame_counter % self.snapshot_interval != 0):
             return None
 
-        snapshot = self._capture_snapshot(game_engine)
+        start = time.perf_counter()
+        if self.snapshot_mode == 'delta':
+            snapshot = self._capture_delta(game_engine)
+        else:
+            snapshot = self._capture_snapshot(game_engine)
         self._snapshots.append(snapshot)
+        self._last_capture_us = (time.perf_counter() - start) * 1e6
+        self._total_capture_us += self._last_capture_us
         self._total_captures += 1
 
         return snapshot
@@ -143,6 +203,59 @@ class RollbackStateManager:
             if entity_id != 'pointer':
                 entity_snapshots[entity_id] = EntitySnapshot.from_entity(entity)
 
+        return GameSnapshot(entities=entity_snapshots, **self._capture_globals(game_engine))
+
+    def _capture_delta(self, game_engine: 'GameEngine') -> Snapshot:
+        """Internal: Capture changes since the last capture (delta mode).
+
+        Unchanged entities reuse their previous EntitySnapshot, so keyframes
+        only cost a dict of references on top of the delta work.
+        """
+        lua_engine = game_engine._behavior_engine
+        last = self._last_entities
+
+        current: Dict[str, EntitySnapshot] = {}
+        changed: Dict[str, Dict[str, Any]] = {}
+        added: Dict[str, EntitySnapshot] = {}
+        for entity_id, entity in lua_engine.entities.items():
+            if entity_id == 'pointer':
+                continue
+            previous = last.get(entity_id)
+            if previous is None:
+                snap = added[entity_id] = EntitySnapshot.from_entity(entity)
+            else:
+                changes = previous.changes_from(entity)
+                if changes:
+                    changed[entity_id] = changes
+                    snap = previous.with_changes(changes)
+                else:
+                    snap = previous
+            current[entity_id] = snap
+
+        removed = tuple(entity_id for entity_id in last if entity_id not in current)
+        self._last_entities = current
+
+        global_state = self._capture_globals(game_engine)
+        if (self._last_record is None
+                or self._deltas_since_keyframe + 1 >= self.keyframe_interval):
+            record: Snapshot = GameSnapshot(entities=current, **global_state)
+            self._deltas_since_keyframe = 0
+        else:
+            record = DeltaSnapshot(
+                previous=self._last_record,
+                changed=changed,
+                added=added,
+                removed=removed,
+                **global_state,
+            )
+            self._deltas_since_keyframe += 1
+        self._last_record = record
+        return record
+
+    def _capture_globals(self, game_engine: 'GameEngine') -> Dict[str, Any]:
+        """Internal: Capture timing and global game state (not entities)."""
+        lua_engine = game_engine._behavior_engine
+
         # Capture scheduled callbacks
         scheduled = tuple(
             ScheduledCallbackSnapshot(
@@ -150,7 +263,7 @@ class RollbackStateManager:
                 callback_name=cb.callback_name,
                 entity_id=cb.entity_id,
             )
-            for cb in lua_engine._scheduled
+            for cb in lua_engine.get_scheduled()
         )
 
         # Get internal state as string
@@ -158,18 +271,17 @@ class RollbackStateManager:
             game_engine._internal_state, 'name'
         ) else str(game_engine._internal_state)
 
-        return GameSnapshot(
+        return dict(
             frame_number=self._frame_counter,
             elapsed_time=lua_engine.elapsed_time,
             timestamp=time.monotonic(),
-            entities=entity_snapshots,
             score=lua_engine.score,
             lives=getattr(game_engine, '_lives', 3),
             internal_state=internal_state,
             scheduled_callbacks=scheduled,
         )
 
-    def find_snapshot(self, timestamp: float) -> Optional[GameSnapshot]:
+    def find_snapshot(self, timestamp: float) -> Optional[Snapshot]:
         """Find the snapshot closest to (but not after) the given timestamp.
 
         Args:
@@ -182,7 +294,7 @@ class RollbackStateManager:
             return None
 
         # Binary search would be faster, but linear is fine for typical sizes
-        best: Optional[GameSnapshot] = None
+        best: Optional[Snapshot] = None
         for snapshot in self._snapshots:
             if snapshot.timestamp <= timestamp:
                 best = snapshot
@@ -209,9 +321,12 @@ class RollbackStateManager:
                 break
         return best_idx
 
-    def restore(self, game_engine: 'GameEngine', snapshot: GameSnapshot) -> None:
+    def restore(self, game_engine: 'GameEngine', snapshot: Snapshot) -> None:
         """Restore game state from a snapshot.
 
+        A DeltaSnapshot is rebuilt by applying deltas forward from its
+        keyframe.
+
         Args:
             game_engine: The game engine to restore
             snapshot: The snapshot to restore from
@@ -231,7 +346,11 @@ class RollbackStateManager:
         self._restore_scheduled_callbacks(lua_engine, snapshot.scheduled_callbacks)
 
         # Restore entities
-        self._restore_entities(game_engine, lua_engine, snapshot)
+        self._restore_entities(game_engine, lua_engine, snapshot.entities)
+
+        # Entities were swapped in place, bypassing spawn/destroy/transform
+        if hasattr(game_engine, '_rebuild_entity_index'):
+            game_engine._rebuild_entity_index()
 
     def _restore_internal_state(
         self, game_engine: 'GameEngine', state_str: str
@@ -254,34 +373,38 @@ class RollbackStateManager:
         lua_engine: Any,
         callbacks: Tuple[ScheduledCallbackSnapshot, ...],
     ) -> None:
-        """Restore scheduled callbacks from snapshot."""
+        """Restore scheduled callbacks from snapshot.
+
+        Must run after elapsed_time is restored: the engine schedules them
+        relative to it.
+        """
         from ams.lua.engine import ScheduledCallback
 
-        lua_engine._scheduled = [
+        lua_engine.restore_scheduled([
             ScheduledCallback(
                 time_remaining=cb.time_remaining,
                 callback_name=cb.callback_name,
                 entity_id=cb.entity_id,
             )
             for cb in callbacks
-        ]
+        ])
 
     def _restore_entities(
         self,
         game_engine: 'GameEngine',
         lua_engine: Any,
-        snapshot: GameSnapshot,
+        entities: Dict[str, EntitySnapshot],
     ) -> None:
-        """Restore entity state from snapshot."""
+        """Restore entity state from snapshot entities."""
         current_ids = set(lua_engine.entities.keys())
-        snapshot_ids = set(snapshot.entities.keys())
+        snapshot_ids = set(entities.keys())
 
         # Remove entities that didn't exist at snapshot time
         for entity_id in current_ids - snapshot_ids:
             del lua_engine.entities[entity_id]
 
         # Restore or recreate entities from snapshot
-        for entity_id, entity_snap in snapshot.entities.items():
+        for entity_id, entity_snap in entities.items():
             if entity_id in lua_engine.entities:
                 # Entity exists - restore its state
                 entity_snap.apply_to(lua_engine.entities[entity_id])
@@ -296,7 +419,9 @@ class RollbackStateManager:
         """Recreate an entity from snapshot (for entities that were removed)."""
         from ams.games.game_engine.entity import GameEntity
 
-        entity = GameEntity(
+        # Let the engine pick the entity class (e.g. columnar store-backed)
+        entity_factory = getattr(game_engine, '_create_entity_object', GameEntity)
+        entity = entity_factory(
             id=snapshot.id,
             entity_type=snapshot.entity_type,
             alive=snapshot.alive,
@@ -313,12 +438,13 @@ class RollbackStateManager:
             spawn_time=snapshot.spawn_time,
             tags=list(snapshot.tags),
             behaviors=list(snapshot.behaviors),
-            behavior_config=dict(snapshot.behavior_config),
+            behavior_config=copy.deepcopy(snapshot.behavior_config),
             parent_id=snapshot.parent_id,
             parent_offset=tuple(snapshot.parent_offset),
             children=list(snapshot.children),
         )
-        entity.properties = dict(snapshot.properties)
+        # Deep copies: snapshots may be shared between captures (delta mode)
+        entity.properties = copy.deepcopy(snapshot.properties)
 
         # Set lifecycle dispatch if available
         if hasattr(game_engine, '_dispatch_lifecycle'):
@@ -346,8 +472,42 @@ class RollbackStateManager:
         Returns:
             RollbackResult with success status and statistics
         """
+        return self.rollback_and_resimulate_batch(
+            game_engine,
+            [(target_timestamp, hit_applicator)],
+            current_timestamp=current_timestamp,
+        )
+
+    def rollback_and_resimulate_batch(
+        self,
+        game_engine: 'GameEngine',
+        hits: Sequence[Tuple[float, Callable[[], None]]],
+        current_timestamp: Optional[float] = None,
+    ) -> RollbackResult:
+        """Apply several delayed hits with a single rollback.
+
+        Hits are sorted by timestamp. State is restored once, to the
+        snapshot for the earliest hit, which is applied straight away (as in
+        rollback_and_resimulate). Each later hit is applied before the
+        re-simulated frame that contains its timestamp, so a volley costs one
+        re-simulation of the window instead of one per hit.
+
+        Args:
+            game_engine: The game engine to rollback
+            hits: (hit_timestamp, hit_applicator) pairs, in any order
+            current_timestamp: Current time (defaults to time.monotonic())
+
+        Returns:
+            RollbackResult with success status and statistics
+        """
+        if not hits:
+            return RollbackResult(success=False, error="No hits to apply")
         if current_timestamp is None:
             current_timestamp = time.monotonic()
+        start = time.perf_counter()
+
+        ordered = sorted(hits, key=lambda hit: hit[0])
+        target_timestamp = ordered[0][0]
 
         # Find snapshot to restore from
         snapshot = self.find_snapshot(target_timestamp)
@@ -363,22 +523,63 @@ class RollbackStateManager:
         # Restore to snapshot
         self.restore(game_engine, snapshot)
 
-        # Apply the hit at the restored state
-        hit_applicator()
+        # Frame (relative to the restore) at which each hit is applied.
+        # Frames are counted on the snapshot's grid, as _resimulate steps
+        # them; the earliest hit's frame is 0. (Epsilon keeps a hit stamped
+        # exactly on a frame boundary in that frame.)
+        def grid_frame(timestamp: float) -> int:
+            return int((timestamp - snapshot.timestamp) * self.fps + 1e-6)
+
+        first_frame = grid_frame(target_timestamp)
+        schedule = [(grid_frame(hit_timestamp) - first_frame, applicator)
+                    for hit_timestamp, applicator in ordered]
+        applied = 0
+
+        def apply_due_hits(frame: float) -> None:
+            nonlocal applied
+            while applied < len(schedule) and schedule[applied][0] <= frame:
+                schedule[applied][1]()
+                applied += 1
+
+        # Apply the earliest hit(s) at the restored state
+        apply_due_hits(0)
+        restored = time.perf_counter()
 
         # Re-simulate from snapshot time to current time
         frames = self._resimulate(
             game_engine,
             from_time=snapshot.elapsed_time,
             to_elapsed=(current_timestamp - snapshot.timestamp) + snapshot.elapsed_time,
+            before_frame=apply_due_hits if len(schedule) > 1 else None,
         )
 
-        self._total_rollbacks += 1
+        # Hits stamped after the re-simulated window land on the present
+        apply_due_hits(float('inf'))
+        finished = time.perf_counter()
 
-        return RollbackResult(
+        result = RollbackResult(
             success=True,
             frames_resimulated=frames,
             snapshot_age_ms=snapshot_age_ms,
+            restored_frame=snapshot.frame_number,
+            hits_applied=applied,
+            restore_ms=(restored - start) * 1000,
+            resimulate_ms=(finished - restored) * 1000,
+            total_ms=(finished - start) * 1000,
+        )
+        self._record_rollback(result, target_timestamp)
+        return result
+
+    def _record_rollback(self, result: RollbackResult, target_timestamp: float) -> None:
+        """Update rollback cost statistics and the frame profile."""
+        self._total_rollbacks += 1
+        self._last_rollback = result
+        self._max_rollback_ms = max(self._max_rollback_ms, result.total_ms)
+        self._total_rollback_ms += result.total_ms
+        profiling.record_rollback(
+            frames_resimulated=result.frames_resimulated,
+            target_timestamp=target_timestamp,
+            snapshot_age_ms=result.snapshot_age_ms,
         )
 
     def _resimulate(
@@ -386,15 +587,19 @@ class RollbackStateManager:
         game_engine: 'GameEngine',
         from_time: float,
         to_elapsed: float,
+        before_frame: Optional[Callable[[int], None]] = None,
     ) -> int:
         """Re-simulate game state from one time to another.
 
-        Uses fixed timestep for determinism.
+        Uses fixed timestep for determinism. With headless_resimulation,
+        every frame but the last uses the engine's headless frame update
+        (when it has one).
 
         Args:
             game_engine: The game engine to simulate
             from_time: Starting elapsed time
             to_elapsed: Target elapsed time
+            before_frame: Called with the frame index before each frame
 
         Returns:
             Number of frames simulated
@@ -402,18 +607,26 @@ class RollbackStateManager:
         dt = 1.0 / self.fps
         frames = 0
 
-        lua_engine = game_engine._behavior_engine
+        max_frames = self.fps * self.history_duration * 2
+        full_update = game_engine._do_frame_update
+        headless_update = full_update
+        if self.headless_resimulation:
+            headless_update = getattr(game_engine, '_do_headless_frame_update', full_update)
+
         current_elapsed = from_time
 
         while current_elapsed < to_elapsed:
             # Run one frame of game logic
             # Use the engine's internal update that doesn't capture snapshots
-            game_engine._do_frame_update(dt)
+            if before_frame is not None:
+                before_frame(frames)
+            last_frame = current_elapsed + dt >= to_elapsed or frames + 1 > max_frames
+            (full_update if last_frame else headless_update)(dt)
             current_elapsed += dt
             frames += 1
 
             # Safety limit to prevent infinite loops
-            if frames > self.fps * self.history_duration * 2:
+            if frames > max_frames:
                 break
 
         return frames
@@ -421,18 +634,28 @@ class RollbackStateManager:
     def clear(self) -> None:
         """Clear all stored snapshots."""
         self._snapshots.clear()
+        self._last_entities = {}
+        self._last_record = None
+        self._deltas_since_keyframe = 0
         self._frame_counter = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about rollback manager state.
 
+        Memory figures walk the whole history, so call this for reporting
+        rather than every frame.
+
         Returns:
-            Dict with snapshot count, time span, capture/rollback counts
+            Dict with snapshot count, time span, capture/rollback counts,
+            capture time (microseconds), history memory (bytes) and
+            rollback cost (milliseconds)
         """
         time_span = 0.0
         if self._snapshots and len(self._snapshots) >= 2:
             time_span = self._snapshots[-1].timestamp - self._snapshots[0].timestamp
 
+        history_bytes = estimate_size(list(self._snapshots))
+
         return {
             'snapshot_count': len(self._snapshots),
             'max_snapshots': self.max_snapshots,
@@ -442,4 +665,21 @@ class RollbackStateManager:
             'total_captures': self._total_captures,
             'total_rollbacks': self._total_rollbacks,
             'frame_counter': self._frame_counter,
+            'snapshot_mode': self.snapshot_mode,
+            'keyframe_count': sum(1 for s in self._snapshots if isinstance(s, GameSnapshot)),
+            'history_bytes': history_bytes,
+            'bytes_per_snapshot': history_bytes / len(self._snapshots) if self._snapshots else 0.0,
+            'capture_us_last': self._last_capture_us,
+            'capture_us_mean': (
+                self._total_capture_us / self._total_captures if self._total_captures else 0.0
+            ),
+            'headless_resimulation': self.headless_resimulation,
+            'rollback_ms_last': self._last_rollback.total_ms if self._last_rollback else 0.0,
+            'rollback_ms_max': self._max_rollback_ms,
+            'rollback_ms_mean': (
+                self._total_rollback_ms / self._total_rollbacks if self._total_rollbacks else 0.0
+            ),
+            'resimulated_frames_last': (
+                self._last_rollback.frames_resimulated if self._last_rollback else 0
+            ),
         }
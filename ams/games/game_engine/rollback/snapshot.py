@@ -3,11 +3,17 @@ Snapshot dataclasses for rollback state management.
 
 These immutable snapshots capture the complete game state at a point in time,
 enabling restoration and re-simulation for handling delayed hit detection.
+
+DeltaSnapshot stores only what changed since the previous capture and
+rebuilds its entities on demand from the nearest GameSnapshot keyframe.
+Unchanged EntitySnapshots are shared between captures (copy-on-write), so
+snapshots must be treated as read-only.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple, Union
 import copy
+import sys
 
 
 @dataclass(frozen=True)
@@ -97,6 +103,38 @@ class EntitySnapshot:
             behavior_config=copy.deepcopy(entity.behavior_config),
         )
 
+    def changes_from(self, entity: 'GameEntity') -> Dict[str, Any]:
+        """Fields where entity differs from this snapshot.
+
+        Values are in snapshot form (tuples, deep-copied dicts), ready for
+        with_changes(). Comparing is much cheaper than from_entity() because
+        properties/behavior_config are only copied when they changed.
+
+        Args:
+            entity: Entity this snapshot was taken from
+
+        Returns:
+            Dict of field name to new value (empty if unchanged)
+        """
+        changes: Dict[str, Any] = {}
+        for name in _VALUE_FIELDS:
+            value = getattr(entity, name)
+            if value != getattr(self, name):
+                changes[name] = value
+        for name in _SEQUENCE_FIELDS:
+            value = tuple(getattr(entity, name))
+            if value != getattr(self, name):
+                changes[name] = value
+        for name in _DICT_FIELDS:
+            value = getattr(entity, name)
+            if value != getattr(self, name):
+                changes[name] = copy.deepcopy(value)
+        return changes
+
+    def with_changes(self, changes: Dict[str, Any]) -> 'EntitySnapshot':
+        """New snapshot with changes applied (unchanged fields are shared)."""
+        return replace(self, **changes)
+
     def apply_to(self, entity: 'GameEntity') -> None:
         """Apply this snapshot's state to an entity.
 
@@ -125,6 +163,15 @@ class EntitySnapshot:
         entity.behavior_config = copy.deepcopy(self.behavior_config)
 
 
+# EntitySnapshot fields compared by changes_from(), grouped by copy rule
+_VALUE_FIELDS = (
+    'entity_type', 'alive', 'x', 'y', 'vx', 'vy', 'width', 'height',
+    'color', 'sprite', 'visible', 'health', 'spawn_time', 'parent_id',
+)
+_SEQUENCE_FIELDS = ('tags', 'parent_offset', 'children', 'behaviors')
+_DICT_FIELDS = ('properties', 'behavior_config')
+
+
 @dataclass
 class GameSnapshot:
     """
@@ -174,6 +221,111 @@ class GameSnapshot:
         )
 
 
+@dataclass
+class DeltaSnapshot:
+    """
+    Game state stored as changes since the previous capture.
+
+    Global state (score, lives, callbacks...) is stored in full since it is
+    small. Entities are stored as per-field changes plus added/removed ids;
+    the entities property rebuilds the full entity dict by applying the
+    chain of deltas forward from the keyframe (GameSnapshot) it started
+    from. A DeltaSnapshot can be used anywhere a GameSnapshot is read.
+    """
+    # Timing
+    frame_number: int
+    elapsed_time: float
+    timestamp: float
+
+    # Capture this delta applies on top of
+    previous: Union[GameSnapshot, 'DeltaSnapshot'] = field(repr=False)
+
+    # Entity changes: {entity_id: {field: value}}
+    changed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    added: Dict[str, EntitySnapshot] = field(default_factory=dict)
+    removed: Tuple[str, ...] = ()
+
+    # Game progress
+    score: int = 0
+    lives: int = 3
+    internal_state: str = "PLAYING"
+    scheduled_callbacks: Tuple[ScheduledCallbackSnapshot, ...] = ()
+
+    @property
+    def keyframe(self) -> GameSnapshot:
+        """Full snapshot this delta chain starts from."""
+        record = self.previous
+        while isinstance(record, DeltaSnapshot):
+            record = record.previous
+        return record
+
+    @property
+    def entities(self) -> Dict[str, EntitySnapshot]:
+        """All entity snapshots at this point (rebuilt on each access)."""
+        chain = []
+        record: Union[GameSnapshot, DeltaSnapshot] = self
+        while isinstance(record, DeltaSnapshot):
+            chain.append(record)
+            record = record.previous
+
+        entities = dict(record.entities)
+        for delta in reversed(chain):
+            for entity_id in delta.removed:
+                entities.pop(entity_id, None)
+            for entity_id, changes in delta.changed.items():
+                entities[entity_id] = entities[entity_id].with_changes(changes)
+            entities.update(delta.added)
+        return entities
+
+    @property
+    def entity_count(self) -> int:
+        """Number of entities in snapshot."""
+        return len(self.entities)
+
+    @property
+    def alive_entity_count(self) -> int:
+        """Number of alive entities in snapshot."""
+        return sum(1 for e in self.entities.values() if e.alive)
+
+    def get_entity(self, entity_id: str) -> Optional[EntitySnapshot]:
+        """Get entity snapshot by ID."""
+        return self.entities.get(entity_id)
+
+    def __repr__(self) -> str:
+        return (
+            f"DeltaSnapshot(frame={self.frame_number}, "
+            f"time={self.elapsed_time:.3f}, "
+            f"changed={len(self.changed)}, added={len(self.added)}, "
+            f"removed={len(self.removed)}, score={self.score})"
+        )
+
+
+def estimate_size(objects: List[Any]) -> int:
+    """Approximate memory footprint of objects in bytes.
+
+    Follows dicts, sequences and instance attributes (including a
+    DeltaSnapshot's previous chain). Objects shared between snapshots are
+    counted once.
+    """
+    seen = set()
+    stack = list(objects)
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            stack.append(obj.__dict__)
+    return total
+
+
 # Type hint for GameEntity (avoid circular import)
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -13,6 +13,7 @@ from enum import Enum
 
 from ams.games.game_engine.rollback import (
     RollbackStateManager,
+    DeltaSnapshot,
     EntitySnapshot,
     GameSnapshot,
     ScheduledCallbackSnapshot,
@@ -98,6 +99,17 @@ class MockLuaEngine:
         if entity_id in self.entities:
             del self.entities[entity_id]
 
+    def get_scheduled(self) -> List[MockScheduledCallback]:
+        """Pending callbacks with time left."""
+        return list(self._scheduled)
+
+    def restore_scheduled(self, callbacks) -> None:
+        """Replace pending callbacks."""
+        self._scheduled = [
+            MockScheduledCallback(cb.time_remaining, cb.callback_name, cb.entity_id)
+            for cb in callbacks
+        ]
+
 
 class MockGameEngine:
     """Mock game engine for testing rollback."""
@@ -602,6 +614,63 @@ class TestResimulation:
         # Should be approximately initial_x + 50 * 1.0 = initial_x + 50
         assert abs(player.x - (initial_x + 50)) < 5  # Allow small variance
 
+    def test_headless_frames_until_last(self, manager, game_with_entities):
+        """Only the final re-simulated frame runs the full frame update."""
+        calls = []
+        game = game_with_entities
+        full_update = game._do_frame_update
+
+        def headless_update(dt):
+            calls.append('headless')
+            full_update(dt)
+
+        def tracked_full_update(dt):
+            calls.append('full')
+            full_update(dt)
+
+        game._do_headless_frame_update = headless_update
+        game._do_frame_update = tracked_full_update
+
+        manager.capture(game, force=True)
+        snapshot_time = manager.newest_timestamp
+        result = manager.rollback_and_resimulate(
+            game,
+            target_timestamp=snapshot_time,
+            hit_applicator=lambda: None,
+            current_timestamp=snapshot_time + 0.1,
+        )
+
+        assert result.frames_resimulated == len(calls)
+        assert calls[-1] == 'full'
+        assert set(calls[:-1]) == {'headless'}
+
+        calls.clear()
+        manager.headless_resimulation = False
+        manager.rollback_and_resimulate(
+            game,
+            target_timestamp=snapshot_time,
+            hit_applicator=lambda: None,
+            current_timestamp=snapshot_time + 0.1,
+        )
+        assert set(calls) == {'full'}
+
+    def test_rollback_reports_cost(self, manager, game_with_entities):
+        """Rollback results and stats carry timing instrumentation."""
+        snapshot = manager.capture(game_with_entities, force=True)
+        result = manager.rollback_and_resimulate(
+            game_with_entities,
+            target_timestamp=snapshot.timestamp,
+            hit_applicator=lambda: None,
+            current_timestamp=snapshot.timestamp + 0.15,
+        )
+
+        assert result.restored_frame == snapshot.frame_number
+        assert result.total_ms >= result.resimulate_ms > 0
+        stats = manager.get_stats()
+        assert stats['rollback_ms_last'] == result.total_ms
+        assert stats['rollback_ms_max'] >= stats['rollback_ms_mean'] > 0
+        assert stats['resimulated_frames_last'] == result.frames_resimulated
+
     def test_rollback_fails_without_snapshot(self, manager, game_engine):
         """Test rollback fails gracefully when no snapshot available."""
         result = manager.rollback_and_resimulate(
@@ -613,6 +682,76 @@ class TestResimulation:
         assert not result.success
         assert result.error is not None
 
+    def test_batch_applies_hits_at_their_frames(self, manager, game_with_entities):
+        """A batch restores once and applies each hit at its own frame."""
+        lua = game_with_entities._behavior_engine
+        snapshot = manager.capture(game_with_entities, force=True)
+        t0 = snapshot.timestamp
+        restores = []
+        original_restore = manager.restore
+        manager.restore = lambda game, snap: (restores.append(snap), original_restore(game, snap))
+
+        applied = []
+
+        def hit(name):
+            return lambda: applied.append((name, round(lua.elapsed_time - snapshot.elapsed_time, 4)))
+
+        # Deliberately out of order: the batch sorts by timestamp
+        result = manager.rollback_and_resimulate_batch(
+            game_with_entities,
+            [(t0 + 10 / 60, hit('late')), (t0, hit('first')), (t0 + 5 / 60, hit('middle'))],
+            current_timestamp=t0 + 0.5,
+        )
+
+        assert result.success
+        assert result.hits_applied == 3
+        assert restores == [snapshot]
+        assert [name for name, _ in applied] == ['first', 'middle', 'late']
+        assert [elapsed for _, elapsed in applied] == [0.0, round(5 / 60, 4), round(10 / 60, 4)]
+
+    def test_batch_frames_follow_snapshot_grid(self, manager, game_with_entities):
+        """Hit frames are counted from the snapshot, not from the earliest hit."""
+        lua = game_with_entities._behavior_engine
+        snapshot = manager.capture(game_with_entities, force=True)
+        t0 = snapshot.timestamp
+        applied = []
+
+        def hit():
+            return lambda: applied.append(round(lua.elapsed_time - snapshot.elapsed_time, 4))
+
+        # Earliest hit is 0.6 frames after the snapshot; the next one falls
+        # in the snapshot's second frame, though only 0.6 frames after it
+        result = manager.rollback_and_resimulate_batch(
+            game_with_entities,
+            [(t0 + 0.6 / 60, hit()), (t0 + 1.2 / 60, hit()), (t0 + 2.9 / 60, hit())],
+            current_timestamp=t0 + 0.2,
+        )
+
+        assert result.success
+        assert applied == [0.0, round(1 / 60, 4), round(2 / 60, 4)]
+
+    def test_batch_applies_hits_past_window_at_end(self, manager, game_with_entities):
+        """Hits newer than the re-simulated window are applied last."""
+        snapshot = manager.capture(game_with_entities, force=True)
+        applied = []
+
+        result = manager.rollback_and_resimulate_batch(
+            game_with_entities,
+            [(snapshot.timestamp, lambda: applied.append('old')),
+             (snapshot.timestamp + 1.0, lambda: applied.append('new'))],
+            current_timestamp=snapshot.timestamp + 0.1,
+        )
+
+        assert result.success
+        assert applied == ['old', 'new']
+        assert result.hits_applied == 2
+
+    def test_batch_fails_without_hits(self, manager, game_engine):
+        """An empty batch is rejected."""
+        result = manager.rollback_and_resimulate_batch(game_engine, [])
+
+        assert not result.success
+
 
 class TestRollbackRoundTrip:
     """Integration tests for full rollback scenarios."""
@@ -738,6 +877,83 @@ class TestStatistics:
         assert manager.oldest_timestamp is None
 
 
+class TestDeltaSnapshots:
+    """Tests for keyframe + delta snapshot mode."""
+
+    def _step(self, game, frame):
+        """Advance the mock game with a mix of moves, edits, spawns and removals."""
+        lua = game._behavior_engine
+        game._do_frame_update(1 / 60)
+        if frame == 3:
+            lua.entities["brick_1"].properties["hits_remaining"] = 1
+        if frame == 5:
+            lua.add_entity(MockEntity(id=f"spawn_{frame}", tags=["new"]))
+        if frame == 7:
+            lua.remove_entity("brick_1")
+        if frame == 9:
+            lua.entities["enemy_1"].properties["patrol_points"].append(4)
+            lua.score += 100
+
+    def test_matches_full_snapshots(self, game_with_entities):
+        full = RollbackStateManager(history_duration=1.0, fps=10)
+        delta = RollbackStateManager(history_duration=1.0, fps=10,
+                                     snapshot_mode='delta', keyframe_interval=4)
+
+        pairs = []
+        for frame in range(25):
+            self._step(game_with_entities, frame)
+            pairs.append((full.capture(game_with_entities), delta.capture(game_with_entities)))
+
+        # Includes deltas whose keyframe was evicted from the history
+        for full_snap, delta_snap in pairs[-10:]:
+            assert delta_snap.entities == full_snap.entities
+            assert delta_snap.score == full_snap.score
+        assert any(isinstance(d, DeltaSnapshot) for _, d in pairs)
+        assert delta.get_stats()['keyframe_count'] == 3
+
+    def test_unchanged_entities_are_shared(self, game_with_entities):
+        manager = RollbackStateManager(snapshot_mode='delta')
+        first = manager.capture(game_with_entities)
+        game_with_entities._behavior_engine.entities["player"].x += 5
+        second = manager.capture(game_with_entities)
+
+        assert isinstance(second, DeltaSnapshot)
+        assert second.changed == {"player": {"x": 105.0}}
+        assert second.entities["brick_1"] is first.entities["brick_1"]
+
+    def test_restore_from_delta(self, game_with_entities):
+        manager = RollbackStateManager(snapshot_mode='delta')
+        lua = game_with_entities._behavior_engine
+        manager.capture(game_with_entities)
+        lua.entities["enemy_1"].properties["damage"] = 20
+        target = manager.capture(game_with_entities)
+
+        lua.remove_entity("enemy_1")
+        lua.entities["player"].x = 999.0
+        manager.restore(game_with_entities, target)
+
+        assert lua.entities["player"].x == 100.0
+        assert lua.entities["enemy_1"].properties["damage"] == 20
+
+    def test_stats_report_bytes_and_capture_time(self, game_with_entities):
+        full = RollbackStateManager(snapshot_mode='full')
+        delta = RollbackStateManager(snapshot_mode='delta')
+        for frame in range(30):
+            self._step(game_with_entities, frame)
+            full.capture(game_with_entities)
+            delta.capture(game_with_entities)
+
+        full_stats = full.get_stats()
+        delta_stats = delta.get_stats()
+        assert delta_stats['bytes_per_snapshot'] < full_stats['bytes_per_snapshot']
+        assert delta_stats['capture_us_mean'] > 0
+        assert full_stats['capture_us_last'] > 0
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            RollbackStateManager(snapshot_mode='zip')
+
+
 # =============================================================================
 # Logger Tests
 # =============================================================================
@@ -0,0 +1,105 @@
+"""
+SpatialHash - uniform grid broadphase for entity collision checks.
+
+The grid buckets entity bounding boxes into fixed-size cells so that
+collision checks only compare entities that share at least one cell.
+It is rebuilt once per frame from the alive entities; the narrowphase
+(exact AABB overlap) still runs against live entity positions.
+
+Usage:
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(entities)
+    for other in grid.query(ball.x, ball.y, ball.width, ball.height):
+        ...
+"""
+
+from math import floor
+from typing import Dict, List, Sequence, Tuple
+
+from ams.lua.entity import Entity
+
+
+class SpatialHash:
+    """Uniform grid of entity AABBs keyed by integer cell coordinates.
+
+    Entities are stored by their position in the sequence passed to
+    rebuild(), and query() returns candidates in that same order. This
+    keeps collision dispatch order identical to a brute-force scan.
+
+    Args:
+        cell_size: Width/height of a grid cell in pixels. A good value is
+            roughly the size of the most common moving entity.
+    """
+
+    def __init__(self, cell_size: float = 64.0):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = float(cell_size)
+        self._inv_cell = 1.0 / self.cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._entities: List[Entity] = []
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    @property
+    def cell_count(self) -> int:
+        """Number of occupied cells."""
+        return len(self._cells)
+
+    def clear(self) -> None:
+        """Remove all entities from the grid."""
+        self._cells.clear()
+        self._entities = []
+
+    def rebuild(self, entities: Sequence[Entity]) -> None:
+        """Replace grid contents with the given entities.
+
+        Args:
+            entities: Entities with x, y, width, height attributes
+        """
+        self._cells.clear()
+        self._entities = list(entities)
+
+        cells = self._cells
+        inv = self._inv_cell
+        for index, entity in enumerate(self._entities):
+            x0 = floor(entity.x * inv)
+            y0 = floor(entity.y * inv)
+            x1 = floor((entity.x + entity.width) * inv)
+            y1 = floor((entity.y + entity.height) * inv)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [index]
+                    else:
+                        bucket.append(index)
+
+    def query(self, x: float, y: float, width: float, height: float) -> List[Entity]:
+        """Get entities whose cells overlap the given box.
+
+        Candidates may not actually overlap the box; callers still run
+        the exact AABB test. Results are unique and ordered by their
+        position in the last rebuild() sequence.
+        """
+        inv = self._inv_cell
+        x0 = floor(x * inv)
+        y0 = floor(y * inv)
+        x1 = floor((x + width) * inv)
+        y1 = floor((y + height) * inv)
+
+        cells = self._cells
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            if not bucket:
+                return []
+            return [self._entities[i] for i in bucket]
+
+        found: set[int] = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return [self._entities[i] for i in sorted(found)]
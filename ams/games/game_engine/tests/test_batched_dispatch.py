@@ -0,0 +1,125 @@
+"""Tests for batched behavior on_update dispatch."""
+
+import os
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+import pytest
+
+from ams.test_backend import InlineGameHarness
+
+
+GAME = """
+name: "Test Batched Dispatch"
+screen_width: 400
+screen_height: 300
+win_condition: reach_score
+win_target: 1000
+
+inline_behaviors:
+  drift:
+    lua: |
+      local drift = {}
+      function drift.on_update(id, dt)
+        ams.set_x(id, ams.get_x(id) + 10 * dt)
+      end
+      return drift
+  count:
+    lua: |
+      local count = {}
+      function count.on_update(id, dt)
+        ams.set_prop(id, "updates", (ams.get_prop(id, "updates") or 0) + 1)
+      end
+      return count
+  reaper:
+    lua: |
+      local reaper = {}
+      function reaper.on_update(id, dt)
+        local victim = ams.get_prop(id, "victim")
+        if victim then ams.destroy(victim) end
+      end
+      return reaper
+  broken:
+    lua: |
+      local broken = {}
+      function broken.on_update(id, dt)
+        error("boom")
+      end
+      return broken
+
+entity_types:
+  mover:
+    width: 10
+    height: 10
+    color: white
+    behaviors: [drift, count]
+  reaper:
+    width: 10
+    height: 10
+    color: red
+    behaviors: [reaper]
+  broken:
+    width: 10
+    height: 10
+    color: gray
+    behaviors: [broken, count]
+"""
+
+
+def run_frames(batched, frames=5):
+    harness = InlineGameHarness(GAME, batched_dispatch=batched, rollback_enabled=False)
+    game = harness._create_game()
+    try:
+        game._clear_entities()
+        movers = [game.spawn_entity('mover', 10 * i, 20) for i in range(5)]
+        broken = game.spawn_entity('broken', 0, 100)
+        for _ in range(frames):
+            game._behavior_engine.update(0.1)
+        return ([(m.x, m.properties.get('updates')) for m in movers],
+                broken.properties.get('updates'))
+    finally:
+        harness.cleanup()
+
+
+def test_batched_matches_per_entity_dispatch():
+    assert run_frames(batched=True) == run_frames(batched=False)
+    movers, broken_updates = run_frames(batched=True)
+    assert movers[0] == (pytest.approx(5.0), 5)
+    # An error in one behavior doesn't stop the others
+    assert broken_updates == 5
+
+
+def test_entities_destroyed_mid_frame_are_skipped():
+    harness = InlineGameHarness(GAME, batched_dispatch=True, rollback_enabled=False)
+    game = harness._create_game()
+    try:
+        game._clear_entities()
+        reaper = game.spawn_entity('reaper', 0, 0)
+        victim = game.spawn_entity('mover', 50, 50)
+        reaper.properties['victim'] = victim.id
+
+        game._behavior_engine.update(0.1)
+
+        assert not victim.alive
+        assert victim.properties.get('updates') is None
+    finally:
+        harness.cleanup()
+
+
+def test_behavior_methods_are_cached():
+    harness = InlineGameHarness(GAME, rollback_enabled=False)
+    game = harness._create_game()
+    try:
+        engine = game._behavior_engine
+        first = engine.get_subroutine_method('behavior', 'drift', 'on_update')
+        assert first is not None
+        assert engine.get_subroutine_method('behavior', 'drift', 'on_update') is first
+        assert engine.get_subroutine_method('behavior', 'drift', 'on_hit') is None
+        assert engine.get_subroutine_method('behavior', 'missing', 'on_update') is None
+
+        engine.load_inline_subroutine('behavior', 'missing', 'return {on_update = function() end}')
+        assert engine.get_subroutine_method('behavior', 'missing', 'on_update') is not None
+    finally:
+        harness.cleanup()
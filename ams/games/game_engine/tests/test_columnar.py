@@ -0,0 +1,173 @@
+"""Tests for the columnar (struct-of-arrays) entity store."""
+
+import os
+import random
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+from ams.games.game_engine.columnar import ColumnarEntity, ColumnarStore
+from ams.games.game_engine.engine import GameEngine
+from ams.test_backend import InlineGameHarness
+
+
+class TestColumnarStore:
+    """Unit tests for ColumnarStore and ColumnarEntity."""
+
+    def test_entity_reads_and_writes_columns(self):
+        store = ColumnarStore(capacity=1)
+        entity = ColumnarEntity(id='a', entity_type='ball', x=3, y=4, vx=1.5, store=store)
+
+        assert (entity.x, entity.y, entity.vx) == (3.0, 4.0, 1.5)
+        entity.y = 10
+        assert store.y[entity._row] == 10.0
+        assert isinstance(entity.x, float)
+
+    def test_integrate_skips_dead_rows_and_grows(self):
+        store = ColumnarStore(capacity=1)
+        moving = ColumnarEntity(id='a', entity_type='ball', vx=10, vy=-5, store=store)
+        dead = ColumnarEntity(id='b', entity_type='ball', vx=10, store=store)
+        dead.alive = False
+
+        store.integrate(0.5)
+
+        assert store.capacity >= 2
+        assert (moving.x, moving.y) == (5.0, -2.5)
+        assert dead.x == 0.0
+
+    def test_release_detaches_and_recycles_row(self):
+        store = ColumnarStore()
+        first = ColumnarEntity(id='a', entity_type='ball', x=7, store=store)
+        row = first._row
+        store.release(first)
+
+        second = ColumnarEntity(id='b', entity_type='ball', x=1, store=store)
+        assert second._row == row
+        assert first.x == 7.0
+        assert len(store) == 1
+
+    def test_overlaps_and_exited_screen(self):
+        store = ColumnarStore()
+        a = ColumnarEntity(id='a', entity_type='ball', x=0, y=0, width=10, height=10, store=store)
+        b = ColumnarEntity(id='b', entity_type='ball', x=5, y=5, width=10, height=10, store=store)
+        c = ColumnarEntity(id='c', entity_type='ball', x=50, y=700, width=10, height=10, store=store)
+        rows = store.rows_of([b, c])
+
+        assert store.overlaps(a._row, rows).tolist() == [True, False]
+        assert store.exited_screen(rows, 'bottom', 800, 600).tolist() == [False, True]
+        assert store.exited_screen(rows, 'top', 800, 600).tolist() == [False, False]
+
+
+class TestColumnarEngine:
+    """Columnar mode must match the per-object engine paths."""
+
+    GAME = """
+name: "Test Columnar"
+screen_width: 400
+screen_height: 300
+
+entity_types:
+  ball:
+    width: 8
+    height: 8
+    color: white
+  brick:
+    width: 30
+    height: 12
+    color: red
+
+collisions:
+  - [ball, brick]
+
+lose_conditions:
+  - entity_type: ball
+    event: exited_screen
+    edge: bottom
+    action: lose_life
+    then:
+      destroy: ball
+"""
+
+    def _run(self, columnar_store, broadphase_enabled=False, candidate_min=None):
+        harness = InlineGameHarness(self.GAME, columnar_store=columnar_store,
+                                    broadphase_enabled=broadphase_enabled)
+        game = harness._create_game()
+        if candidate_min is not None:
+            game.COLUMNAR_CANDIDATE_MIN = candidate_min
+        try:
+            game._clear_entities()
+            rng = random.Random(3)
+            spawn_index = {}
+            for _ in range(40):
+                brick = game.spawn_entity('brick', rng.uniform(0, 370), rng.uniform(0, 200))
+                spawn_index[brick.id] = len(spawn_index)
+            for _ in range(30):
+                ball = game.spawn_entity('ball', rng.uniform(0, 390), rng.uniform(0, 290),
+                                         vx=rng.uniform(-200, 200), vy=rng.uniform(50, 300))
+                spawn_index[ball.id] = len(spawn_index)
+
+            pairs = []
+            game._handle_collision = lambda a, b: pairs.append(
+                (spawn_index[a.id], spawn_index[b.id])
+            )
+            for _ in range(30):
+                game._apply_physics(1 / 60)
+                game._check_collisions()
+                game._check_lose_conditions()
+
+            positions = sorted(
+                (spawn_index[e.id], e.x, e.y, e.alive)
+                for e in game._behavior_engine.entities.values()
+                if e.id in spawn_index
+            )
+            return pairs, positions, game._lives
+        finally:
+            harness.cleanup()
+
+    def test_matches_object_path(self):
+        object_result = self._run(columnar_store=False)
+        columnar_result = self._run(columnar_store=True)
+
+        assert object_result[0], "Expected some collisions"
+        assert columnar_result == object_result
+
+    def test_broadphase_candidates_use_store_rows(self, monkeypatch):
+        object_result = self._run(columnar_store=False, broadphase_enabled=True)
+        row_calls = []
+        original = GameEngine._check_collision_rows
+
+        def counting(self, entity_a, entities_b, rows_b, processed):
+            row_calls.append(len(entities_b))
+            return original(self, entity_a, entities_b, rows_b, processed)
+
+        monkeypatch.setattr(GameEngine, '_check_collision_rows', counting)
+        columnar_result = self._run(columnar_store=True, broadphase_enabled=True,
+                                    candidate_min=1)
+
+        assert row_calls, "Expected grid candidates to be tested as rows"
+        assert columnar_result == object_result
+
+    def test_rollback_recreates_store_backed_entities(self):
+        from ams.games.game_engine.rollback import RollbackStateManager
+
+        harness = InlineGameHarness(self.GAME, columnar_store=True)
+        game = harness._create_game()
+        try:
+            manager = RollbackStateManager()
+            ball = game.spawn_entity('ball', 10, 10, vx=60)
+            snapshot = manager.capture(game)
+
+            ball.destroy()
+            game._behavior_engine.update(0.016)
+            extra = game.spawn_entity('brick', 50, 50)
+            manager.restore(game, snapshot)
+
+            restored = game._behavior_engine.get_entity(ball.id)
+            assert isinstance(restored, ColumnarEntity)
+            assert restored._row is not None
+            assert extra._row is None  # Released by restore
+            game._apply_physics(0.5)
+            assert restored.x == 40.0
+        finally:
+            harness.cleanup()
@@ -0,0 +1,77 @@
+"""Tests for batched delayed-hit processing (queue_delayed_hit)."""
+
+import os
+import time
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+from ams.test_backend import InlineGameHarness
+
+
+GAME = """
+name: "Test Delayed Hits"
+screen_width: 400
+screen_height: 300
+win_condition: reach_score
+win_target: 1000
+
+entity_types:
+  ball:
+    width: 8
+    height: 8
+    color: white
+"""
+
+
+class TestQueuedDelayedHits:
+    """Queued hits are applied by the next update() with one rollback."""
+
+    def test_volley_shares_one_rollback(self):
+        harness = InlineGameHarness(GAME, rollback_enabled=True, rollback_threshold=0.0)
+        game = harness._create_game()
+        try:
+            manager = game._rollback_manager
+            for _ in range(10):
+                game.update(1 / 60)
+            snapshots = list(manager._snapshots)
+
+            restores = []
+            original_restore = manager.restore
+            manager.restore = lambda g, snap: (restores.append(snap), original_restore(g, snap))
+
+            applied = []
+            for index in (6, 2, 4):
+                game.queue_delayed_hit(0, 0, snapshots[index].timestamp,
+                                       lambda index=index: applied.append(index))
+            # Older than the rollback history: applied at the current time
+            game.queue_delayed_hit(0, 0, time.monotonic() - 100,
+                                   lambda: applied.append('stale'))
+
+            game.update(1 / 60)
+
+            assert restores == [snapshots[2]]
+            assert applied == [2, 4, 6, 'stale']
+            assert game._pending_hits == []
+        finally:
+            harness.cleanup()
+
+    def test_recent_hits_skip_rollback(self):
+        harness = InlineGameHarness(GAME, rollback_enabled=True, rollback_threshold=10.0)
+        game = harness._create_game()
+        try:
+            manager = game._rollback_manager
+            game.update(1 / 60)
+            before = manager.get_stats()['rollback_ms_last']
+
+            applied = []
+            now = time.monotonic()
+            game.queue_delayed_hit(0, 0, now, lambda: applied.append('b'))
+            game.queue_delayed_hit(0, 0, now - 0.05, lambda: applied.append('a'))
+
+            assert game.process_delayed_hits()
+            assert applied == ['a', 'b']
+            assert manager.get_stats()['rollback_ms_last'] == before
+        finally:
+            harness.cleanup()
@@ -0,0 +1,195 @@
+"""Tests for dirty-rect rendering."""
+
+import os
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+import pygame
+
+from ams.games.game_engine.dirty_rects import DirtyRectTracker, merge_rects
+from ams.test_backend import InlineGameHarness
+
+pygame.init()
+
+
+GAME = """
+name: "Test Dirty Rects"
+screen_width: 400
+screen_height: 300
+win_condition: reach_score
+win_target: 1000
+
+entity_types:
+  target:
+    width: 20
+    height: 20
+    color: red
+    render:
+      - shape: circle
+        color: $color
+      - shape: text
+        text: $label
+        font_size: 18
+        color: white
+  wall:
+    width: 100
+    height: 10
+    color: gray
+  ghost:
+    width: 60
+    height: 30
+    color: blue
+    render:
+      - shape: sprite
+        sprite: "ghost_{frame}"
+        alpha: 0.5
+      - shape: text
+        text: $label
+        font_size: 18
+        color: white
+        alpha: 0.5
+"""
+
+SCREEN = pygame.Rect(0, 0, 400, 300)
+
+
+def state(x, y, signature='a'):
+    return pygame.Rect(x, y, 10, 10), signature
+
+
+class TestDirtyRectTracker:
+    """Unit tests for DirtyRectTracker."""
+
+    def test_first_frame_is_full_redraw(self):
+        tracker = DirtyRectTracker()
+        assert tracker.compute({'a': state(0, 0)}, SCREEN) is None
+        assert tracker.compute({'a': state(0, 0)}, SCREEN) == []
+
+    def test_moved_item_dirties_old_and_new_bounds(self):
+        tracker = DirtyRectTracker()
+        tracker.compute({'a': state(0, 0), 'b': state(200, 200)}, SCREEN)
+
+        rects = tracker.compute({'a': state(100, 50), 'b': state(200, 200)}, SCREEN)
+
+        assert sorted(map(tuple, rects)) == [(0, 0, 10, 10), (100, 50, 10, 10)]
+
+    def test_signature_change_and_removal(self):
+        tracker = DirtyRectTracker()
+        tracker.compute({'a': state(0, 0), 'b': state(50, 50)}, SCREEN)
+
+        rects = tracker.compute({'a': state(0, 0, 'changed')}, SCREEN)
+
+        assert sorted(map(tuple, rects)) == [(0, 0, 10, 10), (50, 50, 10, 10)]
+
+    def test_threshold_falls_back_to_full_redraw(self):
+        tracker = DirtyRectTracker(threshold=0.1)
+        big = (pygame.Rect(0, 0, 300, 200), 'a')
+        tracker.compute({}, SCREEN)
+
+        assert tracker.compute({'big': big}, SCREEN) is None
+        assert tracker.get_stats()['full_redraws'] == 2
+
+    def test_merge_rects(self):
+        merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10),
+                              pygame.Rect(50, 50, 5, 5)])
+        assert sorted(map(tuple, merged)) == [(0, 0, 15, 15), (50, 50, 5, 5)]
+
+
+class TestDirtyRectRendering:
+    """GameEngine(dirty_rects=True) repaints only changed regions."""
+
+    def _full_render(self, game):
+        """Reference frame rendered from scratch."""
+        tracker = game._dirty_tracker
+        game._dirty_tracker = None
+        screen = pygame.Surface((400, 300))
+        game.render(screen)
+        game._dirty_tracker = tracker
+        return screen
+
+    def test_matches_full_redraw(self):
+        harness = InlineGameHarness(GAME, dirty_rects=True)
+        game = harness._create_game()
+        try:
+            game._clear_entities()
+            target = game.spawn_entity('target', 40, 40)
+            target.properties['label'] = 'one'
+            game.spawn_entity('wall', 30, 55)
+            other = game.spawn_entity('target', 300, 200)
+            screen = pygame.Surface((400, 300))
+
+            game.render(screen)
+            assert game.get_dirty_rects() is None
+
+            game.render(screen)
+            assert game.get_dirty_rects() == []
+
+            # Move one target under the wall, relabel, remove another
+            target.x = 60
+            target.properties['label'] = 'two'
+            other.alive = False
+            game.render(screen)
+
+            rects = game.get_dirty_rects()
+            assert rects
+            assert sum(r.w * r.h for r in rects) < 400 * 300 * 0.5
+            expected = self._full_render(game)
+            assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+        finally:
+            harness.cleanup()
+
+    def test_translucent_content_change_matches_full_redraw(self):
+        harness = InlineGameHarness(GAME, dirty_rects=True)
+        game = harness._create_game()
+        try:
+            sprites = game._skin._assets._sprites
+            sprites['ghost_a'] = pygame.Surface((60, 30))
+            sprites['ghost_a'].fill((0, 200, 0))
+            sprites['ghost_b'] = pygame.Surface((60, 30))
+            sprites['ghost_b'].fill((200, 0, 200))
+
+            game._clear_entities()
+            ghost = game.spawn_entity('ghost', 100, 100)
+            ghost.properties.update(frame='a', label='one')
+            screen = pygame.Surface((400, 300))
+            game.render(screen)
+            game.render(screen)
+
+            # Only the sprite frame and label change; bounds stay put
+            ghost.properties.update(frame='b', label='two')
+            game.render(screen)
+
+            assert game.get_dirty_rects()
+            expected = self._full_render(game)
+            assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+        finally:
+            harness.cleanup()
+
+    def test_invalidate_display_forces_full_redraw(self):
+        harness = InlineGameHarness(GAME, dirty_rects=True)
+        game = harness._create_game()
+        try:
+            screen = pygame.Surface((400, 300))
+            game.render(screen)
+            game.render(screen)
+            assert game.get_dirty_rects() == []
+
+            game.invalidate_display()
+            game.render(screen)
+            assert game.get_dirty_rects() is None
+        finally:
+            harness.cleanup()
+
+    def test_disabled_by_default(self):
+        harness = InlineGameHarness(GAME)
+        game = harness._create_game()
+        try:
+            screen = pygame.Surface((400, 300))
+            game.render(screen)
+            game.render(screen)
+            assert game.get_dirty_rects() is None
+            assert game.get_dirty_rect_stats() == {}
+        finally:
+            harness.cleanup()
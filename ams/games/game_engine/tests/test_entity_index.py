@@ -0,0 +1,154 @@
+"""Tests for the engine-owned entity type index."""
+
+import os
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+from ams.games.game_engine.entity import GameEntity
+from ams.games.game_engine.entity_index import EntityIndex
+from ams.test_backend import InlineGameHarness
+
+
+def make_entity(entity_id, entity_type, tags=()):
+    return GameEntity(id=entity_id, entity_type=entity_type, tags=list(tags))
+
+
+class TestEntityIndex:
+    """Unit tests for EntityIndex."""
+
+    def test_type_base_type_and_matching(self):
+        index = EntityIndex()
+        red = make_entity('r', 'brick_red')
+        plain = make_entity('p', 'brick')
+        ball = make_entity('b', 'ball')
+        index.add(red, base_type='brick')
+        index.add(plain)
+        index.add(ball)
+
+        assert index.of_type('brick') == [plain]
+        assert index.of_base_type('brick') == [red]
+        assert index.matching('brick') == [red, plain]
+        assert index.matching('ball') == [ball]
+
+    def test_dead_entities_are_filtered(self):
+        index = EntityIndex()
+        a = make_entity('a', 'ball', tags=['hostile'])
+        b = make_entity('b', 'ball', tags=['hostile'])
+        index.add(a)
+        index.add(b)
+        a.alive = False
+
+        assert index.of_type('ball') == [b]
+        assert index.count_tag('hostile') == 1
+
+    def test_retype_keeps_registration_order(self):
+        index = EntityIndex()
+        first = make_entity('1', 'brick')
+        second = make_entity('2', 'brick_hard')
+        third = make_entity('3', 'brick')
+        for entity in (first, second, third):
+            index.add(entity)
+
+        second.entity_type = 'brick'
+        index.retype(second)
+
+        assert index.of_type('brick') == [first, second, third]
+        assert index.of_type('brick_hard') == []
+
+    def test_remove_and_union(self):
+        index = EntityIndex()
+        a = make_entity('a', 'ball')
+        b = make_entity('b', 'brick')
+        c = make_entity('c', 'ball')
+        for entity in (a, b, c):
+            index.add(entity)
+        index.remove('c')
+
+        assert 'c' not in index
+        assert index.union([index.of_type('brick'), index.of_type('ball')]) == [a, b]
+
+
+class TestEngineEntityIndex:
+    """GameEngine keeps the index in step with LuaEngine.entities."""
+
+    GAME = """
+name: "Test Entity Index"
+screen_width: 400
+screen_height: 300
+
+entity_types:
+  brick:
+    width: 20
+    height: 10
+    color: red
+    tags: [target]
+  brick_hard:
+    extends: brick
+    color: silver
+  ball:
+    width: 8
+    height: 8
+    color: white
+"""
+
+    def _create_game(self):
+        harness = InlineGameHarness(self.GAME)
+        return harness, harness._create_game()
+
+    def _scan(self, game, type_pattern):
+        """Reference result: linear scan over alive entities."""
+        return game._get_entities_matching_type(
+            type_pattern, game._behavior_engine.get_alive_entities()
+        )
+
+    def test_spawn_transform_destroy(self):
+        harness, game = self._create_game()
+        try:
+            game._clear_entities()
+            bricks = [game.spawn_entity('brick', i * 25, 10) for i in range(3)]
+            hard = game.spawn_entity('brick_hard', 0, 40)
+            game.spawn_entity('ball', 100, 100)
+
+            assert game._entity_index.matching('brick') == self._scan(game, 'brick')
+            assert game.get_entities_by_base_type('brick') == bricks + [hard]
+
+            game._transform_into_type(bricks[1], 'brick_hard')
+            assert game.get_entities_by_type('brick_hard') == [bricks[1], hard]
+            assert game._entity_index.matching('brick') == self._scan(game, 'brick')
+
+            bricks[0].destroy()
+            game._behavior_engine.update(0.016)
+            assert bricks[0].id not in game._entity_index
+            assert game._entity_index.matching('brick') == self._scan(game, 'brick')
+
+            api = game._behavior_engine.api
+            assert api.count_entities_by_tag('target') == 3
+            # Lua tables are 1-indexed
+            ball_ids = api.get_entities_of_type('ball')
+            assert [ball_ids[1]] == [e.id for e in game.get_entities_by_type('ball')]
+        finally:
+            harness.cleanup()
+
+    def test_rollback_restore_rebuilds_index(self):
+        from ams.games.game_engine.rollback import RollbackStateManager
+
+        harness, game = self._create_game()
+        try:
+            manager = RollbackStateManager()
+            brick = game.spawn_entity('brick', 10, 10)
+            snapshot = manager.capture(game)
+
+            brick.destroy()
+            game._behavior_engine.update(0.016)
+            game.spawn_entity('ball', 50, 50)
+            assert brick.id not in game._entity_index
+
+            manager.restore(game, snapshot)
+
+            assert [e.id for e in game.get_entities_by_type('brick')] == [brick.id]
+            assert game.get_entities_by_type('ball') == []
+            assert game._entity_index.matching('brick') == self._scan(game, 'brick')
+        finally:
+            harness.cleanup()
@@ -0,0 +1,165 @@
+"""Tests for headless frame updates used by rollback re-simulation."""
+
+import os
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+from ams import profiling
+from ams.test_backend import InlineGameHarness
+
+
+GAME = """
+name: "Test Headless Resim"
+screen_width: 400
+screen_height: 300
+
+inline_behaviors:
+  ticker:
+    lua: |
+      local ticker = {}
+      function ticker.on_update(id, dt)
+        local ticks = (ams.get_prop(id, "ticks") or 0) + 1
+        ams.set_prop(id, "ticks", ticks)
+        if ticks % 3 == 0 then
+          ams.play_sound("tick" .. ticks)
+        end
+      end
+      return ticker
+
+entity_types:
+  ball:
+    width: 8
+    height: 8
+    color: white
+  ticking_ball:
+    width: 8
+    height: 8
+    color: white
+    behaviors: [ticker]
+"""
+
+
+def rollback_outcome(headless):
+    """Game state and sounds after one rollback, with or without headless frames."""
+    harness = InlineGameHarness(GAME, rollback_enabled=True, rollback_headless=headless)
+    game = harness._create_game()
+    try:
+        played = []
+        game._skin.play_sound = played.append
+        game._clear_entities()
+        balls = [game.spawn_entity('ticking_ball', 20 * i, 50, vx=30 * i) for i in range(4)]
+        manager = game._rollback_manager
+        snapshot = manager.capture(game, force=True)
+
+        def apply_hit():
+            balls[1].vy = 40
+
+        result = manager.rollback_and_resimulate(
+            game,
+            target_timestamp=snapshot.timestamp,
+            hit_applicator=apply_hit,
+            current_timestamp=snapshot.timestamp + 0.25,
+        )
+        state = [(b.x, b.y, b.vx, b.vy, b.properties.get('ticks')) for b in balls]
+        return result.frames_resimulated, state, played
+    finally:
+        harness.cleanup()
+
+
+class TestHeadlessFrameUpdate:
+    """_do_headless_frame_update runs game logic without skin/sound work."""
+
+    def test_sounds_wait_for_full_frame(self):
+        harness = InlineGameHarness(GAME)
+        game = harness._create_game()
+        try:
+            played = []
+            skin_updates = []
+            game._skin.play_sound = played.append
+            game._skin.update = skin_updates.append
+            ball = game.spawn_entity('ball', 10, 10, vx=60)
+
+            game._behavior_engine.queue_sound('hit')
+            game._do_headless_frame_update(0.5)
+
+            assert ball.x == 40.0
+            assert played == [] and skin_updates == []
+
+            game._do_frame_update(0.5)
+            assert played == ['hit']
+            assert skin_updates == [0.5]
+        finally:
+            harness.cleanup()
+
+    def test_headless_frames_record_no_profile_samples(self):
+        harness = InlineGameHarness(GAME)
+        game = harness._create_game()
+        profiling.enable()
+        try:
+            game.spawn_entity('ball', 10, 10, vx=60)
+
+            profiling.begin_frame(1)
+            game._do_headless_frame_update(0.1)
+            assert profiling.end_frame().calls == []
+            assert profiling.is_enabled()
+
+            profiling.begin_frame(2)
+            game._do_frame_update(0.1)
+            labels = {call.label for call in profiling.end_frame().calls}
+            assert {'Frame Update', 'Apply Physics'} <= labels
+        finally:
+            profiling.disable()
+            profiling.clear_frame_buffer()
+            harness.cleanup()
+
+    def test_headless_rollback_matches_full_rollback(self):
+        frames, state, played = rollback_outcome(headless=True)
+
+        assert frames > 3
+        assert (frames, state, played) == rollback_outcome(headless=False)
+        assert played
+
+    def test_rollback_can_run_full_frames(self):
+        harness = InlineGameHarness(GAME, rollback_enabled=True, rollback_headless=False)
+        game = harness._create_game()
+        try:
+            skin_updates = []
+            game._skin.update = skin_updates.append
+            manager = game._rollback_manager
+            snapshot = manager.capture(game, force=True)
+
+            result = manager.rollback_and_resimulate(
+                game,
+                target_timestamp=snapshot.timestamp,
+                hit_applicator=lambda: None,
+                current_timestamp=snapshot.timestamp + 0.15,
+            )
+
+            assert len(skin_updates) == result.frames_resimulated > 1
+        finally:
+            harness.cleanup()
+
+    def test_rollback_uses_headless_frames(self):
+        harness = InlineGameHarness(GAME, rollback_enabled=True)
+        game = harness._create_game()
+        try:
+            skin_updates = []
+            game._skin.update = skin_updates.append
+            manager = game._rollback_manager
+            snapshot = manager.capture(game, force=True)
+
+            result = manager.rollback_and_resimulate(
+                game,
+                target_timestamp=snapshot.timestamp,
+                hit_applicator=lambda: None,
+                current_timestamp=snapshot.timestamp + 0.15,
+            )
+
+            assert manager.headless_resimulation
+            assert result.frames_resimulated > 1
+            assert len(skin_updates) == 1
+            assert game._rollback_manager.get_stats()['rollback_ms_last'] == result.total_ms
+        finally:
+            harness.cleanup()
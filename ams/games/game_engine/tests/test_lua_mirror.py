@@ -0,0 +1,181 @@
+"""Tests for the Lua-side entity mirror (lua_mirror=True)."""
+
+import os
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+import pytest
+
+from ams.test_backend import InlineGameHarness
+
+
+GAME = """
+name: "Test Lua Mirror"
+screen_width: 400
+screen_height: 300
+win_condition: reach_score
+win_target: 1000
+
+inline_behaviors:
+  drift:
+    lua: |
+      local drift = {}
+      function drift.on_update(id, dt)
+        ams.set_x(id, ams.get_x(id) + ams.get_vx(id) * dt)
+        ams.set_prop(id, "updates", (ams.get_prop(id, "updates") or 0) + 1)
+      end
+      return drift
+  direct:
+    lua: |
+      local direct = {}
+      function direct.on_update(id, dt)
+        local e = ams.entities[id]
+        if e then
+          e.y = e.y + 1
+          e.health = e.health - 1
+          e.properties.seen = true
+          e.properties.temp = nil
+        else
+          ams.set_y(id, ams.get_y(id) + 1)
+          ams.set_health(id, ams.get_health(id) - 1)
+          ams.set_prop(id, "seen", true)
+          ams.set_prop(id, "temp", nil)
+        end
+      end
+      return direct
+  reader:
+    lua: |
+      local reader = {}
+      function reader.on_update(id, dt)
+        -- Reads another entity written earlier in the same phase
+        local other = ams.get_prop(id, "watch")
+        if other then
+          ams.set_prop(id, "seen_x", ams.get_x(other))
+        end
+      end
+      return reader
+  grower:
+    lua: |
+      local grower = {}
+      function grower.on_update(id, dt)
+        ams.set_vx(id, 7)
+        ams.transform(id, "big")
+      end
+      return grower
+
+entity_types:
+  mover:
+    width: 10
+    height: 10
+    color: white
+    behaviors: [drift]
+  direct:
+    width: 10
+    height: 10
+    color: white
+    health: 3
+    behaviors: [direct]
+  reader:
+    width: 10
+    height: 10
+    color: white
+    behaviors: [reader]
+  plain:
+    width: 10
+    height: 10
+    color: white
+  small:
+    width: 10
+    height: 10
+    color: white
+    behaviors: [grower]
+  big:
+    width: 40
+    height: 40
+    color: white
+"""
+
+
+def make_game(**kwargs):
+    harness = InlineGameHarness(GAME, rollback_enabled=False, **kwargs)
+    game = harness._create_game()
+    game._clear_entities()
+    return harness, game
+
+
+@pytest.mark.parametrize('batched', [False, True])
+def test_mirror_matches_python_api(batched):
+    results = []
+    for mirror in (False, True):
+        harness, game = make_game(lua_mirror=mirror, batched_dispatch=batched)
+        try:
+            mover = game.spawn_entity('mover', 10, 20, vx=30)
+            direct = game.spawn_entity('direct', 50, 50)
+            direct.properties['temp'] = 1
+            for _ in range(3):
+                game._behavior_engine.update(0.1)
+            results.append((mover.x, mover.properties.get('updates'),
+                            direct.y, direct.health, dict(direct.properties)))
+        finally:
+            harness.cleanup()
+    assert results[0] == results[1]
+    assert results[1][0] == pytest.approx(19.0)
+    assert results[1][4] == {'seen': True, 'temp': None}
+
+
+def test_only_changed_fields_are_written_back():
+    harness, game = make_game(lua_mirror=True)
+    try:
+        game.spawn_entity('mover', 10, 20, vx=30)
+        game.spawn_entity('plain', 0, 0)
+        game._behavior_engine.update(0.1)
+        stats = game._lua_mirror.get_stats()
+        # Only the entity with behaviors is mirrored; x and one property change
+        assert stats['entities_mirrored'] == 1
+        assert stats['fields_written'] == 2
+        assert not game._lua_mirror.active
+    finally:
+        harness.cleanup()
+
+
+def test_reads_see_writes_within_the_phase():
+    harness, game = make_game(lua_mirror=True)
+    try:
+        mover = game.spawn_entity('mover', 10, 20, vx=30)
+        reader = game.spawn_entity('reader', 0, 0)
+        plain = game.spawn_entity('plain', 5, 5)
+        reader.properties['watch'] = mover.id
+        game._behavior_engine.update(0.1)
+        assert reader.properties['seen_x'] == pytest.approx(13.0)
+
+        # Entities without behaviors are read through Python
+        reader.properties['watch'] = plain.id
+        game._behavior_engine.update(0.1)
+        assert reader.properties['seen_x'] == 5
+    finally:
+        harness.cleanup()
+
+
+def test_transform_writes_back_and_leaves_mirror():
+    harness, game = make_game(lua_mirror=True)
+    try:
+        entity = game.spawn_entity('small', 0, 0)
+        game._behavior_engine.update(0.1)
+        assert entity.entity_type == 'big'
+        assert entity.vx == 7
+        # The pre-transform width in the mirror must not overwrite the new one
+        assert entity.width == 40
+    finally:
+        harness.cleanup()
+
+
+def test_entities_table_empty_outside_phase():
+    harness, game = make_game(lua_mirror=True)
+    try:
+        game.spawn_entity('mover', 10, 20)
+        game._behavior_engine.update(0.1)
+        assert game._behavior_engine.evaluate_expression('next(ams.entities) == nil')
+    finally:
+        harness.cleanup()
@@ -0,0 +1,115 @@
+"""Tests for the renderer's surface/font cache."""
+
+import os
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+import pygame
+
+from ams.games.game_engine.render_cache import RenderCache, surface_bytes
+from ams.test_backend import InlineGameHarness
+
+pygame.init()
+
+
+GAME = """
+name: "Test Render Cache"
+screen_width: 400
+screen_height: 300
+win_condition: reach_score
+win_target: 1000
+
+entity_types:
+  label:
+    width: 80
+    height: 20
+    color: white
+    render:
+      - shape: rectangle
+        color: blue
+        alpha: 0.5
+      - shape: text
+        text: "HUD"
+        font_size: 24
+        color: yellow
+"""
+
+
+class TestRenderCache:
+    """Unit tests for RenderCache."""
+
+    def test_scaled_sprite_is_reused(self):
+        cache = RenderCache()
+        sprite = pygame.Surface((8, 8))
+        sprite.set_colorkey((255, 0, 255))
+
+        first = cache.scaled_sprite(sprite, 16, 16)
+        second = cache.scaled_sprite(sprite, 16, 16)
+
+        assert first is second
+        assert first.get_size() == (16, 16)
+        assert first.get_colorkey()[:3] == (255, 0, 255)
+        assert cache.scaled_sprite(sprite, 32, 16) is not first
+        assert cache.get_stats()['hits'] == 1
+
+    def test_text_and_font_are_reused(self):
+        cache = RenderCache()
+
+        assert cache.font(24) is cache.font(24)
+        surface = cache.text("Score: 10", 24, (255, 255, 255))
+        assert cache.text("Score: 10", 24, (255, 255, 255)) is surface
+        assert cache.text("Score: 10", 24, (255, 0, 0)) is not surface
+
+    def test_scratch_is_cleared_between_uses(self):
+        cache = RenderCache()
+        scratch = cache.scratch(10, 10)
+        scratch.fill((255, 0, 0, 255))
+
+        again = cache.scratch(10, 10)
+
+        assert again is scratch
+        assert again.get_at((5, 5)) == (0, 0, 0, 0)
+
+    def test_lru_eviction_respects_budget(self):
+        one = surface_bytes(pygame.Surface((10, 10), pygame.SRCALPHA))
+        cache = RenderCache(max_bytes=one * 2)
+        cache.scratch(10, 10)
+        cache.scratch(5, 20)
+        cache.scratch(10, 10)  # hit, now most recently used
+        cache.scratch(20, 5)
+
+        stats = cache.get_stats()
+        assert stats['bytes'] <= one * 2
+        assert stats['evictions'] == 1
+        assert ('scratch', 5, 20) not in cache._surfaces
+        assert ('scratch', 10, 10) in cache._surfaces
+
+    def test_zero_budget_disables_caching(self):
+        cache = RenderCache(max_bytes=0)
+
+        assert cache.scratch(4, 4) is not cache.scratch(4, 4)
+        assert cache.text("a", 12, (0, 0, 0)) is not cache.text("a", 12, (0, 0, 0))
+        assert cache.get_stats()['fonts'] == 0
+
+
+class TestRendererUsesCache:
+    """GameEngineRenderer reuses surfaces across frames."""
+
+    def test_second_frame_hits_cache(self):
+        harness = InlineGameHarness(GAME)
+        game = harness._create_game()
+        try:
+            screen = pygame.Surface((400, 300))
+            game.spawn_entity('label', 10, 10)
+
+            game.render(screen)
+            misses = game._skin.get_cache_stats()['misses']
+            game.render(screen)
+            stats = game._skin.get_cache_stats()
+
+            assert stats['misses'] == misses
+            assert stats['hits'] > 0
+        finally:
+            harness.cleanup()
@@ -0,0 +1,99 @@
+"""Tests for compiled render conditions and sprite templates."""
+
+import os
+
+import pytest
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+from ams.games.game_engine.config import RenderWhen
+from ams.games.game_engine.entity import GameEntity, compile_sprite_template, compile_when
+from ams.test_backend import InlineGameHarness
+
+
+GAME = """
+name: "Test Render Compile"
+screen_width: 400
+screen_height: 300
+
+entity_types:
+  duck:
+    width: 32
+    height: 32
+    render:
+      - shape: sprite
+        sprite: duck_{color}_{frame}
+        when:
+          property: hit
+          value: false
+"""
+
+
+def make_entity(**properties):
+    return GameEntity(id='e1', entity_type='duck', vx=-3.0, vy=4.0, health=2,
+                      spawn_time=1.0, properties=properties)
+
+
+CONDITIONS = [
+    RenderWhen(property='hit', value=True),
+    RenderWhen(property='hit', value=True, compare='not_equals'),
+    RenderWhen(property='age', value=2.0, compare='greater_than'),
+    RenderWhen(property='age', value=2.0, compare='less_than'),
+    RenderWhen(property='missing', value=2.0, compare='greater_than'),
+    RenderWhen(property='damage_ratio', value=0.75, min=0.25, compare='between'),
+    RenderWhen(property='damage_ratio', value=0.75, compare='between'),
+    RenderWhen(property='facing', value='left'),
+    RenderWhen(property='heading', value=180, compare='less_than'),
+    RenderWhen(property='health_ratio', value=1.0),
+    RenderWhen(property='hit', value=True, compare='unknown'),
+]
+
+
+class TestCompileWhen:
+    """compile_when() agrees with GameEntity.evaluate_when()."""
+
+    @pytest.mark.parametrize('when', CONDITIONS, ids=lambda w: f"{w.property}-{w.compare}")
+    @pytest.mark.parametrize('current_time', [1.5, 4.0])
+    def test_matches_evaluate_when(self, when, current_time):
+        check = compile_when(when)
+        for properties in ({'hit': True, 'brick_max_hits': 4, 'brick_hits_remaining': 2},
+                           {'hit': False, 'brick_max_hits': 4, 'brick_hits_remaining': 4}):
+            entity = make_entity(**properties)
+            assert check(entity, current_time) == entity.evaluate_when(when, current_time)
+
+
+class TestCompileSpriteTemplate:
+    """compile_sprite_template() resolves placeholders like the old regex path."""
+
+    def test_resolves_placeholders(self):
+        template = compile_sprite_template('duck_{color}_{frame}')
+        assert template(make_entity(color='green', frame=2.0)) == 'duck_green_2'
+        assert template(make_entity(color='red', frame=1.5)) == 'duck_red_1.5'
+
+    def test_missing_property_keeps_placeholder(self):
+        template = compile_sprite_template('duck_{color}_{frame}')
+        assert template(make_entity(color='blue')) == 'duck_blue_{frame}'
+
+    def test_plain_name_and_cache(self):
+        assert compile_sprite_template('paddle')(make_entity()) == 'paddle'
+        assert compile_sprite_template('a_{b}') is compile_sprite_template('a_{b}')
+
+
+class TestLoadedRenderCommands:
+    """Render commands are compiled when the game definition loads."""
+
+    def test_commands_carry_compiled_closures(self):
+        harness = InlineGameHarness(GAME)
+        game = harness._create_game()
+        try:
+            command = game._game_def.entity_types['duck'].render[0]
+            assert command.when_check is not None
+            assert command.sprite_template is not None
+
+            duck = make_entity(color='green', frame=3, hit=False)
+            assert command.when_check(duck, 0.0)
+            assert command.sprite_template(duck) == 'duck_green_3'
+        finally:
+            harness.cleanup()
@@ -0,0 +1,127 @@
+"""Tests for the spatial-hash collision broadphase."""
+
+import os
+import random
+
+import pytest
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+from ams.games.game_engine.spatial_hash import SpatialHash
+from ams.test_backend import InlineGameHarness
+
+
+class Box:
+    """Minimal entity stand-in with an AABB."""
+
+    def __init__(self, x, y, width=10, height=10):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+class TestSpatialHash:
+    """Unit tests for SpatialHash."""
+
+    def test_rejects_non_positive_cell_size(self):
+        with pytest.raises(ValueError):
+            SpatialHash(cell_size=0)
+
+    def test_query_finds_neighbours_only(self):
+        near = Box(5, 5)
+        far = Box(500, 500)
+        grid = SpatialHash(cell_size=32)
+        grid.rebuild([near, far])
+
+        assert grid.query(0, 0, 10, 10) == [near]
+        assert grid.query(490, 490, 20, 20) == [far]
+        assert grid.query(200, 200, 10, 10) == []
+
+    def test_entity_spanning_cells_is_returned_once(self):
+        wide = Box(20, 20, width=100, height=100)
+        grid = SpatialHash(cell_size=32)
+        grid.rebuild([wide])
+
+        assert grid.cell_count > 1
+        assert grid.query(0, 0, 200, 200) == [wide]
+
+    def test_query_preserves_rebuild_order(self):
+        boxes = [Box(x, x) for x in (60, 0, 30, 45)]
+        grid = SpatialHash(cell_size=16)
+        grid.rebuild(boxes)
+
+        assert grid.query(0, 0, 100, 100) == boxes
+
+    def test_negative_coordinates(self):
+        box = Box(-40, -40)
+        grid = SpatialHash(cell_size=32)
+        grid.rebuild([box])
+
+        assert grid.query(-35, -35, 1, 1) == [box]
+        assert grid.query(5, 5, 1, 1) == []
+
+
+class TestBroadphaseCollisions:
+    """Broadphase must dispatch the same collisions as all-pairs checks."""
+
+    GAME = """
+name: "Test Broadphase"
+screen_width: 800
+screen_height: 600
+
+entity_types:
+  ball:
+    width: 10
+    height: 10
+    color: white
+  brick:
+    width: 30
+    height: 12
+    color: red
+  brick_hard:
+    extends: brick
+    color: silver
+
+collisions:
+  - [ball, brick]
+  - [ball, ball]
+"""
+
+    def _collect_pairs(self, broadphase_enabled):
+        harness = InlineGameHarness(self.GAME, width=800, height=600)
+        game = harness._create_game()
+        try:
+            game._broadphase_enabled = broadphase_enabled
+            game._clear_entities()
+
+            # Entity ids are random, so compare pairs by spawn index
+            rng = random.Random(7)
+            spawn_index = {}
+            for i in range(120):
+                brick_type = 'brick_hard' if i % 3 == 0 else 'brick'
+                brick = game.spawn_entity(brick_type, rng.uniform(0, 770), rng.uniform(0, 588))
+                spawn_index[brick.id] = len(spawn_index)
+            for _ in range(40):
+                ball = game.spawn_entity('ball', rng.uniform(0, 790), rng.uniform(0, 590))
+                spawn_index[ball.id] = len(spawn_index)
+
+            pairs = []
+            game._handle_collision = lambda a, b: pairs.append(
+                (spawn_index[a.id], spawn_index[b.id])
+            )
+            game._check_collisions()
+            return pairs, game.get_collision_stats()
+        finally:
+            harness.cleanup()
+
+    def test_same_collisions_as_all_pairs(self):
+        brute_pairs, brute_stats = self._collect_pairs(broadphase_enabled=False)
+        grid_pairs, grid_stats = self._collect_pairs(broadphase_enabled=True)
+
+        assert brute_pairs, "Expected some overlapping entities"
+        assert grid_pairs == brute_pairs
+        assert grid_stats['collisions'] == brute_stats['collisions']
+        assert grid_stats['pairs_tested'] < brute_stats['pairs_tested']
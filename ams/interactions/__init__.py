@@ -28,6 +28,8 @@ from .filter import (
     EntityBounds,
     InteractionContext,
     evaluate_filter,
+    compile_filter,
+    max_distance,
     compute_distance,
     compute_angle,
 )
@@ -59,6 +61,8 @@ __all__ = [
     'EntityBounds',
     'InteractionContext',
     'evaluate_filter',
+    'compile_filter',
+    'max_distance',
     'compute_distance',
     'compute_angle',
     'TriggerManager',
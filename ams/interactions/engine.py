@@ -11,10 +11,12 @@ The InteractionEngine:
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Protocol, Set
+from typing import Any, Callable, Collection, Dict, List, Optional, Protocol, Set, Tuple, Union
 
-from .parser import Interaction, parse_interactions, TriggerMode, Filter
-from .filter import FilterEvaluator, InteractionContext, evaluate_filter
+from .parser import DistanceFrom, Interaction, parse_interactions, TriggerMode, Filter
+from .filter import (
+    EntityBounds, FilterEvaluator, InteractionContext, compile_filter, evaluate_filter, max_distance,
+)
 from .trigger import TriggerManager, TriggerEvent, LifecycleManager, LifecycleEvent
 from .system_entities import SystemEntities, InputType
 
@@ -129,7 +131,9 @@ class Entity:
     Representation of a game entity for the interaction system.
 
     The engine stores a minimal view of entities needed for interaction
-    evaluation (bounds and attributes).
+    evaluation (bounds and attributes). It exposes the same bounds
+    properties and get() lookup as filter.EntityBounds, so filters read it
+    in place instead of going through to_dict().
     """
     id: str
     entity_type: str
@@ -151,6 +155,39 @@ class Entity:
             **self.attributes,
         }
 
+    def get(self, name: str, default: Any = None) -> Any:
+        """Attribute lookup with the same result as to_dict().get(name)."""
+        attributes = self.attributes
+        if name in attributes:
+            return attributes[name]
+        if name == "id":
+            return self.id
+        if name == "type":
+            return self.entity_type
+        if name in ("x", "y", "width", "height"):
+            return getattr(self, name)
+        return default
+
+    @property
+    def center_x(self) -> float:
+        """Center x coordinate."""
+        return self.x + self.width / 2
+
+    @property
+    def center_y(self) -> float:
+        """Center y coordinate."""
+        return self.y + self.height / 2
+
+    @property
+    def right(self) -> float:
+        """Right edge x coordinate."""
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> float:
+        """Bottom edge y coordinate."""
+        return self.y + self.height
+
 
 class InteractionEngine:
     """
@@ -171,14 +208,30 @@ class InteractionEngine:
         engine.update_pointer(x, y, active)
         events = engine.evaluate(entities, dt)
         # Events are automatically dispatched to handlers
+
+    Distance-bounded interactions (e.g. distance: 0, distance: {lt: 150})
+    only evaluate targets within range: a uniform grid of the target type
+    is built once per frame and queried with the filter's maximum
+    distance. Types with fewer than spatial_min_targets entities are
+    scanned directly. get_interaction_stats() reports candidates vs
+    matches per interaction for the last frame.
     """
 
+    # Grid cell size for target queries (pixels)
+    SPATIAL_CELL_SIZE = 64.0
+
+    # Below this many targets a plain scan beats building a grid
+    SPATIAL_MIN_TARGETS = 32
+
     def __init__(
         self,
         screen_width: float = 800,
         screen_height: float = 600,
         lives: int = 3,
-        input_type: InputType = InputType.MOUSE
+        input_type: InputType = InputType.MOUSE,
+        spatial_index: bool = True,
+        spatial_cell_size: float = SPATIAL_CELL_SIZE,
+        spatial_min_targets: int = SPATIAL_MIN_TARGETS,
     ):
         # System entities
         self.system = SystemEntities.create(
@@ -216,6 +269,27 @@ class InteractionEngine:
         # Currently tracked entities
         self._entities: Dict[str, Entity] = {}
 
+        # Tracked entities grouped by type, maintained on add/remove/transform.
+        # Buckets follow _entities order; a transform can append out of order,
+        # so those types are re-sorted lazily at the next evaluate().
+        self._entities_by_type: Dict[str, Dict[str, Entity]] = {}
+        self._unsorted_types: Set[str] = set()
+
+        # System entity filter views for the frame being evaluated
+        self._system_views: Dict[str, Optional[EntityBounds]] = {}
+
+        # Range queries for distance-bounded interactions. Grids are built
+        # lazily per target type and discarded at the start of each frame.
+        self._spatial_index = spatial_index
+        self._spatial_cell_size = spatial_cell_size
+        self._spatial_min_targets = spatial_min_targets
+        self._target_grids: Dict[str, Tuple[Any, Dict[str, int]]] = {}
+
+        # Per-interaction counters for the last evaluate():
+        # {interaction_key: {"targets", "candidates", "matches"}}
+        self._interaction_stats: Dict[str, Dict[str, int]] = {}
+        self._pair_matches = 0
+
     def register_entity_type(
         self,
         entity_type: str,
@@ -224,6 +298,9 @@ class InteractionEngine:
         """
         Register an entity type with its interactions.
 
+        Each interaction's filter is compiled into a plan here, so the
+        per-pair check does not re-interpret the Filter every frame.
+
         Args:
             entity_type: Name of the entity type (e.g., "ball")
             interactions_data: The 'interactions' dict from entity type definition
@@ -232,6 +309,9 @@ class InteractionEngine:
             List of parsed Interaction objects
         """
         interactions = parse_interactions(interactions_data, entity_type)
+        for interaction in interactions:
+            interaction.plan = compile_filter(interaction.filter)
+            interaction.max_distance = max_distance(interaction.filter)
         self._interactions[entity_type] = interactions
         return interactions
 
@@ -277,7 +357,12 @@ class InteractionEngine:
 
         Returns spawn lifecycle events.
         """
+        previous = self._entities.get(entity.id)
+        if previous is not None:
+            self._unindex_entity(previous)
+            self._unsorted_types.add(entity.entity_type)
         self._entities[entity.id] = entity
+        self._entities_by_type.setdefault(entity.entity_type, {})[entity.id] = entity
         return self._lifecycle.on_spawn(entity.id)
 
     def remove_entity(self, entity_id: str) -> List[LifecycleEvent]:
@@ -289,9 +374,17 @@ class InteractionEngine:
         self._triggers.clear_entity(entity_id)
         self._clear_fired_monotonic(entity_id)
         if entity_id in self._entities:
-            del self._entities[entity_id]
+            self._unindex_entity(self._entities.pop(entity_id))
         return self._lifecycle.on_destroy(entity_id)
 
+    def _unindex_entity(self, entity: Entity) -> None:
+        """Remove an entity from its type bucket."""
+        bucket = self._entities_by_type.get(entity.entity_type)
+        if bucket is not None:
+            bucket.pop(entity.id, None)
+            if not bucket:
+                del self._entities_by_type[entity.entity_type]
+
     def _clear_fired_monotonic(self, entity_id: str) -> None:
         """Clear fired monotonic interactions for an entity (on destroy/transform)."""
         to_remove = [key for key in self._fired_monotonic if key[0] == entity_id]
@@ -307,7 +400,13 @@ class InteractionEngine:
         Transform to same type = reset all timers/interactions.
         """
         if entity_id in self._entities:
-            self._entities[entity_id].entity_type = new_type
+            entity = self._entities[entity_id]
+            self._unindex_entity(entity)
+            entity.entity_type = new_type
+            bucket = self._entities_by_type.setdefault(new_type, {})
+            if bucket:
+                self._unsorted_types.add(new_type)
+            bucket[entity_id] = entity
             self._triggers.clear_entity(entity_id)
             self._clear_fired_monotonic(entity_id)
 
@@ -351,12 +450,15 @@ class InteractionEngine:
 
         all_events: List[TriggerEvent] = []
 
-        # Get entities by type for efficient lookup
-        entities_by_type: Dict[str, List[Entity]] = {}
-        for entity in self._entities.values():
-            if entity.entity_type not in entities_by_type:
-                entities_by_type[entity.entity_type] = []
-            entities_by_type[entity.entity_type].append(entity)
+        # Entities by type for efficient lookup (restore tracking order if needed)
+        if self._unsorted_types:
+            self._sort_type_buckets()
+        entities_by_type = self._entities_by_type
+
+        # System entity views, built once per frame rather than per pair
+        self._system_views = {}
+        self._target_grids = {}
+        self._interaction_stats = {}
 
         # Evaluate each entity's interactions
         for entity in self._entities.values():
@@ -376,6 +478,16 @@ class InteractionEngine:
 
         return all_events
 
+    def _sort_type_buckets(self) -> None:
+        """Reorder type buckets that fell out of _entities order."""
+        for entity_type in self._unsorted_types:
+            if entity_type in self._entities_by_type:
+                self._entities_by_type[entity_type] = {
+                    eid: e for eid, e in self._entities.items()
+                    if e.entity_type == entity_type
+                }
+        self._unsorted_types.clear()
+
     def _get_interaction_key(self, interaction: Interaction) -> str:
         """Get stable key for an interaction."""
         return f"{interaction.source_entity_type}:{interaction.target}:{interaction.action}"
@@ -384,7 +496,7 @@ class InteractionEngine:
         self,
         entity_a: Entity,
         interaction: Interaction,
-        entities_by_type: Dict[str, List[Entity]]
+        entities_by_type: Dict[str, Dict[str, Entity]]
     ) -> List[TriggerEvent]:
         """Evaluate a single interaction for an entity."""
         # Skip if this monotonic interaction already fired for this entity
@@ -398,25 +510,37 @@ class InteractionEngine:
         # Get target entities
         if self.system.is_system_entity(target):
             # System entity target
-            target_dict = self.system.get_entity_dict(target)
-            if target_dict:
+            target_view = self._get_system_view(target)
+            if target_view is not None:
                 events.extend(self._check_pair(
                     entity_a,
                     target,
-                    target_dict,
+                    target_view,
                     interaction,
                 ))
         else:
             # Game entity targets
-            targets = entities_by_type.get(target, [])
-            for entity_b in targets:
-                if entity_b.id != entity_a.id:  # Don't interact with self
-                    events.extend(self._check_pair(
-                        entity_a,
-                        entity_b.id,
-                        entity_b.to_dict(),
-                        interaction,
-                    ))
+            targets = entities_by_type.get(target)
+            if targets:
+                candidates = self._get_candidates(entity_a, interaction, targets)
+                matches_before = self._pair_matches
+                for entity_b in candidates:
+                    if entity_b.id != entity_a.id:  # Don't interact with self
+                        events.extend(self._check_pair(
+                            entity_a,
+                            entity_b.id,
+                            entity_b,
+                            interaction,
+                        ))
+
+                stats = self._interaction_stats.get(int_key)
+                if stats is None:
+                    stats = self._interaction_stats[int_key] = {
+                        "targets": 0, "candidates": 0, "matches": 0,
+                    }
+                stats["targets"] += len(targets)
+                stats["candidates"] += len(candidates)
+                stats["matches"] += self._pair_matches - matches_before
 
         # If monotonic filter + enter trigger fired: delete the rule forever.
         # The universe has spoken. (Transform resets.)
@@ -425,31 +549,106 @@ class InteractionEngine:
 
         return events
 
+    def _get_candidates(
+        self,
+        entity_a: Entity,
+        interaction: Interaction,
+        targets: Dict[str, Entity]
+    ) -> Collection[Entity]:
+        """
+        Targets worth evaluating for entity A, in target order.
+
+        With a bounded filter distance, only targets whose bounds overlap
+        the search box can match. Targets that matched last frame are kept
+        too, so their exit/enter trigger state is still updated.
+        """
+        radius = interaction.max_distance
+        if (radius is None or not self._spatial_index
+                or len(targets) < self._spatial_min_targets):
+            return targets.values()
+
+        grid, order = self._get_target_grid(interaction.target, targets)
+        if interaction.filter.distance_from == DistanceFrom.CENTER:
+            # Distance is measured from A's center
+            found = grid.query(entity_a.center_x - radius, entity_a.center_y - radius,
+                               radius * 2, radius * 2)
+        else:
+            found = grid.query(entity_a.x - radius, entity_a.y - radius,
+                               entity_a.width + radius * 2, entity_a.height + radius * 2)
+
+        previous = self._triggers.matching_targets(interaction, entity_a.id)
+        if previous:
+            found_ids = {e.id for e in found}
+            stale = [targets[eid] for eid in previous
+                     if eid in targets and eid not in found_ids]
+            if stale:
+                found = sorted(found + stale, key=lambda e: order[e.id])
+        return found
+
+    def _get_target_grid(
+        self,
+        target_type: str,
+        targets: Dict[str, Entity]
+    ) -> Tuple[Any, Dict[str, int]]:
+        """Grid of a target type for this frame, plus each target's order."""
+        cached = self._target_grids.get(target_type)
+        if cached is None:
+            # Imported lazily: the game_engine package imports this module
+            from ams.games.game_engine.spatial_hash import SpatialHash
+
+            grid = SpatialHash(cell_size=self._spatial_cell_size)
+            grid.rebuild(list(targets.values()))
+            order = {eid: index for index, eid in enumerate(targets)}
+            cached = self._target_grids[target_type] = (grid, order)
+        return cached
+
+    def get_interaction_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get candidate/match counters for the last evaluate().
+
+        Returns:
+            Dict of interaction key ("source:target:action") to counts of
+            targets of the type, candidates evaluated, and filter matches.
+            Interactions with system entity targets are not included.
+        """
+        return {key: dict(stats) for key, stats in self._interaction_stats.items()}
+
+    def _get_system_view(self, name: str) -> Optional[EntityBounds]:
+        """Filter view of a system entity (cached for the current frame)."""
+        views = self._system_views
+        if name not in views:
+            data = self.system.get_entity_dict(name)
+            views[name] = EntityBounds.from_dict(data) if data else None
+        return views[name]
+
     def _check_pair(
         self,
         entity_a: Entity,
         entity_b_id: str,
-        entity_b_dict: Dict[str, Any],
+        entity_b: Union[Entity, EntityBounds],
         interaction: Interaction
     ) -> List[TriggerEvent]:
         """Check a single entity pair against an interaction filter."""
-        entity_a_dict = entity_a.to_dict()
-
-        # Evaluate filter
-        matches, context = evaluate_filter(
-            interaction.filter,
-            entity_a_dict,
-            entity_b_dict,
-        )
+        # Filters read the entities in place; nothing is copied per pair
+        plan = interaction.plan
+        if plan is not None:
+            matches, context = plan(entity_a, entity_b)
+        else:
+            matches, context = evaluate_filter(
+                interaction.filter,
+                entity_a,
+                entity_b,
+            )
+        if matches:
+            self._pair_matches += 1
 
-        # Build context dict for trigger manager
-        context_dict = {}
-        if context:
-            context_dict = {
+        # Context dicts are only built for events that actually fire
+        def build_context() -> Dict[str, Any]:
+            return {
                 "distance": context.distance,
                 "angle": context.angle,
-                "a": entity_a_dict,
-                "b": entity_b_dict,
+                "a": entity_a.to_dict(),
+                "b": entity_b.to_dict(),
             }
 
         # Update trigger state and get events
@@ -458,7 +657,7 @@ class InteractionEngine:
             entity_a.id,
             entity_b_id,
             matches,
-            context_dict,
+            context_factory=build_context if context else None,
         )
 
     def _dispatch(self, event: TriggerEvent) -> None:
@@ -558,7 +757,11 @@ class InteractionEngine:
         self._triggers.reset()
         self._lifecycle.clear()
         self._entities.clear()
+        self._entities_by_type.clear()
+        self._unsorted_types.clear()
         self._fired_monotonic.clear()
+        self._target_grids.clear()
+        self._interaction_stats.clear()
         self.system.game.reset()
         self.system.time.reset_absolute()
         self.system.level.reset()
@@ -3,11 +3,17 @@ Filter evaluation for the unified interaction system.
 
 Evaluates interaction filters against entity pairs, computing
 distance, angle, and checking entity attribute conditions.
+
+Entities can be passed either as dicts (x/y/width/height plus attributes)
+or as objects that expose x/y/width/height, the derived right/bottom/
+center_x/center_y, and a dict-style get() for attributes - e.g.
+interactions.Entity or EntityBounds.from_dict(). The object path reads
+values in place, so no per-pair dicts are built.
 """
 
 import math
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .parser import Filter, FilterValue, DistanceFrom
 
@@ -17,16 +23,21 @@ class EntityBounds:
     """
     Entity bounds for distance/angle calculations.
 
+    When built with from_dict(), the source dict is kept so the bounds can
+    also stand in for the entity in attribute filters (get()).
+
     Attributes:
         x: Left edge x position
         y: Top edge y position
         width: Width
         height: Height
+        data: Source entity dict, if any
     """
     x: float
     y: float
     width: float
     height: float
+    data: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
 
     @property
     def center_x(self) -> float:
@@ -56,8 +67,21 @@ class EntityBounds:
             y=data.get("y", 0),
             width=data.get("width", 0),
             height=data.get("height", 0),
+            data=data,
         )
 
+    def get(self, name: str, default: Any = None) -> Any:
+        """Look up an entity attribute (same as dict.get on the source dict)."""
+        if self.data is None:
+            return default
+        return self.data.get(name, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Source entity dict (or plain bounds if created directly)."""
+        if self.data is not None:
+            return self.data
+        return {"x": self.x, "y": self.y, "width": self.width, "height": self.height}
+
 
 def compute_distance_edge_to_edge(a: EntityBounds, b: EntityBounds) -> float:
     """
@@ -173,15 +197,17 @@ class InteractionContext:
     Context for a single interaction evaluation.
 
     Contains computed values and entity attributes needed for filtering.
+    On the object path entity_a/entity_b (and the bounds) are the entity
+    objects themselves rather than dicts.
     """
     distance: float
     angle: float
-    entity_a: Dict[str, Any]
-    entity_b: Dict[str, Any]
+    entity_a: Any
+    entity_b: Any
 
     # Bounds for reference
-    bounds_a: EntityBounds
-    bounds_b: EntityBounds
+    bounds_a: Any
+    bounds_b: Any
 
 
 class FilterEvaluator:
@@ -266,6 +292,59 @@ class FilterEvaluator:
 
         return True
 
+    def evaluate_entities(
+        self,
+        entity_a: Any,
+        entity_b: Any,
+        filter_obj: Filter
+    ) -> Tuple[bool, Optional[InteractionContext]]:
+        """
+        Evaluate a filter against entity objects without copying them.
+
+        Distance and angle are only computed when the filter uses them or
+        the pair matches (the context needs both). Attribute filters read
+        entity_a.get()/entity_b.get() directly.
+
+        Returns (matches, context) tuple; context is None if no match.
+        """
+        distance = None
+        if filter_obj.distance is not None:
+            distance = compute_distance(
+                entity_a, entity_b, filter_obj.distance_from, filter_obj.distance_to
+            )
+            if not filter_obj.distance.matches(distance):
+                return False, None
+
+        angle = None
+        if filter_obj.angle is not None:
+            angle = compute_angle(entity_a, entity_b)
+            if not filter_obj.angle.matches(angle):
+                return False, None
+
+        for attr_name, filter_value in filter_obj.entity_a_attrs.items():
+            if not filter_value.matches(entity_a.get(attr_name)):
+                return False, None
+
+        for attr_name, filter_value in filter_obj.entity_b_attrs.items():
+            if not filter_value.matches(entity_b.get(attr_name)):
+                return False, None
+
+        if distance is None:
+            distance = compute_distance(
+                entity_a, entity_b, filter_obj.distance_from, filter_obj.distance_to
+            )
+        if angle is None:
+            angle = compute_angle(entity_a, entity_b)
+
+        return True, InteractionContext(
+            distance=distance,
+            angle=angle,
+            entity_a=entity_a,
+            entity_b=entity_b,
+            bounds_a=entity_a,
+            bounds_b=entity_b,
+        )
+
     def evaluate_pair(
         self,
         entity_a: Dict[str, Any],
@@ -289,15 +368,191 @@ _default_evaluator = FilterEvaluator()
 
 def evaluate_filter(
     filter_obj: Filter,
-    entity_a: Dict[str, Any],
-    entity_b: Dict[str, Any]
+    entity_a: Any,
+    entity_b: Any
 ) -> Tuple[bool, Optional[InteractionContext]]:
     """
     Evaluate filter against entity pair.
 
-    Convenience function using default evaluator.
+    Convenience function using default evaluator. Dicts go through
+    compute_context/evaluate; entity objects use the zero-copy
+    evaluate_entities path.
 
     Returns:
         (matches, context) tuple. Context is None if filter doesn't match.
     """
-    return _default_evaluator.evaluate_pair(entity_a, entity_b, filter_obj)
+    if isinstance(entity_a, dict) or isinstance(entity_b, dict):
+        return _default_evaluator.evaluate_pair(entity_a, entity_b, filter_obj)
+    return _default_evaluator.evaluate_entities(entity_a, entity_b, filter_obj)
+
+
+# =============================================================================
+# Compiled filter plans
+# =============================================================================
+
+# plan(entity_a, entity_b) -> (matches, context), same contract as
+# FilterEvaluator.evaluate_entities
+FilterPlan = Callable[[Any, Any], Tuple[bool, Optional[InteractionContext]]]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_cheap(value: FilterValue) -> bool:
+    """Exact/set matches: cheap, and never raise on missing (None) values."""
+    if value.exact is not None:
+        return True
+    return value.in_set is not None and all(
+        bound is None for bound in (value.lt, value.gt, value.lte, value.gte, value.between)
+    )
+
+
+def _distance_upper_bound(value: FilterValue) -> Optional[float]:
+    """Largest distance the filter value can accept, if bounded above."""
+    if value.exact is not None:
+        return value.exact if _is_number(value.exact) else None
+    bounds = [b for b in (value.lt, value.lte) if _is_number(b)]
+    if value.between is not None and _is_number(value.between[1]):
+        bounds.append(value.between[1])
+    return min(bounds) if bounds else None
+
+
+def max_distance(filter_obj: Filter) -> Optional[float]:
+    """
+    Largest distance at which the filter can match, or None if unbounded.
+
+    Used to restrict candidate targets to a search radius.
+    """
+    if filter_obj.distance is None:
+        return None
+    limit = _distance_upper_bound(filter_obj.distance)
+    if limit is None or not math.isfinite(limit):
+        return None
+    return limit
+
+
+def _distance_function(filter_obj: Filter) -> Callable[[Any, Any], float]:
+    """Resolve compute_distance's mode dispatch once."""
+    from_mode, to_mode = filter_obj.distance_from, filter_obj.distance_to
+    if from_mode == DistanceFrom.CENTER and to_mode == DistanceFrom.CENTER:
+        return compute_distance_center_to_center
+    if from_mode == DistanceFrom.CENTER and to_mode == DistanceFrom.EDGE:
+        return compute_distance_center_to_edge
+    if from_mode == DistanceFrom.EDGE and to_mode == DistanceFrom.CENTER:
+        return lambda a, b: compute_distance_center_to_edge(b, a)
+    return compute_distance_edge_to_edge
+
+
+def _distance_reject(filter_obj: Filter) -> Optional[Callable[[Any, Any], bool]]:
+    """
+    Cheap pre-check that rejects pairs whose distance is certainly too large.
+
+    Uses per-axis gaps (a lower bound on the distance) so no sqrt is taken
+    for far-apart pairs. Only rejects; matching pairs still go through the
+    exact FilterValue.matches() check.
+    """
+    limit = _distance_upper_bound(filter_obj.distance)
+    if limit is None:
+        return None
+    from_mode, to_mode = filter_obj.distance_from, filter_obj.distance_to
+
+    if from_mode == DistanceFrom.EDGE and to_mode == DistanceFrom.EDGE:
+        def reject(a: Any, b: Any) -> bool:
+            ax, ay, bx, by = a.x, a.y, b.x, b.y
+            return (bx - (ax + a.width) > limit or ax - (bx + b.width) > limit or
+                    by - (ay + a.height) > limit or ay - (by + b.height) > limit)
+        return reject
+
+    if from_mode == DistanceFrom.CENTER and to_mode == DistanceFrom.CENTER:
+        def reject(a: Any, b: Any) -> bool:
+            return (abs(b.center_x - a.center_x) > limit or
+                    abs(b.center_y - a.center_y) > limit)
+        return reject
+
+    return None
+
+
+def _collision_plan(filter_obj: Filter) -> bool:
+    """distance: 0 measured edge to edge, i.e. a plain AABB overlap test."""
+    exact = filter_obj.distance.exact
+    return (_is_number(exact) and exact == 0 and
+            filter_obj.distance_from == DistanceFrom.EDGE and
+            filter_obj.distance_to == DistanceFrom.EDGE)
+
+
+def compile_filter(filter_obj: Filter) -> FilterPlan:
+    """
+    Compile a parsed Filter into a specialized evaluation function.
+
+    The plan gives the same result as evaluate_filter() on entity objects,
+    but decides up front which checks exist and runs them cheapest first:
+
+    1. exact/set attribute checks (a.*, b.*)
+    2. distance, with a sqrt-free early reject on its upper bound
+       (distance: 0 edge-to-edge becomes a plain overlap test)
+    3. angle, only if the filter has one
+    4. range attribute checks, in their original order
+
+    Distance and angle are still computed for matching pairs, because the
+    returned InteractionContext carries both.
+
+    The plan captures the filter's values at compile time; recompile after
+    mutating the Filter.
+    """
+    distance_fn = _distance_function(filter_obj)
+    distance_value = filter_obj.distance
+    angle_value = filter_obj.angle
+
+    cheap: List[Tuple[bool, str, Callable[[Any], bool]]] = []
+    ranged: List[Tuple[bool, str, Callable[[Any], bool]]] = []
+    for is_a, attrs in ((True, filter_obj.entity_a_attrs), (False, filter_obj.entity_b_attrs)):
+        for name, value in attrs.items():
+            target = cheap if _is_cheap(value) else ranged
+            target.append((is_a, name, value.matches))
+
+    def attrs_match(checks, a: Any, b: Any) -> bool:
+        for is_a, name, matches in checks:
+            if not matches((a if is_a else b).get(name)):
+                return False
+        return True
+
+    steps: List[Callable[[Any, Any], bool]] = []
+    if cheap:
+        steps.append(lambda a, b: attrs_match(cheap, a, b))
+
+    collision = distance_value is not None and _collision_plan(filter_obj)
+    if collision:
+        steps.append(lambda a, b: not (a.x + a.width < b.x or b.x + b.width < a.x or
+                                       a.y + a.height < b.y or b.y + b.height < a.y))
+    elif distance_value is not None:
+        reject = _distance_reject(filter_obj)
+        if reject is not None:
+            steps.append(lambda a, b: not reject(a, b))
+        distance_matches = distance_value.matches
+        steps.append(lambda a, b: distance_matches(distance_fn(a, b)))
+
+    if angle_value is not None:
+        angle_matches = angle_value.matches
+        steps.append(lambda a, b: angle_matches(compute_angle(a, b)))
+
+    if ranged:
+        steps.append(lambda a, b: attrs_match(ranged, a, b))
+
+    steps = tuple(steps)
+
+    def plan(entity_a: Any, entity_b: Any) -> Tuple[bool, Optional[InteractionContext]]:
+        for step in steps:
+            if not step(entity_a, entity_b):
+                return False, None
+        return True, InteractionContext(
+            # Overlapping boxes are distance 0 by definition
+            distance=0 if collision else distance_fn(entity_a, entity_b),
+            angle=compute_angle(entity_a, entity_b),
+            entity_a=entity_a,
+            entity_b=entity_b,
+            bounds_a=entity_a,
+            bounds_b=entity_b,
+        )
+
+    return plan
@@ -8,7 +8,7 @@ that can be evaluated by the InteractionEngine.
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 import json
 
 
@@ -99,6 +99,8 @@ class Interaction:
         edges: Screen edge shorthand (expands to angle filter)
         action: Action name to execute
         modifier: Configuration passed to the action
+        plan: Compiled filter (set by InteractionEngine.register_entity_type)
+        max_distance: Search radius for candidate targets (set with plan)
     """
     target: str
     filter: Filter
@@ -110,6 +112,12 @@ class Interaction:
     # Source info for error messages
     source_entity_type: str = ""
 
+    # filter.compile_filter(filter); None means evaluate_filter interprets it
+    plan: Optional[Callable[[Any, Any], Any]] = field(default=None, repr=False, compare=False)
+
+    # filter.max_distance(filter); None means every target is a candidate
+    max_distance: Optional[float] = field(default=None, repr=False, compare=False)
+
 
 def _parse_filter_value(value: Any) -> FilterValue:
     """Parse a filter value from YAML."""
@@ -12,7 +12,7 @@ Trigger modes:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .parser import Interaction, TriggerMode
 
@@ -62,6 +62,9 @@ class TriggerManager:
         # State tracking: {(interaction_key, entity_a_id, entity_b_id): was_matching}
         self._state: Dict[Tuple[str, str, str], bool] = {}
 
+        # Currently matching B ids: {(interaction_key, entity_a_id): {entity_b_id}}
+        self._matching: Dict[Tuple[str, str], Set[str]] = {}
+
         # Counter for generating interaction keys
         self._interaction_keys: Dict[int, str] = {}
 
@@ -79,7 +82,8 @@ class TriggerManager:
         entity_a_id: str,
         entity_b_id: str,
         filter_matches: bool,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        context_factory: Optional[Callable[[], Dict[str, Any]]] = None
     ) -> List[TriggerEvent]:
         """
         Update trigger state and return events to fire.
@@ -90,6 +94,8 @@ class TriggerManager:
             entity_b_id: Entity B identifier
             filter_matches: Whether the filter currently matches
             context: Interaction context (distance, angle, etc.)
+            context_factory: Builds the context lazily; only called when an
+                enter/continuous event fires (takes precedence over context)
 
         Returns:
             List of TriggerEvents to fire (0, 1, or more)
@@ -99,6 +105,8 @@ class TriggerManager:
 
         # Update state
         self._state[key] = filter_matches
+        if filter_matches != was_matching:
+            self._set_matching(key, filter_matches)
 
         events = []
         ctx = context or {}
@@ -111,7 +119,7 @@ class TriggerManager:
                     entity_a_id=entity_a_id,
                     entity_b_id=entity_b_id,
                     trigger_type=TriggerMode.ENTER,
-                    context=ctx,
+                    context=context_factory() if context_factory else ctx,
                 ))
 
         elif interaction.trigger == TriggerMode.EXIT:
@@ -133,7 +141,7 @@ class TriggerManager:
                     entity_a_id=entity_a_id,
                     entity_b_id=entity_b_id,
                     trigger_type=TriggerMode.CONTINUOUS,
-                    context=ctx,
+                    context=context_factory() if context_factory else ctx,
                 ))
 
         return events
@@ -149,7 +157,8 @@ class TriggerManager:
             if key[1] == entity_id or key[2] == entity_id
         ]
         for key in keys_to_remove:
-            del self._state[key]
+            if self._state.pop(key):
+                self._set_matching(key, False)
 
     def clear_pair(
         self,
@@ -159,8 +168,34 @@ class TriggerManager:
     ) -> None:
         """Clear state for a specific entity pair."""
         key = (self._get_interaction_key(interaction), entity_a_id, entity_b_id)
-        if key in self._state:
-            del self._state[key]
+        if self._state.pop(key, False):
+            self._set_matching(key, False)
+
+    def _set_matching(self, key: Tuple[str, str, str], matching: bool) -> None:
+        """Keep _matching in step with a state change for key."""
+        pair = (key[0], key[1])
+        if matching:
+            self._matching.setdefault(pair, set()).add(key[2])
+            return
+        targets = self._matching.get(pair)
+        if targets is not None:
+            targets.discard(key[2])
+            if not targets:
+                del self._matching[pair]
+
+    def matching_targets(
+        self,
+        interaction: Interaction,
+        entity_a_id: str
+    ) -> Set[str]:
+        """
+        Get B ids whose filter matched at their last update for entity A.
+
+        Callers that skip evaluating some pairs (e.g. spatial pruning) must
+        still update these, so enter/exit state stays correct.
+        """
+        key = (self._get_interaction_key(interaction), entity_a_id)
+        return self._matching.get(key, set())
 
     def get_state(
         self,
@@ -175,6 +210,7 @@ class TriggerManager:
     def reset(self) -> None:
         """Clear all state (e.g., on level reset)."""
         self._state.clear()
+        self._matching.clear()
 
     def get_active_pairs(self, interaction: Interaction) -> List[Tuple[str, str]]:
         """
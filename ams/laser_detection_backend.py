@@ -26,8 +26,10 @@ import cv2
 
 from ams.detection_backend import DetectionBackend
 from ams.events import PlaneHitEvent, CalibrationResult
-from ams.camera import CameraInterface
+from ams.camera import CameraInterface, grab_frame
+from ams.detection_roi import ScreenROI
 from ams.logging import get_logger
+from ams.stage_timer import StageTimer
 
 log = get_logger('laser_detection')
 
@@ -59,7 +61,8 @@ class LaserDetectionBackend(DetectionBackend):
         calibration_manager: Optional['CalibrationManager'],
         display_width: int,
         display_height: int,
-        brightness_threshold: int = 200
+        brightness_threshold: int = 200,
+        roi: bool = False
     ):
         """
         Initialize laser detection backend.
@@ -70,6 +73,8 @@ class LaserDetectionBackend(DetectionBackend):
             display_width: Display width in pixels
             display_height: Display height in pixels
             brightness_threshold: Minimum brightness for laser detection (0-255)
+            roi: Only process the calibrated screen area (crop and mask frames)
+                instead of filtering detections afterwards
         """
         super().__init__(display_width, display_height)
 
@@ -97,6 +102,14 @@ class LaserDetectionBackend(DetectionBackend):
         self.debug_frame: Optional[np.ndarray] = None
         self.debug_targets: List[Tuple[float, float, float, tuple]] = []  # (x, y, radius, color) in normalized coords
 
+        # ROI mode: screen polygon crop + mask
+        self.use_roi = roi
+        self.roi: Optional[ScreenROI] = None
+        self._update_roi()
+
+        # Per-stage latency (enabled by benchmarks)
+        self.stage_timer = StageTimer()
+
         log.info("LaserDetectionBackend initialized")
         log.info("  Camera resolution: %s", camera.get_resolution())
         log.info("  Brightness threshold: %d", brightness_threshold)
@@ -108,16 +121,35 @@ class LaserDetectionBackend(DetectionBackend):
 
         Detects bright laser spot in camera frame.
         Much simpler than projectile detection - no motion tracking needed.
+
+        With a ThreadedCamera this uses the newest captured frame and returns
+        immediately if none arrived since the last update; hit timestamps
+        are the frame's capture time.
         """
-        # Capture camera frame
-        frame = self.camera.capture_frame()
-        timestamp = time.monotonic()
+        # Latest camera frame (non-blocking for threaded cameras)
+        captured = grab_frame(self.camera)
+        if captured is None:
+            return
+        frame = captured.image
+        timestamp = captured.timestamp
+        timer = self.stage_timer
+        timer.start()
+
+        # ROI mode: only process the screen area
+        roi = self.roi
+        ox, oy = 0, 0
+        source = frame
+        if roi is not None:
+            source = roi.crop(frame)
+            ox, oy = roi.offset
 
         # Convert to grayscale for brightness analysis
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(source, cv2.COLOR_BGR2GRAY)
+        timer.mark('convert')
 
         # Apply Gaussian blur to reduce noise
         gray = cv2.GaussianBlur(gray, (self.blur_size, self.blur_size), 0)
+        timer.mark('blur')
 
         # Threshold for very bright spots (laser pointer)
         # Laser pointers are typically 200-255 brightness
@@ -127,22 +159,29 @@ class LaserDetectionBackend(DetectionBackend):
             255,
             cv2.THRESH_BINARY
         )
+        if roi is not None:
+            bright_spots = roi.apply_mask(bright_spots)
+        timer.mark('threshold')
 
         # Morphological operations to clean noise
         kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
         bright_spots = cv2.morphologyEx(bright_spots, cv2.MORPH_OPEN, kernel)
 
-        # Find contours (bright blobs)
+        # Find contours (bright blobs), in full-frame coordinates
         contours, _ = cv2.findContours(
             bright_spots,
             cv2.RETR_EXTERNAL,
-            cv2.CHAIN_APPROX_SIMPLE
+            cv2.CHAIN_APPROX_SIMPLE,
+            offset=(ox, oy)
         )
+        timer.mark('contours')
 
         # Debug visualization - create frame FIRST
         if self.debug_mode:
             if self.debug_bw_mode:
                 # Show black/white threshold view (easier to tune)
+                if roi is not None:
+                    bright_spots = roi.expand(bright_spots)
                 debug_frame = cv2.cvtColor(bright_spots, cv2.COLOR_GRAY2BGR)
             else:
                 # Show normal camera view with contours
@@ -223,7 +262,7 @@ class LaserDetectionBackend(DetectionBackend):
             # Add text overlay
             cv2.putText(
                 debug_frame,
-                f"Laser ({int(cx)}, {int(cy)}) Area: {int(area)} Bright: {int(gray[int(cy), int(cx)])}",
+                f"Laser ({int(cx)}, {int(cy)}) Area: {int(area)} Bright: {int(gray[int(cy) - oy, int(cx) - ox])}",
                 (10, 30),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.6,
@@ -261,6 +300,7 @@ class LaserDetectionBackend(DetectionBackend):
             # Use calibration for accurate transformation
             try:
                 game_pos = self.calibration_manager.camera_to_game(camera_pos)
+                timer.mark('transform')
 
                 # Validate transformed coordinates (check for NaN, infinity, or out of bounds)
                 import math
@@ -292,7 +332,7 @@ class LaserDetectionBackend(DetectionBackend):
             return
 
         # Sample brightness at detection point
-        brightness = int(gray[int(cy), int(cx)])
+        brightness = int(gray[int(cy) - oy, int(cx) - ox])
 
         # Create event
         event = PlaneHitEvent(
@@ -335,8 +375,18 @@ class LaserDetectionBackend(DetectionBackend):
         if self.calibration_manager is None or not CALIBRATION_AVAILABLE:
             return True  # No calibration = no filtering
 
+        if self.roi is not None:
+            return True  # Only pixels inside the polygon were processed
+
         return self.calibration_manager.is_within_screen_bounds(camera_pos)
 
+    def _update_roi(self) -> None:
+        """Derive the detection ROI from the current calibration."""
+        if self.use_roi and CALIBRATION_AVAILABLE:
+            self.roi = ScreenROI.from_calibration(self.calibration_manager)
+        else:
+            self.roi = None
+
     def calibrate(self, display_surface=None, display_resolution=None) -> CalibrationResult:
         """
         Run geometric calibration using ArUco markers.
@@ -524,6 +574,7 @@ class LaserDetectionBackend(DetectionBackend):
             # Update calibration manager if available
             if self.calibration_manager and CALIBRATION_AVAILABLE:
                 self.calibration_manager.load_calibration(calib_path)
+                self._update_roi()
                 log.info("Calibration manager updated")
 
             return CalibrationResult(
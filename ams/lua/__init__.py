@@ -9,8 +9,11 @@ Provides a reusable, sandboxed Lua execution environment with:
 Entity is an ABC; use GameEntity from ams.games.game_engine for games.
 """
 
-from ams.lua.engine import LuaEngine
+from ams.lua.engine import LuaEngine, clear_subroutine_cache, get_subroutine_cache_stats
 from ams.lua.entity import Entity
 from ams.lua.api import LuaAPIBase, lua_safe_function, _to_lua_value
 
-__all__ = ['LuaEngine', 'Entity', 'LuaAPIBase', 'lua_safe_function', '_to_lua_value']
+__all__ = [
+    'LuaEngine', 'Entity', 'LuaAPIBase', 'lua_safe_function', '_to_lua_value',
+    'clear_subroutine_cache', 'get_subroutine_cache_stats',
+]
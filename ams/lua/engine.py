@@ -16,7 +16,8 @@ directory names. Common types include:
 - input_action: User input handlers with execute(x, y, args)
 """
 
-from collections import defaultdict
+import hashlib
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from typing import Any, Callable, Optional, Protocol, TYPE_CHECKING
 
@@ -24,11 +25,49 @@ from lupa import LuaRuntime
 
 from .entity import Entity
 from .api import LuaAPIBase
+from .scheduler import CallbackScheduler
 from ams import profiling
 from ams.logging import get_logger
 
 log = get_logger('lua_engine')
 
+# Default number of compiled expressions kept by LuaEngine.evaluate_expression
+EXPRESSION_CACHE_SIZE = 512
+
+# Parsed .lua.yaml subroutines shared by every LuaEngine in the process, keyed
+# by (sub_type, name, SHA-1 of the file text). Restarting a game re-reads the
+# files but skips YAML parsing and ScriptMetadata construction; edited files
+# hash differently and are parsed again. LRU-bounded so repeated edits during
+# development don't grow it forever.
+SUBROUTINE_CACHE_SIZE = 1024
+_subroutine_cache: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+_subroutine_cache_hits = 0
+_subroutine_cache_misses = 0
+
+# Lua side of LuaEngine.call_batched: calls fns[g](id, ...) for every id in
+# groups[g], skipping ids marked in `dead`, and collects errors instead of
+# stopping at the first one
+_BATCH_DISPATCHER = """
+return function(fns, groups, count, dead, ...)
+    local errors = nil
+    for g = 1, count do
+        local fn = fns[g]
+        local ids = groups[g]
+        for i = 1, #ids do
+            local id = ids[i]
+            if not dead[id] then
+                local ok, err = pcall(fn, id, ...)
+                if not ok then
+                    errors = errors or {}
+                    errors[#errors + 1] = {g, id, tostring(err)}
+                end
+            end
+        end
+    end
+    return errors
+end
+"""
+
 if TYPE_CHECKING:
     from ams.content_fs import ContentFS
 
@@ -52,6 +91,54 @@ def _init_script_loader():
         HAS_SCRIPT_LOADER = False
 
 
+def get_subroutine_cache_stats() -> dict[str, int]:
+    """Get statistics of the process-wide .lua.yaml subroutine cache.
+
+    Returns:
+        Dict with size, capacity, hits and misses
+    """
+    return {
+        'size': len(_subroutine_cache),
+        'capacity': SUBROUTINE_CACHE_SIZE,
+        'hits': _subroutine_cache_hits,
+        'misses': _subroutine_cache_misses,
+    }
+
+
+def clear_subroutine_cache() -> None:
+    """Drop all cached subroutines (e.g. after changing SUBROUTINE_CACHE_SIZE)."""
+    global _subroutine_cache_hits, _subroutine_cache_misses
+    _subroutine_cache.clear()
+    _subroutine_cache_hits = 0
+    _subroutine_cache_misses = 0
+
+
+def _parse_yaml_subroutine(sub_type: str, name: str, yaml_content: str) -> Any:
+    """Parse .lua.yaml text into ScriptMetadata, through the process-wide cache."""
+    global _subroutine_cache_hits, _subroutine_cache_misses
+    key = (sub_type, name, hashlib.sha1(yaml_content.encode('utf-8')).hexdigest())
+    script = _subroutine_cache.get(key)
+    if script is not None:
+        _subroutine_cache.move_to_end(key)
+        _subroutine_cache_hits += 1
+        return script
+
+    _subroutine_cache_misses += 1
+    # Parse YAML using ams.yaml (handles both YAML and JSON formats)
+    from ams.yaml import loads as yaml_loads
+    data = yaml_loads(yaml_content, format='yaml')
+
+    # Create ScriptMetadata via ScriptLoader
+    loader = ScriptLoader(validate=False)  # Schema validation optional
+    script = loader.load_inline(name, sub_type, data)
+
+    if SUBROUTINE_CACHE_SIZE:
+        _subroutine_cache[key] = script
+        if len(_subroutine_cache) > SUBROUTINE_CACHE_SIZE:
+            _subroutine_cache.popitem(last=False)
+    return script
+
+
 class LifecycleProvider(Protocol):
     """Protocol for dispatching lifecycle events to entity subroutines.
 
@@ -67,6 +154,10 @@ class LifecycleProvider(Protocol):
         """Called each frame for alive entities."""
         ...
 
+    # Optional: on_entities_update(entities, lua_engine, dt) receives every
+    # registered entity once per frame instead (dead ones included; skip
+    # them), so a provider can batch the per-entity dispatch.
+
     def on_entity_destroyed(self, entity: Entity, lua_engine: 'LuaEngine') -> None:
         """Called when an entity is destroyed and about to be removed."""
         ...
@@ -117,7 +208,12 @@ def _lua_attribute_filter(obj, attr_name, is_setting):
 
 
 class ScheduledCallback:
-    """A callback scheduled to run after a delay."""
+    """A callback scheduled to run after a delay.
+
+    Pending callbacks live in a CallbackScheduler keyed on absolute due
+    time; this is the relative form used by get_scheduled() and
+    restore_scheduled() (e.g. for rollback snapshots).
+    """
     def __init__(self, time_remaining: float, callback_name: str, entity_id: str):
         self.time_remaining = time_remaining
         self.callback_name = callback_name
@@ -160,6 +256,7 @@ class LuaEngine:
         screen_width: float = 800,
         screen_height: float = 600,
         api_class: Optional[type] = None,
+        expression_cache_size: int = EXPRESSION_CACHE_SIZE,
     ):
         self._content_fs = content_fs
         self.screen_width = screen_width
@@ -175,12 +272,19 @@ class LuaEngine:
         # e.g., 'behavior', 'collision_action', 'generator', 'input_action'
         self._subroutines: defaultdict[str, dict[str, Any]] = defaultdict(dict)
 
+        # Bound subroutine functions: (type, name, method) -> Lua function or
+        # None. Cleared whenever a subroutine is loaded.
+        self._method_cache: dict[tuple[str, str, str], Any] = {}
+
+        # Entities destroyed while call_batched() runs (Lua table, id -> true)
+        self._batch_dead: Any = None
+
         # Pending entity spawns/destroys (processed end of frame)
         self._pending_spawns: list[Entity] = []
         self._pending_destroys: list[str] = []
 
         # Scheduled callbacks
-        self._scheduled: list[ScheduledCallback] = []
+        self._scheduler = CallbackScheduler()
 
         # Sound queue (processed by game layer)
         self._sound_queue: list[str] = []
@@ -194,6 +298,12 @@ class LuaEngine:
         # GameEngine implements this to handle behavior-specific dispatch
         self._lifecycle_provider: Optional[LifecycleProvider] = None
 
+        # Compiled expressions (source -> Lua function), least recently used first
+        self._expression_cache: OrderedDict[str, Any] = OrderedDict()
+        self._expression_cache_size = max(0, int(expression_cache_size))
+        self._expression_hits = 0
+        self._expression_misses = 0
+
         # Initialize Lua with sandbox protections:
         # - register_eval=False: don't expose python.eval()
         # - register_builtins=False: don't expose python.builtins.*
@@ -386,6 +496,8 @@ class LuaEngine:
         # Validate sandbox is properly locked down
         self._validate_sandbox()
 
+        self._batch_dispatcher = self._lua.execute(_BATCH_DISPATCHER)
+
     # =========================================================================
     # Generic Subroutine Loading
     # =========================================================================
@@ -412,6 +524,7 @@ class LuaEngine:
                 return False
 
             self._subroutines[sub_type][name] = result
+            self._method_cache.clear()
             return True
 
         except Exception as e:
@@ -468,18 +581,12 @@ class LuaEngine:
             return False
 
         try:
-            # Read YAML content
+            # Read YAML content; parsing is shared across engines by content hash
             yaml_content = self._content_fs.readtext(content_path)
+            script = _parse_yaml_subroutine(sub_type, name, yaml_content)
 
-            # Parse YAML using ams.yaml (handles both YAML and JSON formats)
-            from ams.yaml import loads as yaml_loads
-            data = yaml_loads(yaml_content, format='yaml')
-
-            # Create ScriptMetadata via ScriptLoader
-            loader = ScriptLoader(validate=False)  # Schema validation optional
-            script = loader.load_inline(name, sub_type, data)
-
-            # Execute the Lua code
+            # Execute the Lua code (compiled per runtime: chunks can't be
+            # shared between LuaRuntimes)
             result = self._lua.execute(script.code)
 
             if result is None:
@@ -491,6 +598,7 @@ class LuaEngine:
                 return False
 
             self._subroutines[sub_type][name] = result
+            self._method_cache.clear()
             log.debug(f"Subroutine loaded: [{sub_type}][{name}] from {content_path}")
 
             return True
@@ -507,6 +615,57 @@ class LuaEngine:
         """Check if a subroutine is loaded."""
         return name in self._subroutines[sub_type]
 
+    def get_subroutine_method(self, sub_type: str, name: str, method: str) -> Optional[Any]:
+        """Get a function from a loaded subroutine table (e.g. behavior.on_update).
+
+        Lookups are cached, so hot dispatch paths don't index the Lua table
+        on every call. Returns None if the subroutine or function is missing.
+        """
+        key = (sub_type, name, method)
+        try:
+            return self._method_cache[key]
+        except KeyError:
+            pass
+        subroutine = self._subroutines[sub_type].get(name)
+        fn = getattr(subroutine, method, None) if subroutine is not None else None
+        self._method_cache[key] = fn
+        return fn
+
+    def call_batched(self, batches: list[tuple[Any, list[str]]],
+                     *args) -> list[tuple[int, str, str]]:
+        """Call Lua functions for many entities in one Python -> Lua call.
+
+        Each batch is (function, entity_ids); the function is called as
+        fn(entity_id, *args) for every id, in order, from a loop on the Lua
+        side. Entities reported through notify_destroyed() during the call
+        are skipped for the rest of it.
+
+        Args:
+            batches: (Lua function, entity ids) pairs
+            *args: Extra arguments passed to every call
+
+        Returns:
+            Errors as (batch index, entity id, message), in call order
+        """
+        if not batches:
+            return []
+        lua = self._lua
+        fns = lua.table_from([fn for fn, _ in batches])
+        groups = lua.table_from([ids for _, ids in batches], recursive=True)
+        self._batch_dead = lua.table()
+        try:
+            errors = self._batch_dispatcher(fns, groups, len(batches), self._batch_dead, *args)
+        finally:
+            self._batch_dead = None
+        if errors is None:
+            return []
+        return [(int(e[1]) - 1, e[2], e[3]) for e in errors.values()]
+
+    def notify_destroyed(self, entity_id: str) -> None:
+        """Record that an entity died, so a running call_batched() skips it."""
+        if self._batch_dead is not None:
+            self._batch_dead[entity_id] = True
+
     # =========================================================================
     # Subroutine Execution (collision actions, input actions, generators)
     # =========================================================================
@@ -761,6 +920,11 @@ class LuaEngine:
 
         The ams.* API is available in both modes.
 
+        Each distinct expression is compiled once into a Lua function and
+        kept in an LRU cache (expression_cache_size entries), so expressions
+        evaluated every frame or every spawn only pay for the call. Globals
+        such as those set by set_global() are read when the function runs.
+
         Args:
             expression: Lua expression or block string
 
@@ -768,33 +932,56 @@ class LuaEngine:
             Evaluated result (any type - number, boolean, table, etc.)
         """
         try:
-            # Check if multiline (contains newlines or 'return')
-            is_multiline = '\n' in expression or expression.strip().startswith('return') \
-                          or 'local ' in expression
-
-            if is_multiline:
-                # Wrap in function and execute to get return value
-                # Strip leading/trailing whitespace but preserve internal structure
-                code = expression.strip()
-
-                # Ensure there's a return statement if not present
-                if not code.startswith('return') and 'return ' not in code:
-                    # Wrap entire block as return value
-                    code = f"return {code}"
-
-                # Create anonymous function and call it immediately
-                wrapped = f"return (function()\n{code}\nend)()"
-                result = self._lua.execute(wrapped)
-                return result
+            func = self._expression_cache.get(expression)
+            if func is not None:
+                self._expression_hits += 1
+                self._expression_cache.move_to_end(expression)
             else:
-                # Simple expression - use eval
-                result = self._lua.eval(expression)
-                return result
+                self._expression_misses += 1
+                func = self._compile_expression(expression)
+                if self._expression_cache_size:
+                    self._expression_cache[expression] = func
+                    if len(self._expression_cache) > self._expression_cache_size:
+                        self._expression_cache.popitem(last=False)
+            return func()
 
         except Exception as e:
             log.error(f"Lua error in expression: {e}, expression: {expression[:100]}...")
             return None
 
+    def _compile_expression(self, expression: str) -> Any:
+        """Compile an expression or block into a Lua function."""
+        # Check if multiline (contains newlines or 'return')
+        is_multiline = '\n' in expression or expression.strip().startswith('return') \
+                      or 'local ' in expression
+
+        if is_multiline:
+            # Strip leading/trailing whitespace but preserve internal structure
+            code = expression.strip()
+
+            # Ensure there's a return statement if not present
+            if not code.startswith('return') and 'return ' not in code:
+                # Wrap entire block as return value
+                code = f"return {code}"
+        else:
+            # Simple expression - same as eval
+            code = f"return {expression}"
+
+        return self._lua.compile(code)
+
+    def get_expression_cache_stats(self) -> dict[str, int]:
+        """Get evaluate_expression cache statistics.
+
+        Returns:
+            Dict with size, capacity, hits and misses
+        """
+        return {
+            'size': len(self._expression_cache),
+            'capacity': self._expression_cache_size,
+            'hits': self._expression_hits,
+            'misses': self._expression_misses,
+        }
+
     def set_global(self, name: str, value: Any) -> None:
         """Set a global variable in the Lua environment.
 
@@ -812,22 +999,24 @@ class LuaEngine:
         """
         self.elapsed_time += dt
 
-        # Update scheduled callbacks
-        for scheduled in self._scheduled[:]:
-            scheduled.time_remaining -= dt
-            if scheduled.time_remaining <= 0:
-                self._call_scheduled_callback(scheduled)
-                self._scheduled.remove(scheduled)
+        # Fire scheduled callbacks that are due
+        for callback_name, entity_id in self._scheduler.pop_due(self.elapsed_time):
+            self._call_scheduled_callback(callback_name, entity_id)
 
         # Call on_update for each entity's behaviors
         if self._lifecycle_provider:
-            for entity in list(self.entities.values()):
-                if entity.alive:
-                    self._lifecycle_provider.on_entity_update(entity, self, dt)
+            update_all = getattr(self._lifecycle_provider, 'on_entities_update', None)
+            if update_all is not None:
+                update_all(list(self.entities.values()), self, dt)
+            else:
+                for entity in list(self.entities.values()):
+                    if entity.alive:
+                        self._lifecycle_provider.on_entity_update(entity, self, dt)
 
         # Remove dead entities
         dead_ids = [eid for eid, e in self.entities.items() if not e.alive]
         for eid in dead_ids:
+            self._scheduler.cancel_entity(eid)
             entity = self.entities.get(eid)
             if entity:
                 # Notify GameEngine BEFORE removing (for orphan handling)
@@ -874,18 +1063,30 @@ class LuaEngine:
         if self._lifecycle_provider:
             self._lifecycle_provider.dispatch_lifecycle(method_name, entity, self, *args)
 
-    def _call_scheduled_callback(self, scheduled: ScheduledCallback) -> None:
+    def _call_scheduled_callback(self, callback_name: str, entity_id: str) -> None:
         """Execute a scheduled callback via the lifecycle provider."""
-        entity = self.entities.get(scheduled.entity_id)
+        entity = self.entities.get(entity_id)
         if entity is None or not entity.alive:
             return
 
         if self._lifecycle_provider:
-            self._lifecycle_provider.dispatch_scheduled(scheduled.callback_name, entity, self)
+            self._lifecycle_provider.dispatch_scheduled(callback_name, entity, self)
 
     def schedule_callback(self, delay: float, callback_name: str, entity_id: str) -> None:
         """Schedule a callback to run after delay seconds."""
-        self._scheduled.append(ScheduledCallback(delay, callback_name, entity_id))
+        self._scheduler.schedule(self.elapsed_time + delay, callback_name, entity_id)
+
+    def get_scheduled(self) -> list[ScheduledCallback]:
+        """Get pending callbacks, in firing order, with time left until each."""
+        now = self.elapsed_time
+        return [ScheduledCallback(due - now, callback_name, entity_id)
+                for due, callback_name, entity_id in self._scheduler.pending()]
+
+    def restore_scheduled(self, callbacks: list[ScheduledCallback]) -> None:
+        """Replace pending callbacks, timed relative to the current elapsed_time."""
+        now = self.elapsed_time
+        self._scheduler.restore((now + cb.time_remaining, cb.callback_name, cb.entity_id)
+                                for cb in callbacks)
 
     def queue_sound(self, sound_name: str) -> None:
         """Queue a sound to be played by the game layer."""
@@ -905,7 +1106,7 @@ class LuaEngine:
                 self._lifecycle_provider.on_entity_destroyed(entity, self)
 
         self.entities.clear()
-        self._scheduled.clear()
+        self._scheduler.clear()
         self._sound_queue.clear()
         self.score = 0
         self.elapsed_time = 0.0
@@ -0,0 +1,117 @@
+"""
+Min-heap scheduler for ams.schedule() callbacks.
+
+Callbacks are keyed on their absolute due time (the engine's elapsed_time
+when they should fire), so a frame only looks at the callbacks that are
+due instead of decrementing every pending one:
+
+- schedule():      O(log n)
+- pop_due():       O(k log n) for k due callbacks
+- cancel_entity(): O(k) for k callbacks of that entity; cancelled entries
+                   stay in the heap until they reach the top, or until
+                   they make up half of it and the heap is compacted
+
+Used by LuaEngine and the browser LuaEngineBrowser.
+
+Usage:
+    scheduler = CallbackScheduler()
+    scheduler.schedule(engine.elapsed_time + 2.0, 'respawn', entity_id)
+    for callback_name, entity_id in scheduler.pop_due(engine.elapsed_time):
+        ...
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+# Heap entry fields; entries are lists so cancellation can clear the name
+_DUE, _SEQ, _NAME, _ENTITY = range(4)
+
+
+class CallbackScheduler:
+    """Pending (callback_name, entity_id) pairs ordered by due time.
+
+    Callbacks with the same due time fire in the order they were scheduled.
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._by_entity: Dict[str, List[list]] = {}
+        self._seq = 0
+        self._cancelled = 0
+
+    def __len__(self) -> int:
+        """Number of pending (not cancelled) callbacks."""
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, due: float, callback_name: str, entity_id: str) -> None:
+        """Add a callback that fires once the clock reaches `due`."""
+        entry = [due, self._seq, callback_name, entity_id]
+        self._seq += 1
+        heapq.heappush(self._heap, entry)
+        entries = self._by_entity.get(entity_id)
+        if entries is None:
+            self._by_entity[entity_id] = [entry]
+        else:
+            entries.append(entry)
+
+    def pop_due(self, now: float) -> List[Tuple[str, str]]:
+        """Remove and return the callbacks due at `now`, in firing order.
+
+        Callbacks scheduled while the returned ones run are not included,
+        even with a zero delay; they fire on the next call.
+        """
+        heap = self._heap
+        due = []
+        while heap and heap[0][_DUE] <= now:
+            entry = heapq.heappop(heap)
+            if entry[_NAME] is None:
+                self._cancelled -= 1
+                continue
+            self._forget(entry)
+            due.append((entry[_NAME], entry[_ENTITY]))
+        return due
+
+    def cancel_entity(self, entity_id: str) -> int:
+        """Cancel every pending callback of an entity (e.g. when it dies).
+
+        Returns:
+            Number of callbacks cancelled
+        """
+        entries = self._by_entity.pop(entity_id, None)
+        if not entries:
+            return 0
+        for entry in entries:
+            entry[_NAME] = None
+        self._cancelled += len(entries)
+        if self._cancelled > len(self._heap) // 2:
+            self._compact()
+        return len(entries)
+
+    def pending(self) -> List[Tuple[float, str, str]]:
+        """Pending callbacks as (due, callback_name, entity_id), in firing order."""
+        return [(entry[_DUE], entry[_NAME], entry[_ENTITY])
+                for entry in sorted(self._heap) if entry[_NAME] is not None]
+
+    def restore(self, callbacks: Iterable[Tuple[float, str, str]]) -> None:
+        """Replace the pending callbacks with (due, callback_name, entity_id) items."""
+        self.clear()
+        for due, callback_name, entity_id in callbacks:
+            self.schedule(due, callback_name, entity_id)
+
+    def clear(self) -> None:
+        """Drop all pending callbacks."""
+        self._heap.clear()
+        self._by_entity.clear()
+        self._cancelled = 0
+
+    def _forget(self, entry: list) -> None:
+        entries = self._by_entity.get(entry[_ENTITY])
+        if entries is not None:
+            entries.remove(entry)
+            if not entries:
+                del self._by_entity[entry[_ENTITY]]
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if entry[_NAME] is not None]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
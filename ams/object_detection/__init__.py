@@ -7,6 +7,8 @@ Provides flexible object detection with pluggable detector implementations.
 from .base import ObjectDetector, DetectedObject, ImpactEvent
 from .color_blob import ColorBlobDetector
 from .config import ColorBlobConfig, DetectorType, ImpactMode, ImpactDetectionConfig
+from .point_grid import PointGrid
+from .tracker import MultiObjectTracker, solve_assignment
 
 __all__ = [
     "ObjectDetector",
@@ -17,4 +19,7 @@ __all__ = [
     "DetectorType",
     "ImpactMode",
     "ImpactDetectionConfig",
+    "MultiObjectTracker",
+    "solve_assignment",
+    "PointGrid",
 ]
@@ -21,6 +21,8 @@ class DetectedObject:
         confidence: Detection confidence (0.0-1.0)
         timestamp: Time of detection
         contour: Optional contour points for shape analysis (STUCK mode impact point)
+        track_id: Identity assigned by the detector's tracker (None if the
+            detector does not track)
     """
     position: Point2D
     velocity: Point2D  # Using Point2D as 2D vector
@@ -29,6 +31,7 @@ class DetectedObject:
     confidence: float
     timestamp: float
     contour: Optional[np.ndarray] = None  # For impact point estimation in STUCK mode
+    track_id: Optional[int] = None
 
 
 @dataclass
@@ -93,3 +96,27 @@ class ObjectDetector(ABC):
             **kwargs: Configuration parameters specific to detector type
         """
         pass
+
+    def set_roi(self, roi) -> bool:
+        """Restrict detection to a region of interest.
+
+        Args:
+            roi: ScreenROI to crop and mask frames to, or None for the full frame
+
+        Returns:
+            True if the detector supports ROI mode (detections are then
+            guaranteed to lie inside the screen polygon)
+        """
+        return False
+
+    def set_exclusion_mask(self, mask: Optional[np.ndarray]) -> bool:
+        """Ignore foreground pixels in parts of the frame.
+
+        Args:
+            mask: Full-frame uint8 image, 0 where pixels are ignored and 255
+                elsewhere, or None to use every pixel
+
+        Returns:
+            True if the detector applies the mask before finding objects
+        """
+        return False
@@ -4,12 +4,13 @@ Color blob detector for nerf darts and other colored objects.
 
 import cv2
 import numpy as np
-from typing import List, Optional, Dict
-import time
+from typing import List, Optional
 import math
 
 from .base import ObjectDetector, DetectedObject
 from .config import ColorBlobConfig
+from .tracker import MultiObjectTracker
+from ams.stage_timer import StageTimer
 from models import Point2D
 
 
@@ -17,7 +18,8 @@ class ColorBlobDetector(ObjectDetector):
     """Detects colored objects using HSV color filtering.
 
     Optimized for nerf darts but configurable for any colored object.
-    Tracks object velocity for impact detection.
+    Tracks blobs across frames (MultiObjectTracker) for identity and
+    velocity, used by impact detection.
     """
 
     def __init__(self, config: Optional[ColorBlobConfig] = None):
@@ -29,11 +31,14 @@ class ColorBlobDetector(ObjectDetector):
         self.config = config or ColorBlobConfig()
         self.debug_mode = False
         self.debug_frame: Optional[np.ndarray] = None
+        self.roi = None  # ScreenROI (crop + polygon mask), see set_roi()
+        self.exclusion_mask: Optional[np.ndarray] = None  # See set_exclusion_mask()
 
-        # Track previous detections for velocity calculation
-        self.prev_detections: Dict[int, DetectedObject] = {}
-        self.prev_timestamp: Optional[float] = None
-        self.next_object_id = 0
+        # Identity and velocity across frames
+        self.tracker = MultiObjectTracker(gate=self.config.track_gate)
+
+        # Per-stage latency (ObjectDetectionBackend shares its timer)
+        self.stage_timer = StageTimer()
 
     def detect(self, frame: np.ndarray, timestamp: float) -> List[DetectedObject]:
         """Detect colored blobs in frame.
@@ -45,13 +50,30 @@ class ColorBlobDetector(ObjectDetector):
         Returns:
             List of detected objects with positions and velocities
         """
+        timer = self.stage_timer
+
+        # ROI mode: only process the screen area
+        roi = self.roi
+        offset = (0, 0)
+        source = frame
+        if roi is not None:
+            source = roi.crop(frame)
+            offset = roi.offset
+
         # Convert to HSV for better color detection
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(source, cv2.COLOR_BGR2HSV)
+        timer.mark('convert')
 
         # Create mask for target color
         lower_bound = np.array(self.config.get_hsv_lower())
         upper_bound = np.array(self.config.get_hsv_upper())
         mask = cv2.inRange(hsv, lower_bound, upper_bound)
+        if roi is not None:
+            mask = roi.apply_mask(mask)
+        if self.exclusion_mask is not None:
+            exclusion = self.exclusion_mask if roi is None else roi.crop(self.exclusion_mask)
+            if exclusion.shape == mask.shape:
+                mask = cv2.bitwise_and(mask, exclusion, dst=mask)
 
         # Morphological operations to remove noise
         if self.config.erode_iterations > 0:
@@ -61,92 +83,49 @@ class ColorBlobDetector(ObjectDetector):
         if self.config.dilate_iterations > 0:
             kernel = np.ones((3, 3), np.uint8)
             mask = cv2.dilate(mask, kernel, iterations=self.config.dilate_iterations)
+        timer.mark('threshold')
 
-        # Find contours
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-        # Filter contours by area and extract objects
-        detected_objects = []
+        # Find contours (in full-frame coordinates)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE,
+                                       offset=offset)
 
+        # Filter contours by area
+        blobs = []
         for contour in contours:
             area = cv2.contourArea(contour)
+            if self.config.min_area <= area <= self.config.max_area:
+                blobs.append((contour, area, cv2.boundingRect(contour)))
+        timer.mark('contours')
 
-            # Filter by area
-            if area < self.config.min_area or area > self.config.max_area:
-                continue
-
-            # Get bounding box and center
-            x, y, w, h = cv2.boundingRect(contour)
-            center_x = x + w / 2
-            center_y = y + h / 2
-
-            # Calculate velocity if we have previous detection
-            velocity_x = 0.0
-            velocity_y = 0.0
-
-            if self.prev_timestamp is not None and timestamp > self.prev_timestamp:
-                dt = timestamp - self.prev_timestamp
-
-                # Find closest previous detection (simple nearest neighbor)
-                closest_prev = self._find_closest_previous(center_x, center_y)
+        # Match blobs to tracks (bounding box centers) for identity and velocity
+        centers = np.array([(x + w / 2, y + h / 2) for _, _, (x, y, w, h) in blobs]).reshape(-1, 2)
+        self.tracker.gate = self.config.track_gate
+        track_ids, velocities = self.tracker.update(centers, timestamp)
+        timer.mark('track')
 
-                if closest_prev is not None:
-                    velocity_x = (center_x - closest_prev.position.x) / dt
-                    velocity_y = (center_y - closest_prev.position.y) / dt
-
-            # Create detected object
-            obj = DetectedObject(
+        detected_objects = []
+        for (contour, area, box), (center_x, center_y), track_id, (velocity_x, velocity_y) in zip(
+            blobs, centers.tolist(), track_ids.tolist(), velocities.tolist()
+        ):
+            detected_objects.append(DetectedObject(
                 position=Point2D(x=center_x, y=center_y),
                 velocity=Point2D(x=velocity_x, y=velocity_y),
                 area=area,
-                bounding_box=(x, y, w, h),
+                bounding_box=box,
                 confidence=1.0,  # Simple blob detection has binary confidence
                 timestamp=timestamp,
                 contour=contour,  # For STUCK mode impact point estimation
-            )
-
-            detected_objects.append(obj)
-
-        # Update tracking
-        self.prev_detections = {i: obj for i, obj in enumerate(detected_objects)}
-        self.prev_timestamp = timestamp
+                track_id=track_id,
+            ))
 
         # Create debug frame if enabled
         if self.debug_mode:
+            if roi is not None:
+                mask = roi.expand(mask)
             self._create_debug_frame(frame, mask, detected_objects)
 
         return detected_objects
 
-    def _find_closest_previous(self, x: float, y: float) -> Optional[DetectedObject]:
-        """Find closest previous detection to given position.
-
-        Args:
-            x, y: Position to search from
-
-        Returns:
-            Closest previous detection or None
-        """
-        if not self.prev_detections:
-            return None
-
-        closest = None
-        min_dist = float('inf')
-
-        for obj in self.prev_detections.values():
-            dx = x - obj.position.x
-            dy = y - obj.position.y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            if dist < min_dist:
-                min_dist = dist
-                closest = obj
-
-        # Only return if close enough (within 200 pixels)
-        if min_dist < 200:
-            return closest
-
-        return None
-
     def _create_debug_frame(
         self,
         original: np.ndarray,
@@ -220,6 +199,30 @@ class ColorBlobDetector(ObjectDetector):
         if not enabled:
             self.debug_frame = None
 
+    def set_roi(self, roi) -> bool:
+        """Crop and mask frames to a ScreenROI before detection.
+
+        Args:
+            roi: ScreenROI, or None to process the full frame
+
+        Returns:
+            True (ROI mode is supported)
+        """
+        self.roi = roi
+        return True
+
+    def set_exclusion_mask(self, mask: Optional[np.ndarray]) -> bool:
+        """Clear masked-out pixels from the color mask before finding contours.
+
+        Args:
+            mask: Full-frame uint8 image (0 = ignore), or None
+
+        Returns:
+            True (exclusion masks are supported)
+        """
+        self.exclusion_mask = mask
+        return True
+
     def configure(self, **kwargs) -> None:
         """Update detector configuration dynamically.
 
@@ -44,6 +44,13 @@ class ColorBlobConfig(BaseModel):
     min_area: int = Field(default=50, ge=1, description="Minimum blob area in pixels")
     max_area: int = Field(default=5000, ge=1, description="Maximum blob area in pixels")
 
+    # Tracking
+    track_gate: float = Field(
+        default=100.0,
+        gt=0.0,
+        description="Max distance (px) from a track's predicted position to match a blob"
+    )
+
     # Impact detection
     impact_velocity_threshold: float = Field(
         default=10.0,
@@ -0,0 +1,96 @@
+"""
+Grid-bucketed index of points for radius queries.
+
+STUCK mode keeps every registered projectile for the whole round, and each
+impact candidate (and each frame's removal check) has to find handled
+objects near a position. PointGrid buckets points into square cells the
+size of the query radius, so a query only looks at the 3x3 block of cells
+around the position instead of scanning every entry.
+
+Usage:
+    grid = PointGrid(cell_size=30.0)
+    grid.add(x, y, handled)
+    if grid.any_within(px, py, 30.0):
+        ...
+"""
+
+from math import floor
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+class PointGrid:
+    """Uniform grid of (x, y, value) entries keyed by integer cell coordinates.
+
+    Args:
+        cell_size: Width/height of a grid cell in pixels. Queries are
+            cheapest when this equals the usual query radius.
+    """
+
+    def __init__(self, cell_size: float = 30.0):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = float(cell_size)
+        self._inv_cell = 1.0 / self.cell_size
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, Any]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        for bucket in self._cells.values():
+            for _, _, value in bucket:
+                yield value
+
+    @property
+    def cell_count(self) -> int:
+        """Number of occupied cells."""
+        return len(self._cells)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._cells.clear()
+        self._count = 0
+
+    def add(self, x: float, y: float, value: Any) -> None:
+        """Insert a value at a position."""
+        key = (floor(x * self._inv_cell), floor(y * self._inv_cell))
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = [(x, y, value)]
+        else:
+            bucket.append((x, y, value))
+        self._count += 1
+
+    def rebuild(self, entries: Iterable[Tuple[float, float, Any]]) -> None:
+        """Replace the contents with (x, y, value) entries."""
+        self.clear()
+        for x, y, value in entries:
+            self.add(x, y, value)
+
+    def _candidates(self, x: float, y: float, radius: float) -> Iterator[Tuple[float, float, Any]]:
+        inv = self._inv_cell
+        x0, x1 = floor((x - radius) * inv), floor((x + radius) * inv)
+        y0, y1 = floor((y - radius) * inv), floor((y + radius) * inv)
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def within(self, x: float, y: float, radius: float) -> List[Any]:
+        """Values strictly closer than radius to (x, y)."""
+        limit = radius * radius
+        return [
+            value for px, py, value in self._candidates(x, y, radius)
+            if (px - x) * (px - x) + (py - y) * (py - y) < limit
+        ]
+
+    def any_within(self, x: float, y: float, radius: float) -> bool:
+        """Whether any entry is strictly closer than radius to (x, y)."""
+        limit = radius * radius
+        for px, py, _ in self._candidates(x, y, radius):
+            if (px - x) * (px - x) + (py - y) * (py - y) < limit:
+                return True
+        return False
@@ -9,13 +9,14 @@ import cv2
 from ams.logging import get_logger
 import math
 import numpy as np
-import time
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass
 
 from ams.detection_backend import DetectionBackend
-from ams.camera import CameraInterface
+from ams.camera import CameraInterface, grab_frames
+from ams.detection_roi import ScreenROI
 from ams.events import PlaneHitEvent, CalibrationResult
+from ams.stage_timer import StageTimer
 from calibration.calibration_manager import CalibrationManager
 from models import Point2D
 
@@ -27,6 +28,8 @@ from .object_detection import (
     ColorBlobDetector,
     ColorBlobConfig,
     ImpactMode,
+    MultiObjectTracker,
+    PointGrid,
 )
 
 
@@ -49,11 +52,13 @@ class HandledObject:
     """A stuck projectile that has been registered (STUCK mode).
 
     Once a projectile sticks and registers an impact, it's added here
-    to prevent duplicate detections. Cleared on round reset.
+    to prevent duplicate detections. Cleared on round reset (or after
+    handled_expiry seconds).
     """
     position: Point2D           # Impact point in camera coords
     registered_at: float        # Timestamp when registered
     object_id: int              # Tracking ID for reference
+    footprint: Optional[np.ndarray] = None  # Blob contour (occupancy mask)
 
 
 class ObjectDetectionBackend(DetectionBackend):
@@ -76,6 +81,9 @@ class ObjectDetectionBackend(DetectionBackend):
         velocity_change_threshold: float = 100.0,
         direction_change_threshold: float = 90.0,
         min_impact_velocity: float = 50.0,
+        roi: bool = False,
+        handled_expiry: Optional[float] = None,
+        mask_handled: bool = False,
     ):
         """Initialize object detection backend.
 
@@ -91,6 +99,14 @@ class ObjectDetectionBackend(DetectionBackend):
             velocity_change_threshold: Velocity change magnitude (px/s) for trajectory_change mode
             direction_change_threshold: Direction change (degrees) for trajectory_change mode
             min_impact_velocity: Minimum speed before impact (px/s) for trajectory_change mode
+            roi: Restrict detection to the calibrated screen polygon (crop and
+                mask frames before detection) instead of filtering afterwards
+            handled_expiry: Seconds after which a handled stuck object is
+                forgotten (STUCK mode), or None to keep it until
+                reset_handled_objects()
+            mask_handled: Mask handled stuck objects out of the frame before
+                detection (STUCK mode), so they are no longer detected or
+                tracked. Removal of masked objects is not reported.
         """
         self.camera = camera
         self.detector = detector or ColorBlobDetector()
@@ -112,14 +128,20 @@ class ObjectDetectionBackend(DetectionBackend):
 
         # Tracking state
         self.tracked_objects: Dict[int, TrackedObject] = {}
-        self.next_object_id = 0
         self.max_tracking_gap = 0.5  # seconds
+        # Used when the detector doesn't track (DetectedObject.track_id is None)
+        self.tracker = MultiObjectTracker(gate=100.0, max_gap=self.max_tracking_gap)
 
         # STUCK mode state
         self._handled_objects: List[HandledObject] = []
         self._stuck_stationary_threshold: float = 5.0  # px/s
         self._stuck_confirm_frames: int = 3
         self._handled_radius: float = 30.0  # px
+        self._handled_index = PointGrid(cell_size=self._handled_radius)
+        self.handled_expiry = handled_expiry
+        self.mask_handled = mask_handled
+        self._occupancy_mask: Optional[np.ndarray] = None  # 0 over handled objects
+        self._frame_shape: Optional[Tuple[int, ...]] = None
         self._camera_center_x: Optional[float] = None  # Set after calibration
 
         # Initialize camera geometry if calibration already loaded
@@ -128,6 +150,16 @@ class ObjectDetectionBackend(DetectionBackend):
             if geometry:
                 self._camera_center_x = geometry['camera_center_x']
 
+        # ROI mode (screen polygon applied inside the detector)
+        self.use_roi = roi
+        self.roi: Optional[ScreenROI] = None
+        self._update_roi()
+
+        # Per-stage latency (enabled by benchmarks), shared with the detector
+        self.stage_timer = StageTimer()
+        if hasattr(self.detector, 'stage_timer'):
+            self.detector.stage_timer = self.stage_timer
+
         # Debug visualization
         self.debug_mode = False
         self.debug_frame: Optional[np.ndarray] = None
@@ -155,15 +187,25 @@ class ObjectDetectionBackend(DetectionBackend):
     def poll(self) -> List[PlaneHitEvent]:
         """Poll for object impacts and return hit events.
 
+        With a ThreadedCamera every frame captured since the last poll is
+        processed in order (so tracking sees each frame), without waiting
+        for a new one. Timestamps are monotonic frame capture times.
+
         Returns:
             List of hit events from detected impacts
         """
-        # Capture camera frame
-        frame = self.camera.capture_frame()
-        if frame is None:
-            return []
+        events = []
+        for captured in grab_frames(self.camera):
+            events.extend(self._process_frame(captured.image, captured.timestamp))
+        return events
 
-        timestamp = time.time()
+    def _process_frame(self, frame: np.ndarray, timestamp: float) -> List[PlaneHitEvent]:
+        """Detect, track and convert impacts for one camera frame."""
+        if self.impact_mode == ImpactMode.STUCK:
+            self._frame_shape = frame.shape[:2]
+            self._expire_handled(timestamp)
+        timer = self.stage_timer
+        timer.start()
 
         # Detect objects in frame
         detections = self.detector.detect(frame, timestamp)
@@ -171,9 +213,12 @@ class ObjectDetectionBackend(DetectionBackend):
         # Update tracking and detect impacts
         impacts = self._update_tracking(detections, timestamp)
 
-        # STUCK mode: check for removed objects (logging only)
-        if self.impact_mode == ImpactMode.STUCK and self._handled_objects:
+        # STUCK mode: check for removed objects (logging only). Masked
+        # objects are never detected, so there is nothing to check.
+        if (self.impact_mode == ImpactMode.STUCK and self._handled_objects
+                and self._occupancy_mask is None):
             self._check_removed_objects(detections, timestamp)
+        timer.mark('impacts')
 
         # Convert impacts to hit events
         events = []
@@ -198,6 +243,7 @@ class ObjectDetectionBackend(DetectionBackend):
                         timestamp=impact.timestamp
                     )
                     events.append(event)
+        timer.mark('transform')
 
         # Create debug visualization if enabled
         if self.debug_mode:
@@ -221,163 +267,168 @@ class ObjectDetectionBackend(DetectionBackend):
         """
         impacts = []
 
-        # Match detections to tracked objects
-        matched_detections = set()
+        # Identify detections across frames (tracker ids and velocities)
+        track_ids = self._assign_tracks(detections, timestamp)
         current_tracks: Dict[int, TrackedObject] = {}
 
-        for track_id, tracked in self.tracked_objects.items():
-            # Find closest matching detection
-            closest_det = None
-            min_dist = float('inf')
-
-            for i, det in enumerate(detections):
-                if i in matched_detections:
-                    continue
-
-                dx = det.position.x - tracked.last_detection.position.x
-                dy = det.position.y - tracked.last_detection.position.y
-                dist = math.sqrt(dx * dx + dy * dy)
-
-                if dist < min_dist and dist < 100:  # 100px max matching distance
-                    min_dist = dist
-                    closest_det = (i, det)
-
-            if closest_det is not None:
-                det_idx, det = closest_det
-                matched_detections.add(det_idx)
-
-                # Calculate current speed
-                speed = math.sqrt(det.velocity.x ** 2 + det.velocity.y ** 2)
-
-                # Get previous velocity for trajectory change detection
-                prev_velocity = tracked.last_detection.velocity
-                prev_speed = math.sqrt(prev_velocity.x ** 2 + prev_velocity.y ** 2)
-
-                # Impact detection based on mode
-                impact_detected = False
-
-                if self.impact_mode == ImpactMode.TRAJECTORY_CHANGE:
-                    # Trajectory change mode - detect bounces
-                    # Calculate velocity change magnitude
-                    velocity_change_mag = math.sqrt(
-                        (det.velocity.x - prev_velocity.x) ** 2 +
-                        (det.velocity.y - prev_velocity.y) ** 2
-                    )
+        for det, track_id in zip(detections, track_ids):
+            tracked = self.tracked_objects.get(track_id)
+            if tracked is None:
+                # New object (or one whose impact ended its previous track)
+                current_tracks[track_id] = TrackedObject(
+                    object_id=track_id,
+                    last_detection=det,
+                    velocity_history=[(timestamp, det.velocity)]
+                )
+                continue
+
+            # Calculate current speed
+            speed = math.sqrt(det.velocity.x ** 2 + det.velocity.y ** 2)
+
+            # Get previous velocity for trajectory change detection
+            prev_velocity = tracked.last_detection.velocity
+            prev_speed = math.sqrt(prev_velocity.x ** 2 + prev_velocity.y ** 2)
 
-                    # Calculate direction change
-                    direction_change = self._calculate_direction_change(prev_velocity, det.velocity)
-
-                    # Check if this looks like an impact (bounce)
-                    # Requirements:
-                    # 1. Object was moving fast enough before impact
-                    # 2. Significant velocity change OR direction change
-                    if prev_speed >= self.min_impact_velocity:
-                        if (velocity_change_mag >= self.velocity_change_threshold or
-                            direction_change >= self.direction_change_threshold):
-                            # Detected bounce/impact!
+            # Impact detection based on mode
+            impact_detected = False
+
+            if self.impact_mode == ImpactMode.TRAJECTORY_CHANGE:
+                # Trajectory change mode - detect bounces
+                # Calculate velocity change magnitude
+                velocity_change_mag = math.sqrt(
+                    (det.velocity.x - prev_velocity.x) ** 2 +
+                    (det.velocity.y - prev_velocity.y) ** 2
+                )
+
+                # Calculate direction change
+                direction_change = self._calculate_direction_change(prev_velocity, det.velocity)
+
+                # Check if this looks like an impact (bounce)
+                # Requirements:
+                # 1. Object was moving fast enough before impact
+                # 2. Significant velocity change OR direction change
+                if prev_speed >= self.min_impact_velocity:
+                    if (velocity_change_mag >= self.velocity_change_threshold or
+                        direction_change >= self.direction_change_threshold):
+                        # Detected bounce/impact!
+                        impact_detected = True
+                        impact = ImpactEvent(
+                            position=tracked.last_detection.position,  # Use position before bounce
+                            velocity_before=prev_velocity,
+                            timestamp=timestamp,
+                            stationary_duration=0.0  # N/A for trajectory change mode
+                        )
+                        impacts.append(impact)
+
+                        # Continue tracking (object bounces off, doesn't stop)
+
+            elif self.impact_mode == ImpactMode.STATIONARY:
+                # Stationary mode - detect when object stops and stays
+                is_stationary = speed < self.impact_velocity_threshold
+
+                if is_stationary:
+                    # Object is stationary
+                    if tracked.stationary_since is None:
+                        # Just became stationary
+                        tracked.stationary_since = timestamp
+                    else:
+                        # Check if stationary long enough for impact
+                        stationary_duration = timestamp - tracked.stationary_since
+
+                        if stationary_duration >= self.impact_duration:
+                            # Register impact!
                             impact_detected = True
                             impact = ImpactEvent(
-                                position=tracked.last_detection.position,  # Use position before bounce
-                                velocity_before=prev_velocity,
+                                position=det.position,
+                                velocity_before=tracked.last_detection.velocity,
                                 timestamp=timestamp,
-                                stationary_duration=0.0  # N/A for trajectory change mode
+                                stationary_duration=stationary_duration
                             )
                             impacts.append(impact)
 
-                            # Continue tracking (object bounces off, doesn't stop)
-
-                elif self.impact_mode == ImpactMode.STATIONARY:
-                    # Stationary mode - detect when object stops and stays
-                    is_stationary = speed < self.impact_velocity_threshold
-
-                    if is_stationary:
-                        # Object is stationary
-                        if tracked.stationary_since is None:
-                            # Just became stationary
-                            tracked.stationary_since = timestamp
-                        else:
-                            # Check if stationary long enough for impact
-                            stationary_duration = timestamp - tracked.stationary_since
-
-                            if stationary_duration >= self.impact_duration:
-                                # Register impact!
-                                impact_detected = True
-                                impact = ImpactEvent(
-                                    position=det.position,
-                                    velocity_before=tracked.last_detection.velocity,
-                                    timestamp=timestamp,
-                                    stationary_duration=stationary_duration
-                                )
-                                impacts.append(impact)
-
-                                # Stop tracking this object (impact registered)
-                                continue
-                    else:
-                        # Object is moving, reset stationary timer
-                        tracked.stationary_since = None
-
-                elif self.impact_mode == ImpactMode.STUCK:
-                    # STUCK mode - detect projectiles that embed permanently (arrows, darts)
-                    # Register once when stuck, then ignore (added to handled list)
-                    is_stationary = speed < self._stuck_stationary_threshold
-
-                    if is_stationary:
-                        # Increment stationary frame counter
-                        tracked.stationary_frames += 1
-
-                        # Check if confirmed stuck (enough consecutive stationary frames)
-                        if tracked.stationary_frames >= self._stuck_confirm_frames:
-                            # Get impact point from contour (tip, not tail)
-                            impact_pos = self._get_impact_point(det.contour, det.position)
-
-                            # Check if this location already has a handled object
-                            if not self._is_handled(impact_pos):
-                                # NEW IMPACT - projectile just stuck!
-                                impact_detected = True
-                                impact = ImpactEvent(
-                                    position=impact_pos,
-                                    velocity_before=tracked.last_detection.velocity,
-                                    timestamp=timestamp,
-                                    stationary_duration=tracked.stationary_frames / 30.0  # Approx seconds
-                                )
-                                impacts.append(impact)
-
-                                # Add to handled list to prevent duplicate detection
-                                self._add_handled(impact_pos, tracked.object_id, timestamp)
-
-                            # Keep tracking (object stays visible but won't trigger again)
-                    else:
-                        # Object is moving, reset stationary counter
-                        tracked.stationary_frames = 0
+                            # Stop tracking this object (impact registered)
+                            continue
+                else:
+                    # Object is moving, reset stationary timer
+                    tracked.stationary_since = None
+
+            elif self.impact_mode == ImpactMode.STUCK:
+                # STUCK mode - detect projectiles that embed permanently (arrows, darts)
+                # Register once when stuck, then ignore (added to handled list)
+                is_stationary = speed < self._stuck_stationary_threshold
+
+                if is_stationary:
+                    # Increment stationary frame counter
+                    tracked.stationary_frames += 1
+
+                    # Check if confirmed stuck (enough consecutive stationary frames)
+                    if tracked.stationary_frames >= self._stuck_confirm_frames:
+                        # Get impact point from contour (tip, not tail)
+                        impact_pos = self._get_impact_point(det.contour, det.position)
+
+                        # Check if this location already has a handled object
+                        if not self._is_handled(impact_pos):
+                            # NEW IMPACT - projectile just stuck!
+                            impact_detected = True
+                            impact = ImpactEvent(
+                                position=impact_pos,
+                                velocity_before=tracked.last_detection.velocity,
+                                timestamp=timestamp,
+                                stationary_duration=tracked.stationary_frames / 30.0  # Approx seconds
+                            )
+                            impacts.append(impact)
 
-                # Update tracked object
-                tracked.last_detection = det
-                tracked.velocity_history.append((timestamp, det.velocity))
+                            # Add to handled list to prevent duplicate detection
+                            self._add_handled(impact_pos, tracked.object_id, timestamp,
+                                              footprint=det.contour)
 
-                # Keep only recent velocity history
-                tracked.velocity_history = [
-                    (t, v) for t, v in tracked.velocity_history
-                    if timestamp - t < 1.0
-                ]
+                        # Keep tracking (object stays visible but won't trigger again)
+                else:
+                    # Object is moving, reset stationary counter
+                    tracked.stationary_frames = 0
 
-                current_tracks[track_id] = tracked
+            # Update tracked object
+            tracked.last_detection = det
+            tracked.velocity_history.append((timestamp, det.velocity))
 
-        # Add new tracks for unmatched detections
-        for i, det in enumerate(detections):
-            if i not in matched_detections:
-                new_track = TrackedObject(
-                    object_id=self.next_object_id,
-                    last_detection=det,
-                    velocity_history=[(timestamp, det.velocity)]
-                )
-                current_tracks[self.next_object_id] = new_track
-                self.next_object_id += 1
+            # Keep only recent velocity history
+            tracked.velocity_history = [
+                (t, v) for t, v in tracked.velocity_history
+                if timestamp - t < 1.0
+            ]
+
+            current_tracks[track_id] = tracked
+
+        # Keep tracks missing from this frame for up to max_tracking_gap, so a
+        # dropped detection doesn't reset their impact state
+        for track_id, tracked in self.tracked_objects.items():
+            if (track_id not in current_tracks and track_id not in track_ids
+                    and timestamp - tracked.last_detection.timestamp <= self.max_tracking_gap):
+                current_tracks[track_id] = tracked
 
         # Update tracking state
         self.tracked_objects = current_tracks
 
         return impacts
 
+    def _assign_tracks(self, detections: List[DetectedObject], timestamp: float) -> List[int]:
+        """Track id per detection.
+
+        Detectors that track (ColorBlobDetector) already set track_id and
+        the matching velocity. Otherwise the backend's tracker assigns ids
+        and overwrites the detections' velocities with its estimates, so
+        impact detection always uses one consistent velocity per object.
+        """
+        if all(det.track_id is not None for det in detections):
+            return [det.track_id for det in detections]
+
+        positions = np.array([(det.position.x, det.position.y) for det in detections]).reshape(-1, 2)
+        track_ids, velocities = self.tracker.update(positions, timestamp)
+        for det, track_id, (vx, vy) in zip(detections, track_ids.tolist(), velocities.tolist()):
+            det.track_id = track_id
+            det.velocity = Point2D(x=vx, y=vy)
+        return track_ids.tolist()
+
     def _calculate_direction_change(self, v1: Point2D, v2: Point2D) -> float:
         """Calculate angle change between two velocity vectors.
 
@@ -448,8 +499,20 @@ class ObjectDetectionBackend(DetectionBackend):
         if self.calibration_manager is None:
             return True  # No calibration = no filtering
 
+        if self.roi is not None:
+            return True  # Detector only sees pixels inside the polygon
+
         return self.calibration_manager.is_within_screen_bounds(camera_pos)
 
+    def _update_roi(self) -> None:
+        """Derive the detection ROI from the current calibration."""
+        roi = ScreenROI.from_calibration(self.calibration_manager) if self.use_roi else None
+        if roi is not None and not self.detector.set_roi(roi):
+            roi = None  # Detector can't use it; keep filtering by screen bounds
+        if roi is None:
+            self.detector.set_roi(None)
+        self.roi = roi
+
     # =========================================================================
     # STUCK Mode Methods
     # =========================================================================
@@ -463,27 +526,28 @@ class ObjectDetectionBackend(DetectionBackend):
         Returns:
             True if this position already has a registered stuck object
         """
-        for handled in self._handled_objects:
-            dx = position.x - handled.position.x
-            dy = position.y - handled.position.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist < self._handled_radius:
-                return True
-        return False
-
-    def _add_handled(self, position: Point2D, object_id: int, timestamp: float) -> None:
+        return self._handled_index.any_within(position.x, position.y, self._handled_radius)
+
+    def _add_handled(self, position: Point2D, object_id: int, timestamp: float,
+                     footprint: Optional[np.ndarray] = None) -> None:
         """Add a new handled stuck object.
 
         Args:
             position: Impact position in camera coordinates
             object_id: Tracking ID of the object
             timestamp: Time of registration
+            footprint: Contour of the detected blob (for mask_handled)
         """
-        self._handled_objects.append(HandledObject(
+        handled = HandledObject(
             position=position,
             registered_at=timestamp,
-            object_id=object_id
-        ))
+            object_id=object_id,
+            footprint=footprint,
+        )
+        self._handled_objects.append(handled)
+        self._handled_index.add(position.x, position.y, handled)
+        if self.mask_handled:
+            self._update_occupancy_mask([handled])
         log.debug(f"Added handled stuck object at ({position.x:.0f}, {position.y:.0f})")
 
     def reset_handled_objects(self) -> None:
@@ -493,9 +557,62 @@ class ObjectDetectionBackend(DetectionBackend):
         """
         count = len(self._handled_objects)
         self._handled_objects.clear()
+        self._handled_index.clear()
+        self._clear_occupancy_mask()
         if count > 0:
             log.info(f"Cleared {count} handled stuck objects")
 
+    def _expire_handled(self, timestamp: float) -> None:
+        """Forget handled stuck objects older than handled_expiry."""
+        if self.handled_expiry is None or not self._handled_objects:
+            return
+        cutoff = timestamp - self.handled_expiry
+        # Registered in time order: nothing to do unless the oldest expired
+        if self._handled_objects[0].registered_at >= cutoff:
+            return
+
+        kept = [h for h in self._handled_objects if h.registered_at >= cutoff]
+        log.debug(f"Expired {len(self._handled_objects) - len(kept)} handled stuck objects")
+        self._handled_objects = kept
+        self._handled_index.rebuild((h.position.x, h.position.y, h) for h in kept)
+        self._clear_occupancy_mask()
+        if self.mask_handled and kept:
+            self._update_occupancy_mask([])
+
+    def _update_occupancy_mask(self, handled_objects: List[HandledObject]) -> None:
+        """Mask handled objects out of the detector's foreground.
+
+        The blob contour (plus a small margin for edge jitter) is masked;
+        objects without one get a circle of the handled radius.
+        """
+        if self._frame_shape is None:
+            return
+        if self._occupancy_mask is None or self._occupancy_mask.shape != self._frame_shape:
+            # New mask (or frame size changed): draw every handled object
+            self._occupancy_mask = np.full(self._frame_shape, 255, dtype=np.uint8)
+            handled_objects = self._handled_objects
+
+        mask = self._occupancy_mask
+        for handled in handled_objects:
+            if handled.footprint is not None and len(handled.footprint) >= 3:
+                contour = handled.footprint.astype(np.int32)
+                cv2.drawContours(mask, [contour], -1, 0, thickness=cv2.FILLED)
+                cv2.drawContours(mask, [contour], -1, 0, thickness=5)
+            else:
+                center = (int(round(handled.position.x)), int(round(handled.position.y)))
+                cv2.circle(mask, center, int(self._handled_radius), 0, -1)
+
+        if not self.detector.set_exclusion_mask(mask):
+            # Detector can't use it; keep detecting (and removal checks)
+            self._occupancy_mask = None
+            self.mask_handled = False
+            log.warning("Detector does not support masking handled objects")
+
+    def _clear_occupancy_mask(self) -> None:
+        if self._occupancy_mask is not None:
+            self._occupancy_mask = None
+            self.detector.set_exclusion_mask(None)
+
     def _get_impact_point(self, contour: Optional[np.ndarray], detection_pos: Point2D) -> Point2D:
         """Estimate true impact point from contour based on camera viewing angle.
 
@@ -544,19 +661,19 @@ class ObjectDetectionBackend(DetectionBackend):
         """
         min_age = 1.0  # Object must be at least 1s old to count as "removed"
 
+        # Handled objects with a detection nearby are still visible
+        visible = set()
+        for det in current_detections:
+            for handled in self._handled_index.within(det.position.x, det.position.y,
+                                                      self._handled_radius):
+                visible.add(id(handled))
+
         for handled in self._handled_objects:
             # Check if object has been there long enough to consider removal
             if (timestamp - handled.registered_at) < min_age:
                 continue
 
-            # Check if still visible (any detection near handled position)
-            still_visible = any(
-                math.sqrt((handled.position.x - det.position.x) ** 2 +
-                         (handled.position.y - det.position.y) ** 2) < self._handled_radius
-                for det in current_detections
-            )
-
-            if not still_visible:
+            if id(handled) not in visible:
                 log.info(
                     f"Stuck object may have been removed at "
                     f"({handled.position.x:.0f}, {handled.position.y:.0f})"
@@ -919,6 +1036,7 @@ class ObjectDetectionBackend(DetectionBackend):
                 if geometry:
                     self._camera_center_x = geometry['camera_center_x']
                     log.debug(f"Camera center X set to {self._camera_center_x:.1f}")
+                self._update_roi()
 
             return CalibrationResult(
                 success=True,
@@ -1182,6 +1300,8 @@ class ObjectDetectionBackend(DetectionBackend):
             'display_resolution': f'{self.display_width}x{self.display_height}',
             'impact_threshold': f'{self.impact_velocity_threshold}px/s',
             'impact_duration': f'{self.impact_duration}s',
+            'roi': f'{self.roi.area_fraction:.0%} of frame' if self.roi else 'off',
+            'handled_objects': len(self._handled_objects),
         }
 
     def set_debug_mode(self, enabled: bool) -> None:
@@ -152,6 +152,28 @@ def disable() -> None:
     _enabled = False
 
 
+@contextmanager
+def suspended():
+    """
+    Context manager that pauses profiling inside the block.
+
+    Used for work that shouldn't show up as (or pay for) profiled calls,
+    like rollback re-simulation. The previous enabled state is restored
+    on exit.
+
+    Example:
+        with profiling.suspended():
+            engine._do_headless_frame_update(dt)
+    """
+    global _enabled
+    previous = _enabled
+    _enabled = False
+    try:
+        yield
+    finally:
+        _enabled = previous
+
+
 def begin_frame(frame_number: int) -> None:
     """
     Begin profiling a new frame.
@@ -0,0 +1,71 @@
+"""
+Per-stage latency timing for detection pipelines.
+
+Detection backends call mark() after each processing stage (convert, blur,
+threshold, contours, transform, ...). Timing is off by default so mark()
+is a single attribute check; benchmarks enable it to get a latency
+breakdown per frame without a profiler.
+
+Usage:
+    timer = StageTimer(enabled=True)
+    backend.stage_timer = timer
+
+    timer.start()
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    timer.mark('convert')
+    ...
+    print(timer.get_stats())
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List
+
+
+class StageTimer:
+    """Collects durations (ms) of named pipeline stages.
+
+    Each mark() records the time since the previous mark (or start()) under
+    the given stage name, so stages must be marked in processing order.
+
+    Args:
+        enabled: Record timings (when False, start() and mark() do nothing)
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.samples: DefaultDict[str, List[float]] = defaultdict(list)
+        self._last = 0.0
+
+    def start(self) -> None:
+        """Begin timing a frame."""
+        if self.enabled:
+            self._last = time.perf_counter()
+
+    def mark(self, stage: str) -> None:
+        """Record the time since the previous mark as `stage`."""
+        if self.enabled:
+            now = time.perf_counter()
+            self.samples[stage].append((now - self._last) * 1000)
+            self._last = now
+
+    def reset(self) -> None:
+        """Discard recorded samples."""
+        self.samples.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-stage timing, in the order stages were first marked.
+
+        Returns:
+            Dict of stage -> dict with count, mean_ms, p95_ms and max_ms
+        """
+        stats = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            stats[stage] = {
+                'count': len(ordered),
+                'mean_ms': sum(ordered) / len(ordered),
+                'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                'max_ms': ordered[-1],
+            }
+        return stats
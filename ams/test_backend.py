@@ -548,7 +548,8 @@ class InlineGameHarness:
         game_name: str = "TestGame",
         width: int = 400,
         height: int = 300,
-        headless: bool = True
+        headless: bool = True,
+        **game_kwargs
     ):
         """Initialize with inline YAML game definition.
 
@@ -558,12 +559,14 @@ class InlineGameHarness:
             width: Display width
             height: Display height
             headless: If True, skip rendering (faster)
+            **game_kwargs: Extra GameEngine arguments (e.g. columnar_store=True)
         """
         self.game_yaml = game_yaml
         self.game_name = game_name
         self.width = width
         self.height = height
         self.headless = headless
+        self.game_kwargs = game_kwargs
         self.backend = TestDetectionBackend(width, height)
 
         self._game = None
@@ -595,7 +598,7 @@ class InlineGameHarness:
         # Create game class using existing factory
         game_class = GameEngine.from_yaml(game_yaml_path)
 
-        return game_class(content_fs=self._content_fs)
+        return game_class(content_fs=self._content_fs, **self.game_kwargs)
 
     def cleanup(self):
         """Clean up temporary resources."""
@@ -26,6 +26,7 @@ import sys
 import os
 import time
 import argparse
+import functools
 from pathlib import Path
 
 # Add DuckHunt to path for imports (needed for some shared modules)
@@ -38,6 +39,122 @@ from games.registry import get_registry, GameRegistry
 from input.sources.mouse import MouseInputSource
 
 
+def load_calibration(calib_path: str = "calibration.json"):
+    """Load a saved camera calibration.
+
+    Args:
+        calib_path: Path to the calibration file
+
+    Returns:
+        CalibrationManager, or None if there is no usable calibration
+    """
+    from calibration.calibration_manager import CalibrationManager
+    from models import CalibrationConfig
+
+    if not os.path.exists(calib_path):
+        print(f"   No calibration found. Press 'C' to calibrate.")
+        return None
+    try:
+        calibration_manager = CalibrationManager(CalibrationConfig())
+        calibration_manager.load_calibration(calib_path)
+        print(f"   ✓ Loaded calibration from {calib_path}")
+        quality = calibration_manager.get_calibration_quality()
+        print(f"   Calibration quality: RMS error {quality.reprojection_error_rms:.2f}px")
+        return calibration_manager
+    except Exception as e:
+        print(f"   Warning: Could not load calibration: {e}")
+        return None
+
+
+def open_camera(camera_id: int, camera_thread: bool):
+    """Open the OpenCV camera, optionally with background capture."""
+    from ams.camera import OpenCVCamera, ThreadedCamera
+
+    camera = OpenCVCamera(camera_id=camera_id)
+    if camera_thread:
+        # Capture on a background thread; detection reads the latest frames
+        camera = ThreadedCamera(camera)
+    return camera
+
+
+def build_laser_backend(camera_id, brightness, camera_thread, display_width, display_height,
+                        roi=False):
+    """Build the laser backend (module level so a detection worker can call it)."""
+    from ams.laser_detection_backend import LaserDetectionBackend
+
+    detection_backend = LaserDetectionBackend(
+        camera=open_camera(camera_id, camera_thread),
+        calibration_manager=load_calibration(),
+        display_width=display_width,
+        display_height=display_height,
+        brightness_threshold=brightness,
+        roi=roi
+    )
+    detection_backend.set_debug_mode(True)
+    return detection_backend
+
+
+def build_object_backend(camera_id, camera_thread, display_width, display_height, roi=False):
+    """Build the object backend (module level so a detection worker can call it)."""
+    from ams.object_detection_backend import ObjectDetectionBackend
+    from ams.object_detection import ColorBlobDetector, ColorBlobConfig, ImpactMode
+
+    camera = open_camera(camera_id, camera_thread)
+    calibration_manager = load_calibration()
+
+    # Create color blob detector for nerf darts
+    blob_config = ColorBlobConfig(
+        hue_min=0,
+        hue_max=15,
+        saturation_min=100,
+        saturation_max=255,
+        value_min=100,
+        value_max=255,
+        min_area=50,
+        max_area=2000,
+    )
+    detector = ColorBlobDetector(blob_config)
+
+    detection_backend = ObjectDetectionBackend(
+        camera=camera,
+        detector=detector,
+        calibration_manager=calibration_manager,
+        display_width=display_width,
+        display_height=display_height,
+        impact_mode=ImpactMode.TRAJECTORY_CHANGE,  # Bouncing objects
+        velocity_change_threshold=100.0,
+        direction_change_threshold=90.0,
+        min_impact_velocity=50.0,
+        roi=roi,
+    )
+    detection_backend.set_debug_mode(True)
+    return detection_backend
+
+
+def start_camera_backend(factory, args, DISPLAY_WIDTH, DISPLAY_HEIGHT):
+    """Build a camera backend in this process, or in a detection worker.
+
+    Args:
+        factory: Picklable callable returning the backend
+        args: Parsed command-line arguments
+        DISPLAY_WIDTH: Display width in pixels
+        DISPLAY_HEIGHT: Display height in pixels
+
+    Raises:
+        Exception: Whatever the factory raises (in a worker, RuntimeError
+            carrying its message), so callers can fall back to mouse input
+    """
+    if not args.detection_worker:
+        return factory()
+
+    from ams.detection_worker import DetectionWorkerBackend
+
+    print("   Detection runs in a worker process (calibration unavailable)")
+    detection_backend = DetectionWorkerBackend(factory, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+    detection_backend.set_debug_mode(True)
+    return detection_backend
+
+
 def create_detection_backend(args, DISPLAY_WIDTH, DISPLAY_HEIGHT):
     """Create detection backend based on command-line arguments.
 
@@ -69,37 +186,11 @@ def create_detection_backend(args, DISPLAY_WIDTH, DISPLAY_HEIGHT):
         print(f"   Brightness threshold: {args.brightness}")
 
         try:
-            from ams.camera import OpenCVCamera
-            from ams.laser_detection_backend import LaserDetectionBackend
-            from calibration.calibration_manager import CalibrationManager
-            from models import CalibrationConfig
-
-            camera = OpenCVCamera(camera_id=args.camera_id)
-
-            # Try to load existing calibration
-            calibration_manager = None
-            calib_path = "calibration.json"
-            if os.path.exists(calib_path):
-                try:
-                    calibration_manager = CalibrationManager(CalibrationConfig())
-                    calibration_manager.load_calibration(calib_path)
-                    print(f"   ✓ Loaded calibration from {calib_path}")
-                    quality = calibration_manager.get_calibration_quality()
-                    print(f"   Calibration quality: RMS error {quality.reprojection_error_rms:.2f}px")
-                except Exception as e:
-                    print(f"   Warning: Could not load calibration: {e}")
-                    calibration_manager = None
-            else:
-                print(f"   No calibration found. Press 'C' to calibrate.")
-
-            detection_backend = LaserDetectionBackend(
-                camera=camera,
-                calibration_manager=calibration_manager,
-                display_width=DISPLAY_WIDTH,
-                display_height=DISPLAY_HEIGHT,
-                brightness_threshold=args.brightness
+            factory = functools.partial(
+                build_laser_backend, args.camera_id, args.brightness, args.camera_thread,
+                DISPLAY_WIDTH, DISPLAY_HEIGHT, roi=args.roi
             )
-            detection_backend.set_debug_mode(True)
+            detection_backend = start_camera_backend(factory, args, DISPLAY_WIDTH, DISPLAY_HEIGHT)
 
             print("\n   NOTE: Laser mode requires a camera and laser pointer!")
             print("   Controls:")
@@ -124,55 +215,11 @@ def create_detection_backend(args, DISPLAY_WIDTH, DISPLAY_HEIGHT):
         print(f"   Camera ID: {args.camera_id}")
 
         try:
-            from ams.camera import OpenCVCamera
-            from ams.object_detection_backend import ObjectDetectionBackend
-            from ams.object_detection import ColorBlobDetector, ColorBlobConfig, ImpactMode
-            from calibration.calibration_manager import CalibrationManager
-            from models import CalibrationConfig
-
-            camera = OpenCVCamera(camera_id=args.camera_id)
-
-            # Try to load existing calibration
-            calibration_manager = None
-            calib_path = "calibration.json"
-            if os.path.exists(calib_path):
-                try:
-                    calibration_manager = CalibrationManager(CalibrationConfig())
-                    calibration_manager.load_calibration(calib_path)
-                    print(f"   ✓ Loaded calibration from {calib_path}")
-                    quality = calibration_manager.get_calibration_quality()
-                    print(f"   Calibration quality: RMS error {quality.reprojection_error_rms:.2f}px")
-                except Exception as e:
-                    print(f"   Warning: Could not load calibration: {e}")
-                    calibration_manager = None
-            else:
-                print(f"   No calibration found. Press 'C' to calibrate.")
-
-            # Create color blob detector for nerf darts
-            blob_config = ColorBlobConfig(
-                hue_min=0,
-                hue_max=15,
-                saturation_min=100,
-                saturation_max=255,
-                value_min=100,
-                value_max=255,
-                min_area=50,
-                max_area=2000,
+            factory = functools.partial(
+                build_object_backend, args.camera_id, args.camera_thread,
+                DISPLAY_WIDTH, DISPLAY_HEIGHT, roi=args.roi
             )
-            detector = ColorBlobDetector(blob_config)
-
-            detection_backend = ObjectDetectionBackend(
-                camera=camera,
-                detector=detector,
-                calibration_manager=calibration_manager,
-                display_width=DISPLAY_WIDTH,
-                display_height=DISPLAY_HEIGHT,
-                impact_mode=ImpactMode.TRAJECTORY_CHANGE,  # Bouncing objects
-                velocity_change_threshold=100.0,
-                direction_change_threshold=90.0,
-                min_impact_velocity=50.0,
-            )
-            detection_backend.set_debug_mode(True)
+            detection_backend = start_camera_backend(factory, args, DISPLAY_WIDTH, DISPLAY_HEIGHT)
 
             print("\n   NOTE: Object detection mode for nerf darts/balls (bouncing objects)!")
             print("   Impact mode: TRAJECTORY_CHANGE (detects bounces)")
@@ -726,7 +773,8 @@ def launch_game_generic(args, screen, detection_backend, ams, registry: GameRegi
 
     # Collect game-specific kwargs from args
     game_kwargs = {}
-    for key in ['mode', 'spawn_rate', 'max_escaped', 'target_pops', 'skin', 'level', 'level_group', 'pacing']:
+    for key in ['mode', 'spawn_rate', 'max_escaped', 'target_pops', 'skin', 'level', 'level_group', 'pacing',
+                'dirty_rects', 'batched_dispatch', 'lua_mirror']:
         if hasattr(args, key):
             value = getattr(args, key)
             if value is not None:
@@ -784,6 +832,7 @@ def launch_game_generic(args, screen, detection_backend, ams, registry: GameRegi
                     running = False
                 elif event.key == pygame.K_f:
                     pygame.display.toggle_fullscreen()
+                    game.invalidate_display()
                 elif event.key == pygame.K_r:
                     # Restart game
                     game = registry.create_game(game_slug, DISPLAY_WIDTH, DISPLAY_HEIGHT, **game_kwargs)
@@ -794,6 +843,8 @@ def launch_game_generic(args, screen, detection_backend, ams, registry: GameRegi
                         display_surface=screen,
                         display_resolution=(DISPLAY_WIDTH, DISPLAY_HEIGHT)
                     )
+                    # Calibration patterns were drawn straight onto screen
+                    game.invalidate_display()
                     print("Calibration complete!")
                 elif event.key == pygame.K_d and args.backend in ['laser', 'object']:
                     if hasattr(detection_backend, 'set_debug_mode') and hasattr(detection_backend, 'debug_mode'):
@@ -815,9 +866,13 @@ def launch_game_generic(args, screen, detection_backend, ams, registry: GameRegi
         # Update game
         game.update(dt)
 
-        # Render
+        # Render (games with dirty-rect rendering report the changed regions)
         game.render(screen)
-        pygame.display.flip()
+        dirty_rects = game.get_dirty_rects()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
 
         # Show debug visualization if enabled
         if args.backend in ['laser', 'object'] and hasattr(detection_backend, 'debug_mode') and detection_backend.debug_mode:
@@ -951,6 +1006,21 @@ Examples:
         default=200,
         help='Brightness threshold for laser detection (default: 200)'
     )
+    parser.add_argument(
+        '--camera-thread',
+        action='store_true',
+        help='Capture camera frames on a background thread (laser/object backends)'
+    )
+    parser.add_argument(
+        '--detection-worker',
+        action='store_true',
+        help='Run camera capture and detection in a separate process (laser/object backends)'
+    )
+    parser.add_argument(
+        '--roi',
+        action='store_true',
+        help='Only process the calibrated screen area of camera frames (laser/object backends)'
+    )
 
     # Display settings
     parser.add_argument(
@@ -970,6 +1040,24 @@ Examples:
         default=None,
         help='Resolution as WIDTHxHEIGHT (e.g., 1920x1080). Auto-detected in fullscreen.'
     )
+    parser.add_argument(
+        '--dirty-rects',
+        action='store_true',
+        default=None,
+        help='Repaint only changed screen regions (YAML engine games)'
+    )
+    parser.add_argument(
+        '--batched-dispatch',
+        action='store_true',
+        default=None,
+        help='Run behavior on_update hooks in one Lua call per frame (YAML engine games)'
+    )
+    parser.add_argument(
+        '--lua-mirror',
+        action='store_true',
+        default=None,
+        help='Sync entity fields to Lua tables in bulk for on_update (YAML engine games)'
+    )
 
     # Simple targets specific
     parser.add_argument(
@@ -1131,6 +1219,8 @@ Examples:
         cv2.destroyAllWindows()
         if hasattr(detection_backend, 'camera'):
             detection_backend.camera.release()
+        elif hasattr(detection_backend, 'close'):
+            detection_backend.close()
 
     pygame.quit()
     return exit_code
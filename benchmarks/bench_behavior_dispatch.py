@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Lua behavior dispatch benchmark.
+
+Times the per-frame behavior on_update pass (LuaEngine.update) with:
+
+- per-entity: one Python -> Lua call per (entity, behavior)
+- batched:    one Python -> Lua call per frame; a Lua loop walks the
+              entities grouped by behavior (batched_dispatch=True)
+- mirror:     per-entity dispatch, with entity fields synced to Lua
+              tables in bulk so ams.get_x/set_x/... stay in Lua
+              (lua_mirror=True)
+- batched+mirror: both
+
+Scenes are inline YAML modeled on the shipped games, with on_update
+behaviors attached (no shipped YAML game uses per-frame behaviors yet):
+
+- brickbreaker: a brick wall (two behaviors per brick) plus a few balls
+- manytargets:  many drifting targets with one behavior each
+
+Usage:
+    python benchmarks/bench_behavior_dispatch.py
+    python benchmarks/bench_behavior_dispatch.py --scenes manytargets --scale 1 4 --frames 200
+    python benchmarks/bench_behavior_dispatch.py --modes per-entity mirror
+"""
+
+import argparse
+
+from common import InlineGame, print_table, summarize, time_calls
+
+GAME_YAML = """
+name: "Behavior Dispatch Benchmark"
+screen_width: 1280
+screen_height: 720
+
+inline_behaviors:
+  move:
+    lua: |
+      local move = {}
+      function move.on_update(id, dt)
+        ams.set_x(id, ams.get_x(id) + ams.get_vx(id) * dt)
+        ams.set_y(id, ams.get_y(id) + ams.get_vy(id) * dt)
+      end
+      return move
+  pulse:
+    lua: |
+      local pulse = {}
+      function pulse.on_update(id, dt)
+        local t = (ams.get_prop(id, "t") or 0) + dt
+        ams.set_prop(id, "t", t)
+      end
+      return pulse
+  idle:
+    lua: |
+      local idle = {}
+      function idle.on_update(id, dt)
+      end
+      return idle
+
+entity_types:
+  ball:
+    width: 10
+    height: 10
+    color: white
+    behaviors: [move]
+  brick:
+    width: 60
+    height: 20
+    color: red
+    behaviors: [idle, pulse]
+  target:
+    width: 40
+    height: 40
+    color: yellow
+    behaviors: [move]
+"""
+
+
+def populate(game, scene: str, scale: int) -> int:
+    """Spawn a scene; returns the entity count."""
+    if scene == 'brickbreaker':
+        rows, cols = 10 * scale, 18
+        for row in range(rows):
+            for col in range(cols):
+                game.spawn_entity('brick', 10 + col * 70, 40 + row * 25)
+        for i in range(3):
+            game.spawn_entity('ball', 400 + 100 * i, 600, vx=150, vy=-200)
+        return rows * cols + 3
+    count = 100 * scale
+    for i in range(count):
+        game.spawn_entity('target', (i * 37) % 1240, (i * 53) % 680,
+                          vx=20 + i % 7, vy=10 - i % 5)
+    return count
+
+
+MODES = {
+    'per-entity': {},
+    'batched': {'batched_dispatch': True},
+    'mirror': {'lua_mirror': True},
+    'batched+mirror': {'batched_dispatch': True, 'lua_mirror': True},
+}
+
+
+def run_case(scene: str, scale: int, frames: int, options: dict):
+    with InlineGame(GAME_YAML, width=1280, height=720, **options) as game:
+        game._clear_entities()
+        count = populate(game, scene, scale)
+        engine = game._behavior_engine
+        samples = time_calls(lambda: engine.update(1 / 60), repeat=frames)
+    return count, summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenes', nargs='+', choices=['brickbreaker', 'manytargets'],
+                        default=['brickbreaker', 'manytargets'])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 4],
+                        help='Scene size multiplier')
+    parser.add_argument('--frames', type=int, default=100)
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    args = parser.parse_args()
+
+    rows = []
+    for scene in args.scenes:
+        for scale in args.scale:
+            baseline = None
+            for mode in args.modes:
+                count, timing = run_case(scene, scale, args.frames, MODES[mode])
+                baseline = baseline or timing['mean']
+                rows.append((scene, count, mode,
+                             timing['mean'], timing['p95'],
+                             f"{baseline / timing['mean']:.2f}x"))
+
+    print_table(['scene', 'entities', 'dispatch', 'ms/frame', 'p95 ms', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
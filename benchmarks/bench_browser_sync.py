@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Browser Python -> Fengari entity sync benchmark.
+
+Builds the lua_update message LuaEngineBrowser posts to fengari_bridge.js
+every frame, for N entities of which a fraction move each frame (the rest
+sit still, like bricks or walls), and compares per-frame cost and size of:
+
+- full:   every alive entity's to_dict() (delta_sync=False)
+- delta:  EntitySyncEncoder, changed fields as JSON
+- binary: EntitySyncEncoder, changed numeric fields as a Float64Array
+
+Timing covers encoding plus json.dumps, which is what the message costs
+in Python; run under pygbag the absolute numbers are several times
+higher. games/browser/bench_sync.html measures the JavaScript side.
+
+Usage:
+    python benchmarks/bench_browser_sync.py
+    python benchmarks/bench_browser_sync.py --entities 100 1000 --moving 0.1 0.5 1.0
+"""
+
+import argparse
+import json
+import random
+
+from common import print_table, summarize, time_calls
+
+from games.browser.lua_bridge import EntityBrowser, EntitySyncEncoder
+
+MODES = ('full', 'delta', 'binary')
+FPS = 60
+
+
+def make_entities(count: int, rng: random.Random):
+    return [EntityBrowser(id=f"entity_{i}", entity_type='brick' if i % 4 else 'ball',
+                          x=rng.uniform(0, 800), y=rng.uniform(0, 600),
+                          vx=rng.uniform(-200, 200), vy=rng.uniform(-200, 200),
+                          width=40.0, height=20.0, color='red', sprite='brick',
+                          behaviors=['bounce'], behavior_config={'bounce': {'speed': 200}},
+                          tags=['solid'], properties={'hits': 0})
+            for i in range(count)]
+
+
+def run(mode: str, count: int, moving: float, frames: int, seed: int):
+    rng = random.Random(seed)
+    entities = make_entities(count, rng)
+    movers = entities[:int(count * moving)]
+    encoder = EntitySyncEncoder(binary=mode == 'binary')
+    dt = 1.0 / FPS
+    sizes = []
+
+    def step():
+        for entity in movers:
+            entity.x += entity.vx * dt
+            entity.y += entity.vy * dt
+
+    def frame():
+        data = {'dt': dt, 'elapsed_time': 0.0, 'score': 0}
+        if mode == 'full':
+            data['entities'] = {e.id: e.to_dict() for e in entities if e.alive}
+        else:
+            data['sync'] = encoder.encode(entities)
+        message = json.dumps({'source': 'lua_engine', 'type': 'lua_update', 'data': data})
+        sizes.append(len(message))
+
+    # First frame spawns everything in every mode
+    frame()
+    samples = []
+    for _ in range(frames):
+        step()
+        samples.extend(time_calls(frame, repeat=1, warmup=0))
+    steady = sizes[1:]
+    return sizes[0], sum(steady) / len(steady), summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', type=int, nargs='+', default=[100, 500, 2000])
+    parser.add_argument('--moving', type=float, nargs='+', default=[0.1, 1.0],
+                        help='Fraction of entities that move each frame')
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.entities:
+        for moving in args.moving:
+            for mode in MODES:
+                first, steady, timing = run(mode, count, moving, args.frames, args.seed)
+                rows.append((count, f"{moving:.0%}", mode, first, int(steady),
+                             timing['mean'], timing['p95']))
+
+    print_table(['entities', 'moving', 'sync', 'first bytes', 'bytes/frame', 'ms/frame',
+                 'p95 ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
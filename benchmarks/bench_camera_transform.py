@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Camera -> game coordinate transform benchmark.
+
+Converts N camera points (detections or contour points) to normalized game
+coordinates with:
+
+- per-point cv2:  the previous camera_to_game (array + perspectiveTransform per point)
+- per-point:      CalibrationManager.camera_to_game (scalar math)
+- batched:        CalibrationManager.camera_to_game_points (one call for all points)
+
+and times CalibrationManager.warp_to_game (cv2.remap with cached maps) for
+warping a whole camera frame into game space.
+
+Usage:
+    python benchmarks/bench_camera_transform.py
+    python benchmarks/bench_camera_transform.py --points 10 100 1000
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from common import print_table, summarize, time_calls
+
+from calibration.calibration_manager import CalibrationManager
+from models import (
+    CalibrationConfig,
+    CalibrationData,
+    CalibrationQuality,
+    HomographyMatrix,
+    Point2D,
+    Resolution,
+)
+
+H_CAM_TO_PROJ = np.array([
+    [1.6, 0.1, -250.0],
+    [0.04, 1.55, -140.0],
+    [0.0001, 0.00005, 1.0],
+])
+
+
+def make_manager(directory: str, camera, projector) -> CalibrationManager:
+    data = CalibrationData(
+        projector_resolution=Resolution(width=projector[0], height=projector[1]),
+        camera_resolution=Resolution(width=camera[0], height=camera[1]),
+        homography_camera_to_projector=HomographyMatrix.from_numpy(H_CAM_TO_PROJ),
+        quality=CalibrationQuality(reprojection_error_rms=0.5, reprojection_error_max=1.0,
+                                   num_inliers=16, num_total_points=16, inlier_ratio=1.0),
+    )
+    path = Path(directory) / 'calibration.json'
+    data.save(str(path))
+    return CalibrationManager(CalibrationConfig(auto_save=False), str(path))
+
+
+def legacy_camera_to_game(point: Point2D, width: int, height: int) -> Point2D:
+    cam_pt = np.array([[point.x, point.y]], dtype=np.float32)
+    proj_pt = cv2.perspectiveTransform(cam_pt.reshape(-1, 1, 2), H_CAM_TO_PROJ)[0][0]
+    return Point2D(x=proj_pt[0] / width, y=proj_pt[1] / height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--camera', default='1280x720')
+    parser.add_argument('--projector', default='1920x1080')
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    camera = tuple(int(v) for v in args.camera.split('x'))
+    projector = tuple(int(v) for v in args.projector.split('x'))
+    rng = np.random.default_rng(args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = make_manager(directory, camera, projector)
+
+        rows = []
+        for count in args.points:
+            array = rng.uniform(0, camera[0], (count, 2))
+            points = [Point2D(x=x, y=y) for x, y in array.tolist()]
+            legacy = summarize(time_calls(
+                lambda: [legacy_camera_to_game(p, *projector) for p in points], args.repeat))
+            scalar = summarize(time_calls(
+                lambda: [manager.camera_to_game(p) for p in points], args.repeat))
+            batched = summarize(time_calls(
+                lambda: manager.camera_to_game_points(array), args.repeat))
+            for name, timing in (('per-point cv2', legacy), ('per-point', scalar),
+                                 ('batched', batched)):
+                rows.append((count, name, timing['mean'] * 1000 / count,
+                             f"{legacy['mean'] / timing['mean']:.1f}x"))
+        print_table(['points', 'method', 'us/point', 'speedup'], rows)
+
+        frame = rng.integers(0, 255, (camera[1], camera[0], 3), dtype=np.uint8)
+        build = summarize(time_calls(lambda: (manager._remap_cache.clear(),
+                                              manager.get_game_remap(projector)), 3, warmup=0))
+        warp = summarize(time_calls(lambda: manager.warp_to_game(frame), args.repeat))
+        print()
+        print_table(['warp', 'mean ms', 'p95 ms'], [
+            ('build maps', build['mean'], build['p95']),
+            (f"remap {args.camera} -> {args.projector}", warp['mean'], warp['p95']),
+        ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Collision broadphase benchmark.
+
+Compares the legacy all-pairs collision check against the spatial-hash
+broadphase in GameEngine._check_collisions. Reports pairs reaching the
+AABB test and ms/frame at several entity counts.
+
+Usage:
+    python benchmarks/bench_collisions.py
+    python benchmarks/bench_collisions.py --counts 100 1000 --frames 50
+"""
+
+import argparse
+import math
+import random
+
+from common import InlineGame, print_table, summarize, time_calls
+
+GAME_YAML = """
+name: "Collision Benchmark"
+screen_width: {width}
+screen_height: {height}
+
+entity_types:
+  ball:
+    width: 10
+    height: 10
+    color: white
+  brick:
+    width: 24
+    height: 12
+    color: red
+  brick_hard:
+    extends: brick
+    color: silver
+  particle:
+    width: 4
+    height: 4
+    color: yellow
+
+collisions:
+  - [ball, brick]
+  - [particle, brick]
+  - [ball, ball]
+"""
+
+# Share of entities per type (the rest are bricks)
+BALL_SHARE = 0.05
+PARTICLE_SHARE = 0.15
+
+# Average screen area per entity, roughly a dense BrickBreaker layout
+AREA_PER_ENTITY = 2000.0
+
+
+def populate(game, count: int, width: int, height: int, seed: int) -> None:
+    """Spawn a deterministic mix of balls, particles and bricks."""
+    rng = random.Random(seed)
+    balls = max(1, int(count * BALL_SHARE))
+    particles = int(count * PARTICLE_SHARE)
+    bricks = count - balls - particles
+
+    for i in range(bricks):
+        entity_type = 'brick_hard' if i % 4 == 0 else 'brick'
+        game.spawn_entity(entity_type, rng.uniform(0, width - 24), rng.uniform(0, height - 12))
+    for _ in range(balls):
+        game.spawn_entity('ball', rng.uniform(0, width), rng.uniform(0, height),
+                          vx=rng.uniform(-300, 300), vy=rng.uniform(-300, 300))
+    for _ in range(particles):
+        game.spawn_entity('particle', rng.uniform(0, width), rng.uniform(0, height),
+                          vx=rng.uniform(-100, 100), vy=rng.uniform(-100, 100))
+
+
+def run_case(count: int, frames: int, broadphase: bool, cell_size: float, seed: int):
+    """Run one configuration; returns (pairs_tested, collisions, timing summary)."""
+    side = math.sqrt(count * AREA_PER_ENTITY)
+    width, height = int(side * 4 / 3), int(side * 3 / 4)
+    # The schema caps screen size; the engine uses the constructor size
+    yaml_def = GAME_YAML.format(width=min(width, 3840), height=min(height, 2160))
+
+    with InlineGame(yaml_def, width=width, height=height,
+                    broadphase_enabled=broadphase,
+                    broadphase_cell_size=cell_size) as game:
+        game._clear_entities()
+        populate(game, count, width, height, seed)
+
+        dt = 1.0 / 60
+        pairs = []
+        hits = []
+
+        def frame():
+            game._apply_physics(dt)
+            game._check_collisions()
+            stats = game.get_collision_stats()
+            pairs.append(stats['pairs_tested'])
+            hits.append(stats['collisions'])
+
+        # Physics runs inside the timed call; it is identical for both modes
+        samples = time_calls(frame, repeat=frames, warmup=1)
+
+    return (
+        sum(pairs) // max(1, len(pairs)),
+        sum(hits) // max(1, len(hits)),
+        summarize(samples),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--counts', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--frames', type=int, default=20,
+                        help='Frames timed per case (all-pairs at 10k is slow)')
+    parser.add_argument('--cell-size', type=float, default=64.0)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.counts:
+        for broadphase in (False, True):
+            pairs, hits, timing = run_case(count, args.frames, broadphase,
+                                           args.cell_size, args.seed)
+            rows.append((
+                count,
+                'grid' if broadphase else 'all-pairs',
+                pairs,
+                hits,
+                timing['mean'],
+                timing['p95'],
+            ))
+
+    print_table(['entities', 'mode', 'pairs/frame', 'hits/frame', 'ms/frame', 'p95 ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
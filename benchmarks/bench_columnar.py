@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Columnar entity store benchmark.
+
+Compares the per-object GameEntity path against the NumPy-backed
+ColumnarStore (GameEngine(columnar_store=True)) for a particle-burst
+style scene:
+
+- physics:     GameEngine._apply_physics
+- exited:      exited_screen lose-condition check over all particles
+- aabb:        all-pairs collision narrowphase (broadphase disabled)
+
+Usage:
+    python benchmarks/bench_columnar.py
+    python benchmarks/bench_columnar.py --counts 1000 5000 --repeat 50
+"""
+
+import argparse
+import random
+
+from common import InlineGame, print_table, summarize, time_calls
+
+from ams.games.game_engine.config import LoseConditionConfig
+
+GAME_YAML = """
+name: "Columnar Benchmark"
+screen_width: 1920
+screen_height: 1080
+
+entity_types:
+  particle:
+    width: 4
+    height: 4
+    color: yellow
+  blade:
+    width: 24
+    height: 24
+    color: white
+
+collisions:
+  - [blade, particle]
+"""
+
+WIDTH, HEIGHT = 1920, 1080
+
+# One blade (collision source) per this many particles
+PARTICLES_PER_BLADE = 100
+
+
+def populate(game, count: int, seed: int) -> None:
+    """Spawn particles plus a few blades, all slow enough to stay on screen."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        game.spawn_entity('particle', rng.uniform(100, WIDTH - 100), rng.uniform(100, HEIGHT - 100),
+                          vx=rng.uniform(-30, 30), vy=rng.uniform(-30, 30))
+    for _ in range(max(1, count // PARTICLES_PER_BLADE)):
+        game.spawn_entity('blade', rng.uniform(100, WIDTH - 100), rng.uniform(100, HEIGHT - 100))
+
+
+def run_case(count: int, repeat: int, columnar: bool, seed: int):
+    """Time each operation for one store mode; returns {op: summary}."""
+    exited_rule = LoseConditionConfig(entity_type='particle', event='exited_screen', edge='any')
+    dt = 1.0 / 60
+    results = {}
+
+    with InlineGame(GAME_YAML, width=WIDTH, height=HEIGHT,
+                    columnar_store=columnar, broadphase_enabled=False) as game:
+        game._clear_entities()
+        populate(game, count, seed)
+
+        results['physics'] = summarize(time_calls(lambda: game._apply_physics(dt), repeat))
+        results['exited'] = summarize(
+            time_calls(lambda: game._check_exited_screen_condition(exited_rule), repeat)
+        )
+        # All-pairs at large counts is slow on the object path; fewer samples
+        results['aabb'] = summarize(
+            time_calls(game._check_collisions, max(3, repeat // 10), warmup=1)
+        )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000, 5000, 10000])
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.counts:
+        objects = run_case(count, args.repeat, columnar=False, seed=args.seed)
+        columnar = run_case(count, args.repeat, columnar=True, seed=args.seed)
+        for op in ('physics', 'exited', 'aabb'):
+            object_ms = objects[op]['mean']
+            columnar_ms = columnar[op]['mean']
+            rows.append((
+                count,
+                op,
+                object_ms,
+                columnar_ms,
+                f"{object_ms / columnar_ms:.1f}x" if columnar_ms else '-',
+            ))
+
+    print_table(['entities', 'op', 'object ms', 'columnar ms', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Detection backend benchmark on recorded footage.
+
+Replays a video file or image directory (ReplayCamera) through the laser
+or object detection backend, optionally with a stored calibration, and
+reports:
+
+- throughput (frames/s over the whole recording)
+- per-stage latency (convert, blur, threshold, contours, track, impacts,
+  transform; which stages exist depends on the backend)
+- events produced, and precision/recall/position error against an
+  annotated ground-truth file (see ams/detection_replay.py for the format)
+
+The ground truth defaults to ground_truth.json inside an image directory,
+or <video stem>.json next to a video. With --synthetic a recording with
+known hits is generated first, so the harness runs without footage.
+
+Usage:
+    python benchmarks/bench_detection_replay.py --synthetic laser
+    python benchmarks/bench_detection_replay.py --synthetic object --backend object
+    python benchmarks/bench_detection_replay.py recordings/laser01/ --calibration calibration.json
+    python benchmarks/bench_detection_replay.py session.mp4 --backend object --roi --realtime
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from common import print_table
+
+from ams.camera import ReplayCamera
+from ams.detection_replay import (
+    GroundTruthHit,
+    load_ground_truth,
+    match_events,
+    run_replay,
+    save_ground_truth,
+)
+
+SYNTHETIC_SIZE = (640, 480)
+SYNTHETIC_FPS = 60
+
+
+def synthesize_laser(directory: Path, frames: int, seed: int) -> None:
+    """Dim noisy frames with a laser dot shown for 3 frames every 20 frames."""
+    rng = np.random.default_rng(seed)
+    width, height = SYNTHETIC_SIZE
+    hits = []
+    dot = None
+    for index in range(frames):
+        image = rng.integers(20, 60, (height, width, 3), dtype=np.uint8)
+        if index % 20 == 5:
+            dot = (int(rng.integers(20, width - 20)), int(rng.integers(20, height - 20)))
+            hits.append(GroundTruthHit(timestamp=index / SYNTHETIC_FPS,
+                                       x=dot[0] / width, y=dot[1] / height))
+        if dot is not None and 5 <= index % 20 < 8:
+            cv2.circle(image, dot, 3, (255, 255, 255), -1)
+        cv2.imwrite(str(directory / f"frame_{index:05d}.png"), image)
+    save_ground_truth(str(directory / 'ground_truth.json'), hits)
+
+
+def synthesize_object(directory: Path, frames: int, seed: int) -> None:
+    """A red ball thrown at the wall every 30 frames, bouncing back."""
+    rng = np.random.default_rng(seed)
+    width, height = SYNTHETIC_SIZE
+    hits = []
+    throw = None
+    for index in range(frames):
+        image = rng.integers(10, 40, (height, width, 3), dtype=np.uint8)
+        phase = index % 30
+        if phase == 0:
+            target = rng.uniform([100, 100], [width - 100, height - 100])
+            angle = rng.uniform(0, 2 * np.pi)
+            velocity = 600.0 * np.array([np.cos(angle), np.sin(angle)])
+            throw = (target, velocity)
+            hits.append(GroundTruthHit(timestamp=(index + 10) / SYNTHETIC_FPS,
+                                       x=target[0] / width, y=target[1] / height))
+        if throw is not None and phase < 20:
+            target, velocity = throw
+            t = (phase - 10) / SYNTHETIC_FPS
+            # Approach the wall, then bounce back at half speed
+            position = target + velocity * t if t <= 0 else target - 0.5 * velocity * t
+            cv2.circle(image, tuple(int(v) for v in position), 8, (0, 0, 255), -1)
+        cv2.imwrite(str(directory / f"frame_{index:05d}.png"), image)
+    save_ground_truth(str(directory / 'ground_truth.json'), hits)
+
+
+def default_ground_truth(recording: Path):
+    path = recording / 'ground_truth.json' if recording.is_dir() else recording.with_suffix('.json')
+    return path if path.exists() else None
+
+
+def build_backend(args, camera, display):
+    calibration = None
+    if args.calibration:
+        from calibration.calibration_manager import CalibrationManager
+        from models import CalibrationConfig
+        calibration = CalibrationManager(CalibrationConfig(auto_save=False), args.calibration)
+
+    if args.backend == 'laser':
+        from ams.laser_detection_backend import LaserDetectionBackend
+        return LaserDetectionBackend(camera, calibration, display[0], display[1],
+                                     brightness_threshold=args.brightness, roi=args.roi)
+
+    from ams.object_detection import ImpactMode
+    from ams.object_detection_backend import ObjectDetectionBackend
+    return ObjectDetectionBackend(camera, calibration_manager=calibration,
+                                  display_width=display[0], display_height=display[1],
+                                  impact_mode=ImpactMode(args.impact_mode), roi=args.roi)
+
+
+def run(args, recording: Path) -> None:
+    display = tuple(int(v) for v in args.display.split('x'))
+    camera = ReplayCamera(str(recording), realtime=args.realtime)
+    backend = build_backend(args, camera, display)
+    backend.stage_timer.enabled = True
+
+    result = run_replay(backend, camera, max_frames=args.frames)
+    camera.release()
+
+    ordered = sorted(result.frame_ms) or [0.0]
+    print(f"{recording}: {result.frames} frames, {args.backend} backend"
+          f"{' (real-time)' if args.realtime else ''}")
+    print_table(['frames', 'fps', 'mean ms/frame', 'p95 ms/frame', 'events'], [(
+        result.frames, result.fps, float(np.mean(ordered)),
+        ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], len(result.events),
+    )])
+
+    print()
+    print_table(['stage', 'count', 'mean ms', 'p95 ms', 'max ms'], [
+        (stage, stats['count'], stats['mean_ms'], stats['p95_ms'], stats['max_ms'])
+        for stage, stats in backend.stage_timer.get_stats().items()
+    ])
+
+    truth_path = args.ground_truth or default_ground_truth(recording)
+    if truth_path is None:
+        print("\nNo ground truth file; skipping accuracy")
+        return
+    scores = match_events(result.events, load_ground_truth(str(truth_path)),
+                          time_tolerance=args.time_tolerance,
+                          distance_tolerance=args.distance_tolerance)
+    print()
+    print_table(['hits', 'matched', 'false pos', 'missed', 'precision', 'recall', 'f1',
+                 'mean error', 'mean delay ms'], [(
+        scores['true_positives'] + scores['false_negatives'], scores['true_positives'],
+        scores['false_positives'], scores['false_negatives'], f"{scores['precision']:.1%}",
+        f"{scores['recall']:.1%}", f"{scores['f1']:.3f}", scores['mean_error'],
+        scores['mean_delay'] * 1000,
+    )])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('recording', nargs='?', help='Video file or image directory')
+    parser.add_argument('--synthetic', choices=['laser', 'object'],
+                        help='Generate and replay a synthetic recording')
+    parser.add_argument('--synthetic-frames', type=int, default=600)
+    parser.add_argument('--backend', choices=['laser', 'object'], default='laser')
+    parser.add_argument('--calibration', help='Calibration JSON for camera -> game mapping')
+    parser.add_argument('--ground-truth', help='Ground truth JSON (hits in game coordinates)')
+    parser.add_argument('--realtime', action='store_true', help='Replay at the recorded pace')
+    parser.add_argument('--frames', type=int, help='Stop after this many frames')
+    parser.add_argument('--display', default='1920x1080')
+    parser.add_argument('--roi', action='store_true', help='Restrict detection to the screen polygon')
+    parser.add_argument('--brightness', type=int, default=200, help='Laser brightness threshold')
+    parser.add_argument('--impact-mode', default='trajectory_change',
+                        help='Object backend impact mode (trajectory_change, stationary, stuck)')
+    parser.add_argument('--time-tolerance', type=float, default=0.15, help='Seconds')
+    parser.add_argument('--distance-tolerance', type=float, default=0.05,
+                        help='Normalized game units')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        with tempfile.TemporaryDirectory(prefix='ams_replay_') as directory:
+            directory = Path(directory)
+            if args.synthetic == 'laser':
+                synthesize_laser(directory, args.synthetic_frames, args.seed)
+            else:
+                synthesize_object(directory, args.synthetic_frames, args.seed)
+            (directory / 'timestamps.txt').write_text(
+                ''.join(f"{i / SYNTHETIC_FPS:.6f}\n" for i in range(args.synthetic_frames)))
+            run(args, directory)
+    elif args.recording:
+        run(args, Path(args.recording))
+    else:
+        parser.error('give a recording or --synthetic')
+
+
+if __name__ == '__main__':
+    main()
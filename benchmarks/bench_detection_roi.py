@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+ROI-restricted detection benchmark.
+
+Synthetic camera frames where the projected screen (a keystoned quad)
+covers only part of the view, with a few colored blobs and a bright spot
+inside it. Times per-frame detection for:
+
+- ColorBlobDetector.detect (object backend)
+- LaserDetectionBackend.update (laser backend)
+
+with the full frame versus ScreenROI crop + mask (roi=True). The full-frame
+laser run includes its per-detection screen polygon test.
+
+Usage:
+    python benchmarks/bench_detection_roi.py
+    python benchmarks/bench_detection_roi.py --resolution 1920x1080 --screen 0.5
+"""
+
+import argparse
+
+import cv2
+import numpy as np
+
+from common import print_table, summarize, time_calls
+
+from ams.camera import CameraInterface
+from ams.detection_roi import ScreenROI
+from ams.laser_detection_backend import LaserDetectionBackend
+from ams.object_detection import ColorBlobConfig, ColorBlobDetector
+from models import Point2D
+
+
+class StaticCamera(CameraInterface):
+    def __init__(self, frame):
+        self.frame = frame
+
+    def capture_frame(self):
+        return self.frame
+
+    def get_resolution(self):
+        return self.frame.shape[1], self.frame.shape[0]
+
+    def release(self):
+        pass
+
+
+class QuadCalibration:
+    """Minimal calibration manager exposing screen bounds."""
+
+    def __init__(self, polygon, width, height):
+        self.polygon = polygon
+        self.width = width
+        self.height = height
+
+    def get_screen_bounds(self):
+        return self
+
+    def to_numpy_polygon(self):
+        return self.polygon
+
+    def is_within_screen_bounds(self, point):
+        return cv2.pointPolygonTest(self.polygon, (point.x, point.y), False) >= 0
+
+    def camera_to_game(self, point):
+        return Point2D(x=point.x / self.width, y=point.y / self.height)
+
+
+def make_scene(width: int, height: int, screen: float, seed: int):
+    """Noisy frame plus a keystoned screen quad covering ~`screen` of its width/height."""
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 120, (height, width, 3), dtype=np.uint8)
+    w, h = width * screen, height * screen
+    x0, y0 = (width - w) / 2, (height - h) / 2
+    skew = w * 0.05
+    polygon = np.array([[x0 + skew, y0], [x0 + w - skew, y0],
+                        [x0 + w, y0 + h], [x0, y0 + h]], dtype=np.float32)
+    cx, cy = int(x0 + w / 2), int(y0 + h / 2)
+    for dx in (-60, 0, 60):
+        cv2.circle(frame, (cx + dx, cy + 40), 8, (0, 0, 255), -1)
+    cv2.circle(frame, (cx, cy - 40), 4, (255, 255, 255), -1)
+    return frame, polygon
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resolution', default='1280x720')
+    parser.add_argument('--screen', type=float, default=0.6,
+                        help='Screen quad size as a fraction of frame width/height')
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.resolution.split('x'))
+    frame, polygon = make_scene(width, height, args.screen, args.seed)
+    calibration = QuadCalibration(polygon, width, height)
+
+    rows = []
+    baseline = {}
+    for roi in (False, True):
+        mode = 'roi' if roi else 'full'
+        region = ScreenROI(polygon) if roi else None
+
+        detector = ColorBlobDetector(ColorBlobConfig(min_area=20))
+        detector.set_roi(region)
+        blob = summarize(time_calls(lambda: detector.detect(frame, 0.0), args.repeat))
+
+        laser = LaserDetectionBackend(StaticCamera(frame), calibration, width, height, roi=roi)
+        laser.update(0.0)
+        hits = len(laser.poll_events())
+        laser._min_detection_interval = 0.0
+        spot = summarize(time_calls(lambda: laser.update(0.0), args.repeat))
+
+        fraction = region.area_fraction if region else 1.0
+        for name, timing, found in (('color blob', blob, len(detector.detect(frame, 0.0))),
+                                    ('laser', spot, hits)):
+            baseline.setdefault(name, timing['mean'])
+            rows.append((name, mode, f"{fraction:.0%}", found, timing['mean'], timing['p95'],
+                         f"{baseline[name] / timing['mean']:.1f}x"))
+
+    print(f"{width}x{height}, screen {args.screen:.0%} of width/height")
+    print_table(['detector', 'mode', 'pixels', 'detections', 'mean ms', 'p95 ms', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Dirty-rect rendering benchmark.
+
+A projector-sized scene with many static entities (a brick wall) and a
+handful of moving targets, rendered every frame through GameEngine.render()
+with full redraws and with dirty_rects=True. Reports render time per frame
+and the mean fraction of the screen repainted. Rendering goes to an
+off-screen surface, so display presentation (flip vs update(rects)) is
+not included.
+
+Usage:
+    python benchmarks/bench_dirty_rects.py
+    python benchmarks/bench_dirty_rects.py --moving 5 20 --width 3840 --height 2160
+"""
+
+import argparse
+import random
+
+import pygame
+
+from common import InlineGame, print_table, summarize, time_calls
+
+GAME_YAML = """
+name: "Dirty Rect Benchmark"
+screen_width: 1920
+screen_height: 1080
+win_condition: reach_score
+win_target: 1000000
+
+entity_types:
+  brick:
+    width: 60
+    height: 20
+    color: red
+    render:
+      - shape: rectangle
+        color: $color
+      - shape: rectangle
+        color: white
+        fill: false
+        line_width: 2
+  target:
+    width: 48
+    height: 48
+    color: yellow
+    render:
+      - shape: circle
+        color: $color
+      - shape: circle
+        color: red
+        radius: 0.5
+"""
+
+
+def run_case(moving: int, bricks: int, width: int, height: int, frames: int,
+             dirty: bool, seed: int):
+    rng = random.Random(seed)
+    with InlineGame(GAME_YAML, width=width, height=height, dirty_rects=dirty) as game:
+        game._clear_entities()
+        for _ in range(bricks):
+            game.spawn_entity('brick', rng.uniform(0, width - 60), rng.uniform(0, height / 2))
+        targets = [game.spawn_entity('target', rng.uniform(0, width - 48), rng.uniform(height / 2, height - 48))
+                   for _ in range(moving)]
+
+        screen = pygame.Surface((width, height))
+        fractions = []
+
+        def frame():
+            for target in targets:
+                target.x = (target.x + 7) % (width - 48)
+            game.render(screen)
+            fractions.append(game.get_dirty_rect_stats().get('dirty_fraction', 1.0))
+
+        timing = summarize(time_calls(frame, frames))
+        return timing, sum(fractions) / len(fractions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--moving', type=int, nargs='+', default=[5, 20])
+    parser.add_argument('--bricks', type=int, default=200)
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--frames', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    pygame.init()
+
+    rows = []
+    for moving in args.moving:
+        baseline = None
+        for label, dirty in (('full', False), ('dirty', True)):
+            timing, fraction = run_case(moving, args.bricks, args.width, args.height,
+                                        args.frames, dirty, args.seed)
+            baseline = baseline or timing['mean']
+            rows.append((moving, label, timing['mean'], timing['p95'], f"{fraction:.3f}",
+                         f"{baseline / timing['mean']:.1f}x"))
+
+    print(f"{args.width}x{args.height}, {args.bricks} static bricks")
+    print_table(['moving', 'mode', 'frame ms', 'p95 ms', 'screen repainted', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
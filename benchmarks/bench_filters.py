@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Interaction filter micro-benchmark.
+
+Times every interaction shipped with the repo (games/*/game.yaml entity
+types and the Lua behavior bundles) against random entity pairs, comparing:
+
+- interpreted: evaluate_filter() walking the parsed Filter per pair
+- compiled:    the plan built by compile_filter() at registration
+
+System targets (pointer, screen, ...) are evaluated against their
+EntityBounds view, as InteractionEngine does.
+
+Usage:
+    python benchmarks/bench_filters.py
+    python benchmarks/bench_filters.py --pairs 5000 --repeat 50
+"""
+
+import argparse
+import random
+
+from common import PROJECT_ROOT, print_table, summarize, time_calls
+
+from ams.interactions import Entity, EntityBounds, SystemEntities, compile_filter, evaluate_filter
+from ams.interactions.parser import parse_interactions
+from ams.yaml import safe_load_path
+
+WIDTH, HEIGHT = 800, 600
+
+
+def shipped_interactions():
+    """Yield (source, Interaction) for every interaction definition on disk."""
+    for path in sorted(PROJECT_ROOT.glob('games/*/game.yaml')):
+        game = safe_load_path(path) or {}
+        for type_name, type_data in (game.get('entity_types') or {}).items():
+            interactions = (type_data or {}).get('interactions')
+            if interactions:
+                for interaction in parse_interactions(interactions, type_name):
+                    yield path.parent.name, interaction
+
+    behaviors = PROJECT_ROOT / 'ams' / 'games' / 'game_engine' / 'lua' / 'behaviors'
+    for path in sorted(behaviors.glob('*.yaml')):
+        behavior = safe_load_path(path) or {}
+        if behavior.get('interactions'):
+            for interaction in parse_interactions(behavior['interactions'], path.stem):
+                yield f"behavior:{path.stem}", interaction
+
+
+def make_pairs(interaction, count: int, seed: int):
+    """Random (entity_a, entity_b) pairs for one interaction."""
+    rng = random.Random(seed)
+    system = SystemEntities.create(WIDTH, HEIGHT)
+    pairs = []
+    for i in range(count):
+        a = Entity(id=f"a{i}", entity_type=interaction.source_entity_type,
+                   x=rng.uniform(0, WIDTH), y=rng.uniform(0, HEIGHT), width=16, height=16,
+                   attributes={'hits_remaining': rng.randint(0, 3)})
+        if system.is_system_entity(interaction.target):
+            system.pointer.x = rng.uniform(0, WIDTH)
+            system.pointer.y = rng.uniform(0, HEIGHT)
+            system.pointer.active = rng.random() < 0.1
+            b = EntityBounds.from_dict(system.get_entity_dict(interaction.target) or {})
+        else:
+            b = Entity(id=f"b{i}", entity_type=interaction.target,
+                       x=rng.uniform(0, WIDTH), y=rng.uniform(0, HEIGHT), width=70, height=25)
+        pairs.append((a, b))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pairs', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    total_interpreted = total_compiled = 0.0
+    for source, interaction in shipped_interactions():
+        pairs = make_pairs(interaction, args.pairs, args.seed)
+        filter_obj = interaction.filter
+        plan = compile_filter(filter_obj)
+
+        def interpreted():
+            for a, b in pairs:
+                evaluate_filter(filter_obj, a, b)
+
+        def compiled():
+            for a, b in pairs:
+                plan(a, b)
+
+        interpreted_ms = summarize(time_calls(interpreted, args.repeat))['mean']
+        compiled_ms = summarize(time_calls(compiled, args.repeat))['mean']
+        total_interpreted += interpreted_ms
+        total_compiled += compiled_ms
+        rows.append((
+            source,
+            f"{interaction.source_entity_type}->{interaction.target}",
+            interaction.action,
+            interpreted_ms,
+            compiled_ms,
+            f"{interpreted_ms / compiled_ms:.1f}x" if compiled_ms else '-',
+        ))
+
+    rows.append(('total', '', '', total_interpreted, total_compiled,
+                 f"{total_interpreted / total_compiled:.1f}x" if total_compiled else '-'))
+    print(f"{args.pairs} pairs per interaction")
+    print_table(['source', 'pair', 'action', 'interpreted ms', 'compiled ms', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Game restart benchmark.
+
+Times creating a GameEngine instance (what a launch, a web-controller
+restart or the R key does) with the process-wide .lua.yaml subroutine
+cache cold (cleared before every instance) and warm, and the share spent
+loading the lua/{type}/ subroutines.
+
+Usage:
+    python benchmarks/bench_game_restart.py
+    python benchmarks/bench_game_restart.py --repeat 50
+"""
+
+import argparse
+import time
+
+from common import InlineGame, print_table, summarize
+
+from ams.games.game_engine import GameEngine
+from ams.lua import clear_subroutine_cache, get_subroutine_cache_stats
+
+GAME_YAML = """
+name: "Restart Benchmark"
+screen_width: 800
+screen_height: 600
+
+entity_types:
+  ball:
+    width: 10
+    height: 10
+    color: white
+  brick:
+    width: 60
+    height: 20
+    color: red
+"""
+
+
+def run(repeat: int, warm: bool):
+    """Returns (create timings, subroutine-loading timings) in ms."""
+    original = GameEngine._load_subroutines
+    load_ms = []
+
+    def timed_load(self):
+        start = time.perf_counter()
+        original(self)
+        load_ms.append((time.perf_counter() - start) * 1000)
+
+    GameEngine._load_subroutines = timed_load
+    create_ms = []
+    try:
+        clear_subroutine_cache()
+        for _ in range(repeat + 1):
+            if not warm:
+                clear_subroutine_cache()
+            start = time.perf_counter()
+            with InlineGame(GAME_YAML):
+                pass
+            create_ms.append((time.perf_counter() - start) * 1000)
+    finally:
+        GameEngine._load_subroutines = original
+    # The first instance warms imports (and the cache in warm mode)
+    return create_ms[1:], load_ms[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for warm in (False, True):
+        create_ms, load_ms = run(args.repeat, warm)
+        create, load = summarize(create_ms), summarize(load_ms)
+        rows.append(('warm' if warm else 'cold', create['mean'], create['p95'],
+                     load['mean'], load['p95']))
+
+    print(f"{get_subroutine_cache_stats()['size']} cached subroutines")
+    print_table(['cache', 'create ms', 'p95 ms', 'subroutines ms', 'p95 ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
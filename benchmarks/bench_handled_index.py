@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+STUCK-mode handled object benchmark.
+
+With N arrows already stuck in the target, times:
+
+- lookup: one _is_handled() check, as a linear scan with math.sqrt per
+  entry (previous implementation) and with the PointGrid index
+- detect: ColorBlobDetector.detect() on a frame showing the N stuck arrows,
+  with and without the handled objects masked out (mask_handled), which
+  removes their contours, tracking and removal checks from every frame
+
+Usage:
+    python benchmarks/bench_handled_index.py
+    python benchmarks/bench_handled_index.py --handled 10 100 1000
+"""
+
+import argparse
+import math
+
+import cv2
+import numpy as np
+
+from common import print_table, summarize, time_calls
+
+from ams.camera import CameraInterface
+from ams.object_detection import ColorBlobDetector, ImpactMode
+from ams.object_detection_backend import ObjectDetectionBackend
+from models import Point2D
+
+WIDTH, HEIGHT = 1280, 720
+ARROW_RADIUS = 6
+
+
+class StaticCamera(CameraInterface):
+    def capture_frame(self):
+        return np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    def get_resolution(self):
+        return (WIDTH, HEIGHT)
+
+    def release(self):
+        pass
+
+
+def linear_is_handled(handled_objects, position, radius):
+    for handled in handled_objects:
+        dx = position.x - handled.position.x
+        dy = position.y - handled.position.y
+        if math.sqrt(dx * dx + dy * dy) < radius:
+            return True
+    return False
+
+
+def make_backend(positions, mask_handled):
+    backend = ObjectDetectionBackend(StaticCamera(), detector=ColorBlobDetector(),
+                                     display_width=WIDTH, display_height=HEIGHT,
+                                     impact_mode=ImpactMode.STUCK, mask_handled=mask_handled)
+    backend._frame_shape = (HEIGHT, WIDTH)
+    for index, (x, y) in enumerate(positions):
+        footprint = cv2.ellipse2Poly((int(x), int(y)), (ARROW_RADIUS, ARROW_RADIUS), 0, 0, 360, 30)
+        backend._add_handled(Point2D(x=x, y=y), index, 0.0, footprint=footprint.reshape(-1, 1, 2))
+    return backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--handled', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--queries', type=int, default=200, help='Lookups per timed call')
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    lookup_rows = []
+    detect_rows = []
+    for count in args.handled:
+        positions = rng.uniform([20, 20], [WIDTH - 20, HEIGHT - 20], (count, 2))
+        # Keep the in-flight object (frame center) clear of stuck arrows
+        positions[np.hypot(*(positions - (WIDTH // 2, HEIGHT // 2)).T) < 30] += 60
+        positions = positions.tolist()
+        queries = [Point2D(x=x, y=y) for x, y in
+                   rng.uniform([0, 0], [WIDTH, HEIGHT], (args.queries, 2)).tolist()]
+
+        backend = make_backend(positions, mask_handled=False)
+        radius = backend._handled_radius
+        linear = summarize(time_calls(
+            lambda: [linear_is_handled(backend._handled_objects, q, radius) for q in queries],
+            args.repeat))
+        grid = summarize(time_calls(lambda: [backend._is_handled(q) for q in queries], args.repeat))
+        for name, timing in (('linear', linear), ('grid', grid)):
+            lookup_rows.append((count, name, timing['mean'] * 1000 / args.queries,
+                                f"{linear['mean'] / timing['mean']:.1f}x"))
+
+        # Stuck arrows plus one in flight
+        frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        for x, y in positions:
+            cv2.circle(frame, (int(x), int(y)), ARROW_RADIUS, (0, 0, 255), -1)
+        cv2.circle(frame, (WIDTH // 2, HEIGHT // 2), ARROW_RADIUS, (0, 0, 255), -1)
+
+        plain = ColorBlobDetector()
+        masked = make_backend(positions, mask_handled=True).detector
+        results = {}
+        for name, detector in (('unmasked', plain), ('masked', masked)):
+            clock = iter(range(10 ** 6))
+            results[name] = summarize(time_calls(
+                lambda: detector.detect(frame, next(clock) / 30), args.repeat))
+            found = len(detector.detect(frame, next(clock) / 30))
+            detect_rows.append((count, name, found, results[name]['mean'], results[name]['p95']))
+
+    print_table(['handled', 'lookup', 'us/lookup', 'speedup'], lookup_rows)
+    print()
+    print_table(['handled', 'detect', 'blobs', 'mean ms', 'p95 ms'], detect_rows)
+
+
+if __name__ == '__main__':
+    main()
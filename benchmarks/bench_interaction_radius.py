@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Bounded-radius interaction benchmark.
+
+A few radial effects (bombs with distance: {lt: R}) plus enemy-enemy
+collisions over a field of enemies, evaluated with InteractionEngine
+spatial candidate queries on and off. Reports evaluate() time and the
+per-interaction candidate/match counters from get_interaction_stats().
+
+Usage:
+    python benchmarks/bench_interaction_radius.py
+    python benchmarks/bench_interaction_radius.py --targets 500 1000 --bombs 5
+"""
+
+import argparse
+import random
+
+from common import print_table, summarize, time_calls
+
+from ams.interactions import Entity, InteractionEngine
+
+WIDTH, HEIGHT = 1920, 1080
+
+INTERACTIONS = {
+    "bomb": {
+        "enemy": {
+            "when": {"distance": {"lt": 120}, "from": "center", "to": "edge"},
+            "because": "continuous",
+            "action": "blast",
+        },
+    },
+    "enemy": {
+        "enemy": {"when": {"distance": 0}, "action": "bump"},
+    },
+}
+
+
+def build_engine(targets: int, bombs: int, spatial_index: bool, seed: int) -> InteractionEngine:
+    rng = random.Random(seed)
+    engine = InteractionEngine(screen_width=WIDTH, screen_height=HEIGHT,
+                               spatial_index=spatial_index)
+    for entity_type, interactions in INTERACTIONS.items():
+        engine.register_entity_type(entity_type, interactions)
+    # Actions are not under test
+    engine.set_default_handler(type('NullHandler', (), {'execute': lambda *a: None})())
+
+    for i in range(bombs):
+        engine.add_entity(Entity(id=f"bomb{i}", entity_type="bomb",
+                                 x=rng.uniform(0, WIDTH), y=rng.uniform(0, HEIGHT),
+                                 width=16, height=16))
+    for i in range(targets):
+        engine.add_entity(Entity(id=f"enemy{i}", entity_type="enemy",
+                                 x=rng.uniform(0, WIDTH), y=rng.uniform(0, HEIGHT),
+                                 width=24, height=24))
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--targets', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--bombs', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for targets in args.targets:
+        for spatial_index in (False, True):
+            engine = build_engine(targets, args.bombs, spatial_index, args.seed)
+            timing = summarize(time_calls(engine.evaluate, args.repeat))
+            stats = engine.get_interaction_stats()
+            for key in sorted(stats):
+                rows.append((
+                    targets,
+                    'grid' if spatial_index else 'scan',
+                    key,
+                    stats[key]['candidates'],
+                    stats[key]['matches'],
+                    timing['mean'],
+                ))
+
+    print_table(['targets', 'mode', 'interaction', 'candidates', 'matches', 'evaluate ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Lua expression benchmark.
+
+Evaluates a frame's worth of YAML-style {lua: ...} expressions (random
+ranges, math on a loop variable set with set_global, multiline win-condition
+blocks) through LuaEngine.evaluate_expression, with the compiled-expression
+cache on and off (expression_cache_size=0 compiles every call, as before).
+Reports time per frame and the cache counters from
+get_expression_cache_stats().
+
+Usage:
+    python benchmarks/bench_lua_expressions.py
+    python benchmarks/bench_lua_expressions.py --expressions 200 500 --frames 60
+"""
+
+import argparse
+
+from common import PROJECT_ROOT, print_table, summarize, time_calls
+
+from ams.content_fs import ContentFS
+from ams.games.game_engine.api import GameLuaAPI
+from ams.lua.engine import EXPRESSION_CACHE_SIZE, LuaEngine
+
+TEMPLATES = (
+    "ams.random_range(-60, -120) + {n}",
+    "i * {n} % 800",
+    "ams.sin(i / {n}) * 40 + 300",
+    "math.max(0, 255 - i * {n})",
+    "local bricks = ams.count_entities_by_tag('brick')\nreturn bricks == {n}",
+)
+
+
+def make_expressions(count: int):
+    """Distinct expressions cycling through TEMPLATES."""
+    return [TEMPLATES[k % len(TEMPLATES)].format(n=k + 1) for k in range(count)]
+
+
+def run_case(expressions, frames: int, cache_size: int):
+    content_fs = ContentFS(PROJECT_ROOT, add_user_layer=False)
+    engine = LuaEngine(content_fs, 800, 600, api_class=GameLuaAPI,
+                       expression_cache_size=cache_size)
+
+    def frame():
+        for i, expression in enumerate(expressions):
+            engine.set_global('i', i)
+            engine.evaluate_expression(expression)
+
+    timing = summarize(time_calls(frame, frames))
+    return timing, engine.get_expression_cache_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--expressions', type=int, nargs='+', default=[100, 300])
+    parser.add_argument('--frames', type=int, default=30)
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.expressions:
+        expressions = make_expressions(count)
+        results = {}
+        for label, cache_size in (('compile', 0), ('cached', max(count, EXPRESSION_CACHE_SIZE))):
+            timing, stats = run_case(expressions, args.frames, cache_size)
+            results[label] = timing['mean']
+            rows.append((count, label, timing['mean'], timing['p95'], stats['hits'], stats['misses'],
+                         f"{results['compile'] / timing['mean']:.1f}x" if timing['mean'] else '-'))
+
+    print_table(['expressions', 'mode', 'frame ms', 'p95 ms', 'hits', 'misses', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
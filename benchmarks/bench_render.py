@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Renderer cache benchmark.
+
+Renders a projector-sized frame of HUD-style entities through
+GameEngine.render(): each label has a translucent backplate (alpha
+scratch surface) and $property text, and each icon is a sprite scaled to
+its entity size. Compares GameEngineRenderer with its RenderCache
+disabled (cache_bytes=0: new Font, text surface, scaled sprite and SRCALPHA
+surface on every draw) against the default budget, and reports the cache
+counters from get_cache_stats().
+
+Usage:
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --labels 100 400 --width 3840 --height 2160
+"""
+
+import argparse
+import random
+
+import pygame
+
+from common import InlineGame, print_table, summarize, time_calls
+
+from ams.games.game_engine.render_cache import RENDER_CACHE_BYTES, RenderCache
+
+GAME_YAML = """
+name: "Render Benchmark"
+screen_width: 1920
+screen_height: 1080
+win_condition: reach_score
+win_target: 1000000
+
+entity_types:
+  label:
+    width: 160
+    height: 32
+    color: white
+    render:
+      - shape: rectangle
+        color: [20, 20, 60]
+        alpha: 0.6
+      - shape: text
+        text: $caption
+        font_size: 28
+        color: yellow
+  icon:
+    width: 48
+    height: 48
+    color: white
+    render:
+      - shape: sprite
+        sprite: icon
+"""
+
+
+def run_case(labels: int, icons: int, width: int, height: int, frames: int,
+             cache_bytes: int, seed: int):
+    rng = random.Random(seed)
+    with InlineGame(GAME_YAML, width=width, height=height) as game:
+        game._clear_entities()
+        skin = game._skin
+        skin._cache = RenderCache(max_bytes=cache_bytes)
+        # In-memory sprite stands in for a loaded asset (drawn at 16x16, shown at 48x48)
+        sprite = pygame.Surface((16, 16))
+        sprite.fill((200, 80, 40))
+        skin._assets._sprites['icon'] = sprite
+
+        for i in range(labels):
+            label = game.spawn_entity('label', rng.uniform(0, width - 160), rng.uniform(0, height - 32))
+            label.properties['caption'] = f"Target {i % 20}"
+        for _ in range(icons):
+            game.spawn_entity('icon', rng.uniform(0, width - 48), rng.uniform(0, height - 48))
+
+        screen = pygame.Surface((width, height))
+        timing = summarize(time_calls(lambda: game.render(screen), frames))
+        return timing, skin.get_cache_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--labels', type=int, nargs='+', default=[100, 300])
+    parser.add_argument('--icons', type=int, default=100)
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--frames', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    pygame.init()
+
+    rows = []
+    for labels in args.labels:
+        baseline = None
+        for label, cache_bytes in (('uncached', 0), ('cached', RENDER_CACHE_BYTES)):
+            timing, stats = run_case(labels, args.icons, args.width, args.height,
+                                     args.frames, cache_bytes, args.seed)
+            baseline = baseline or timing['mean']
+            rows.append((labels, label, timing['mean'], timing['p95'], stats['entries'],
+                         f"{stats['bytes'] / 1024:.0f}", f"{baseline / timing['mean']:.1f}x"))
+
+    print(f"{args.width}x{args.height}, {args.icons} sprite icons")
+    print_table(['labels', 'mode', 'frame ms', 'p95 ms', 'entries', 'KiB', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Render condition / sprite template benchmark.
+
+DuckHunt-style animated ducks: each entity type has several conditional
+sprite commands (facing, hit state, age) whose sprite names are templates
+like duck_{color}_{frame}. Times the per-frame render decisions for every
+command of every duck (when-condition + sprite name), comparing:
+
+- interpreted: GameEntity.evaluate_when() plus the re.sub() placeholder
+  substitution the renderer used before templates were compiled
+- compiled:    RenderCommand.when_check / sprite_template closures built
+               when the game definition is loaded
+
+Drawing itself is not included (see bench_render.py).
+
+Usage:
+    python benchmarks/bench_render_when.py
+    python benchmarks/bench_render_when.py --ducks 100 1000 --repeat 50
+"""
+
+import argparse
+import random
+import re
+
+from common import InlineGame, print_table, summarize, time_calls
+
+GAME_YAML = """
+name: "Render When Benchmark"
+screen_width: 1920
+screen_height: 1080
+
+entity_types:
+  duck:
+    width: 64
+    height: 64
+    render:
+      - shape: sprite
+        sprite: duck_{color}_hit
+        when: {property: hit, value: true}
+        stop: true
+      - shape: sprite
+        sprite: duck_{color}_fall_{frame}
+        when: {property: age, compare: greater_than, value: 8.0}
+        stop: true
+      - shape: sprite
+        sprite: duck_{color}_left_{frame}
+        when: {property: facing, value: left}
+        stop: true
+      - shape: sprite
+        sprite: duck_{color}_{frame}
+"""
+
+COLORS = ('green', 'blue', 'red')
+
+
+def regex_template(entity, sprite_name: str) -> str:
+    """Placeholder substitution as previously done on every render."""
+    def replace_placeholder(match):
+        value = entity.properties.get(match.group(1))
+        if value is None:
+            return match.group(0)
+        if isinstance(value, float) and value == int(value):
+            return str(int(value))
+        return str(value)
+
+    return re.sub(r'\{(\w+)\}', replace_placeholder, sprite_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ducks', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.ducks:
+        rng = random.Random(args.seed)
+        with InlineGame(GAME_YAML, width=1920, height=1080) as game:
+            game._clear_entities()
+            commands = game._game_def.entity_types['duck'].render
+            ducks = []
+            for _ in range(count):
+                duck = game.spawn_entity('duck', rng.uniform(0, 1856), rng.uniform(0, 1016),
+                                         vx=rng.choice((-120, 120)))
+                duck.properties.update(color=rng.choice(COLORS), frame=float(rng.randint(0, 2)),
+                                       hit=rng.random() < 0.1)
+                duck.spawn_time = -rng.uniform(0, 10)
+                ducks.append(duck)
+
+            def interpreted():
+                for duck in ducks:
+                    for cmd in commands:
+                        if cmd.when and not duck.evaluate_when(cmd.when, 0.0):
+                            continue
+                        regex_template(duck, cmd.sprite_name)
+                        if cmd.stop:
+                            break
+
+            def compiled():
+                for duck in ducks:
+                    for cmd in commands:
+                        if cmd.when_check and not cmd.when_check(duck, 0.0):
+                            continue
+                        cmd.sprite_template(duck)
+                        if cmd.stop:
+                            break
+
+            interpreted_ms = summarize(time_calls(interpreted, args.repeat))['mean']
+            compiled_ms = summarize(time_calls(compiled, args.repeat))['mean']
+            rows.append((count, interpreted_ms, compiled_ms,
+                         f"{interpreted_ms / compiled_ms:.1f}x" if compiled_ms else '-'))
+
+    print_table(['ducks', 'interpreted ms', 'compiled ms', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
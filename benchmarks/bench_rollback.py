@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Rollback snapshot benchmark.
+
+Fills the rollback history of a scene where a fraction of the entities
+move each frame (the rest are static, like a brick wall), and compares
+snapshot modes of RollbackStateManager:
+
+- full:  GameSnapshot (deep copy of every entity) per capture
+- delta: keyframe every --keyframe-interval captures, deltas in between
+
+Reports capture time (microseconds) and memory per stored snapshot from
+RollbackStateManager.get_stats(), plus the time to restore the oldest
+snapshot.
+
+Usage:
+    python benchmarks/bench_rollback.py
+    python benchmarks/bench_rollback.py --counts 500 2000 --moving 0.1
+"""
+
+import argparse
+import random
+
+from common import InlineGame, print_table, summarize, time_calls
+
+from ams.games.game_engine.rollback import RollbackStateManager
+
+GAME_YAML = """
+name: "Rollback Benchmark"
+screen_width: 1280
+screen_height: 720
+
+entity_types:
+  brick:
+    width: 40
+    height: 16
+    color: red
+  ball:
+    width: 8
+    height: 8
+    color: white
+"""
+
+
+def run_case(count: int, moving: float, mode: str, keyframe_interval: int, seed: int):
+    rng = random.Random(seed)
+    with InlineGame(GAME_YAML, width=1280, height=720) as game:
+        game._clear_entities()
+        movers = []
+        for _ in range(count):
+            if rng.random() < moving:
+                movers.append(game.spawn_entity('ball', rng.uniform(0, 1280), rng.uniform(0, 720),
+                                                vx=rng.uniform(-100, 100), vy=rng.uniform(-100, 100)))
+            else:
+                entity = game.spawn_entity('brick', rng.uniform(0, 1280), rng.uniform(0, 720))
+                entity.properties['hits_remaining'] = 3
+
+        manager = RollbackStateManager(history_duration=2.0, fps=60, snapshot_mode=mode,
+                                       keyframe_interval=keyframe_interval)
+        for _ in range(manager.max_snapshots):
+            for entity in movers:
+                entity.x += entity.vx / 60
+                entity.y += entity.vy / 60
+            manager.capture(game)
+
+        stats = manager.get_stats()
+        oldest = manager._snapshots[0]
+        newest = manager._snapshots[-1]
+        restore = summarize(time_calls(lambda: manager.restore(game, oldest), 5, warmup=1))
+        manager.restore(game, newest)
+        return stats, restore['mean']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--counts', type=int, nargs='+', default=[200, 1000])
+    parser.add_argument('--moving', type=float, default=0.1,
+                        help='Fraction of entities that move every frame')
+    parser.add_argument('--keyframe-interval', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.counts:
+        for mode in ('full', 'delta'):
+            stats, restore_ms = run_case(count, args.moving, mode, args.keyframe_interval, args.seed)
+            rows.append((
+                count,
+                mode,
+                stats['capture_us_mean'],
+                f"{stats['bytes_per_snapshot'] / 1024:.1f}",
+                f"{stats['history_bytes'] / (1024 * 1024):.2f}",
+                restore_ms,
+            ))
+
+    print_table(['entities', 'mode', 'capture us', 'KiB/snapshot', 'history MiB', 'restore ms'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
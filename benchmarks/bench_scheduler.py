@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Scheduled callback benchmark.
+
+Simulates per-entity timers (respawns, blinks, combo windows): N callbacks
+pending with random delays, each fired callback rescheduling itself, and
+compares per-frame cost of:
+
+- list: the previous LuaEngine loop (decrement every pending callback,
+        list.remove the fired ones)
+- heap: CallbackScheduler (min-heap on absolute due time)
+
+Usage:
+    python benchmarks/bench_scheduler.py
+    python benchmarks/bench_scheduler.py --pending 1000 10000 --frames 300
+"""
+
+import argparse
+import random
+
+from common import print_table, summarize, time_calls
+
+from ams.lua.scheduler import CallbackScheduler
+
+FPS = 60
+
+
+class ListScheduler:
+    """Previous LuaEngine scheduling: a list of [time_remaining, name, id]."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def schedule(self, delay, callback_name, entity_id):
+        self.scheduled.append([delay, callback_name, entity_id])
+
+    def update(self, dt):
+        fired = []
+        for scheduled in self.scheduled[:]:
+            scheduled[0] -= dt
+            if scheduled[0] <= 0:
+                fired.append((scheduled[1], scheduled[2]))
+                self.scheduled.remove(scheduled)
+        return fired
+
+
+def run(mode: str, pending: int, frames: int, seed: int):
+    rng = random.Random(seed)
+    dt = 1.0 / FPS
+    fired_total = 0
+    clock = [0.0]
+
+    if mode == 'list':
+        scheduler = ListScheduler()
+        for i in range(pending):
+            scheduler.schedule(rng.uniform(0.1, 5.0), 'blink', f'e{i}')
+
+        def frame():
+            nonlocal fired_total
+            fired = scheduler.update(dt)
+            fired_total += len(fired)
+            for callback_name, entity_id in fired:
+                scheduler.schedule(rng.uniform(0.1, 5.0), callback_name, entity_id)
+    else:
+        scheduler = CallbackScheduler()
+        for i in range(pending):
+            scheduler.schedule(rng.uniform(0.1, 5.0), 'blink', f'e{i}')
+
+        def frame():
+            nonlocal fired_total
+            clock[0] += dt
+            fired = scheduler.pop_due(clock[0])
+            fired_total += len(fired)
+            for callback_name, entity_id in fired:
+                scheduler.schedule(clock[0] + rng.uniform(0.1, 5.0), callback_name, entity_id)
+
+    samples = time_calls(frame, repeat=frames, warmup=0)
+    return fired_total / frames, summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pending', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for pending in args.pending:
+        for mode in ('list', 'heap'):
+            fired, timing = run(mode, pending, args.frames, args.seed)
+            rows.append((pending, mode, f"{fired:.1f}", timing['mean'], timing['p95']))
+
+    print_table(['pending', 'scheduler', 'fired/frame', 'ms/frame', 'p95 ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
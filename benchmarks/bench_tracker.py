@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Object tracker benchmark on synthetic volleys.
+
+Simulates volleys of projectiles thrown from the same spot toward a wall
+(crossing, ballistic trajectories with detection noise and dropped
+detections) and tracks them with:
+
+- greedy:    the previous ObjectDetectionBackend matching (each track takes
+             its nearest unclaimed detection within 100 px, no prediction)
+- hungarian: MultiObjectTracker (constant-velocity prediction, gated
+             global assignment)
+
+Reports the ID-switch rate (detections whose track id differs from the id
+the same true object had in its previous detection) and per-frame cost.
+
+Usage:
+    python benchmarks/bench_tracker.py
+    python benchmarks/bench_tracker.py --objects 4 8 16 --noise 2 --drop 0.05
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from common import print_table
+
+from ams.object_detection import MultiObjectTracker
+
+FPS = 60
+
+
+class GreedyTracker:
+    """Previous backend matching: nearest unclaimed detection per track."""
+
+    def __init__(self, gate: float = 100.0):
+        self.gate = gate
+        self.tracks = {}
+        self.next_id = 0
+
+    def update(self, positions, timestamp):
+        ids = [None] * len(positions)
+        current = {}
+        for track_id, (tx, ty) in self.tracks.items():
+            best, best_dist = None, float('inf')
+            for i, (x, y) in enumerate(positions):
+                if ids[i] is not None:
+                    continue
+                dist = math.sqrt((x - tx) ** 2 + (y - ty) ** 2)
+                if dist < best_dist and dist < self.gate:
+                    best, best_dist = i, dist
+            if best is not None:
+                ids[best] = track_id
+                current[track_id] = positions[best]
+        for i, position in enumerate(positions):
+            if ids[i] is None:
+                ids[i] = self.next_id
+                current[self.next_id] = position
+                self.next_id += 1
+        self.tracks = current
+        return ids
+
+
+def simulate(objects: int, frames: int, noise: float, drop: float, seed: int):
+    """Per frame: list of (true_object, x, y) detections."""
+    rng = np.random.default_rng(seed)
+    start = rng.uniform([500, 650], [780, 700], (objects, 2))
+    velocity = np.column_stack([rng.uniform(-500, 500, objects), rng.uniform(-900, -600, objects)])
+    launch = rng.integers(0, frames // 3, objects)
+    gravity = 900.0
+    output = []
+    for frame in range(frames):
+        detections = []
+        for obj in range(objects):
+            t = (frame - launch[obj]) / FPS
+            if t < 0 or rng.random() < drop:
+                continue
+            x = start[obj, 0] + velocity[obj, 0] * t
+            y = start[obj, 1] + velocity[obj, 1] * t + 0.5 * gravity * t * t
+            if 0 <= x < 1280 and 0 <= y < 720:
+                detections.append((obj, x + rng.normal(0, noise), y + rng.normal(0, noise)))
+        rng.shuffle(detections)
+        output.append(detections)
+    return output
+
+
+def run(tracker, frames, array_input: bool):
+    last_id = {}
+    switches = matched = 0
+    elapsed = []
+    for frame, detections in enumerate(frames):
+        positions = [(x, y) for _, x, y in detections]
+        start = time.perf_counter()
+        if array_input:
+            ids, _ = tracker.update(np.array(positions).reshape(-1, 2), frame / FPS)
+            ids = ids.tolist()
+        else:
+            ids = tracker.update(positions, frame / FPS)
+        elapsed.append((time.perf_counter() - start) * 1000)
+        for (obj, _, _), track_id in zip(detections, ids):
+            if obj in last_id:
+                matched += 1
+                switches += last_id[obj] != track_id
+            last_id[obj] = track_id
+    return switches / matched if matched else 0.0, float(np.mean(elapsed)), float(np.percentile(elapsed, 95))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--objects', type=int, nargs='+', default=[4, 8, 16])
+    parser.add_argument('--frames', type=int, default=180)
+    parser.add_argument('--noise', type=float, default=1.5, help='Detection noise (px, std dev)')
+    parser.add_argument('--drop', type=float, default=0.03, help='Probability a detection is missed')
+    parser.add_argument('--seeds', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    for objects in args.objects:
+        for name in ('greedy', 'hungarian'):
+            rates, means, p95s = [], [], []
+            for seed in range(args.seeds):
+                frames = simulate(objects, args.frames, args.noise, args.drop, seed)
+                if name == 'greedy':
+                    rate, mean, p95 = run(GreedyTracker(), frames, array_input=False)
+                else:
+                    rate, mean, p95 = run(MultiObjectTracker(gate=100.0), frames, array_input=True)
+                rates.append(rate)
+                means.append(mean)
+                p95s.append(p95)
+            rows.append((objects, name, f"{np.mean(rates):.2%}", float(np.mean(means)),
+                         float(np.mean(p95s))))
+
+    print(f"{args.frames} frames at {FPS} fps, noise {args.noise}px, drop {args.drop:.0%}, "
+          f"{args.seeds} seeds")
+    print_table(['objects', 'tracker', 'id switches', 'ms/frame', 'p95 ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Builds GameEngine instances from inline YAML (same approach as
+InlineGameHarness) and provides simple timing/report utilities.
+"""
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+# Headless pygame, quiet logs
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('AMS_LOG_LEVEL', 'WARNING')
+
+# Ensure project root is on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+class InlineGame:
+    """Context manager that creates a GameEngine from an inline YAML string.
+
+    Usage:
+        with InlineGame(yaml_def, width=800, height=600) as game:
+            game.update(1 / 60)
+    """
+
+    def __init__(self, game_yaml: str, width: int = 800, height: int = 600, **kwargs):
+        self.game_yaml = game_yaml
+        self.width = width
+        self.height = height
+        self.kwargs = kwargs
+        self._temp_dir = None
+        self.game = None
+
+    def __enter__(self):
+        from ams.content_fs import ContentFS
+        from ams.games.game_engine import GameEngine
+
+        content_fs = ContentFS(PROJECT_ROOT, add_user_layer=False)
+        self._temp_dir = tempfile.mkdtemp(prefix='ams_bench_game_')
+        game_yaml_path = Path(self._temp_dir) / 'game.yaml'
+        game_yaml_path.write_text(self.game_yaml)
+        content_fs.add_game_layer(Path(self._temp_dir))
+
+        game_class = GameEngine.from_yaml(game_yaml_path)
+        kwargs = {'rollback_enabled': False, **self.kwargs}
+        self.game = game_class(
+            content_fs=content_fs, width=self.width, height=self.height, **kwargs
+        )
+        return self.game
+
+    def __exit__(self, *exc):
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+        return False
+
+
+def time_calls(fn: Callable[[], Any], repeat: int, warmup: int = 2) -> List[float]:
+    """Call fn repeatedly and return per-call durations in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Summarize timing samples (ms) as mean/median/p95."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        'mean': statistics.fmean(ordered),
+        'median': statistics.median(ordered),
+        'p95': p95,
+    }
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Print rows as a fixed-width text table."""
+    cells = [[str(h) for h in headers]]
+    for row in rows:
+        cells.append([f"{v:.3f}" if isinstance(v, float) else str(v) for v in row])
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    for index, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if index == 0:
+            print("  ".join("-" * w for w in widths))
@@ -8,7 +8,7 @@ Provides clean API for game engine integration.
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 from models import (
@@ -25,7 +25,8 @@ from calibration.pattern_detector import ArucoPatternDetector
 from calibration.homography import (
     compute_homography,
     compute_inverse_homography,
-    apply_homography_single
+    apply_homography_single,
+    transform_points,
 )
 
 
@@ -51,6 +52,9 @@ class CalibrationManager:
         self._calibration: Optional[CalibrationData] = None
         self._H_cam_to_proj: Optional[np.ndarray] = None  # Cached numpy matrix
         self._H_proj_to_cam: Optional[np.ndarray] = None  # Cached inverse
+        self._H_cam_to_game: Optional[np.ndarray] = None  # Camera px -> normalized game
+        self._cam_to_game_coeffs: Tuple[float, ...] = ()  # Same, flattened for scalar math
+        self._remap_cache: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
 
         if calibration_file:
             self.load_calibration(calibration_file)
@@ -73,6 +77,7 @@ class CalibrationManager:
         self._calibration = CalibrationData.load(filepath)
         self._H_cam_to_proj = self._calibration.homography_camera_to_projector.to_numpy()
         self._H_proj_to_cam = np.linalg.inv(self._H_cam_to_proj)
+        self._update_game_transform()
 
         print(f"Loaded calibration from {filepath}")
         print(f"  Quality: RMS error = {self._calibration.quality.reprojection_error_rms:.2f}px")
@@ -105,18 +110,107 @@ class CalibrationManager:
         if not self.is_calibrated():
             raise RuntimeError("No calibration loaded. Run calibrate() first.")
 
-        # Transform camera → projector
-        cam_pt = np.array([[camera_point.x, camera_point.y]], dtype=np.float32)
-        proj_pt = cv2.perspectiveTransform(
-            cam_pt.reshape(-1, 1, 2),
-            self._H_cam_to_proj
-        )[0][0]
+        # Camera → projector → normalized game space in one matrix; plain
+        # float math avoids array allocation for a single point
+        h00, h01, h02, h10, h11, h12, h20, h21, h22 = self._cam_to_game_coeffs
+        x, y = camera_point.x, camera_point.y
+        w = h20 * x + h21 * y + h22
+        if w == 0:
+            return Point2D(x=float('inf'), y=float('inf'))
+
+        return Point2D(x=(h00 * x + h01 * y + h02) / w, y=(h10 * x + h11 * y + h12) / w)
+
+    def camera_to_game_points(self, camera_points: np.ndarray) -> np.ndarray:
+        """
+        Transform many camera-space points to game space in one call.
+
+        Args:
+            camera_points: Array whose last dimension is (x, y) camera pixels,
+                e.g. (N, 2) detections or an (N, 1, 2) contour
+
+        Returns:
+            float64 array of normalized game coordinates, same shape
+
+        Raises:
+            RuntimeError: If not calibrated
+        """
+        if not self.is_calibrated():
+            raise RuntimeError("No calibration loaded. Run calibrate() first.")
+
+        return transform_points(self._H_cam_to_game, camera_points)
+
+    def get_game_remap(self, size: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lookup maps that warp camera frames into game space with cv2.remap.
+
+        For every pixel of a (width, height) game-space image the maps hold
+        the camera pixel it samples from. They are computed once per size
+        (fixed-point, for fast remapping) and cached until the calibration
+        changes.
+
+        Args:
+            size: (width, height) of the game-space image
+
+        Returns:
+            (map1, map2) for cv2.remap
 
-        # Normalize to game space [0, 1]
-        game_x = proj_pt[0] / self._calibration.projector_resolution.width
-        game_y = proj_pt[1] / self._calibration.projector_resolution.height
+        Raises:
+            RuntimeError: If not calibrated
+        """
+        if not self.is_calibrated():
+            raise RuntimeError("No calibration loaded. Run calibrate() first.")
 
-        return Point2D(x=game_x, y=game_y)
+        size = (int(size[0]), int(size[1]))
+        maps = self._remap_cache.get(size)
+        if maps is None:
+            width, height = size
+            # Game-image pixels → normalized game → camera pixels
+            H_image_to_cam = np.linalg.inv(self._H_cam_to_game) @ np.diag([1 / width, 1 / height, 1.0])
+            grid = np.stack(np.meshgrid(np.arange(width), np.arange(height)), axis=-1)
+            camera = transform_points(H_image_to_cam, grid).astype(np.float32)
+            maps = cv2.convertMaps(camera[..., 0], camera[..., 1], cv2.CV_16SC2)
+            self._remap_cache[size] = maps
+        return maps
+
+    def warp_to_game(
+        self,
+        frame: np.ndarray,
+        size: Optional[Tuple[int, int]] = None,
+        interpolation: int = cv2.INTER_LINEAR
+    ) -> np.ndarray:
+        """
+        Warp a camera frame into game space.
+
+        Pixel (u, v) of the result is game position (u / width, v / height),
+        so detection run on the warped frame yields game coordinates
+        directly. Areas outside the camera view are black.
+
+        Args:
+            frame: Camera image
+            size: (width, height) of the result (default: projector resolution)
+            interpolation: cv2 interpolation flag
+
+        Returns:
+            Warped image of the given size
+
+        Raises:
+            RuntimeError: If not calibrated
+        """
+        if size is None:
+            if not self.is_calibrated():
+                raise RuntimeError("No calibration loaded. Run calibrate() first.")
+            resolution = self._calibration.projector_resolution
+            size = (resolution.width, resolution.height)
+        map1, map2 = self.get_game_remap(size)
+        return cv2.remap(frame, map1, map2, interpolation, borderMode=cv2.BORDER_CONSTANT)
+
+    def _update_game_transform(self) -> None:
+        """Cache the camera → normalized game matrix; drop stale remap tables."""
+        resolution = self._calibration.projector_resolution
+        normalize = np.diag([1 / resolution.width, 1 / resolution.height, 1.0])
+        self._H_cam_to_game = normalize @ self._H_cam_to_proj
+        self._cam_to_game_coeffs = tuple(self._H_cam_to_game.ravel().tolist())
+        self._remap_cache.clear()
 
     def game_to_projector(self, game_point: Point2D) -> Point2D:
         """
@@ -389,6 +483,7 @@ class CalibrationManager:
 
         # Store calibration
         self._calibration = calibration_data
+        self._update_game_transform()
 
         # Auto-save if configured
         if self.config.auto_save:
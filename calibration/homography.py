@@ -118,6 +118,29 @@ def _compute_quality_metrics(
     )
 
 
+def transform_points(H: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Apply a homography to an array of points in one vectorized call.
+
+    Accepts any array whose last dimension is 2: (N, 2) point lists,
+    (N, 1, 2) OpenCV contours, (H, W, 2) grids. Points mapping to infinity
+    come back as inf/nan.
+
+    Args:
+        H: 3x3 homography matrix
+        points: Array of (x, y) points
+
+    Returns:
+        float64 array of transformed points, same shape as points
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    flat = pts.reshape(-1, 2)
+    homogeneous = flat @ H[:, :2].T + H[:, 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        transformed = homogeneous[:, :2] / homogeneous[:, 2:3]
+    return transformed.reshape(pts.shape)
+
+
 def apply_homography(
     H: HomographyMatrix,
     points: List[Point2D]
@@ -135,23 +158,11 @@ def apply_homography(
     if not points:
         return []
 
-    # Convert to numpy
-    H_np = H.to_numpy()
-    pts = np.array([[p.x, p.y] for p in points], dtype=np.float32)
-
-    # Reshape for perspectiveTransform (needs Nx1x2)
-    pts_reshaped = pts.reshape(-1, 1, 2)
-
-    # Apply transformation
-    transformed = cv2.perspectiveTransform(pts_reshaped, H_np)
+    pts = np.array([[p.x, p.y] for p in points], dtype=np.float64)
+    transformed = transform_points(H.to_numpy(), pts)
 
     # Convert back to Point2D list
-    result = [
-        Point2D(x=float(pt[0][0]), y=float(pt[0][1]))
-        for pt in transformed
-    ]
-
-    return result
+    return [Point2D(x=x, y=y) for x, y in transformed.tolist()]
 
 
 def apply_homography_single(
@@ -293,6 +293,10 @@ def _copy_ams_modules(output_dir: Path):
     shutil.copy2(lua_src / "entity.py", lua_dst / "entity.py")
     print(f"  Copied: ams/lua/entity.py")
 
+    # Copy scheduler.py (CallbackScheduler, shared with lua_bridge.py)
+    shutil.copy2(lua_src / "scheduler.py", lua_dst / "scheduler.py")
+    print(f"  Copied: ams/lua/scheduler.py")
+
     # Create __init__.py that redirects engine to browser version
     # Must also export LuaAPIBase from api.py for GameLuaAPI to extend
     (lua_dst / "__init__.py").write_text(
@@ -337,6 +341,12 @@ def _copy_ams_modules(output_dir: Path):
         shutil.copy2(ide_js, output_dir / "ide_bridge.js")
         print(f"  Copied: ide_bridge.js")
 
+    # Copy entity sync benchmark page (loads fengari_bridge.js)
+    bench_html = BROWSER_DIR / "bench_sync.html"
+    if bench_html.exists():
+        shutil.copy2(bench_html, output_dir / "bench_sync.html")
+        print(f"  Copied: bench_sync.html")
+
     # Create root-level lua/ directory for subroutine loading
     # Engine looks for lua/{type}/ at ContentFS root, which maps to working directory
     lua_root_dst = output_dir / "lua"
@@ -501,6 +511,12 @@ def _copy_static_assets(output_dir: Path, build_id: str = "unknown"):
         shutil.copy2(ide_src, served_dir / "ide_bridge.js")
         print(f"  Copied ide_bridge.js to served directory")
 
+    # Copy bench_sync.html to served directory
+    bench_src = output_dir / "bench_sync.html"
+    if bench_src.exists():
+        shutil.copy2(bench_src, served_dir / "bench_sync.html")
+        print(f"  Copied bench_sync.html to served directory")
+
     # Copy launcher.html to served directory
     launcher_src = output_dir / "launcher.html"
     if launcher_src.exists():
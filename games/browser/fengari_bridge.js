@@ -5,7 +5,8 @@
  * Based on the Python Lupa architecture in ams/lua/engine.py.
  *
  * Architecture:
- *   - Entity storage in JavaScript (mirrors Python's LuaEngine.entities)
+ *   - Entity storage in JavaScript (mirrors Python's LuaEngine.entities),
+ *     kept between frames and updated from Python's per-frame deltas
  *   - ams.* API exposed as JavaScript functions callable from Lua
  *   - Subroutines loaded and called synchronously (like Lupa)
  *   - Python sends messages -> bridge executes Lua -> returns results
@@ -716,6 +717,59 @@
         entities = newEntities;
     }
 
+    // Numeric fields of binary sync, in mask bit order (lua_bridge.NUMERIC_FIELDS)
+    const NUMERIC_FIELDS = ['x', 'y', 'vx', 'vy', 'width', 'height', 'health'];
+
+    function decodeFloat64(base64) {
+        const binary = atob(base64);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new Float64Array(bytes.buffer);
+    }
+
+    /**
+     * Merge a delta from Python's EntitySyncEncoder into the entity store.
+     * See the lua_bridge.py module docstring for the message format.
+     */
+    function applyEntitySync(sync) {
+        if (sync.reset) {
+            entities = {};
+        }
+
+        for (const id of sync.destroyed || []) {
+            delete entities[id];
+        }
+
+        const spawned = sync.spawned || {};
+        for (const id in spawned) {
+            entities[id] = spawned[id];
+        }
+
+        const changed = sync.changed || {};
+        for (const id in changed) {
+            const e = entities[id];
+            if (e) Object.assign(e, changed[id]);
+        }
+
+        const numeric = sync.numeric;
+        if (numeric) {
+            const values = decodeFloat64(numeric.values);
+            let v = 0;
+            for (let i = 0; i < numeric.ids.length; i++) {
+                const e = entities[numeric.ids[i]];
+                const mask = numeric.masks[i];
+                for (let f = 0; f < NUMERIC_FIELDS.length; f++) {
+                    if (mask & (1 << f)) {
+                        if (e) e[NUMERIC_FIELDS[f]] = values[v];
+                        v++;
+                    }
+                }
+            }
+        }
+    }
+
     // =========================================================================
     // Subroutine Loading
     // =========================================================================
@@ -919,11 +973,18 @@
                 gameState.elapsedTime = data.elapsed_time || 0;
                 gameState.score = data.score || 0;
 
+                // Delta sync updates the store in place; full sync replaces it
+                if (data.sync) {
+                    applyEntitySync(data.sync);
+                } else {
+                    updateEntities(data.entities || {});
+                }
+
                 if (gameState.elapsedTime < 0.5) {
-                    console.log('[FENGARI] lua_update received, entities:', Object.keys(data.entities || {}).length);
+                    console.log('[FENGARI] lua_update received, entities:', Object.keys(entities).length);
                 }
 
-                const results = executeBehaviorUpdates(data.dt, data.entities);
+                const results = executeBehaviorUpdates(data.dt, entities);
 
                 window.luaResponses.push(JSON.stringify({
                     type: 'lua_update_result',
@@ -987,6 +1048,8 @@
         loadSubroutine,
         executeBehaviorUpdates,
         executeCollisionAction,
+        updateEntities,
+        applyEntitySync,
         isReady: () => luaReady,
         isCrashed: () => luaCrashed,
         getCrashError: () => luaCrashError,
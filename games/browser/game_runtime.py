@@ -283,8 +283,12 @@ class BrowserGameRuntime:
                 # No game loaded - show loading screen
                 self._render_loading_screen()
 
-            # Update display
-            pygame.display.flip()
+            # Update display (only changed regions when the game reports them)
+            dirty_rects = self.game.get_dirty_rects() if self.game else None
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
 
             # CRITICAL: Yield to browser event loop
             await asyncio.sleep(0)
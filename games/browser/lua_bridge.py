@@ -22,13 +22,41 @@ Architecture:
 This avoids async back-and-forth during Lua execution - all ams.* calls
 operate on a local snapshot in JavaScript. Fengari is synchronous, unlike
 WASMOON, which means cleaner execution flow and no memory corruption issues.
+
+State sync:
+    The JavaScript side keeps its own entity store between frames. With
+    delta_sync (the default), each lua_update carries only what changed
+    since the previous frame (EntitySyncEncoder), with changed numeric
+    fields packed into a Float64Array unless binary_sync=False:
+
+        sync = {
+            'reset': bool,                  # JS clears its store first
+            'spawned': {id: to_dict()},     # entities new to the store
+            'changed': {id: {field: value}},
+            'destroyed': [id, ...],         # dead or removed entities
+            'numeric': {                    # binary_sync only
+                'ids': [id, ...],
+                'masks': [int, ...],        # bit i = NUMERIC_FIELDS[i] sent
+                'values': str,              # base64 little-endian Float64Array
+            },
+        }
+
+    Fields that Lua changed are not sent back, since the JS store already
+    holds them. With delta_sync=False every alive entity is sent in full
+    as 'entities', as before.
 """
 
+import base64
+import copy
 import json
 import sys
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Protocol, TYPE_CHECKING
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, TYPE_CHECKING
+
+from ams.lua.scheduler import CallbackScheduler
 
 if sys.platform == "emscripten":
     import platform as browser_platform
@@ -151,6 +179,188 @@ class ScheduledCallback:
     entity_id: str
 
 
+# Entity fields kept in sync with the JavaScript store (to_dict() without id)
+SYNC_FIELDS = (
+    'entity_type', 'alive', 'x', 'y', 'vx', 'vy', 'width', 'height', 'color', 'sprite',
+    'health', 'visible', 'behaviors', 'behavior_config', 'tags', 'properties',
+    'spawn_time', 'parent_id', 'parent_offset', 'children',
+)
+
+# Fields packed into the Float64Array with binary sync, in mask bit order
+NUMERIC_FIELDS = ('x', 'y', 'vx', 'vy', 'width', 'height', 'health')
+
+_FIELD_INDEX = {name: index for index, name in enumerate(SYNC_FIELDS)}
+_NUMERIC_BITS = {_FIELD_INDEX[name]: 1 << bit for bit, name in enumerate(NUMERIC_FIELDS)}
+_PROPERTIES = _FIELD_INDEX['properties']
+_PARENT_OFFSET = _FIELD_INDEX['parent_offset']
+_sync_state = attrgetter(*SYNC_FIELDS)
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy containers so later in-place edits show up as changes."""
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+def _wire(index: int, value: Any) -> Any:
+    """Convert a field value to what to_dict() would send."""
+    if index == _PARENT_OFFSET:
+        return list(value)
+    return value
+
+
+class EntitySyncEncoder:
+    """Builds the per-frame entity delta for the JavaScript entity store.
+
+    Remembers the field values the JS store holds for every entity it has
+    sent and compares each alive entity against them, so unchanged
+    entities cost one tuple comparison and are not serialized at all.
+
+    Args:
+        binary: Pack changed numeric fields into a base64 Float64Array
+            instead of sending them as JSON numbers
+    """
+
+    def __init__(self, binary: bool = False):
+        self.binary = binary
+        self._sent: Dict[str, tuple] = {}
+        self._reset = True
+        self.frames = 0
+        self.entities_spawned = 0
+        self.entities_changed = 0
+        self.entities_destroyed = 0
+        self.fields_sent = 0
+
+    def reset(self) -> None:
+        """Send every entity in full on the next encode(), replacing the JS store."""
+        self._sent.clear()
+        self._reset = True
+
+    def encode(self, entities: Iterable[EntityBrowser]) -> Dict[str, Any]:
+        """Build the sync message for the alive entities (see module docstring)."""
+        sent = self._sent
+        binary = self.binary
+        seen = set()
+        spawned: Dict[str, Dict[str, Any]] = {}
+        changed: Dict[str, Dict[str, Any]] = {}
+        numeric_ids: List[str] = []
+        masks: List[int] = []
+        values = array('d')
+        fields_sent = 0
+
+        for entity in entities:
+            if not entity.alive:
+                continue
+            entity_id = entity.id
+            seen.add(entity_id)
+            state = _sync_state(entity)
+            previous = sent.get(entity_id)
+            if previous is None:
+                spawned[entity_id] = entity.to_dict()
+                sent[entity_id] = tuple(map(_snapshot, state))
+                fields_sent += len(state)
+                continue
+            if state == previous:
+                continue
+
+            fields: Dict[str, Any] = {}
+            mask = 0
+            snapshot = list(previous)
+            for index, value in enumerate(state):
+                if value == previous[index]:
+                    continue
+                snapshot[index] = _snapshot(value)
+                bit = _NUMERIC_BITS.get(index) if binary else None
+                if bit is not None and isinstance(value, (int, float)):
+                    mask |= bit
+                else:
+                    fields[SYNC_FIELDS[index]] = _wire(index, value)
+            sent[entity_id] = tuple(snapshot)
+
+            if fields:
+                changed[entity_id] = fields
+                fields_sent += len(fields)
+            if mask:
+                numeric_ids.append(entity_id)
+                masks.append(mask)
+                # Values follow the mask bits, lowest bit first
+                for index, bit in _NUMERIC_BITS.items():
+                    if mask & bit:
+                        values.append(state[index])
+                fields_sent += bin(mask).count('1')
+
+        destroyed = [entity_id for entity_id in sent if entity_id not in seen]
+        for entity_id in destroyed:
+            del sent[entity_id]
+
+        sync: Dict[str, Any] = {
+            'reset': self._reset,
+            'spawned': spawned,
+            'changed': changed,
+            'destroyed': destroyed,
+        }
+        if numeric_ids:
+            if sys.byteorder != 'little':
+                values.byteswap()
+            sync['numeric'] = {
+                'ids': numeric_ids,
+                'masks': masks,
+                'values': base64.b64encode(values.tobytes()).decode('ascii'),
+            }
+
+        self._reset = False
+        self.frames += 1
+        self.entities_spawned += len(spawned)
+        self.entities_changed += len(set(changed).union(numeric_ids))
+        self.entities_destroyed += len(destroyed)
+        self.fields_sent += fields_sent
+        return sync
+
+    def acknowledge(self, entity_id: str, changes: Dict[str, Any]) -> None:
+        """Record field changes the JS store already holds (Lua results).
+
+        Args:
+            entity_id: Entity the changes were made to
+            changes: Changed fields as returned by JavaScript; 'properties'
+                holds only the changed keys, as in EntityBrowser.apply_changes()
+        """
+        previous = self._sent.get(entity_id)
+        if previous is None:
+            return
+        snapshot = list(previous)
+        for key, value in changes.items():
+            index = _FIELD_INDEX.get(key)
+            if index is None:
+                continue
+            if index == _PROPERTIES:
+                properties = dict(snapshot[index])
+                properties.update(_snapshot(value))
+                snapshot[index] = properties
+            elif index == _PARENT_OFFSET:
+                snapshot[index] = tuple(value)
+            else:
+                snapshot[index] = _snapshot(value)
+        self._sent[entity_id] = tuple(snapshot)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get sync statistics.
+
+        Returns:
+            Dict with frames, tracked (entities in the JS store) and totals
+            of entities_spawned, entities_changed, entities_destroyed and
+            fields_sent
+        """
+        return {
+            'frames': self.frames,
+            'tracked': len(self._sent),
+            'entities_spawned': self.entities_spawned,
+            'entities_changed': self.entities_changed,
+            'entities_destroyed': self.entities_destroyed,
+            'fields_sent': self.fields_sent,
+        }
+
+
 class LuaEngineBrowser:
     """
     Browser-compatible Lua engine using Fengari via JavaScript.
@@ -158,6 +368,15 @@ class LuaEngineBrowser:
     Provides the same interface as native LuaEngine but executes Lua
     in JavaScript. State is serialized before execution and changes
     are applied after.
+
+    Args:
+        content_fs: Browser content filesystem
+        screen_width: Screen width exposed to Lua
+        screen_height: Screen height exposed to Lua
+        api_class: Accepted for LuaEngine compatibility (JS has its own API)
+        expression_cache_size: Accepted for LuaEngine compatibility
+        delta_sync: Send only entity changes each frame (see module docstring)
+        binary_sync: With delta_sync, pack numeric fields as a Float64Array
     """
 
     def __init__(
@@ -166,7 +385,12 @@ class LuaEngineBrowser:
         screen_width: float = 800,
         screen_height: float = 600,
         api_class: Optional[type] = None,
+        expression_cache_size: int = 0,
+        delta_sync: bool = True,
+        binary_sync: bool = True,
     ):
+        # expression_cache_size is accepted for LuaEngine compatibility;
+        # expressions are evaluated in Python here and not cached
         self._content_fs = content_fs
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -183,8 +407,8 @@ class LuaEngineBrowser:
         self._lifecycle_provider: Optional[LifecycleProvider] = None
         self._destroy_callback: Optional[Callable] = None
 
-        # Scheduled callbacks
-        self._scheduled: List[ScheduledCallback] = []
+        # Scheduled callbacks, keyed on absolute due time
+        self._scheduler = CallbackScheduler()
 
         # Sound queue
         self._sound_queue: List[str] = []
@@ -192,6 +416,11 @@ class LuaEngineBrowser:
         # Pending spawns from Lua (collected during JS execution)
         self._pending_spawns: List[Dict[str, Any]] = []
 
+        # Entity deltas for the JS entity store (None = full state every frame)
+        self._sync: Optional[EntitySyncEncoder] = (
+            EntitySyncEncoder(binary=binary_sync) if delta_sync else None
+        )
+
         # API instance (for compatibility - not actually used in browser)
         self._api = None
         if api_class:
@@ -372,6 +601,17 @@ class LuaEngineBrowser:
         """Check if a subroutine is loaded."""
         return name in self._subroutines[sub_type]
 
+    def get_subroutine_method(self, sub_type: str, name: str, method: str) -> Optional[Any]:
+        """Get a subroutine function (always None: behaviors run in JavaScript)."""
+        return None
+
+    def call_batched(self, batches: List[tuple], *args) -> List[tuple]:
+        """Batched dispatch (no-op: lua_update runs behaviors in JavaScript)."""
+        return []
+
+    def notify_destroyed(self, entity_id: str) -> None:
+        """Record a destroyed entity (no-op: JavaScript has no batch in flight)."""
+
     # =========================================================================
     # Entity Management
     # =========================================================================
@@ -399,12 +639,9 @@ class LuaEngineBrowser:
         """Update all entities - executes Lua behaviors in JavaScript."""
         self.elapsed_time += dt
 
-        # Update scheduled callbacks
-        for scheduled in self._scheduled[:]:
-            scheduled.time_remaining -= dt
-            if scheduled.time_remaining <= 0:
-                self._call_scheduled_callback(scheduled)
-                self._scheduled.remove(scheduled)
+        # Fire scheduled callbacks that are due
+        for callback_name, entity_id in self._scheduler.pop_due(self.elapsed_time):
+            self._call_scheduled_callback(callback_name, entity_id)
 
         # Execute behavior updates via JavaScript
         self._execute_behavior_updates(dt)
@@ -412,6 +649,7 @@ class LuaEngineBrowser:
         # Remove dead entities
         dead_ids = [eid for eid, e in self.entities.items() if not e.alive]
         for eid in dead_ids:
+            self._scheduler.cancel_entity(eid)
             entity = self.entities.get(eid)
             if entity:
                 if self._destroy_callback:
@@ -431,19 +669,19 @@ class LuaEngineBrowser:
             return
 
         # Browser mode - batch execute in JavaScript
-        # Serialize entity state
-        entities_data = {}
-        for eid, entity in self.entities.items():
-            if entity.alive:
-                entities_data[eid] = entity.to_dict()
-
-        # Send to JavaScript for execution
-        self._send_to_js('lua_update', {
+        data = {
             'dt': dt,
             'elapsed_time': self.elapsed_time,
             'score': self.score,
-            'entities': entities_data,
-        })
+        }
+        if self._sync is not None:
+            data['sync'] = self._sync.encode(self.entities.values())
+        else:
+            data['entities'] = {eid: entity.to_dict()
+                                for eid, entity in self.entities.items() if entity.alive}
+
+        # Send to JavaScript for execution
+        self._send_to_js('lua_update', data)
 
         # Results are processed asynchronously via message queue
         # The game_runtime will poll for lua_update_result and call apply_lua_results
@@ -456,6 +694,8 @@ class LuaEngineBrowser:
             entity = self.entities.get(eid)
             if entity:
                 entity.apply_changes(changes)
+                if self._sync is not None:
+                    self._sync.acknowledge(eid, changes)
 
         # Update score
         if 'score' in results:
@@ -471,11 +711,7 @@ class LuaEngineBrowser:
 
         # Process scheduled callbacks
         for sched in results.get('scheduled', []):
-            self._scheduled.append(ScheduledCallback(
-                time_remaining=sched['delay'],
-                callback_name=sched['callback'],
-                entity_id=sched['entity_id'],
-            ))
+            self.schedule_callback(sched['delay'], sched['callback'], sched['entity_id'])
 
     # =========================================================================
     # Collision Actions
@@ -646,20 +882,36 @@ class LuaEngineBrowser:
                 'on_hit', entity, self, other.id, other_type, other_base_type
             )
 
-    def _call_scheduled_callback(self, scheduled: ScheduledCallback) -> None:
+    def _call_scheduled_callback(self, callback_name: str, entity_id: str) -> None:
         """Execute a scheduled callback."""
-        entity = self.entities.get(scheduled.entity_id)
+        entity = self.entities.get(entity_id)
         if entity is None or not entity.alive:
             return
 
         if self._lifecycle_provider:
             self._lifecycle_provider.dispatch_scheduled(
-                scheduled.callback_name, entity, self
+                callback_name, entity, self
             )
 
     def schedule_callback(self, delay: float, callback_name: str, entity_id: str) -> None:
         """Schedule a callback."""
-        self._scheduled.append(ScheduledCallback(delay, callback_name, entity_id))
+        self._scheduler.schedule(self.elapsed_time + delay, callback_name, entity_id)
+
+    def get_scheduled(self) -> List[ScheduledCallback]:
+        """Get pending callbacks, in firing order, with time left until each."""
+        now = self.elapsed_time
+        return [ScheduledCallback(due - now, callback_name, entity_id)
+                for due, callback_name, entity_id in self._scheduler.pending()]
+
+    def restore_scheduled(self, callbacks: List[ScheduledCallback]) -> None:
+        """Replace pending callbacks, timed relative to the current elapsed_time."""
+        now = self.elapsed_time
+        self._scheduler.restore((now + cb.time_remaining, cb.callback_name, cb.entity_id)
+                                for cb in callbacks)
+
+    def get_sync_stats(self) -> Optional[Dict[str, int]]:
+        """Get delta sync statistics (None with delta_sync off)."""
+        return self._sync.get_stats() if self._sync is not None else None
 
     def queue_sound(self, sound_name: str) -> None:
         """Queue a sound."""
@@ -684,9 +936,11 @@ class LuaEngineBrowser:
                 self._lifecycle_provider.on_entity_destroyed(entity, self)
 
         self.entities.clear()
-        self._scheduled.clear()
+        self._scheduler.clear()
         self._sound_queue.clear()
         self._pending_spawns.clear()
+        if self._sync is not None:
+            self._sync.reset()
         self.score = 0
         self.elapsed_time = 0.0
 
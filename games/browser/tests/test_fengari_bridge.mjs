@@ -571,6 +571,80 @@ test('schedule queues callbacks', () => {
     assertEqual(stateChanges.scheduled[1].callback, 'flash');
 });
 
+// ----------------------------------------------------------------------------
+// Delta Sync
+// ----------------------------------------------------------------------------
+
+console.log('\nDelta Sync:');
+
+const NUMERIC_FIELDS = ['x', 'y', 'vx', 'vy', 'width', 'height', 'health'];
+
+function applyEntitySync(entities, sync) {
+    if (sync.reset) {
+        for (const id of Object.keys(entities)) delete entities[id];
+    }
+    for (const id of sync.destroyed || []) delete entities[id];
+    for (const [id, e] of Object.entries(sync.spawned || {})) entities[id] = e;
+    for (const [id, fields] of Object.entries(sync.changed || {})) {
+        if (entities[id]) Object.assign(entities[id], fields);
+    }
+    if (sync.numeric) {
+        const bytes = Uint8Array.from(Buffer.from(sync.numeric.values, 'base64'));
+        const values = new Float64Array(bytes.buffer);
+        let v = 0;
+        sync.numeric.ids.forEach((id, i) => {
+            for (let f = 0; f < NUMERIC_FIELDS.length; f++) {
+                if (sync.numeric.masks[i] & (1 << f)) {
+                    if (entities[id]) entities[id][NUMERIC_FIELDS[f]] = values[v];
+                    v++;
+                }
+            }
+        });
+    }
+}
+
+test('sync spawns, changes and destroys entities in place', () => {
+    const entities = {};
+    applyEntitySync(entities, {
+        reset: true,
+        spawned: { e1: { x: 0, color: 'red' }, e2: { x: 5 } },
+        changed: {}, destroyed: []
+    });
+    const e1 = entities['e1'];
+
+    applyEntitySync(entities, {
+        reset: false, spawned: {},
+        changed: { e1: { color: 'blue' } },
+        destroyed: ['e2']
+    });
+
+    assertTrue(entities['e1'] === e1, 'store entry should be updated in place');
+    assertEqual(entities['e1'].color, 'blue');
+    assertEqual(entities['e1'].x, 0);
+    assertFalse('e2' in entities);
+});
+
+test('reset sync replaces the store', () => {
+    const entities = { old: { x: 1 } };
+    applyEntitySync(entities, { reset: true, spawned: { e1: { x: 2 } }, changed: {}, destroyed: [] });
+    assertDeepEqual(Object.keys(entities), ['e1']);
+});
+
+test('binary sync unpacks masked numeric fields', () => {
+    const entities = { e1: { x: 0, y: 0, health: 1 }, e2: { x: 0, vy: 0 } };
+    const values = Buffer.from(new Float64Array([10.5, 3, -2.25]).buffer).toString('base64');
+
+    applyEntitySync(entities, {
+        reset: false, spawned: {}, changed: {}, destroyed: [],
+        numeric: { ids: ['e1', 'e2'], masks: [1 | (1 << 6), 1 << 3], values }
+    });
+
+    assertEqual(entities['e1'].x, 10.5);
+    assertEqual(entities['e1'].y, 0);
+    assertEqual(entities['e1'].health, 3);
+    assertEqual(entities['e2'].vy, -2.25);
+});
+
 // ============================================================================
 // Summary
 // ============================================================================
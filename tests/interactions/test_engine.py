@@ -280,6 +280,47 @@ class TestEngineEvaluation:
         # No self-interaction
         assert len(events) == 0
 
+    def test_context_built_only_when_fired(self, engine, monkeypatch):
+        """Non-firing pairs never build context dicts."""
+        engine.register_entity_type("ball", {
+            "brick": {
+                "when": {"distance": 0},
+                "action": "bounce"
+            }
+        })
+        handler = MockHandler()
+        engine.register_action("bounce", handler)
+
+        ball = Entity(id="ball1", entity_type="ball", x=0, y=0, width=16, height=16,
+                      attributes={"speed": 5})
+        engine.add_entity(ball)
+        engine.add_entity(Entity(id="hit", entity_type="brick", x=10, y=10, width=70, height=25))
+        for i in range(5):
+            engine.add_entity(Entity(id=f"far{i}", entity_type="brick", x=500 + i * 100, y=0,
+                                     width=70, height=25))
+
+        to_dict_calls = []
+        original = Entity.to_dict
+        monkeypatch.setattr(Entity, "to_dict",
+                            lambda self: to_dict_calls.append(self.id) or original(self))
+
+        engine.evaluate()
+
+        assert sorted(to_dict_calls) == ["ball1", "hit"]
+        interaction = handler.calls[0]["interaction"]
+        assert interaction["a"]["speed"] == 5
+        assert interaction["b"]["id"] == "hit"
+        assert interaction["distance"] == 0
+
+    def test_register_compiles_filter_plans(self, engine):
+        """register_entity_type attaches a compiled plan to each interaction."""
+        interactions = engine.register_entity_type("ball", {
+            "brick": {"when": {"distance": 0}, "action": "bounce"},
+            "pointer": {"when": {"b.active": True}, "action": "grab"},
+        })
+
+        assert all(callable(i.plan) for i in interactions)
+
     def test_evaluate_updates_time(self, engine):
         """Evaluate updates system time."""
         initial_time = engine.system.time.absolute
@@ -288,6 +329,67 @@ class TestEngineEvaluation:
         assert engine.system.time.absolute == initial_time + 1.0
 
 
+class TestSpatialCandidates:
+    """Distance-bounded interactions only evaluate targets in range."""
+
+    INTERACTIONS = {
+        "bomb": {
+            "enemy": [
+                {"when": {"distance": {"lt": 40}, "from": "center", "to": "edge"},
+                 "action": "blast"},
+                {"when": {"distance": {"lte": 30}}, "because": "exit",
+                 "action": "leave"},
+            ],
+        },
+        "enemy": {
+            "enemy": {"when": {"distance": 0}, "action": "bump"},
+        },
+    }
+
+    def _run(self, spatial_index):
+        import random
+        rng = random.Random(5)
+        engine = InteractionEngine(spatial_index=spatial_index, spatial_min_targets=8)
+        for entity_type, interactions in self.INTERACTIONS.items():
+            engine.register_entity_type(entity_type, interactions)
+
+        for i in range(3):
+            engine.add_entity(Entity(id=f"bomb{i}", entity_type="bomb",
+                                     x=rng.uniform(0, 400), y=rng.uniform(0, 400),
+                                     width=10, height=10))
+        for i in range(60):
+            engine.add_entity(Entity(id=f"enemy{i}", entity_type="enemy",
+                                     x=rng.uniform(0, 400), y=rng.uniform(0, 400),
+                                     width=20, height=20))
+
+        fired = []
+        stats = []
+        for _ in range(20):
+            for entity_id in list(engine._entities):
+                engine.update_entity(entity_id,
+                                     x=engine.get_entity(entity_id).x + rng.uniform(-15, 15),
+                                     y=engine.get_entity(entity_id).y + rng.uniform(-15, 15))
+            events = engine.evaluate()
+            fired.append([(e.interaction.action, e.entity_a_id, e.entity_b_id) for e in events])
+            stats.append(engine.get_interaction_stats())
+        return fired, stats
+
+    def test_same_events_as_full_scan(self):
+        scan_events, scan_stats = self._run(spatial_index=False)
+        grid_events, grid_stats = self._run(spatial_index=True)
+
+        assert any(scan_events), "Expected some events"
+        assert any(("leave" in [e[0] for e in frame]) for frame in scan_events)
+        assert grid_events == scan_events
+
+        key = "enemy:enemy:bump"
+        assert sum(s[key]["matches"] for s in grid_stats) == \
+            sum(s[key]["matches"] for s in scan_stats)
+        assert sum(s[key]["candidates"] for s in grid_stats) < \
+            sum(s[key]["candidates"] for s in scan_stats)
+        assert scan_stats[0][key]["candidates"] == scan_stats[0][key]["targets"]
+
+
 class TestEngineLifecycle:
     """Tests for lifecycle handling."""
 
@@ -12,6 +12,7 @@ from ams.interactions.filter import (
     compute_distance_center_to_center,
     compute_distance_center_to_edge,
     compute_angle,
+    compile_filter,
     evaluate_filter,
 )
 from ams.interactions.parser import (
@@ -478,6 +479,111 @@ class TestEvaluateFilter:
         assert ctx.angle == pytest.approx(270, abs=5)
 
 
+class TestEvaluateFilterObjects:
+    """evaluate_filter on entity objects must match the dict path."""
+
+    FILTERS = [
+        {"distance": 0},
+        {"distance": {"lt": 30}, "angle": {"between": [180, 360]}},
+        {"distance": 0, "b.active": True},
+        {"a.hp": {"gt": 1}, "b.type": "brick"},
+    ]
+
+    def _entities(self):
+        from ams.interactions.engine import Entity
+        a = Entity(id="a", entity_type="ball", x=10, y=5, width=16, height=16,
+                   attributes={"hp": 3})
+        b = Entity(id="b", entity_type="brick", x=20, y=20, width=40, height=10,
+                   attributes={"active": True})
+        return a, b
+
+    @pytest.mark.parametrize("filter_dict", FILTERS)
+    def test_matches_dict_path(self, filter_dict):
+        filter_obj = _parse_filter(filter_dict)
+        a, b = self._entities()
+
+        obj_matches, obj_ctx = evaluate_filter(filter_obj, a, b)
+        dict_matches, dict_ctx = evaluate_filter(filter_obj, a.to_dict(), b.to_dict())
+
+        assert obj_matches == dict_matches
+        if dict_ctx is not None:
+            assert obj_ctx.distance == dict_ctx.distance
+            assert obj_ctx.angle == dict_ctx.angle
+            assert obj_ctx.entity_b is b
+
+    def test_bounds_view_of_dict(self):
+        """EntityBounds.from_dict keeps the dict for attribute filters."""
+        filter_obj = _parse_filter({"distance": 0, "b.active": True})
+        a, _ = self._entities()
+        pointer = {"x": 20, "y": 20, "width": 1, "height": 1, "active": True}
+
+        matches, ctx = evaluate_filter(filter_obj, a, EntityBounds.from_dict(pointer))
+
+        assert matches is True
+        assert ctx.entity_b.to_dict() is pointer
+
+
+class TestCompileFilter:
+    """Compiled plans must give the same results as evaluate_filter."""
+
+    FILTERS = [
+        {},
+        {"distance": 0},
+        {"distance": 0, "from": "center", "to": "center"},
+        {"distance": {"lt": 40}},
+        {"distance": {"lte": 25}, "from": "center", "to": "edge"},
+        {"distance": {"between": [10, 60]}, "from": "edge", "to": "center"},
+        {"distance": {"gt": 30}},
+        {"distance": 0, "angle": {"between": [225, 315]}},
+        {"b.active": True, "a.hp": {"gte": 2}},
+        {"a.kind": {"in": ["red", "blue"]}, "distance": {"lt": 50}},
+    ]
+
+    def _pairs(self, count=300):
+        import random
+        from ams.interactions.engine import Entity
+        rng = random.Random(7)
+        for i in range(count):
+            a = Entity(id=f"a{i}", entity_type="ball",
+                       x=rng.uniform(0, 100), y=rng.uniform(0, 100),
+                       width=rng.choice([8, 16]), height=rng.choice([8, 16]),
+                       attributes={"hp": rng.randint(0, 3),
+                                   "kind": rng.choice(["red", "blue", "green"])})
+            b = Entity(id=f"b{i}", entity_type="brick",
+                       x=rng.uniform(0, 100), y=rng.uniform(0, 100), width=30, height=10,
+                       attributes={"active": rng.random() < 0.5, "hp": 1})
+            yield a, b
+
+    @pytest.mark.parametrize("filter_dict", FILTERS)
+    def test_plan_matches_evaluate_filter(self, filter_dict):
+        filter_obj = _parse_filter(filter_dict)
+        plan = compile_filter(filter_obj)
+
+        for a, b in self._pairs():
+            expected, expected_ctx = evaluate_filter(filter_obj, a.to_dict(), b.to_dict())
+            matches, ctx = plan(a, b)
+            assert matches == expected
+            if expected:
+                assert ctx.distance == expected_ctx.distance
+                assert ctx.angle == expected_ctx.angle
+
+    def test_no_angle_math_without_angle_filter(self, monkeypatch):
+        import ams.interactions.filter as filter_module
+        filter_obj = _parse_filter({"distance": 0})
+        plan = compile_filter(filter_obj)
+        far = [(a, b) for a, b in self._pairs(50)
+               if not evaluate_filter(filter_obj, a, b)[0]]
+
+        calls = []
+        original = filter_module.compute_angle
+        monkeypatch.setattr(filter_module, "compute_angle",
+                            lambda a, b: calls.append(1) or original(a, b))
+        for a, b in far:
+            plan(a, b)
+
+        assert far and not calls
+
+
 class TestBrickBreakerScenarios:
     """Real-world scenarios from BrickBreakerUltimate."""
 
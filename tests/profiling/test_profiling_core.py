@@ -110,6 +110,17 @@ class TestEnableDisable:
         disable()
         assert is_enabled() is False
 
+    def test_suspended_restores_previous_state(self):
+        enable()
+        with profiling.suspended():
+            assert is_enabled() is False
+        assert is_enabled() is True
+
+        disable()
+        with profiling.suspended():
+            pass
+        assert is_enabled() is False
+
 
 class TestFrameLifecycle:
     """Tests for begin_frame/end_frame lifecycle."""
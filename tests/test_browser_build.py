@@ -0,0 +1,43 @@
+"""Checks that the staged browser build only imports modules it ships."""
+
+import ast
+
+import pytest
+
+build = pytest.importorskip('games.browser.build')
+
+
+@pytest.fixture(scope='module')
+def staged_dir(tmp_path_factory):
+    output_dir = tmp_path_factory.mktemp('browser') / 'web'
+    build.prepare_build_dir(output_dir)
+    return output_dir
+
+
+def _module_level_ams_imports(source):
+    """Yield (lineno, module) for unguarded top-level `ams.*` imports.
+
+    Imports inside functions, TYPE_CHECKING blocks and try/except fallbacks
+    are lazy or optional, so only direct module-body statements count.
+    """
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules = [node.module]
+        elif isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        else:
+            continue
+        for module in modules:
+            if module.split('.')[0] == 'ams':
+                yield node.lineno, module
+
+
+def test_ams_imports_resolve_in_build(staged_dir):
+    missing = []
+    for py_file in sorted((staged_dir / 'ams').rglob('*.py')):
+        for lineno, module in _module_level_ams_imports(py_file.read_text()):
+            path = staged_dir.joinpath(*module.split('.'))
+            if not (path.with_suffix('.py').exists() or (path / '__init__.py').exists()):
+                missing.append(f"{py_file.relative_to(staged_dir)}:{lineno} {module}")
+
+    assert missing == []
@@ -0,0 +1,74 @@
+"""Tests for driving GameEngine lifecycle hooks through LuaEngineBrowser."""
+
+import os
+
+# Set headless mode for tests
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['AMS_LOG_LEVEL'] = 'WARNING'
+
+import pytest
+
+pytest.importorskip('pygame')
+
+from ams.games.game_engine import engine as engine_module
+from ams.games.game_engine.api import GameLuaAPI
+from ams.test_backend import InlineGameHarness
+from games.browser.lua_bridge import LuaEngineBrowser
+
+
+GAME = """
+name: "Test Browser Lifecycle"
+screen_width: 400
+screen_height: 300
+win_condition: reach_score
+win_target: 1000
+
+inline_behaviors:
+  drift:
+    lua: |
+      local drift = {}
+      function drift.on_spawn(id) end
+      function drift.on_update(id, dt) end
+      function drift.on_hit(id, other_id) end
+      function drift.on_destroy(id) end
+      function drift.tick(id) end
+      return drift
+
+entity_types:
+  mover:
+    width: 10
+    height: 10
+    color: white
+    behaviors: [drift]
+"""
+
+
+@pytest.fixture(params=[False, True], ids=['per_entity', 'batched'])
+def game(request, monkeypatch):
+    monkeypatch.setattr(engine_module, 'LuaEngine', LuaEngineBrowser)
+    harness = InlineGameHarness(GAME, batched_dispatch=request.param, rollback_enabled=False)
+    game = harness._create_game()
+    yield game
+    harness.cleanup()
+
+
+def test_spawn_dispatch_and_destroy(game):
+    lua_engine = game._behavior_engine
+    assert isinstance(lua_engine, LuaEngineBrowser)
+
+    game._clear_entities()
+    mover = game.spawn_entity('mover', 10, 20)
+    other = game.spawn_entity('mover', 50, 20)
+    assert lua_engine.get_entity(mover.id) is mover
+
+    lua_engine.update(0.1)
+    lua_engine.notify_hit(mover, other, 10.0, 20.0)
+    lua_engine.schedule_callback(0.05, 'tick', mover.id)
+    lua_engine.update(0.1)
+
+    GameLuaAPI(lua_engine).destroy(mover.id)
+    assert not mover.alive
+
+    lua_engine.update(0.1)
+    assert lua_engine.get_entity(mover.id) is None
+    assert lua_engine.get_entity(other.id) is other
@@ -0,0 +1,183 @@
+"""Tests for the browser bridge's delta entity sync (EntitySyncEncoder)."""
+
+import base64
+from array import array
+
+import pytest
+
+from games.browser.lua_bridge import (
+    EntityBrowser,
+    EntitySyncEncoder,
+    LuaEngineBrowser,
+    NUMERIC_FIELDS,
+    SYNC_FIELDS,
+)
+
+
+def make_entities(count=3):
+    return [EntityBrowser(id=f"e{i}", entity_type='ball', x=float(i), y=2.0 * i,
+                          behaviors=['bounce'], tags=['ball'], properties={'n': i})
+            for i in range(count)]
+
+
+def apply_sync(store, sync):
+    """Python reference of fengari_bridge.js applyEntitySync()."""
+    if sync['reset']:
+        store.clear()
+    for entity_id in sync['destroyed']:
+        store.pop(entity_id, None)
+    store.update(sync['spawned'])
+    for entity_id, fields in sync['changed'].items():
+        store[entity_id].update(fields)
+    numeric = sync.get('numeric')
+    if numeric:
+        values = array('d', base64.b64decode(numeric['values']))
+        position = 0
+        for entity_id, mask in zip(numeric['ids'], numeric['masks']):
+            for bit, name in enumerate(NUMERIC_FIELDS):
+                if mask & (1 << bit):
+                    store[entity_id][name] = values[position]
+                    position += 1
+
+
+def full_state(entities):
+    return {e.id: e.to_dict() for e in entities if e.alive}
+
+
+class TestEntitySyncEncoder:
+
+    def test_sync_fields_cover_to_dict(self):
+        assert set(SYNC_FIELDS) | {'id'} == set(EntityBrowser(id='a', entity_type='t').to_dict())
+
+    def test_first_frame_spawns_everything(self):
+        entities = make_entities()
+        sync = EntitySyncEncoder().encode(entities)
+
+        assert sync['reset'] is True
+        assert sync['spawned'] == full_state(entities)
+        assert sync['changed'] == {} and sync['destroyed'] == []
+
+    def test_unchanged_frame_is_empty(self):
+        entities = make_entities()
+        encoder = EntitySyncEncoder()
+        encoder.encode(entities)
+
+        sync = encoder.encode(entities)
+
+        assert sync == {'reset': False, 'spawned': {}, 'changed': {}, 'destroyed': []}
+
+    def test_only_changed_fields_are_sent(self):
+        entities = make_entities()
+        encoder = EntitySyncEncoder()
+        encoder.encode(entities)
+
+        entities[1].x = 50.0
+        entities[2].properties['n'] = 9
+        entities[2].parent_offset = (1.0, 2.0)
+        sync = encoder.encode(entities)
+
+        assert sync['changed'] == {
+            'e1': {'x': 50.0},
+            'e2': {'properties': {'n': 9}, 'parent_offset': [1.0, 2.0]},
+        }
+
+    def test_dead_and_removed_entities_are_destroyed(self):
+        entities = make_entities()
+        encoder = EntitySyncEncoder()
+        encoder.encode(entities)
+
+        entities[0].alive = False
+        sync = encoder.encode(entities[:2])
+
+        assert sorted(sync['destroyed']) == ['e0', 'e2']
+        assert encoder.get_stats()['tracked'] == 1
+
+    def test_acknowledged_lua_changes_are_not_resent(self):
+        entities = make_entities()
+        encoder = EntitySyncEncoder()
+        encoder.encode(entities)
+
+        changes = {'x': 7.5, 'properties': {'hit': True}}
+        entities[0].apply_changes(changes)
+        encoder.acknowledge('e0', changes)
+        entities[0].y = 1.0
+
+        assert encoder.encode(entities)['changed'] == {'e0': {'y': 1.0}}
+
+    def test_reset_resends_everything(self):
+        entities = make_entities()
+        encoder = EntitySyncEncoder()
+        encoder.encode(entities)
+
+        encoder.reset()
+        sync = encoder.encode(entities)
+
+        assert sync['reset'] is True
+        assert sync['spawned'] == full_state(entities)
+
+    def test_binary_packs_numeric_fields(self):
+        entities = make_entities()
+        encoder = EntitySyncEncoder(binary=True)
+        encoder.encode(entities)
+
+        entities[0].vy = -3.25
+        entities[0].color = 'red'
+        entities[2].x = 0.1
+        entities[2].health = 4
+        sync = encoder.encode(entities)
+
+        assert sync['changed'] == {'e0': {'color': 'red'}}
+        numeric = sync['numeric']
+        assert numeric['ids'] == ['e0', 'e2']
+        assert numeric['masks'] == [1 << NUMERIC_FIELDS.index('vy'),
+                                    1 << NUMERIC_FIELDS.index('x')
+                                    | 1 << NUMERIC_FIELDS.index('health')]
+        assert list(array('d', base64.b64decode(numeric['values']))) == [-3.25, 0.1, 4.0]
+
+    @pytest.mark.parametrize('binary', [False, True])
+    def test_applied_deltas_match_full_state(self, binary):
+        entities = make_entities(5)
+        encoder = EntitySyncEncoder(binary=binary)
+        store = {}
+        for frame in range(6):
+            for entity in entities:
+                entity.x += entity.vx + 1.5
+                if frame % 2:
+                    entity.properties['frame'] = frame
+            if frame == 2:
+                entities[3].alive = False
+                entities.append(EntityBrowser(id='late', entity_type='brick', width=10.0))
+            if frame == 4:
+                entities[1].tags.append('hit')
+            apply_sync(store, encoder.encode(entities))
+            expected = full_state(entities)
+            if binary:
+                for state in store.values():
+                    state['health'] = int(state['health'])
+            assert store == expected
+
+
+class TestLuaEngineBrowserSync:
+
+    def test_clear_resets_delta_sync(self):
+        engine = LuaEngineBrowser(content_fs=None)
+        engine.register_entity(EntityBrowser(id='a', entity_type='t'))
+        engine._sync.encode(engine.entities.values())
+
+        engine.clear()
+
+        assert engine._sync.encode([])['reset'] is True
+
+    def test_lua_results_are_acknowledged(self):
+        engine = LuaEngineBrowser(content_fs=None)
+        engine.register_entity(EntityBrowser(id='a', entity_type='t'))
+        engine._sync.encode(engine.entities.values())
+
+        engine.apply_lua_results({'entities': {'a': {'x': 12.0}}})
+
+        assert engine.entities['a'].x == 12.0
+        assert engine._sync.encode(engine.entities.values())['changed'] == {}
+
+    def test_delta_sync_can_be_disabled(self):
+        engine = LuaEngineBrowser(content_fs=None, delta_sync=False)
+        assert engine.get_sync_stats() is None
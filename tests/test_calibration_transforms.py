@@ -0,0 +1,88 @@
+"""Tests for batched camera -> game transforms and the game-space remap."""
+
+import cv2
+import numpy as np
+import pytest
+
+from calibration.calibration_manager import CalibrationManager
+from calibration.homography import apply_homography, transform_points
+from models import (
+    CalibrationConfig,
+    CalibrationData,
+    CalibrationQuality,
+    HomographyMatrix,
+    Point2D,
+    Resolution,
+)
+
+# Camera 640x480 looking at a 1280x720 projection, with some keystone
+H_CAM_TO_PROJ = np.array([
+    [2.1, 0.15, -180.0],
+    [0.05, 2.0, -110.0],
+    [0.0002, 0.0001, 1.0],
+])
+
+
+@pytest.fixture
+def manager(tmp_path):
+    data = CalibrationData(
+        projector_resolution=Resolution(width=1280, height=720),
+        camera_resolution=Resolution(width=640, height=480),
+        homography_camera_to_projector=HomographyMatrix.from_numpy(H_CAM_TO_PROJ),
+        quality=CalibrationQuality(reprojection_error_rms=0.5, reprojection_error_max=1.0,
+                                   num_inliers=16, num_total_points=16, inlier_ratio=1.0),
+    )
+    path = tmp_path / "calibration.json"
+    data.save(str(path))
+    return CalibrationManager(CalibrationConfig(auto_save=False), str(path))
+
+
+def reference_camera_to_game(point):
+    projected = cv2.perspectiveTransform(np.array([[point]], dtype=np.float64), H_CAM_TO_PROJ)[0][0]
+    return projected[0] / 1280, projected[1] / 720
+
+
+def test_transform_points_matches_opencv():
+    points = np.random.default_rng(1).uniform(0, 640, (50, 2))
+    expected = cv2.perspectiveTransform(points.reshape(-1, 1, 2), H_CAM_TO_PROJ).reshape(-1, 2)
+    np.testing.assert_allclose(transform_points(H_CAM_TO_PROJ, points), expected, rtol=1e-9)
+    # Contour shape is preserved
+    assert transform_points(H_CAM_TO_PROJ, points.reshape(-1, 1, 2)).shape == (50, 1, 2)
+
+
+def test_apply_homography_returns_points():
+    result = apply_homography(HomographyMatrix.from_numpy(H_CAM_TO_PROJ), [Point2D(x=100, y=200)])
+    expected = cv2.perspectiveTransform(np.array([[[100.0, 200.0]]]), H_CAM_TO_PROJ)[0][0]
+    assert (result[0].x, result[0].y) == pytest.approx(tuple(expected))
+
+
+def test_camera_to_game_single_and_batched_agree(manager):
+    points = np.array([[120.0, 80.0], [320.0, 240.0], [500.5, 410.25]])
+    batched = manager.camera_to_game_points(points)
+    for point, game in zip(points, batched):
+        single = manager.camera_to_game(Point2D(x=point[0], y=point[1]))
+        assert (single.x, single.y) == pytest.approx(tuple(game))
+        assert tuple(game) == pytest.approx(reference_camera_to_game(point))
+
+
+def test_transforms_require_calibration():
+    manager = CalibrationManager(CalibrationConfig(auto_save=False))
+    with pytest.raises(RuntimeError):
+        manager.camera_to_game_points(np.zeros((1, 2)))
+    with pytest.raises(RuntimeError):
+        manager.warp_to_game(np.zeros((4, 4, 3), dtype=np.uint8))
+
+
+def test_warp_to_game_places_camera_pixels_at_game_positions(manager):
+    camera_point = (300, 220)
+    frame = np.zeros((480, 640), dtype=np.uint8)
+    cv2.circle(frame, camera_point, 3, 255, -1)
+
+    warped = manager.warp_to_game(frame, size=(640, 360))
+    assert warped.shape == (360, 640)
+    moments = cv2.moments(warped)
+    center = (moments['m10'] / moments['m00'] / 640, moments['m01'] / moments['m00'] / 360)
+    assert center == pytest.approx(reference_camera_to_game(camera_point), abs=2 / 360)
+
+    # Maps are cached per size
+    assert manager.get_game_remap((640, 360))[0] is manager.get_game_remap((640, 360))[0]
@@ -0,0 +1,147 @@
+"""Tests for threaded camera capture and the frame ring buffer."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from ams.camera import (
+    CameraInterface,
+    CapturedFrame,
+    FrameRingBuffer,
+    ThreadedCamera,
+    grab_frame,
+    grab_frames,
+)
+
+
+class FakeCamera(CameraInterface):
+    """Camera producing numbered frames; each read takes `interval` seconds."""
+
+    def __init__(self, interval: float = 0.002, limit: int = None):
+        self.interval = interval
+        self.limit = limit
+        self.reads = 0
+        self.released = False
+        self._lock = threading.Lock()
+
+    def capture_frame(self) -> np.ndarray:
+        time.sleep(self.interval)
+        with self._lock:
+            if self.limit is not None and self.reads >= self.limit:
+                raise RuntimeError("Failed to capture frame")
+            self.reads += 1
+            return np.full((4, 4, 3), self.reads % 256, dtype=np.uint8)
+
+    def get_resolution(self):
+        return (4, 4)
+
+    def release(self):
+        self.released = True
+
+
+def frame(index: int) -> CapturedFrame:
+    return CapturedFrame(image=np.zeros((1, 1)), timestamp=float(index), index=index)
+
+
+class TestFrameRingBuffer:
+    """Unit tests for FrameRingBuffer."""
+
+    def test_overflow_drops_oldest(self):
+        buffer = FrameRingBuffer(capacity=3)
+        for i in range(5):
+            buffer.put(frame(i))
+
+        assert [f.index for f in buffer.drain()] == [2, 3, 4]
+        stats = buffer.get_stats()
+        assert stats['dropped'] == 2
+        assert stats['written'] == 5
+        assert stats['depth'] == 0
+
+    def test_latest_skips_older_frames(self):
+        buffer = FrameRingBuffer(capacity=4)
+        for i in range(3):
+            buffer.put(frame(i))
+
+        assert buffer.latest().index == 2
+        assert buffer.latest() is None
+        assert buffer.get_stats()['skipped'] == 2
+
+    def test_wait_times_out_when_empty(self):
+        assert not FrameRingBuffer().wait(timeout=0.01)
+
+
+class TestThreadedCamera:
+    """ThreadedCamera captures in the background and never blocks reads."""
+
+    def test_reads_are_non_blocking_and_timestamped(self):
+        camera = ThreadedCamera(FakeCamera(), buffer_size=8)
+        try:
+            assert camera.buffer.wait(timeout=1.0)
+            before = time.monotonic()
+            frames = camera.read_all()
+            assert frames
+            assert all(f.timestamp <= before for f in frames)
+            assert [f.index for f in frames] == sorted(f.index for f in frames)
+
+            start = time.perf_counter()
+            camera.read_latest()
+            assert time.perf_counter() - start < 0.01
+        finally:
+            camera.release()
+
+    def test_capture_frame_returns_new_frames(self):
+        camera = ThreadedCamera(FakeCamera())
+        try:
+            first = camera.capture_frame()
+            second = camera.capture_frame()
+            assert first[0, 0, 0] != second[0, 0, 0]
+        finally:
+            camera.release()
+
+    def test_counters_and_release(self):
+        source = FakeCamera(interval=0.001)
+        camera = ThreadedCamera(source, buffer_size=2)
+        try:
+            time.sleep(0.05)
+            stats = camera.get_stats()
+            assert stats['captured'] > 2
+            assert stats['dropped'] > 0
+            assert stats['queue_depth'] == 2
+        finally:
+            camera.release()
+        assert source.released
+        assert not camera._thread.is_alive()
+
+    def test_capture_errors_are_counted(self):
+        camera = ThreadedCamera(FakeCamera(limit=1), frame_timeout=0.2)
+        try:
+            camera.capture_frame()
+            time.sleep(0.05)
+            assert camera.get_stats()['capture_errors'] > 0
+            with pytest.raises(RuntimeError):
+                camera.capture_frame()
+        finally:
+            camera.release()
+
+
+class TestGrabFrame:
+    """grab_frame()/grab_frames() work with plain and threaded cameras."""
+
+    def test_plain_camera_is_read_synchronously(self):
+        source = FakeCamera(interval=0)
+        before = time.monotonic()
+        captured = grab_frame(source)
+
+        assert captured.timestamp >= before
+        assert source.reads == 1
+        assert len(grab_frames(source)) == 1
+
+    def test_threaded_camera_returns_none_without_new_frame(self):
+        camera = ThreadedCamera(FakeCamera(interval=0.5))
+        try:
+            assert grab_frame(camera) is None
+            assert grab_frames(camera) == []
+        finally:
+            camera.release()
@@ -0,0 +1,131 @@
+"""Tests for recorded-footage replay and detection scoring."""
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from ams.camera import ReplayCamera, grab_frame, grab_frames
+from ams.detection_replay import (
+    GroundTruthHit,
+    load_ground_truth,
+    match_events,
+    run_replay,
+    save_ground_truth,
+)
+from ams.events import PlaneHitEvent
+from ams.laser_detection_backend import LaserDetectionBackend
+from ams.stage_timer import StageTimer
+
+
+def write_sequence(directory, count, timestamps=None, dots=None):
+    dots = dots or {}
+    for index in range(count):
+        image = np.full((48, 64, 3), index, dtype=np.uint8)
+        if index in dots:
+            cv2.circle(image, dots[index], 4, (255, 255, 255), -1)
+        cv2.imwrite(str(directory / f"frame_{index:03d}.png"), image)
+    if timestamps is not None:
+        (directory / 'timestamps.txt').write_text(''.join(f"{t}\n" for t in timestamps))
+
+
+class TestReplayCamera:
+    """Playback order, timing and end of recording."""
+
+    def test_image_sequence_uses_timestamps_file(self, tmp_path):
+        write_sequence(tmp_path, 3, timestamps=[10.0, 10.05, 10.2])
+        camera = ReplayCamera(str(tmp_path))
+        assert camera.get_resolution() == (64, 48)
+
+        frames = [grab_frame(camera) for _ in range(3)]
+        assert [int(f.image[0, 0, 0]) for f in frames] == [0, 1, 2]
+        assert [f.timestamp for f in frames] == pytest.approx([0.0, 0.05, 0.2])
+
+        assert grab_frame(camera) is None
+        assert camera.finished
+        with pytest.raises(RuntimeError):
+            camera.capture_frame()
+
+    def test_fps_timing_and_loop(self, tmp_path):
+        write_sequence(tmp_path, 2)
+        camera = ReplayCamera(str(tmp_path), fps=10, loop=True)
+        stamps = [camera.read_frame().timestamp for _ in range(5)]
+        assert stamps == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+
+    def test_video_file(self, tmp_path):
+        path = tmp_path / 'clip.avi'
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), 20, (64, 48))
+        if not writer.isOpened():
+            pytest.skip("No video encoder available")
+        for index in range(4):
+            writer.write(np.full((48, 64, 3), index * 60, dtype=np.uint8))
+        writer.release()
+
+        camera = ReplayCamera(str(path))
+        frames = []
+        while not camera.finished:
+            frames.extend(grab_frames(camera))
+        assert len(frames) == 4
+        assert frames[-1].timestamp == pytest.approx(3 / 20)
+
+    def test_realtime_paces_frames(self, tmp_path):
+        write_sequence(tmp_path, 3, timestamps=[0.0, 0.05, 0.1])
+        camera = ReplayCamera(str(tmp_path), realtime=True)
+        assert len(grab_frames(camera)) == 1
+        # Next frame not due yet
+        assert grab_frames(camera) == []
+        time.sleep(0.12)
+        frames = grab_frames(camera)
+        assert len(frames) == 2
+        assert frames[1].timestamp - camera.time_origin == pytest.approx(0.1)
+
+
+def event(x, y, t):
+    return PlaneHitEvent(x=x, y=y, timestamp=t)
+
+
+def test_match_events():
+    truth = [GroundTruthHit(1.0, 0.2, 0.2), GroundTruthHit(1.05, 0.22, 0.2),
+             GroundTruthHit(3.0, 0.8, 0.8)]
+    events = [
+        event(0.221, 0.2, 1.06),   # Nearest in time to hit 0 but belongs to hit 1
+        event(0.201, 0.2, 1.02),
+        event(0.5, 0.5, 2.0),      # Spurious
+    ]
+    scores = match_events(events, truth, time_tolerance=0.1, distance_tolerance=0.05)
+    assert (scores['true_positives'], scores['false_positives'], scores['false_negatives']) == (2, 1, 1)
+    assert scores['precision'] == pytest.approx(2 / 3)
+    assert scores['recall'] == pytest.approx(2 / 3)
+    assert scores['mean_error'] == pytest.approx(0.001)
+    assert scores['mean_delay'] == pytest.approx(0.015)
+
+
+def test_ground_truth_round_trip(tmp_path):
+    hits = [GroundTruthHit(2.0, 0.5, 0.5), GroundTruthHit(1.0, 0.1, 0.9)]
+    save_ground_truth(str(tmp_path / 'truth.json'), hits)
+    assert load_ground_truth(str(tmp_path / 'truth.json')) == sorted(hits, key=lambda h: h.timestamp)
+
+
+def test_laser_backend_replay(tmp_path):
+    write_sequence(tmp_path, 12, timestamps=[i / 30 for i in range(12)],
+                   dots={3: (16, 12), 4: (16, 12), 9: (48, 36)})
+    camera = ReplayCamera(str(tmp_path))
+    backend = LaserDetectionBackend(camera, None, 640, 480)
+    backend.stage_timer.enabled = True
+
+    result = run_replay(backend, camera)
+    assert result.frames == 12
+    truth = [GroundTruthHit(3 / 30, 16 / 64, 12 / 48), GroundTruthHit(9 / 30, 48 / 64, 36 / 48)]
+    scores = match_events(result.events, truth)
+    assert scores['f1'] == 1.0
+    stats = backend.stage_timer.get_stats()
+    assert list(stats) == ['convert', 'blur', 'threshold', 'contours']
+    assert stats['convert']['count'] == 12
+
+
+def test_stage_timer_disabled_records_nothing():
+    timer = StageTimer()
+    timer.start()
+    timer.mark('convert')
+    assert timer.get_stats() == {}
@@ -0,0 +1,168 @@
+"""Tests for ROI-restricted detection (ScreenROI)."""
+
+import cv2
+import numpy as np
+import pytest
+
+from ams.camera import CameraInterface
+from ams.detection_roi import ScreenROI
+from ams.laser_detection_backend import LaserDetectionBackend
+from ams.object_detection import ColorBlobConfig, ColorBlobDetector
+from models import Point2D
+
+WIDTH, HEIGHT = 320, 240
+
+# Triangle: the ROI rectangle covers x 100-300, y 50-200
+TRIANGLE = np.array([[100, 50], [300, 50], [100, 200]], dtype=np.float32)
+
+
+class StaticCamera(CameraInterface):
+    def __init__(self, frame: np.ndarray):
+        self.frame = frame
+
+    def capture_frame(self) -> np.ndarray:
+        return self.frame
+
+    def get_resolution(self):
+        return (WIDTH, HEIGHT)
+
+    def release(self):
+        pass
+
+
+class PolygonBounds:
+    def __init__(self, polygon):
+        self.polygon = polygon
+
+    def to_numpy_polygon(self):
+        return self.polygon
+
+
+class FakeCalibration:
+    """Calibration manager stand-in: identity camera->game normalization."""
+
+    def __init__(self, polygon):
+        self.bounds = PolygonBounds(polygon)
+        self.bounds_checks = 0
+
+    def get_screen_bounds(self):
+        return self.bounds
+
+    def is_within_screen_bounds(self, point):
+        self.bounds_checks += 1
+        return cv2.pointPolygonTest(self.bounds.polygon, (point.x, point.y), False) >= 0
+
+    def camera_to_game(self, point):
+        return Point2D(x=point.x / WIDTH, y=point.y / HEIGHT)
+
+
+def frame_with_spots(*centers, color=(0, 0, 255), radius=4):
+    frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    for center in centers:
+        cv2.circle(frame, center, radius, color, -1)
+    return frame
+
+
+class TestScreenROI:
+    """Unit tests for ScreenROI."""
+
+    def test_rect_and_mask(self):
+        roi = ScreenROI(TRIANGLE)
+        roi.prepare((HEIGHT, WIDTH, 3))
+
+        x, y, w, h = roi.rect
+        assert (x, y) == (100, 50)
+        assert (w, h) == (201, 151)
+        assert roi.mask.shape == (h, w)
+        assert roi.mask[10, 10] == 255      # near the right angle corner
+        assert roi.mask[140, 190] == 0      # beyond the hypotenuse
+        assert roi.area_fraction == pytest.approx(w * h / (WIDTH * HEIGHT))
+
+    def test_rect_is_clipped_to_frame(self):
+        roi = ScreenROI(np.array([[-50, -20], [400, -20], [400, 300], [-50, 300]]))
+        crop = roi.crop(np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8))
+        assert crop.shape == (HEIGHT, WIDTH, 3)
+        assert roi.offset == (0, 0)
+
+    def test_expand_restores_frame_coordinates(self):
+        roi = ScreenROI(TRIANGLE)
+        roi.prepare((HEIGHT, WIDTH))
+        full = roi.expand(roi.mask)
+        assert full.shape == (HEIGHT, WIDTH)
+        assert full[60, 110] == 255 and full[10, 10] == 0
+
+    def test_no_bounds_means_no_roi(self):
+        calibration = FakeCalibration(TRIANGLE)
+        calibration.bounds = None
+        assert ScreenROI.from_calibration(calibration) is None
+        assert ScreenROI.from_calibration(None) is None
+
+
+class TestColorBlobROI:
+    """ColorBlobDetector with an ROI."""
+
+    def detect(self, frame, roi=None):
+        detector = ColorBlobDetector(ColorBlobConfig(min_area=10, max_area=2000))
+        assert detector.set_roi(roi)
+        return detector.detect(frame, 0.0)
+
+    def test_inside_detection_matches_full_frame(self):
+        frame = frame_with_spots((130, 80))
+        full = self.detect(frame)
+        cropped = self.detect(frame, ScreenROI(TRIANGLE))
+
+        assert len(full) == len(cropped) == 1
+        assert cropped[0].position.x == pytest.approx(full[0].position.x)
+        assert cropped[0].position.y == pytest.approx(full[0].position.y)
+        assert cropped[0].bounding_box == full[0].bounding_box
+        np.testing.assert_array_equal(cropped[0].contour, full[0].contour)
+
+    def test_outside_polygon_is_ignored(self):
+        # (20, 20) is outside the rectangle, (250, 170) inside it but past the hypotenuse
+        frame = frame_with_spots((20, 20), (250, 170), (130, 80))
+        assert len(self.detect(frame)) == 3
+        detections = self.detect(frame, ScreenROI(TRIANGLE))
+        assert [(round(d.position.x), round(d.position.y)) for d in detections] == [(130, 80)]
+
+    def test_debug_frame_is_full_size(self):
+        detector = ColorBlobDetector()
+        detector.set_roi(ScreenROI(TRIANGLE))
+        detector.set_debug_mode(True)
+        detector.detect(frame_with_spots((130, 80)), 0.0)
+        assert detector.get_debug_frame().shape == (HEIGHT, WIDTH * 2, 3)
+
+
+class TestLaserROI:
+    """LaserDetectionBackend with ROI mode."""
+
+    def make_backend(self, frame, roi=True):
+        calibration = FakeCalibration(TRIANGLE)
+        backend = LaserDetectionBackend(StaticCamera(frame), calibration, WIDTH, HEIGHT, roi=roi)
+        return backend, calibration
+
+    def test_spot_inside_screen_reported_in_frame_coordinates(self):
+        backend, calibration = self.make_backend(frame_with_spots((130, 80), color=(255, 255, 255)))
+        assert backend.roi is not None
+        backend.update(0.016)
+
+        events = backend.poll_events()
+        assert len(events) == 1
+        position = events[0].metadata['camera_position']
+        assert position['x'] == pytest.approx(130, abs=0.5)
+        assert position['y'] == pytest.approx(80, abs=0.5)
+        assert events[0].metadata['brightness'] > 200
+        # The mask replaces the per-detection polygon test
+        assert calibration.bounds_checks == 0
+
+    def test_spot_outside_screen_ignored(self):
+        backend, _ = self.make_backend(frame_with_spots((250, 170), color=(255, 255, 255)))
+        backend.update(0.016)
+        assert backend.poll_events() == []
+
+    def test_roi_off_filters_with_polygon_test(self):
+        backend, calibration = self.make_backend(
+            frame_with_spots((250, 170), color=(255, 255, 255)), roi=False)
+        assert backend.roi is None
+        backend.update(0.016)
+        assert backend.poll_events() == []
+        assert calibration.bounds_checks == 1
@@ -0,0 +1,221 @@
+"""Tests for the detection worker process and shared frame buffer."""
+
+import time
+from typing import List
+
+import numpy as np
+import pytest
+
+from ams.camera import FrameRingBuffer
+from ams.detection_backend import DetectionBackend
+from ams.detection_worker import FRAME_WAIT, DetectionWorkerBackend, SharedFrameBuffer
+from ams.events import CalibrationResult, PlaneHitEvent
+
+
+class CountingBackend(DetectionBackend):
+    """Backend emitting one hit per poll (up to `limit`) and a debug frame."""
+
+    def __init__(self, limit: int = 5):
+        super().__init__(100, 100)
+        self.limit = limit
+        self.sent = 0
+        self.debug_mode = False
+        self.debug_frame = None
+
+    def update(self, dt: float):
+        if self.debug_mode:
+            self.debug_frame = np.full((6, 8, 3), self.sent % 256, dtype=np.uint8)
+
+    def poll_events(self):
+        time.sleep(0.001)
+        if self.sent >= self.limit:
+            return []
+        self.sent += 1
+        return [PlaneHitEvent(x=self.sent / 10, y=0.5, timestamp=time.monotonic())]
+
+    def calibrate(self) -> CalibrationResult:
+        return CalibrationResult(success=True, method="test")
+
+    def set_debug_mode(self, enabled: bool):
+        self.debug_mode = enabled
+
+    def get_debug_frame(self):
+        return self.debug_frame
+
+
+class IdleCamera:
+    """ThreadedCamera stand-in whose frame buffer never fills."""
+
+    def __init__(self):
+        self.buffer = FrameRingBuffer()
+
+    def release(self):
+        pass
+
+
+class TunableBackend(CountingBackend):
+    """Backend with laser-style tuning controls, echoed back as hits."""
+
+    def __init__(self):
+        super().__init__(limit=0)
+        self.brightness_threshold = 200
+        self.debug_bw_mode = False
+        self.pending: List[PlaneHitEvent] = []
+
+    def poll_events(self):
+        time.sleep(0.001)
+        events, self.pending = self.pending, []
+        return events
+
+    def _echo(self):
+        self.pending.append(PlaneHitEvent(x=self.brightness_threshold / 255, y=float(self.debug_bw_mode),
+                                          timestamp=time.monotonic()))
+
+    def toggle_bw_mode(self):
+        self.debug_bw_mode = not self.debug_bw_mode
+        self._echo()
+
+    def set_brightness_threshold(self, threshold: int):
+        self.brightness_threshold = threshold
+        self._echo()
+
+
+def counting_backend():
+    return CountingBackend(limit=5)
+
+
+def tunable_backend():
+    return TunableBackend()
+
+
+def idle_camera_backend():
+    backend = CountingBackend(limit=0)
+    backend.camera = IdleCamera()
+    return backend
+
+
+def failing_backend():
+    raise RuntimeError("no camera")
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestSharedFrameBuffer:
+    """Unit tests for SharedFrameBuffer."""
+
+    def test_round_trip_through_attached_buffer(self):
+        owner = SharedFrameBuffer((4, 4, 3))
+        reader = SharedFrameBuffer((4, 4, 3), name=owner.name)
+        try:
+            frame = np.arange(36, dtype=np.uint8).reshape(3, 4, 3)
+            assert owner.write(frame, 12.5)
+
+            image, timestamp, sequence = reader.read()
+            np.testing.assert_array_equal(image, frame)
+            assert timestamp == 12.5
+            assert reader.read(sequence) is None
+        finally:
+            reader.close()
+            owner.close()
+
+    def test_grayscale_and_oversized_frames(self):
+        buffer = SharedFrameBuffer((4, 4, 3))
+        try:
+            assert buffer.write(np.ones((5, 5), dtype=np.uint8), 1.0)
+            assert buffer.read()[0].shape == (5, 5)
+            assert not buffer.write(np.ones((8, 8, 3), dtype=np.uint8), 2.0)
+            assert not buffer.write(np.ones((2, 2), dtype=np.float32), 2.0)
+        finally:
+            buffer.close()
+
+
+class TestDetectionWorkerBackend:
+    """Tests for DetectionWorkerBackend."""
+
+    def test_hits_arrive_from_worker(self):
+        backend = DetectionWorkerBackend(counting_backend, 100, 100, frame_shape=(8, 8, 3))
+        try:
+            events = []
+            assert wait_for(lambda: events.extend(backend.poll_events()) or len(events) >= 5)
+            assert [e.x for e in events] == pytest.approx([0.1, 0.2, 0.3, 0.4, 0.5])
+            # Worker timestamps share the monotonic clock
+            assert all(e.timestamp <= time.monotonic() for e in events)
+
+            stats = backend.get_stats()
+            assert stats['alive']
+            assert stats['events_sent'] == 5
+            assert stats['events_received'] == 5
+            assert stats['events_dropped'] == 0
+        finally:
+            backend.close()
+        assert not backend.alive
+
+    def test_debug_frames_shared_when_enabled(self):
+        backend = DetectionWorkerBackend(counting_backend, 100, 100, frame_shape=(8, 8, 3))
+        try:
+            assert backend.get_debug_frame() is None
+            backend.set_debug_mode(True)
+            assert wait_for(lambda: backend.get_debug_frame() is not None)
+            assert backend.get_debug_frame().shape == (6, 8, 3)
+            assert backend.get_stats()['frames_published'] >= 1
+        finally:
+            backend.close()
+
+    def test_idle_threaded_camera_does_not_spin(self):
+        backend = DetectionWorkerBackend(idle_camera_backend, 100, 100, frame_shape=(2, 2, 3))
+        try:
+            assert wait_for(lambda: backend.get_stats()['polls'] >= 1)
+            polls = backend.get_stats()['polls']
+            time.sleep(0.5)
+            # Each poll waits up to FRAME_WAIT for a frame (a spinning loop
+            # would poll hundreds of times)
+            assert backend.get_stats()['polls'] - polls <= 0.5 / FRAME_WAIT + 2
+        finally:
+            backend.close()
+
+    def test_tuning_controls_forward_to_worker(self):
+        backend = DetectionWorkerBackend(tunable_backend, 100, 100, frame_shape=(2, 2, 3))
+        try:
+            assert backend.brightness_threshold == 200
+            backend.set_brightness_threshold(backend.brightness_threshold + 10)
+            backend.set_brightness_threshold(backend.brightness_threshold + 10)
+            backend.toggle_bw_mode()
+            assert backend.brightness_threshold == 220
+
+            events = []
+            assert wait_for(lambda: events.extend(backend.poll_events()) or len(events) >= 3)
+            assert [(round(e.x * 255), e.y) for e in events] == [(210, 0.0), (220, 0.0), (220, 1.0)]
+        finally:
+            backend.close()
+
+    def test_tuning_controls_ignored_without_support(self):
+        backend = DetectionWorkerBackend(counting_backend, 100, 100, frame_shape=(2, 2, 3))
+        try:
+            backend.set_brightness_threshold(backend.brightness_threshold + 10)
+            backend.toggle_bw_mode()
+            assert backend.brightness_threshold == 0
+            assert backend._commands.empty()
+        finally:
+            backend.close()
+
+    def test_failed_factory_raises_on_start(self):
+        with pytest.raises(RuntimeError, match="no camera"):
+            DetectionWorkerBackend(failing_backend, 100, 100, frame_shape=(2, 2, 3))
+
+    def test_worker_exit_after_start_is_reported(self):
+        backend = DetectionWorkerBackend(idle_camera_backend, 100, 100, frame_shape=(2, 2, 3))
+        try:
+            backend._process.kill()
+            assert wait_for(lambda: not backend.alive)
+            backend.update(0.016)
+            assert backend.poll_events() == []
+            assert not backend.calibrate().success
+        finally:
+            backend.close()
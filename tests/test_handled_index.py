@@ -0,0 +1,111 @@
+"""Tests for the STUCK-mode handled object index, expiry and occupancy mask."""
+
+import cv2
+import numpy as np
+import pytest
+
+from ams.camera import CameraInterface
+from ams.object_detection import ColorBlobDetector, ImpactMode, PointGrid
+from ams.object_detection_backend import ObjectDetectionBackend
+from models import Point2D
+
+
+class TestPointGrid:
+    """Radius queries agree with a linear scan."""
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        points = rng.uniform(-100, 700, (300, 2))
+        grid = PointGrid(cell_size=30.0)
+        for index, (x, y) in enumerate(points.tolist()):
+            grid.add(x, y, index)
+        assert len(grid) == 300
+
+        for qx, qy in rng.uniform(-100, 700, (200, 2)).tolist():
+            for radius in (10.0, 30.0, 75.0):
+                dist = np.hypot(points[:, 0] - qx, points[:, 1] - qy)
+                expected = set(np.flatnonzero(dist < radius).tolist())
+                assert set(grid.within(qx, qy, radius)) == expected
+                assert grid.any_within(qx, qy, radius) == bool(expected)
+
+    def test_rebuild_and_clear(self):
+        grid = PointGrid(cell_size=10.0)
+        grid.rebuild([(0.0, 0.0, 'a'), (25.0, 0.0, 'b')])
+        assert sorted(grid) == ['a', 'b']
+        assert grid.within(24.0, 1.0, 5.0) == ['b']
+        grid.clear()
+        assert len(grid) == 0 and not grid.any_within(0.0, 0.0, 100.0)
+
+    def test_rejects_bad_cell_size(self):
+        with pytest.raises(ValueError):
+            PointGrid(cell_size=0)
+
+
+class StaticCamera(CameraInterface):
+    def capture_frame(self):
+        return np.zeros((240, 320, 3), dtype=np.uint8)
+
+    def get_resolution(self):
+        return (320, 240)
+
+    def release(self):
+        pass
+
+
+def arrow_frame(*centers):
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    for center in centers:
+        cv2.circle(frame, center, 8, (0, 0, 255), -1)
+    return frame
+
+
+def make_backend(**kwargs):
+    return ObjectDetectionBackend(StaticCamera(), detector=ColorBlobDetector(),
+                                  display_width=320, display_height=240,
+                                  impact_mode=ImpactMode.STUCK, **kwargs)
+
+
+def run(backend, frame, start, frames):
+    impacts = 0
+    for i in range(frames):
+        detections = backend.detector.detect(frame, start + i / 30)
+        impacts += len(backend._update_tracking(detections, start + i / 30))
+    return impacts
+
+
+def test_stuck_object_registers_once():
+    backend = make_backend()
+    assert run(backend, arrow_frame((100, 100)), 0.0, 10) == 1
+    assert backend._is_handled(Point2D(x=110, y=105))
+    assert not backend._is_handled(Point2D(x=200, y=100))
+
+    backend.reset_handled_objects()
+    assert not backend._is_handled(Point2D(x=100, y=100))
+
+
+def test_handled_objects_expire():
+    backend = make_backend(handled_expiry=2.0)
+    backend._add_handled(Point2D(x=100, y=100), 0, 0.0)
+    backend._add_handled(Point2D(x=200, y=100), 1, 1.5)
+
+    backend._expire_handled(2.5)
+    assert not backend._is_handled(Point2D(x=100, y=100))
+    assert backend._is_handled(Point2D(x=200, y=100))
+    assert len(backend._handled_objects) == 1
+
+
+def test_masked_stuck_objects_are_not_detected():
+    backend = make_backend(mask_handled=True)
+    frame = arrow_frame((100, 100))
+    for i in range(6):
+        backend._process_frame(frame, i / 30)
+    assert len(backend._handled_objects) == 1
+
+    # The stuck arrow is masked out; a new one elsewhere is still seen
+    both = arrow_frame((100, 100), (220, 150))
+    detections = backend.detector.detect(both, 1.0)
+    assert [(round(d.position.x), round(d.position.y)) for d in detections] == [(220, 150)]
+
+    backend.reset_handled_objects()
+    assert backend.detector.exclusion_mask is None
+    assert len(backend.detector.detect(both, 1.1)) == 2
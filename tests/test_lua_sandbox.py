@@ -13,7 +13,7 @@ import uuid
 from pathlib import Path
 from lupa import LuaError
 
-from ams.lua.engine import LuaEngine
+from ams.lua.engine import LuaEngine, clear_subroutine_cache, get_subroutine_cache_stats
 from ams.games.game_engine.api import GameLuaAPI
 from ams.games.game_engine.entity import GameEntity
 from ams.content_fs import ContentFS
@@ -905,5 +905,113 @@ class TestAttributeFilterEdgeCases:
         assert result is None  # Should work, not raise
 
 
+class TestExpressionCache:
+    """evaluate_expression compiles each expression once and reuses it."""
+
+    def test_repeated_expression_hits_cache(self, engine):
+        """Second evaluation reuses the compiled function."""
+        assert engine.evaluate_expression("1 + 2") == 3
+        assert engine.evaluate_expression("1 + 2") == 3
+
+        stats = engine.get_expression_cache_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+        assert stats['size'] == 1
+
+    def test_cached_expression_reads_current_globals(self, engine):
+        """Globals set between calls are seen by the cached function."""
+        engine.set_global('i', 2)
+        assert engine.evaluate_expression("i * 10") == 20
+        engine.set_global('i', 5)
+        assert engine.evaluate_expression("i * 10") == 50
+
+    def test_block_expression(self, engine):
+        """Multiline blocks are compiled as function bodies."""
+        block = "local a = 4\nreturn a * a"
+        assert engine.evaluate_expression(block) == 16
+        assert engine.evaluate_expression(block) == 16
+        assert engine.get_expression_cache_stats()['hits'] == 1
+
+    def test_lru_eviction(self, content_fs):
+        """Least recently used expressions are evicted at capacity."""
+        eng = LuaEngine(content_fs, 800, 600, api_class=GameLuaAPI, expression_cache_size=2)
+        eng.evaluate_expression("1")
+        eng.evaluate_expression("2")
+        eng.evaluate_expression("1")
+        eng.evaluate_expression("3")
+
+        assert list(eng._expression_cache) == ["1", "3"]
+        assert eng.get_expression_cache_stats()['size'] == 2
+
+    def test_errors_return_none_and_are_not_cached(self, engine):
+        """Syntax and runtime errors return None as before."""
+        assert engine.evaluate_expression("1 +") is None
+        assert engine.evaluate_expression("nil + 1") is None
+        assert "1 +" not in engine._expression_cache
+
+    def test_cached_expression_stays_sandboxed(self, engine):
+        """Compiled expressions see the same sandboxed globals."""
+        assert engine.evaluate_expression("os") is None
+        assert engine.evaluate_expression("io") is None
+
+
+STEP_GENERATOR = """type: generator
+name: step
+description: Test generator
+lua: |
+  local step = {{}}
+  function step.generate(args)
+    return args.value + {step}
+  end
+  return step
+"""
+
+
+class TestSubroutineCache:
+    """Parsed .lua.yaml subroutines are shared across engines by content hash."""
+
+    @pytest.fixture
+    def game_fs(self, tmp_path):
+        generator_dir = tmp_path / 'lua' / 'generator'
+        generator_dir.mkdir(parents=True)
+        (generator_dir / 'step.lua.yaml').write_text(STEP_GENERATOR.format(step=1))
+        fs = ContentFS(_PROJECT_ROOT, add_user_layer=False)
+        fs.add_game_layer(tmp_path)
+        clear_subroutine_cache()
+        yield fs, generator_dir
+        clear_subroutine_cache()
+
+    def test_second_engine_hits_cache(self, game_fs):
+        fs, _ = game_fs
+        first = LuaEngine(fs, 800, 600, api_class=GameLuaAPI)
+        second = LuaEngine(fs, 800, 600, api_class=GameLuaAPI)
+
+        assert first.call_generator('step', {'value': 10}) == 11
+        assert second.call_generator('step', {'value': 20}) == 21
+        stats = get_subroutine_cache_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+
+    def test_engines_get_separate_tables(self, game_fs):
+        """Each engine executes the chunk in its own runtime."""
+        fs, _ = game_fs
+        first = LuaEngine(fs, 800, 600, api_class=GameLuaAPI)
+        second = LuaEngine(fs, 800, 600, api_class=GameLuaAPI)
+        first.call_generator('step', {'value': 0})
+        first.get_subroutine('generator', 'step').generate = None
+
+        assert second.call_generator('step', {'value': 0}) == 1
+
+    def test_edited_file_is_reparsed(self, game_fs):
+        fs, generator_dir = game_fs
+        assert LuaEngine(fs, 800, 600, api_class=GameLuaAPI).call_generator(
+            'step', {'value': 0}) == 1
+
+        (generator_dir / 'step.lua.yaml').write_text(STEP_GENERATOR.format(step=5))
+        assert LuaEngine(fs, 800, 600, api_class=GameLuaAPI).call_generator(
+            'step', {'value': 0}) == 5
+        assert get_subroutine_cache_stats()['misses'] == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,127 @@
+"""Tests for CallbackScheduler and LuaEngine scheduled callbacks."""
+
+from pathlib import Path
+
+import pytest
+
+from ams.content_fs import ContentFS
+from ams.games.game_engine.api import GameLuaAPI
+from ams.games.game_engine.entity import GameEntity
+from ams.lua.engine import LuaEngine, ScheduledCallback
+from ams.lua.scheduler import CallbackScheduler
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class RecordingProvider:
+    """Lifecycle provider that records scheduled dispatches."""
+
+    def __init__(self):
+        self.fired = []
+
+    def on_entity_spawned(self, entity, lua_engine):
+        pass
+
+    def on_entity_update(self, entity, lua_engine, dt):
+        pass
+
+    def on_entity_destroyed(self, entity, lua_engine):
+        pass
+
+    def dispatch_lifecycle(self, hook_name, entity, lua_engine, *args):
+        pass
+
+    def dispatch_scheduled(self, callback_name, entity, lua_engine):
+        self.fired.append((round(lua_engine.elapsed_time, 6), callback_name, entity.id))
+
+
+@pytest.fixture
+def engine():
+    eng = LuaEngine(ContentFS(_PROJECT_ROOT, add_user_layer=False), 800, 600,
+                    api_class=GameLuaAPI)
+    eng.set_lifecycle_provider(RecordingProvider())
+    for entity_id in ('a', 'b'):
+        eng.register_entity(GameEntity(id=entity_id, entity_type='test'))
+    return eng
+
+
+class TestCallbackScheduler:
+
+    def test_pops_in_due_then_schedule_order(self):
+        scheduler = CallbackScheduler()
+        scheduler.schedule(2.0, 'late', 'a')
+        scheduler.schedule(1.0, 'first', 'a')
+        scheduler.schedule(1.0, 'second', 'b')
+
+        assert scheduler.pop_due(0.5) == []
+        assert scheduler.pop_due(1.0) == [('first', 'a'), ('second', 'b')]
+        assert len(scheduler) == 1
+        assert scheduler.pop_due(5.0) == [('late', 'a')]
+        assert len(scheduler) == 0
+
+    def test_cancel_entity_is_lazy_and_compacts(self):
+        scheduler = CallbackScheduler()
+        for i in range(10):
+            scheduler.schedule(float(i), 'tick', 'a')
+        scheduler.schedule(3.5, 'keep', 'b')
+
+        assert scheduler.cancel_entity('a') == 10
+        assert len(scheduler) == 1
+        # More than half cancelled: the heap was rebuilt without them
+        assert len(scheduler._heap) == 1
+        assert scheduler.pop_due(100.0) == [('keep', 'b')]
+        assert scheduler.cancel_entity('a') == 0
+
+    def test_pending_and_restore_round_trip(self):
+        scheduler = CallbackScheduler()
+        scheduler.schedule(3.0, 'c', 'a')
+        scheduler.schedule(1.0, 'a', 'a')
+        scheduler.schedule(2.0, 'b', 'b')
+        scheduler.cancel_entity('b')
+
+        pending = scheduler.pending()
+        assert pending == [(1.0, 'a', 'a'), (3.0, 'c', 'a')]
+
+        restored = CallbackScheduler()
+        restored.restore(pending)
+        assert restored.pop_due(10.0) == [('a', 'a'), ('c', 'a')]
+
+
+class TestLuaEngineScheduling:
+
+    def test_callbacks_fire_once_when_due(self, engine):
+        engine.schedule_callback(0.25, 'blink', 'a')
+        engine.schedule_callback(0.05, 'flash', 'b')
+        for _ in range(5):
+            engine.update(0.1)
+
+        assert engine._lifecycle_provider.fired == [(0.1, 'flash', 'b'), (0.3, 'blink', 'a')]
+
+    def test_dead_entities_lose_their_callbacks(self, engine):
+        engine.schedule_callback(1.0, 'respawn', 'a')
+        engine.entities['a'].alive = False
+        engine.update(0.1)
+
+        assert engine.get_scheduled() == []
+        engine.update(2.0)
+        assert engine._lifecycle_provider.fired == []
+
+    def test_get_and_restore_scheduled_are_relative(self, engine):
+        engine.schedule_callback(1.0, 'combo_end', 'a')
+        engine.update(0.25)
+        snapshot = engine.get_scheduled()
+        assert len(snapshot) == 1
+        assert snapshot[0].time_remaining == pytest.approx(0.75)
+
+        # Restore at a different clock: timing stays relative
+        engine.elapsed_time = 10.0
+        engine.restore_scheduled([ScheduledCallback(0.5, 'combo_end', 'a')])
+        engine.update(0.25)
+        assert engine._lifecycle_provider.fired == []
+        engine.update(0.25)
+        assert engine._lifecycle_provider.fired == [(10.5, 'combo_end', 'a')]
+
+    def test_clear_drops_pending(self, engine):
+        engine.schedule_callback(1.0, 'respawn', 'a')
+        engine.clear()
+        assert engine.get_scheduled() == []
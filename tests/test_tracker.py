@@ -0,0 +1,157 @@
+"""Tests for the global-assignment object tracker."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from ams.camera import CameraInterface
+from ams.object_detection import (
+    ColorBlobDetector,
+    DetectedObject,
+    ImpactMode,
+    MultiObjectTracker,
+    ObjectDetector,
+    solve_assignment,
+)
+from ams.object_detection_backend import ObjectDetectionBackend
+from models import Point2D
+
+
+def brute_force(cost):
+    n, m = cost.shape
+    if n <= m:
+        return min(sum(cost[i, p[i]] for i in range(n)) for p in itertools.permutations(range(m), n))
+    return min(sum(cost[p[j], j] for j in range(m)) for p in itertools.permutations(range(n), m))
+
+
+class TestSolveAssignment:
+    """solve_assignment() finds the optimum."""
+
+    @pytest.mark.parametrize('shape', [(1, 1), (3, 3), (2, 5), (5, 2), (4, 4)])
+    def test_matches_brute_force(self, shape):
+        rng = np.random.default_rng(sum(shape))
+        for _ in range(20):
+            cost = rng.uniform(0, 10, shape)
+            rows, cols = solve_assignment(cost)
+            assert len(rows) == min(shape)
+            assert len(set(rows.tolist())) == len(set(cols.tolist())) == min(shape)
+            assert cost[rows, cols].sum() == pytest.approx(brute_force(cost))
+
+    def test_beats_greedy(self):
+        # Greedy row-by-row picks (0, 0) then is forced into (1, 1) = 100
+        cost = np.array([[1.0, 2.0], [3.0, 100.0]])
+        rows, cols = solve_assignment(cost)
+        assert cols.tolist() == [1, 0]
+
+    def test_empty(self):
+        rows, cols = solve_assignment(np.empty((0, 3)))
+        assert len(rows) == len(cols) == 0
+
+
+class TestMultiObjectTracker:
+    """Identity and velocity across frames."""
+
+    def test_velocity_is_finite_difference(self):
+        tracker = MultiObjectTracker()
+        ids, velocities = tracker.update([[10, 10]], 0.0)
+        assert velocities.tolist() == [[0.0, 0.0]]
+        ids2, velocities = tracker.update([[20, 15]], 0.1)
+        assert ids2.tolist() == ids.tolist()
+        assert velocities[0] == pytest.approx([100.0, 50.0])
+
+    def test_crossing_objects_keep_identity(self):
+        # Two objects cross on nearly the same line; nearest-previous
+        # matching swaps them at the crossing, prediction does not
+        tracker = MultiObjectTracker(gate=100.0)
+        first = None
+        for frame in range(12):
+            t = frame / 30
+            a = (100 + 30 * frame, 200.0)
+            b = (430 - 30 * frame, 208.0)
+            ids, _ = tracker.update([a, b], t)
+            if first is None:
+                first = ids.tolist()
+            assert ids.tolist() == first
+
+    def test_gate_and_coasting(self):
+        tracker = MultiObjectTracker(gate=50.0, max_gap=0.2)
+        (a,), _ = tracker.update([[0, 0]], 0.0)
+        tracker.update([[10, 0]], 0.1)
+        # Missed frame: the track coasts and is matched at its predicted spot
+        tracker.update(np.empty((0, 2)), 0.2)
+        (same,), _ = tracker.update([[30, 0]], 0.3)
+        assert same == a
+        # Too far from the prediction: new track
+        (far,), _ = tracker.update([[300, 0]], 0.4)
+        assert far != a
+        # Unseen past max_gap: dropped
+        tracker.update([[300, 0]], 0.55)
+        assert a not in tracker.track_ids
+        assert tracker.get_stats()['lost'] == 1
+
+
+class StaticCamera(CameraInterface):
+    def capture_frame(self):
+        return np.zeros((480, 640, 3), dtype=np.uint8)
+
+    def get_resolution(self):
+        return (640, 480)
+
+    def release(self):
+        pass
+
+
+class ScriptedDetector(ObjectDetector):
+    """Returns scripted positions without track ids or velocities."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    def detect(self, frame, timestamp):
+        return [
+            DetectedObject(position=Point2D(x=x, y=y), velocity=Point2D(x=0, y=0), area=100,
+                           bounding_box=(int(x), int(y), 1, 1), confidence=1.0, timestamp=timestamp)
+            for x, y in self.frames.pop(0)
+        ]
+
+    def get_debug_frame(self):
+        return None
+
+    def set_debug_mode(self, enabled):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+
+def test_color_blob_detector_tracks_blobs():
+    import cv2
+
+    detector = ColorBlobDetector()
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    cv2.circle(frame, (100, 100), 8, (0, 0, 255), -1)
+    first = detector.detect(frame, 0.0)
+
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    cv2.circle(frame, (110, 100), 8, (0, 0, 255), -1)
+    second = detector.detect(frame, 0.1)
+
+    assert first[0].track_id == second[0].track_id
+    assert second[0].velocity.x == pytest.approx(100.0)
+    assert second[0].velocity.y == pytest.approx(0.0)
+
+
+def test_backend_tracks_for_detectors_without_ids():
+    # Object flies right, then bounces back left
+    path = [[(100 + 20 * i, 200)] for i in range(5)] + [[(180 - 20 * i, 200)] for i in range(1, 4)]
+    backend = ObjectDetectionBackend(StaticCamera(), detector=ScriptedDetector(path),
+                                     display_width=640, display_height=480,
+                                     impact_mode=ImpactMode.TRAJECTORY_CHANGE)
+    events = []
+    for frame in range(len(path)):
+        events.extend(backend._process_frame(np.zeros((480, 640, 3), dtype=np.uint8), frame / 30))
+
+    assert len(backend.tracked_objects) == 1
+    assert len(events) == 1
+    assert events[0].x == pytest.approx(180 / 640)